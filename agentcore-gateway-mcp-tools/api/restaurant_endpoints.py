@@ -7,7 +7,7 @@ that interface with the underlying MCP tools through the MCP client manager.
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from models.request_models import (
     DistrictSearchRequest,
@@ -40,6 +40,23 @@ router = APIRouter(
 )
 
 
+def _extract_pagination(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get pagination details from an MCP search result.
+    
+    Args:
+        result: Search tool result
+        
+    Returns:
+        Pagination metadata reported by the search tool, or None
+    """
+    metadata = result.get("metadata")
+    if not isinstance(metadata, dict):
+        return None
+    pagination = metadata.get("pagination")
+    return pagination if isinstance(pagination, dict) else None
+
+
 @router.post(
     "/search/district",
     response_model=RestaurantSearchResponse,
@@ -88,7 +105,7 @@ async def search_restaurants_by_district(
         result = await mcp_client.call_mcp_tool(
             server_name="restaurant-search",
             tool_name="search_restaurants_by_district",
-            parameters={"districts": request.districts},
+            parameters={"districts": request.districts, **request.result_parameters()},
             user_context=user_context
         )
         
@@ -101,15 +118,17 @@ async def search_restaurants_by_district(
         
         # Transform MCP result to match response model
         restaurants = result.get("restaurants", [])
+        pagination = _extract_pagination(result)
         
         return RestaurantSearchResponse(
             success=True,
             restaurants=restaurants,
             metadata={
-                "total_results": len(restaurants),
+                "total_results": pagination["total_results"] if pagination else len(restaurants),
                 "search_criteria": {"districts": request.districts},
                 "execution_time_ms": 0.0,  # Will be populated by actual execution time
-                "data_sources": ["mcp_restaurant_search"]
+                "data_sources": ["mcp_restaurant_search"],
+                "pagination": pagination
             }
         )
         
@@ -194,7 +213,7 @@ async def search_restaurants_by_meal_type(
         result = await mcp_client.call_mcp_tool(
             server_name="restaurant-search",
             tool_name="search_restaurants_by_meal_type",
-            parameters={"meal_types": meal_types_str},
+            parameters={"meal_types": meal_types_str, **request.result_parameters()},
             user_context=user_context
         )
         
@@ -207,15 +226,17 @@ async def search_restaurants_by_meal_type(
         
         # Transform MCP result to match response model
         restaurants = result.get("restaurants", [])
+        pagination = _extract_pagination(result)
         
         return RestaurantSearchResponse(
             success=True,
             restaurants=restaurants,
             metadata={
-                "total_results": len(restaurants),
+                "total_results": pagination["total_results"] if pagination else len(restaurants),
                 "search_criteria": {"meal_types": meal_types_str},
                 "execution_time_ms": 0.0,  # Will be populated by actual execution time
-                "data_sources": ["mcp_restaurant_search"]
+                "data_sources": ["mcp_restaurant_search"],
+                "pagination": pagination
             }
         )
         
@@ -300,6 +321,7 @@ async def search_restaurants_combined(
             parameters["districts"] = request.districts
         if request.meal_types:
             parameters["meal_types"] = [mt.value for mt in request.meal_types]
+        parameters.update(request.result_parameters())
         
         # Call MCP tool
         result = await mcp_client.call_mcp_tool(
@@ -319,6 +341,7 @@ async def search_restaurants_combined(
         
         # Transform MCP result to match response model
         restaurants = result.get("restaurants", [])
+        pagination = _extract_pagination(result)
         search_criteria = {}
         if request.districts:
             search_criteria["districts"] = request.districts
@@ -329,10 +352,11 @@ async def search_restaurants_combined(
             success=True,
             restaurants=restaurants,
             metadata={
-                "total_results": len(restaurants),
+                "total_results": pagination["total_results"] if pagination else len(restaurants),
                 "search_criteria": search_criteria,
                 "execution_time_ms": 0.0,  # Will be populated by actual execution time
-                "data_sources": ["mcp_restaurant_search"]
+                "data_sources": ["mcp_restaurant_search"],
+                "pagination": pagination
             }
         )
         
@@ -385,7 +409,7 @@ async def recommend_restaurants(
     restaurant sentiment data and provide ranked recommendations.
     
     Args:
-        request: Restaurant recommendation request with restaurant data
+        request: Restaurant recommendation request with restaurant data, ids or a district query
         current_user: Authenticated user context
         mcp_client: MCP client manager for server communication
         
@@ -395,9 +419,11 @@ async def recommend_restaurants(
     Raises:
         HTTPException: If MCP server is unavailable or request fails
     """
+    restaurant_count = len(request.restaurants or request.restaurant_ids or [])
     logger.info(
         "Restaurant recommendation request",
-        restaurant_count=len(request.restaurants),
+        restaurant_count=restaurant_count,
+        districts=request.districts,
         ranking_method=request.ranking_method.value,
         user_id=current_user.user_id,
         username=current_user.username
@@ -412,23 +438,17 @@ async def recommend_restaurants(
             "token": current_user.token_claims.get("access_token")
         }
         
-        # Convert restaurant data to dict format for MCP call
-        restaurants_data = [restaurant.model_dump() for restaurant in request.restaurants]
-        
-        # Call MCP tool
+        # Call MCP tool with the restaurants, or the ids/query resolved by the server
         result = await mcp_client.call_mcp_tool(
             server_name="restaurant-reasoning",
             tool_name="recommend_restaurants",
-            parameters={
-                "restaurants": restaurants_data,
-                "ranking_method": request.ranking_method.value
-            },
+            parameters=request.tool_parameters(),
             user_context=user_context
         )
         
         logger.info(
             "Restaurant recommendation completed",
-            restaurant_count=len(request.restaurants),
+            restaurant_count=restaurant_count,
             ranking_method=request.ranking_method.value,
             user_id=current_user.user_id
         )
@@ -449,7 +469,7 @@ async def recommend_restaurants(
     except Exception as e:
         logger.error(
             "Restaurant recommendation failed",
-            restaurant_count=len(request.restaurants),
+            restaurant_count=restaurant_count,
             ranking_method=request.ranking_method.value,
             error=str(e),
             user_id=current_user.user_id
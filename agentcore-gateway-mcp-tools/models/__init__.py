@@ -9,6 +9,9 @@ tool metadata, and error handling in the AgentCore Gateway.
 from .request_models import (
     MealType,
     RankingMethod,
+    RestaurantField,
+    RestaurantSortField,
+    SearchPaginationRequest,
     DistrictSearchRequest,
     MealTypeSearchRequest,
     CombinedSearchRequest,
@@ -26,6 +29,7 @@ from .response_models import (
     RestaurantMetadata,
     RestaurantResponse,
     FileMetadata,
+    PaginationMetadata,
     SearchResultMetadata,
     RestaurantSearchResponse,
     AnalysisSummary,
@@ -70,6 +74,9 @@ __all__ = [
     # Request models
     "MealType",
     "RankingMethod",
+    "RestaurantField",
+    "RestaurantSortField",
+    "SearchPaginationRequest",
     "DistrictSearchRequest",
     "MealTypeSearchRequest",
     "CombinedSearchRequest",
@@ -85,6 +92,7 @@ __all__ = [
     "RestaurantMetadata",
     "RestaurantResponse",
     "FileMetadata",
+    "PaginationMetadata",
     "SearchResultMetadata",
     "RestaurantSearchResponse",
     "AnalysisSummary",
@@ -10,6 +10,8 @@ from typing import List, Optional, Dict, Any, Literal
 from pydantic import BaseModel, Field, field_validator, model_validator
 from enum import Enum
 
+from .district_aliases import get_district_alias_index
+
 
 class MealType(str, Enum):
     """Valid meal types for restaurant search."""
@@ -24,7 +26,118 @@ class RankingMethod(str, Enum):
     COMBINED_SENTIMENT = "combined_sentiment"
 
 
-class DistrictSearchRequest(BaseModel):
+class RestaurantField(str, Enum):
+    """Restaurant fields that can be selected with a search fields projection."""
+    ID = "id"
+    NAME = "name"
+    ADDRESS = "address"
+    MEAL_TYPE = "meal_type"
+    SENTIMENT = "sentiment"
+    LOCATION_CATEGORY = "location_category"
+    DISTRICT = "district"
+    PRICE_RANGE = "price_range"
+    OPERATING_HOURS = "operating_hours"
+    METADATA = "metadata"
+
+
+class RestaurantSortField(str, Enum):
+    """Server-side rankings for restaurant search results (best first)."""
+    LIKES = "likes"
+    COMBINED_SENTIMENT = "combined_sentiment"
+    QUALITY_SCORE = "quality_score"
+
+
+class SearchPaginationRequest(BaseModel):
+    """Ranking, pagination and field projection parameters shared by search requests."""
+    
+    sort_by: Optional[RestaurantSortField] = Field(
+        None,
+        description="Rank results best first by likes, combined sentiment or quality score"
+    )
+    
+    top_k: Optional[int] = Field(
+        None,
+        ge=1,
+        le=500,
+        description="Maximum number of ranked restaurants to return"
+    )
+    
+    limit: Optional[int] = Field(
+        None,
+        ge=1,
+        le=500,
+        description="Maximum number of restaurants to return. All results are returned if omitted."
+    )
+    
+    offset: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Number of matching restaurants to skip. Cannot be combined with cursor."
+    )
+    
+    cursor: Optional[str] = Field(
+        None,
+        min_length=1,
+        max_length=512,
+        description="next_cursor from a previous page of the same search"
+    )
+    
+    fields: Optional[List[RestaurantField]] = Field(
+        None,
+        min_length=1,
+        description="Restaurant fields to return. All fields are returned if omitted.",
+        json_schema_extra={"example": ["id", "name", "sentiment"]}
+    )
+    
+    @model_validator(mode='after')
+    def validate_cursor_or_offset(self):
+        """Ensure cursor and offset are not both provided."""
+        if self.cursor and self.offset:
+            raise ValueError("Specify either 'cursor' or 'offset', not both")
+        
+        return self
+    
+    def result_parameters(self) -> Dict[str, Any]:
+        """Get the ranking and pagination parameters that were set, for the MCP tool call."""
+        parameters: Dict[str, Any] = {}
+        if self.sort_by is not None:
+            parameters["sort_by"] = self.sort_by.value
+        if self.top_k is not None:
+            parameters["top_k"] = self.top_k
+        if self.limit is not None:
+            parameters["limit"] = self.limit
+        if self.offset is not None:
+            parameters["offset"] = self.offset
+        if self.cursor is not None:
+            parameters["cursor"] = self.cursor
+        if self.fields is not None:
+            parameters["fields"] = [field.value for field in self.fields]
+        return parameters
+
+
+def normalize_district_list(districts: List[str]) -> List[str]:
+    """Strip, canonicalize and de-duplicate district names, preserving order.
+    
+    Known variants ("central", "Mongkok", "TST") are mapped to their configured
+    names with the district alias index. Unknown names are kept as given so the
+    restaurant search server can report them.
+    """
+    alias_index = get_district_alias_index()
+    
+    seen = set()
+    unique_districts = []
+    for district in districts:
+        if district and district.strip():
+            district_clean = district.strip()
+            if alias_index is not None:
+                district_clean = alias_index.resolve(district_clean) or district_clean
+            if district_clean not in seen:
+                seen.add(district_clean)
+                unique_districts.append(district_clean)
+    return unique_districts
+
+
+class DistrictSearchRequest(SearchPaginationRequest):
     """Request model for district-based restaurant search."""
     
     districts: List[str] = Field(
@@ -38,19 +151,12 @@ class DistrictSearchRequest(BaseModel):
     @field_validator('districts')
     @classmethod
     def validate_districts(cls, v):
-        """Validate district names are not empty and properly formatted."""
+        """Validate district names are not empty and map variants to configured names."""
         if not v:
             raise ValueError("Districts list cannot be empty")
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_districts = []
-        for district in v:
-            if district and district.strip():
-                district_clean = district.strip()
-                if district_clean not in seen:
-                    seen.add(district_clean)
-                    unique_districts.append(district_clean)
+        # Canonicalize names and remove duplicates while preserving order
+        unique_districts = normalize_district_list(v)
         
         if not unique_districts:
             raise ValueError("At least one valid district name is required")
@@ -66,7 +172,7 @@ class DistrictSearchRequest(BaseModel):
     }
 
 
-class MealTypeSearchRequest(BaseModel):
+class MealTypeSearchRequest(SearchPaginationRequest):
     """Request model for meal type-based restaurant search."""
     
     meal_types: List[MealType] = Field(
@@ -103,7 +209,7 @@ class MealTypeSearchRequest(BaseModel):
     }
 
 
-class CombinedSearchRequest(BaseModel):
+class CombinedSearchRequest(SearchPaginationRequest):
     """Request model for combined district and meal type search."""
     
     districts: Optional[List[str]] = Field(
@@ -132,15 +238,8 @@ class CombinedSearchRequest(BaseModel):
         if not v:
             raise ValueError("Districts list cannot be empty if provided")
         
-        # Remove duplicates and empty values
-        seen = set()
-        unique_districts = []
-        for district in v:
-            if district and district.strip():
-                district_clean = district.strip()
-                if district_clean not in seen:
-                    seen.add(district_clean)
-                    unique_districts.append(district_clean)
+        # Canonicalize names and remove duplicates and empty values
+        unique_districts = normalize_district_list(v)
         
         if not unique_districts:
             raise ValueError("At least one valid district name is required if districts are provided")
@@ -235,15 +334,43 @@ class RestaurantData(BaseModel):
 
 
 class RestaurantRecommendationRequest(BaseModel):
-    """Request model for restaurant recommendation analysis."""
+    """Request model for restaurant recommendation analysis.
     
-    restaurants: List[RestaurantData] = Field(
-        ...,
+    Restaurants are either sent in full, referenced by id, or selected by
+    districts and meal types from the reasoning server's restaurant dataset.
+    """
+    
+    restaurants: Optional[List[RestaurantData]] = Field(
+        None,
         min_length=1,
         max_length=1000,
         description="List of restaurant data with sentiment information for analysis"
     )
     
+    restaurant_ids: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        max_length=1000,
+        description="Restaurant ids to analyze instead of full restaurant data",
+        json_schema_extra={"example": ["d218e465-9439-4676-91a1-4bf6af021ddd"]}
+    )
+    
+    districts: Optional[List[str]] = Field(
+        None,
+        min_length=1,
+        max_length=20,
+        description="Districts to take restaurants from, or to look restaurant_ids up in",
+        json_schema_extra={"example": ["Central district"]}
+    )
+    
+    meal_types: Optional[List[MealType]] = Field(
+        None,
+        min_length=1,
+        max_length=3,
+        description="Optional meal types to filter district restaurants by. Valid values: breakfast, lunch, dinner",
+        json_schema_extra={"example": ["lunch"]}
+    )
+    
     ranking_method: RankingMethod = Field(
         default=RankingMethod.SENTIMENT_LIKES,
         description="Method to use for ranking restaurants. 'sentiment_likes' ranks by likes count, 'combined_sentiment' ranks by likes + neutral percentage"
@@ -253,6 +380,9 @@ class RestaurantRecommendationRequest(BaseModel):
     @classmethod
     def validate_restaurants(cls, v):
         """Validate restaurant data list."""
+        if v is None:
+            return v
+        
         if not v:
             raise ValueError("Restaurants list cannot be empty")
         
@@ -263,6 +393,61 @@ class RestaurantRecommendationRequest(BaseModel):
         
         return v
     
+    @field_validator('restaurant_ids')
+    @classmethod
+    def validate_restaurant_ids(cls, v):
+        """Remove duplicate and empty restaurant ids."""
+        if v is None:
+            return v
+        
+        unique_ids = list(dict.fromkeys(rid.strip() for rid in v if rid and rid.strip()))
+        if not unique_ids:
+            raise ValueError("At least one restaurant id is required if restaurant_ids are provided")
+        
+        return unique_ids
+    
+    @field_validator('districts')
+    @classmethod
+    def validate_districts(cls, v):
+        """Validate district names if provided."""
+        if v is None:
+            return v
+        
+        # Canonicalize names and remove duplicates and empty values
+        unique_districts = normalize_district_list(v)
+        
+        if not unique_districts:
+            raise ValueError("At least one valid district name is required if districts are provided")
+        
+        return unique_districts
+    
+    @model_validator(mode='after')
+    def validate_input_mode(self):
+        """Ensure exactly one way of selecting restaurants is used."""
+        if self.restaurants is not None:
+            if self.restaurant_ids or self.districts or self.meal_types:
+                raise ValueError("Provide either 'restaurants' or 'restaurant_ids'/'districts', not both")
+        elif self.restaurant_ids:
+            if self.meal_types:
+                raise ValueError("'meal_types' cannot be combined with 'restaurant_ids'")
+        elif not self.districts:
+            raise ValueError("One of 'restaurants', 'restaurant_ids' or 'districts' must be provided")
+        
+        return self
+    
+    def tool_parameters(self) -> Dict[str, Any]:
+        """Build the recommend_restaurants tool parameters for this request."""
+        parameters: Dict[str, Any] = {"ranking_method": self.ranking_method.value}
+        if self.restaurants is not None:
+            parameters["restaurants"] = [restaurant.model_dump() for restaurant in self.restaurants]
+        if self.restaurant_ids:
+            parameters["restaurant_ids"] = self.restaurant_ids
+        if self.districts:
+            parameters["districts"] = self.districts
+        if self.meal_types:
+            parameters["meal_types"] = [meal_type.value for meal_type in self.meal_types]
+        return parameters
+    
     model_config = {
         "json_schema_extra": {
             "example": {
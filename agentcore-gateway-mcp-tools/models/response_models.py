@@ -6,7 +6,7 @@ from the AgentCore Gateway. These models ensure consistent response
 formats and proper error handling structures.
 """
 
-from typing import List, Optional, Dict, Any, Union
+from typing import Annotated, List, Optional, Dict, Any, Union
 from datetime import datetime
 from pydantic import BaseModel, Field, validator
 from enum import Enum
@@ -148,6 +148,43 @@ class FileMetadata(BaseModel):
         }
 
 
+# Full restaurant record, or a partial one when a fields projection was requested
+ProjectedRestaurant = Annotated[
+    Union[RestaurantResponse, Dict[str, Any]],
+    Field(union_mode='left_to_right')
+]
+
+
+class PaginationMetadata(BaseModel):
+    """Pagination details for a page of search results."""
+    
+    total_results: int = Field(..., description="Total number of matching restaurants")
+    returned: int = Field(..., description="Number of restaurants in this page")
+    offset: int = Field(0, description="Offset of the first restaurant in this page")
+    limit: Optional[int] = Field(None, description="Requested page size")
+    has_more: bool = Field(False, description="Whether more results follow this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+    next_offset: Optional[int] = Field(None, description="Offset of the next page")
+    dataset_version: Optional[str] = Field(None, description="Version of the data the page was built from")
+    fields: Optional[List[str]] = Field(None, description="Restaurant fields included in the page")
+    
+    class Config:
+        """Pydantic configuration."""
+        schema_extra = {
+            "example": {
+                "total_results": 137,
+                "returned": 20,
+                "offset": 0,
+                "limit": 20,
+                "has_more": True,
+                "next_cursor": "eyJvIjoyMCwicSI6IjFhMmIzYyIsInYiOiI0ZDVlNmYifQ",
+                "next_offset": 20,
+                "dataset_version": "4d5e6f7a8b9c0d1e",
+                "fields": ["id", "name", "sentiment"]
+            }
+        }
+
+
 class SearchResultMetadata(BaseModel):
     """Metadata for search results."""
     
@@ -155,6 +192,7 @@ class SearchResultMetadata(BaseModel):
     search_criteria: Dict[str, Any] = Field(..., description="Search criteria used")
     execution_time_ms: float = Field(..., description="Search execution time in milliseconds")
     data_sources: List[str] = Field(..., description="Data sources queried")
+    pagination: Optional[PaginationMetadata] = Field(None, description="Pagination details, when requested")
     
     class Config:
         """Pydantic configuration."""
@@ -172,7 +210,10 @@ class RestaurantSearchResponse(BaseModel):
     """Response model for restaurant search operations."""
     
     success: bool = Field(True, description="Indicates if the request was successful")
-    restaurants: List[RestaurantResponse] = Field(..., description="List of matching restaurants")
+    restaurants: List[ProjectedRestaurant] = Field(
+        ...,
+        description="List of matching restaurants (partial records when a fields projection is requested)"
+    )
     metadata: SearchResultMetadata = Field(..., description="Search result metadata")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp")
     
@@ -479,6 +479,51 @@ class ToolMetadataService:
         )
         self._last_generated = datetime.utcnow()
     
+    def _result_parameter_schemas(self) -> Dict[str, ParameterSchema]:
+        """Generate the ranking, pagination and field projection parameters shared by search tools."""
+        return {
+            "sort_by": ParameterSchema(
+                type=ParameterType.STRING,
+                description="Optional server-side ranking, best first. Avoids a separate call to the reasoning tools for simple top-K lists.",
+                required=False,
+                enum=["likes", "combined_sentiment", "quality_score"],
+                example="likes"
+            ),
+            "top_k": ParameterSchema(
+                type=ParameterType.INTEGER,
+                description="Optional maximum number of ranked restaurants to return.",
+                required=False,
+                example=10
+            ),
+            "limit": ParameterSchema(
+                type=ParameterType.INTEGER,
+                description="Optional maximum number of restaurants to return (1-500). All results are returned if omitted.",
+                required=False,
+                example=20
+            ),
+            "offset": ParameterSchema(
+                type=ParameterType.INTEGER,
+                description="Optional number of matching restaurants to skip. Cannot be combined with cursor.",
+                required=False,
+                default=0,
+                example=20
+            ),
+            "cursor": ParameterSchema(
+                type=ParameterType.STRING,
+                description="Optional next_cursor from a previous page of the same search. Cursors expire when the restaurant data changes.",
+                required=False
+            ),
+            "fields": ParameterSchema(
+                type=ParameterType.ARRAY,
+                description="Optional list of restaurant fields to return. All fields are returned if omitted.",
+                required=False,
+                min_items=1,
+                enum=["id", "name", "address", "meal_type", "sentiment", "location_category",
+                      "district", "price_range", "operating_hours", "metadata"],
+                example=["id", "name", "district", "sentiment"]
+            )
+        }
+    
     def _generate_district_search_metadata(self) -> ToolMetadata:
         """Generate metadata for district search tool."""
         return ToolMetadata(
@@ -496,7 +541,8 @@ class ToolMetadataService:
                     min_items=1,
                     max_items=20,
                     example=["Central district", "Admiralty", "Causeway Bay"]
-                )
+                ),
+                **self._result_parameter_schemas()
             },
             
             response_schema=ResponseSchema(
@@ -639,7 +685,8 @@ class ToolMetadataService:
                     max_items=3,
                     enum=["breakfast", "lunch", "dinner"],
                     example=["breakfast", "lunch"]
-                )
+                ),
+                **self._result_parameter_schemas()
             },
             
             response_schema=ResponseSchema(
@@ -774,7 +821,8 @@ class ToolMetadataService:
                     max_items=3,
                     enum=["breakfast", "lunch", "dinner"],
                     example=["lunch", "dinner"]
-                )
+                ),
+                **self._result_parameter_schemas()
             },
             
             response_schema=ResponseSchema(
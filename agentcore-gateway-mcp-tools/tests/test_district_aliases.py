@@ -0,0 +1,104 @@
+"""
+Unit tests for the district alias index.
+
+This module tests resolution of district name variants, abbreviations and
+typos to the district names configured in config/districts.
+"""
+
+import pytest
+
+from models.district_aliases import (
+    DistrictAliasIndex,
+    district_alias_key,
+    get_district_alias_index
+)
+
+
+@pytest.fixture
+def alias_index():
+    """Small alias index with the awkwardly named configured districts."""
+    return DistrictAliasIndex([
+        ("Central district", "Hong Kong Island"),
+        ("Western District", "Hong Kong Island"),
+        ("Mid-Levels", "Hong Kong Island"),
+        ("The Peak", "Hong Kong Island"),
+        ("Tsim Sha Tsui", "Kowloon"),
+        ("Mong Kok", "Kowloon"),
+        ("Tai Po", "New Territories"),
+        ("Tai O", "Islands"),
+        ("Tai Heng", "New Territories"),
+        ("Tai Heng", "Islands")
+    ])
+
+
+class TestDistrictAliasKey:
+    """Tests for alias key normalization."""
+
+    def test_case_and_separators(self):
+        """Test that case, hyphens and spaces do not affect the key."""
+        assert district_alias_key("Mid-Levels") == district_alias_key("mid levels")
+        assert district_alias_key("Mong Kok") == district_alias_key("MONGKOK")
+
+    def test_district_suffix_and_article(self):
+        """Test that a district suffix and leading article are dropped."""
+        assert district_alias_key("Central district") == "central"
+        assert district_alias_key("The Peak") == "peak"
+        assert district_alias_key("District") == "district"
+
+
+class TestDistrictAliasIndex:
+    """Tests for DistrictAliasIndex resolution."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Central district", "Central district"),
+        ("central", "Central district"),
+        ("CENTRAL DISTRICT", "Central district"),
+        ("Western", "Western District"),
+        ("mid levels", "Mid-Levels"),
+        ("peak", "The Peak"),
+        ("mongkok", "Mong Kok"),
+        ("TST", "Tsim Sha Tsui"),
+        ("Tsim Sha Tsiu", "Tsim Sha Tsui"),
+        ("Mong Kong", "Mong Kok")
+    ])
+    def test_resolves_variants(self, alias_index, name, expected):
+        """Test that variants resolve to the configured name."""
+        assert alias_index.resolve(name) == expected
+
+    @pytest.mark.parametrize("name", ["Atlantis", "", "Test District", "Tai", "HK Island"])
+    def test_unknown_names_unresolved(self, alias_index, name):
+        """Test that unrelated names, region names and short near-misses do not resolve."""
+        assert alias_index.resolve(name) is None
+
+    def test_ambiguous_typo_unresolved(self, alias_index):
+        """Test that a typo equally close to two districts is not guessed."""
+        assert alias_index.resolve("Tai Px") == "Tai Po"
+        assert alias_index.resolve("Tai Px", fuzzy=False) is None
+        # One edit away from both "Tai O" and "Tai Po"
+        assert alias_index.resolve("Tai Oo") is None
+
+    def test_duplicate_names_first_region_wins(self, alias_index):
+        """Test that the first occurrence of a duplicated district wins."""
+        assert len(alias_index) == 9
+        assert alias_index.region_for("tai heng") == "New Territories"
+
+    def test_resolve_all(self, alias_index):
+        """Test batch resolution de-duplicates and separates unknown names."""
+        resolved, unresolved = alias_index.resolve_all(["central", "Central district", "Atlantis"])
+        assert resolved == ["Central district"]
+        assert unresolved == ["Atlantis"]
+
+    def test_suggest(self, alias_index):
+        """Test suggestions for names too far off to resolve."""
+        assert alias_index.suggest("Mid Level Area")[0] == "Mid-Levels"
+
+
+class TestSharedIndex:
+    """Tests for the index loaded from config/districts."""
+
+    def test_loads_configured_districts(self):
+        """Test that the shared index covers the shipped configuration."""
+        alias_index = get_district_alias_index()
+        assert alias_index is not None
+        assert alias_index.resolve("causeway bay") == "Causeway Bay"
+        assert alias_index.resolve("Lantau") == "Lantau Island"
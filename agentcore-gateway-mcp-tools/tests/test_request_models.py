@@ -12,6 +12,8 @@ from typing import List, Dict, Any
 from models.request_models import (
     MealType,
     RankingMethod,
+    RestaurantField,
+    RestaurantSortField,
     DistrictSearchRequest,
     MealTypeSearchRequest,
     CombinedSearchRequest,
@@ -103,6 +105,18 @@ class TestDistrictSearchRequest:
         )
         assert request.districts == ["Central district", "Admiralty"]
     
+    def test_district_variants_canonicalized(self):
+        """Test that district name variants map to configured names."""
+        request = DistrictSearchRequest(
+            districts=["central", "Central District", "mongkok", "TST"]
+        )
+        assert request.districts == ["Central district", "Mong Kok", "Tsim Sha Tsui"]
+    
+    def test_unknown_district_kept(self):
+        """Test that unknown districts are passed through for the server to report."""
+        request = DistrictSearchRequest(districts=["Admiralty", "Atlantis"])
+        assert request.districts == ["Admiralty", "Atlantis"]
+    
     def test_too_many_districts(self):
         """Test validation error for too many districts."""
         districts = [f"District {i}" for i in range(25)]  # More than max_items=20
@@ -249,6 +263,60 @@ class TestCombinedSearchRequest:
         assert request.meal_types == [MealType.BREAKFAST, MealType.LUNCH]
 
 
+class TestSearchPagination:
+    """Test pagination and field projection parameters on search requests."""
+    
+    def test_pagination_defaults(self):
+        """Test that pagination parameters are optional and omitted from MCP calls."""
+        request = DistrictSearchRequest(districts=["Central district"])
+        assert request.limit is None
+        assert request.cursor is None
+        assert request.result_parameters() == {}
+    
+    def test_pagination_parameters(self):
+        """Test that set pagination parameters are forwarded."""
+        request = CombinedSearchRequest(
+            meal_types=[MealType.LUNCH],
+            limit=20,
+            offset=40,
+            fields=["id", "name", "sentiment"]
+        )
+        assert request.fields == [RestaurantField.ID, RestaurantField.NAME, RestaurantField.SENTIMENT]
+        assert request.result_parameters() == {
+            "limit": 20,
+            "offset": 40,
+            "fields": ["id", "name", "sentiment"]
+        }
+    
+    def test_ranking_parameters(self):
+        """Test that sort_by and top_k are validated and forwarded."""
+        request = DistrictSearchRequest(districts=["Central district"], sort_by="likes", top_k=10)
+        assert request.sort_by == RestaurantSortField.LIKES
+        assert request.result_parameters() == {"sort_by": "likes", "top_k": 10}
+        
+        with pytest.raises(ValidationError):
+            DistrictSearchRequest(districts=["Central district"], sort_by="price")
+    
+    def test_limit_out_of_range(self):
+        """Test that limit must be between 1 and 500."""
+        with pytest.raises(ValidationError):
+            MealTypeSearchRequest(meal_types=[MealType.DINNER], limit=0)
+        with pytest.raises(ValidationError):
+            MealTypeSearchRequest(meal_types=[MealType.DINNER], limit=501)
+    
+    def test_invalid_field(self):
+        """Test that unknown projection fields are rejected."""
+        with pytest.raises(ValidationError):
+            DistrictSearchRequest(districts=["Central district"], fields=["password"])
+    
+    def test_cursor_and_offset_rejected(self):
+        """Test that cursor and offset cannot be combined."""
+        with pytest.raises(ValidationError) as exc_info:
+            DistrictSearchRequest(districts=["Central district"], cursor="abc", offset=20)
+        
+        assert "either 'cursor' or 'offset'" in str(exc_info.value)
+
+
 class TestRestaurantData:
     """Test RestaurantData model."""
     
@@ -448,6 +516,54 @@ class TestRestaurantRecommendationRequest:
         errors = exc_info.value.errors()
         assert len(errors) > 0
         assert any("Input should be 'sentiment_likes' or 'combined_sentiment'" in str(error) for error in errors)
+    
+    def test_restaurant_ids_request(self):
+        """Test referencing restaurants by id."""
+        request = RestaurantRecommendationRequest(
+            restaurant_ids=["rest_001", " rest_002 ", "rest_001"],
+            districts=["central"]
+        )
+        
+        assert request.restaurant_ids == ["rest_001", "rest_002"]
+        assert request.tool_parameters() == {
+            "ranking_method": "sentiment_likes",
+            "restaurant_ids": ["rest_001", "rest_002"],
+            "districts": ["Central district"]
+        }
+    
+    def test_district_query_request(self):
+        """Test selecting restaurants by districts and meal types."""
+        request = RestaurantRecommendationRequest(
+            districts=["Central district"],
+            meal_types=["lunch"],
+            ranking_method="combined_sentiment"
+        )
+        
+        assert request.restaurants is None
+        assert request.tool_parameters() == {
+            "ranking_method": "combined_sentiment",
+            "districts": ["Central district"],
+            "meal_types": ["lunch"]
+        }
+    
+    def test_input_modes_are_exclusive(self):
+        """Test validation errors for missing or conflicting input modes."""
+        restaurants = [
+            RestaurantData(
+                id="rest_001",
+                name="Restaurant A",
+                sentiment={"likes": 85, "dislikes": 10, "neutral": 5}
+            )
+        ]
+        
+        with pytest.raises(ValidationError, match="One of 'restaurants', 'restaurant_ids' or 'districts'"):
+            RestaurantRecommendationRequest()
+        with pytest.raises(ValidationError, match="not both"):
+            RestaurantRecommendationRequest(restaurants=restaurants, districts=["Central district"])
+        with pytest.raises(ValidationError, match="cannot be combined"):
+            RestaurantRecommendationRequest(restaurant_ids=["rest_001"], meal_types=["lunch"])
+        with pytest.raises(ValidationError, match="One of"):
+            RestaurantRecommendationRequest(meal_types=["lunch"])
 
 
 class TestSentimentAnalysisRequest:
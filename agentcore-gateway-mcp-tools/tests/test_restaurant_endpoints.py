@@ -8,12 +8,16 @@ including authentication, validation, and MCP integration.
 import pytest
 import json
 from unittest.mock import AsyncMock, patch, MagicMock
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from datetime import datetime, timezone
 
 from main import app
+from api.restaurant_endpoints import router as restaurant_router
+from middleware.auth_middleware import get_current_user
 from models.request_models import MealType, RankingMethod
 from middleware.jwt_validator import UserContext
+from services.mcp_client_manager import get_mcp_client_manager
 
 
 class TestRestaurantSearchEndpoints:
@@ -529,4 +533,108 @@ class TestRestaurantSearchEndpoints:
                 headers=invalid_headers
             )
         
-        assert response.status_code == 500  # Exception handling in middleware
\ No newline at end of file
+        assert response.status_code == 500  # Exception handling in middleware
+
+
+class TestCombinedSearchPagination:
+    """Test pagination and field projection on the combined search endpoint."""
+    
+    MCP_USER_CONTEXT = {
+        "user_id": "test-user-123",
+        "username": "testuser",
+        "email": "test@example.com",
+        "token": "test-access-token"
+    }
+    
+    @pytest.fixture
+    def pagination_client(self, mock_user_context, mock_mcp_client):
+        """Create a client for the restaurant router with auth and MCP dependencies overridden."""
+        test_app = FastAPI()
+        test_app.include_router(restaurant_router)
+        test_app.dependency_overrides[get_current_user] = lambda: mock_user_context
+        test_app.dependency_overrides[get_mcp_client_manager] = lambda: mock_mcp_client
+        return TestClient(test_app)
+    
+    def test_first_page_forwards_limit_and_fields(self, pagination_client, mock_mcp_client):
+        """Test that limit and fields are forwarded and pagination metadata is returned."""
+        mock_mcp_client.call_mcp_tool.return_value = {
+            "restaurants": [{"id": "rest_001", "name": "Test Restaurant"}],
+            "metadata": {
+                "pagination": {
+                    "total_results": 57,
+                    "returned": 1,
+                    "offset": 0,
+                    "limit": 1,
+                    "has_more": True,
+                    "next_cursor": "next-page",
+                    "next_offset": 1,
+                    "dataset_version": "abc123",
+                    "fields": ["id", "name"]
+                }
+            }
+        }
+        
+        response = pagination_client.post(
+            "/api/v1/restaurants/search/combined",
+            json={"districts": ["Central district"], "limit": 1, "fields": ["id", "name"]}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["restaurants"] == [{"id": "rest_001", "name": "Test Restaurant"}]
+        assert data["metadata"]["total_results"] == 57
+        assert data["metadata"]["pagination"]["has_more"] is True
+        assert data["metadata"]["pagination"]["next_cursor"] == "next-page"
+        assert data["metadata"]["pagination"]["fields"] == ["id", "name"]
+        
+        mock_mcp_client.call_mcp_tool.assert_called_once_with(
+            server_name="restaurant-search",
+            tool_name="search_restaurants_combined",
+            parameters={"districts": ["Central district"], "limit": 1, "fields": ["id", "name"]},
+            user_context=self.MCP_USER_CONTEXT
+        )
+    
+    def test_next_page_forwards_cursor(self, pagination_client, mock_mcp_client):
+        """Test that a cursor from a previous page is forwarded to the MCP tool."""
+        mock_mcp_client.call_mcp_tool.return_value = {
+            "restaurants": [{"id": "rest_002", "name": "Second Restaurant"}],
+            "metadata": {
+                "pagination": {
+                    "total_results": 2,
+                    "returned": 1,
+                    "offset": 1,
+                    "limit": 1,
+                    "has_more": False,
+                    "next_cursor": None,
+                    "next_offset": None
+                }
+            }
+        }
+        
+        response = pagination_client.post(
+            "/api/v1/restaurants/search/combined",
+            json={"meal_types": ["lunch"], "limit": 1, "cursor": "next-page"}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["metadata"]["total_results"] == 2
+        assert data["metadata"]["pagination"]["has_more"] is False
+        assert data["metadata"]["pagination"]["next_cursor"] is None
+        
+        mock_mcp_client.call_mcp_tool.assert_called_once_with(
+            server_name="restaurant-search",
+            tool_name="search_restaurants_combined",
+            parameters={"meal_types": ["lunch"], "limit": 1, "cursor": "next-page"},
+            user_context=self.MCP_USER_CONTEXT
+        )
+    
+    def test_cursor_and_offset_rejected(self, pagination_client, mock_mcp_client):
+        """Test that providing both cursor and offset is a validation error."""
+        response = pagination_client.post(
+            "/api/v1/restaurants/search/combined",
+            json={"districts": ["Central district"], "cursor": "next-page", "offset": 5}
+        )
+        
+        assert response.status_code == 422
+        mock_mcp_client.call_mcp_tool.assert_not_called()
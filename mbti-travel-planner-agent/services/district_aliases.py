@@ -0,0 +1,362 @@
+"""District name resolution with a precomputed alias index.
+
+This module provides the DistrictAliasIndex class, which maps the ways users
+and agents write Hong Kong district names onto the canonical names from
+config/districts. All aliases are generated once when the index is built:
+
+- case and Unicode width differences ("CENTRAL", "ｃｅｎｔｒａｌ")
+- a "district" suffix or prefix ("Central", "Central District", "Western")
+- hyphen, underscore, dot and space variants ("Mid Levels", "mong-kok", "Mongkok")
+- a leading "the" ("Peak" for "The Peak") and a few common abbreviations
+
+Exact lookups are a single dictionary access. Names that still do not match
+fall back to a bounded edit-distance search ("Tsim Sha Tsiu"), whose results
+are memoized.
+
+The module depends only on the standard library so the same file can be used
+by the restaurant search MCP server, the AgentCore gateway, the planner and the
+reasoning server. restaurant-search-mcp holds the canonical copy; the others
+are kept in sync by scripts/sync_shared_modules.py in that project.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming a config/districts directory to load
+DISTRICT_CONFIG_ENV = "DISTRICT_CONFIG_PATH"
+
+# Well-known abbreviations and short forms, keyed by alias key
+COMMON_ALIASES = {
+    "tst": "Tsim Sha Tsui",
+    "cwb": "Causeway Bay",
+    "ymt": "Yau Ma Tei",
+    "lantau": "Lantau Island",
+    "lamma": "Lamma Island",
+    "tko": "Tseung Kwan O",
+    "mos": "Ma On Shan",
+}
+
+# Upper bound on memoized fuzzy lookups
+MAX_FUZZY_CACHE_SIZE = 2048
+
+_SEPARATORS = re.compile(r"[\s\-_./,']+")
+
+
+def district_alias_key(name: str) -> str:
+    """Reduce a district name to its alias key.
+
+    The key is case-folded, NFKC-normalized, has separators removed and drops
+    a "district" prefix/suffix and a leading "the".
+
+    Args:
+        name: District name as written by a user or agent
+
+    Returns:
+        Alias key (may be empty)
+    """
+    text = unicodedata.normalize("NFKC", name).casefold().strip()
+    words = [word for word in _SEPARATORS.split(text) if word]
+    if len(words) > 1 and words[-1] == "district":
+        words = words[:-1]
+    if len(words) > 2 and words[0] == "district" and words[1] == "of":
+        words = words[2:]
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    return "".join(words)
+
+
+def _within_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Levenshtein distance between a and b if it is at most max_distance.
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        The distance, or None if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+
+def _max_edit_distance(key: str) -> int:
+    """Edit-distance budget for fuzzy matching a key of this length."""
+    if len(key) < 4:
+        return 0
+    if len(key) < 8:
+        return 1
+    return 2
+
+
+class DistrictAliasIndex:
+    """Alias index resolving district name variants to canonical names."""
+
+    def __init__(self, districts: Iterable[Tuple[str, Optional[str]]],
+                 extra_aliases: Optional[Dict[str, str]] = None):
+        """Build the index.
+
+        Args:
+            districts: (canonical district name, region name) pairs; the first
+                occurrence of a duplicated name wins
+            extra_aliases: Additional alias -> canonical name mappings
+                (defaults to COMMON_ALIASES); aliases for unknown districts
+                are ignored
+        """
+        self._regions: Dict[str, Optional[str]] = {}
+        self._aliases: Dict[str, str] = {}
+
+        for name, region in districts:
+            if name in self._regions:
+                continue
+            self._regions[name] = region
+            self._aliases.setdefault(district_alias_key(name), name)
+
+        if extra_aliases is None:
+            extra_aliases = COMMON_ALIASES
+        for alias, name in extra_aliases.items():
+            if name in self._regions:
+                self._aliases.setdefault(district_alias_key(alias), name)
+
+        self._keys_by_length: Dict[int, List[str]] = {}
+        for key in self._aliases:
+            self._keys_by_length.setdefault(len(key), []).append(key)
+
+        self._fuzzy_cache: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config_dir(cls, districts_path: str) -> "DistrictAliasIndex":
+        """Build an index from a config/districts directory.
+
+        Reads master-config.json and the district names of every enabled
+        region file it lists.
+
+        Args:
+            districts_path: Directory containing master-config.json
+
+        Returns:
+            DistrictAliasIndex over all configured districts
+
+        Raises:
+            FileNotFoundError: If the master or a region config is missing
+            ValueError: If a config file is not valid JSON
+        """
+        base_path = Path(districts_path)
+        with open(base_path / "master-config.json", "r", encoding="utf-8") as f:
+            master_config = json.load(f)
+
+        districts: List[Tuple[str, Optional[str]]] = []
+        for region_ref in master_config.get("regions", []):
+            if not region_ref.get("enabled", True):
+                continue
+            with open(base_path / region_ref["configFile"], "r", encoding="utf-8") as f:
+                region_config = json.load(f)
+            region_name = region_config.get("name")
+            for district in region_config.get("districts", []):
+                if district.get("name"):
+                    districts.append((district["name"], region_name))
+
+        return cls(districts)
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, name: str) -> bool:
+        return self.resolve(name) is not None
+
+    @property
+    def canonical_names(self) -> List[str]:
+        """Canonical district names in configuration order."""
+        return list(self._regions)
+
+    def region_for(self, name: str) -> Optional[str]:
+        """Get the region of a district, resolving aliases.
+
+        Args:
+            name: District name or alias
+
+        Returns:
+            Region name, or None if the district cannot be resolved
+        """
+        canonical = self.resolve(name)
+        return self._regions.get(canonical) if canonical else None
+
+    def resolve(self, name: str, fuzzy: bool = True) -> Optional[str]:
+        """Resolve a district name or alias to its canonical name.
+
+        Args:
+            name: District name as written by a user or agent
+            fuzzy: Fall back to edit-distance matching when no alias matches
+
+        Returns:
+            Canonical district name, or None if there is no unambiguous match
+        """
+        if not isinstance(name, str):
+            return None
+        if name in self._regions:
+            return name
+
+        key = district_alias_key(name)
+        canonical = self._aliases.get(key)
+        if canonical is not None or not fuzzy or not key:
+            return canonical
+
+        with self._lock:
+            if key in self._fuzzy_cache:
+                return self._fuzzy_cache[key]
+
+        canonical = self._fuzzy_match(key)
+        with self._lock:
+            if len(self._fuzzy_cache) >= MAX_FUZZY_CACHE_SIZE:
+                self._fuzzy_cache.clear()
+            self._fuzzy_cache[key] = canonical
+        if canonical is not None:
+            logger.debug(f"Resolved district '{name}' to '{canonical}' by edit distance")
+        return canonical
+
+    def resolve_all(self, names: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Resolve several names, separating unresolvable ones.
+
+        Args:
+            names: District names or aliases
+
+        Returns:
+            Tuple of (canonical names without duplicates, unresolved names)
+        """
+        resolved: List[str] = []
+        unresolved: List[str] = []
+        for name in names:
+            canonical = self.resolve(name)
+            if canonical is None:
+                unresolved.append(name)
+            elif canonical not in resolved:
+                resolved.append(canonical)
+        return resolved, unresolved
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """Suggest canonical names close to an unresolvable name.
+
+        Args:
+            name: District name that could not be resolved
+            limit: Maximum number of suggestions
+
+        Returns:
+            Canonical names ordered by edit distance
+        """
+        key = district_alias_key(name)
+        if not key:
+            return []
+
+        budget = max(2, len(key) // 3)
+        scored = []
+        for alias_key, canonical in self._aliases.items():
+            distance = _within_distance(key, alias_key, budget)
+            if distance is not None:
+                scored.append((distance, canonical))
+
+        suggestions: List[str] = []
+        for _, canonical in sorted(scored):
+            if canonical not in suggestions:
+                suggestions.append(canonical)
+            if len(suggestions) >= limit:
+                break
+        return suggestions
+
+    def _fuzzy_match(self, key: str) -> Optional[str]:
+        """Find the unique closest alias within the edit-distance budget."""
+        budget = _max_edit_distance(key)
+        if budget == 0:
+            return None
+
+        best_distance = budget + 1
+        best: Optional[str] = None
+        ambiguous = False
+        for length in range(len(key) - budget, len(key) + budget + 1):
+            for alias_key in self._keys_by_length.get(length, ()):
+                # Abbreviations are too short to be meaningful fuzzy targets
+                if _max_edit_distance(alias_key) == 0:
+                    continue
+                distance = _within_distance(key, alias_key, budget)
+                if distance is None:
+                    continue
+                canonical = self._aliases[alias_key]
+                if distance < best_distance:
+                    best_distance, best, ambiguous = distance, canonical, False
+                elif distance == best_distance and canonical != best:
+                    ambiguous = True
+
+        return None if ambiguous else best
+
+
+_shared_index: Optional[DistrictAliasIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def _candidate_config_dirs() -> List[Path]:
+    """Directories searched for config/districts, most specific first."""
+    candidates = []
+    configured = os.getenv(DISTRICT_CONFIG_ENV)
+    if configured:
+        candidates.append(Path(configured))
+    module_root = Path(__file__).resolve().parent.parent
+    candidates.extend([
+        Path("config") / "districts",
+        module_root / "config" / "districts",
+        module_root.parent / "config" / "districts",
+    ])
+    return candidates
+
+
+def get_district_alias_index() -> Optional[DistrictAliasIndex]:
+    """Get the process-wide alias index, loading it on first use.
+
+    Looks for config/districts in DISTRICT_CONFIG_PATH, the working directory,
+    this project and the repository root.
+
+    Returns:
+        Shared DistrictAliasIndex, or None if no district configuration is found
+    """
+    global _shared_index
+    if _shared_index is not None:
+        return _shared_index
+
+    with _shared_index_lock:
+        if _shared_index is None:
+            for districts_path in _candidate_config_dirs():
+                if (districts_path / "master-config.json").exists():
+                    try:
+                        _shared_index = DistrictAliasIndex.from_config_dir(str(districts_path))
+                        logger.info(f"Loaded {len(_shared_index)} districts from {districts_path}")
+                        break
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.warning(f"Could not load district configuration from {districts_path}: {e}")
+            if _shared_index is None:
+                logger.warning("No district configuration found; district names will not be normalized")
+    return _shared_index
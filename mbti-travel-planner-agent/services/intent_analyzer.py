@@ -22,6 +22,7 @@ import json
 
 # Import shared types
 from .orchestration_types import RequestType, Intent, UserContext
+from .district_aliases import get_district_alias_index
 
 
 class ParameterType(Enum):
@@ -541,21 +542,18 @@ class IntentAnalyzer:
         return parameters
     
     def _normalize_district_name(self, district: str) -> str:
-        """Normalize district name to standard format."""
-        district_mapping = {
-            'central': 'Central',
-            'admiralty': 'Admiralty',
-            'wan chai': 'Wan Chai',
-            'causeway bay': 'Causeway Bay',
-            'tsim sha tsui': 'Tsim Sha Tsui',
-            'mong kok': 'Mong Kok',
-            'yau ma tei': 'Yau Ma Tei',
-            'jordan': 'Jordan',
-            'sheung wan': 'Sheung Wan',
-            'mid-levels': 'Mid-Levels'
-        }
+        """Normalize district name to the configured district name.
+        
+        Uses the shared district alias index so extracted names match what the
+        restaurant search tools accept; unknown names are title-cased.
+        """
+        alias_index = get_district_alias_index()
+        if alias_index is not None:
+            canonical_name = alias_index.resolve(district)
+            if canonical_name:
+                return canonical_name
         
-        return district_mapping.get(district.lower(), district.title())
+        return district.strip().title()
     
     def _normalize_meal_type(self, meal: str) -> str:
         """Normalize meal type to standard format."""
@@ -40,6 +40,12 @@ class MCPClientSettings(BaseSettings):
         env="MCP_RETRY_ATTEMPTS",
         description="Number of retry attempts for failed MCP calls"
     )
+    
+    search_memo_ttl: float = Field(
+        default=5.0,
+        env="MCP_SEARCH_MEMO_TTL",
+        description="Seconds a restaurant search result is reused by identical searches"
+    )
 
 
 class AuthenticationSettings(BaseSettings):
@@ -168,6 +174,50 @@ class KnowledgeBaseSettings(BaseSettings):
         description="Knowledge Base search type (SEMANTIC, HYBRID)"
     )
     
+    # Local Index Configuration
+    local_index_enabled: bool = Field(
+        default=False,
+        env="KB_LOCAL_INDEX_ENABLED",
+        description="Query a local index over organized_kb before the remote Knowledge Base"
+    )
+    
+    local_kb_path: Optional[str] = Field(
+        default=None,
+        env="KB_LOCAL_SOURCE_PATH",
+        description="Path of the organized_kb corpus (defaults to the bundled copy)"
+    )
+    
+    local_index_path: Optional[str] = Field(
+        default=None,
+        env="KB_LOCAL_INDEX_PATH",
+        description="Path of the persisted local index file (defaults to data/local_kb_index.bin)"
+    )
+    
+    # Query Cache Configuration
+    query_cache_ttl: int = Field(
+        default=3600,
+        env="KB_QUERY_CACHE_TTL",
+        description="Seconds MBTI query results are fresh before being refreshed"
+    )
+    
+    query_cache_stale_ttl: int = Field(
+        default=86400,
+        env="KB_QUERY_CACHE_STALE_TTL",
+        description="Seconds stale MBTI query results are served while refreshing"
+    )
+    
+    query_cache_path: Optional[str] = Field(
+        default=None,
+        env="KB_QUERY_CACHE_PATH",
+        description="sqlite file persisting MBTI query results across restarts"
+    )
+    
+    query_cache_prewarm: bool = Field(
+        default=True,
+        env="KB_QUERY_CACHE_PREWARM",
+        description="Query all 16 MBTI types at startup"
+    )
+    
     # Generation Configuration
     kb_temperature: float = Field(
         default=0.1,
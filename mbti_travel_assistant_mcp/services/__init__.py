@@ -11,6 +11,8 @@ from .nova_pro_knowledge_base_client import (
     MBTITraits,
     QueryResult
 )
+from .local_knowledge_base_index import LocalKnowledgeBaseIndex
+from .mbti_query_cache import MBTIQueryCache
 from .mbti_personality_processor import (
     MBTIPersonalityProcessor,
     PersonalityProfile,
@@ -43,6 +45,8 @@ __all__ = [
     'QueryStrategy',
     'MBTITraits',
     'QueryResult',
+    'LocalKnowledgeBaseIndex',
+    'MBTIQueryCache',
     'MBTIPersonalityProcessor',
     'PersonalityProfile',
     'MatchingResult',
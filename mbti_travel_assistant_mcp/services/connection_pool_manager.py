@@ -14,7 +14,7 @@ from enum import Enum
 import weakref
 from contextlib import asynccontextmanager
 import aiohttp
-from mcp.client import ClientSession
+from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
 logger = logging.getLogger(__name__)
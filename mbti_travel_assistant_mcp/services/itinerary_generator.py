@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from ..config.settings import settings
 from ..models.tourist_spot_models import TouristSpot, SessionType
 from ..models.restaurant_models import Restaurant
 from ..models.itinerary_models import (
@@ -21,13 +22,26 @@ from ..models.mbti_request_response_models import ItineraryResponse, ItineraryMe
 from .session_assignment_logic import SessionAssignmentLogic, AssignmentResult
 from .mcp_client_manager import MCPClientManager
 from .assignment_validator import AssignmentValidator, ValidationReport
-from .nova_pro_knowledge_base_client import NovaProKnowledgeBaseClient
+from .nova_pro_knowledge_base_client import NovaProKnowledgeBaseClient, QueryCacheConfig
+from .local_knowledge_base_index import (
+    DEFAULT_INDEX_PATH,
+    DEFAULT_KB_PATH,
+    LocalKnowledgeBaseIndex
+)
 from .error_handler import ErrorHandler, SystemErrorType
 from .performance_monitor import performance_monitor, MetricType
 from .system_resilience import SystemResilienceService, DegradationConfig, CacheConfig
 from .comprehensive_error_monitor import ComprehensiveErrorMonitor, MonitoringConfig
 
 
+# Default meal times for restaurant assignments
+MEAL_TIMES = {
+    "breakfast": "08:30",
+    "lunch": "12:30",
+    "dinner": "19:30"
+}
+
+
 @dataclass
 class ItineraryGenerationContext:
     """Context information for itinerary generation.
@@ -93,12 +107,27 @@ class ItineraryGenerator:
     - 4.9, 4.10, 7.6: Validation and error handling
     """
 
-    def __init__(self):
-        """Initialize itinerary generator with required services."""
+    def __init__(self, concurrent_restaurant_assignment: bool = True):
+        """Initialize itinerary generator with required services.
+        
+        Args:
+            concurrent_restaurant_assignment: Fetch restaurant candidates for
+                all meals in parallel instead of one meal at a time
+        """
         self.logger = logging.getLogger(__name__)
+        self.concurrent_restaurant_assignment = concurrent_restaurant_assignment
         
         # Initialize core services
-        self.nova_client = NovaProKnowledgeBaseClient()
+        kb_settings = settings.knowledge_base
+        self.nova_client = NovaProKnowledgeBaseClient(
+            local_index=self._load_local_index(),
+            query_cache_config=QueryCacheConfig(
+                ttl_seconds=kb_settings.query_cache_ttl,
+                stale_ttl_seconds=kb_settings.query_cache_stale_ttl,
+                persistence_path=kb_settings.query_cache_path
+            )
+        )
+        self._prewarm_task: Optional[asyncio.Task] = None
         self.session_assigner = SessionAssignmentLogic()
         self.mcp_client = MCPClientManager()
         self.validator = AssignmentValidator()
@@ -134,14 +163,40 @@ class ItineraryGenerator:
         
         self.logger.info("Initialized ItineraryGenerator with all required services and resilience features")
     
+    def _load_local_index(self) -> Optional[LocalKnowledgeBaseIndex]:
+        """Load the local knowledge base index if it is enabled in settings.
+        
+        Returns:
+            LocalKnowledgeBaseIndex, or None if disabled or unavailable
+        """
+        kb_settings = settings.knowledge_base
+        if not kb_settings.local_index_enabled:
+            return None
+        
+        try:
+            return LocalKnowledgeBaseIndex.load_or_build(
+                kb_path=kb_settings.local_kb_path or DEFAULT_KB_PATH,
+                index_path=kb_settings.local_index_path or DEFAULT_INDEX_PATH
+            )
+        except Exception as e:
+            self.logger.warning(f"Local knowledge base index unavailable, using remote only: {e}")
+            return None
+    
     async def start(self):
         """Start the itinerary generator and resilience services."""
         await self.resilience_service.start()
         await self.error_monitor.start()
+        
+        # Warm the MBTI query cache in the background so startup is not delayed
+        if settings.knowledge_base.query_cache_prewarm:
+            self._prewarm_task = asyncio.create_task(self.nova_client.prewarm_cache())
+        
         self.logger.info("Itinerary generator and resilience services started")
     
     async def stop(self):
         """Stop the itinerary generator and resilience services."""
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
         await self.resilience_service.stop()
         await self.error_monitor.stop()
         self.logger.info("Itinerary generator and resilience services stopped")
@@ -505,10 +560,32 @@ class ItineraryGenerator:
         """
         self.logger.info("Starting restaurant assignment process")
         
-        # Track used restaurants across all meals
-        used_restaurants: Set[str] = set()
+        meal_slots = self._get_meal_slots(itinerary)
+        if self.concurrent_restaurant_assignment:
+            used_restaurants = await self._assign_restaurants_concurrently(meal_slots)
+        else:
+            used_restaurants = await self._assign_restaurants_sequentially(meal_slots)
+        
+        self.logger.info(
+            f"Completed restaurant assignment with {len(used_restaurants)} unique restaurants"
+        )
+
+    def _get_meal_slots(
+        self, itinerary: MainItinerary
+    ) -> List[Tuple[DayItinerary, str, str, str]]:
+        """List the meals to assign, in itinerary order, with their districts.
+        
+        Breakfast follows the morning district, lunch the afternoon (or morning)
+        district and dinner the night (or afternoon, or morning) district.
+        Meals without any district are left out.
         
-        # Process each day
+        Args:
+            itinerary: MainItinerary to assign restaurants to
+            
+        Returns:
+            List of (day itinerary, day name, meal type, district) tuples
+        """
+        meal_slots = []
         days = [
             (itinerary.day_1, "day_1"),
             (itinerary.day_2, "day_2"),
@@ -516,8 +593,6 @@ class ItineraryGenerator:
         ]
         
         for day_itinerary, day_name in days:
-            self.logger.debug(f"Assigning restaurants for {day_name}")
-            
             # Get districts from tourist spots for this day
             morning_district = None
             afternoon_district = None
@@ -532,56 +607,193 @@ class ItineraryGenerator:
             if day_itinerary.night_session and day_itinerary.night_session.tourist_spot:
                 night_district = day_itinerary.night_session.tourist_spot.district
             
-            # Assign breakfast (based on morning district)
-            if morning_district:
-                breakfast_restaurant = await self._assign_meal_restaurant(
-                    "breakfast", morning_district, used_restaurants
-                )
-                
-                if breakfast_restaurant:
-                    day_itinerary.breakfast = MealAssignment(
-                        meal_type="breakfast",
-                        restaurant=breakfast_restaurant,
-                        meal_time="08:30",
-                        notes=f"Breakfast near {morning_district}"
-                    )
-                    used_restaurants.add(breakfast_restaurant.id)
-            
-            # Assign lunch (based on morning or afternoon district)
-            lunch_district = afternoon_district or morning_district
-            if lunch_district:
-                lunch_restaurant = await self._assign_meal_restaurant(
-                    "lunch", lunch_district, used_restaurants
-                )
-                
-                if lunch_restaurant:
-                    day_itinerary.lunch = MealAssignment(
-                        meal_type="lunch",
-                        restaurant=lunch_restaurant,
-                        meal_time="12:30",
-                        notes=f"Lunch near {lunch_district}"
-                    )
-                    used_restaurants.add(lunch_restaurant.id)
-            
-            # Assign dinner (based on night, afternoon, or morning district)
-            dinner_district = night_district or afternoon_district or morning_district
-            if dinner_district:
-                dinner_restaurant = await self._assign_meal_restaurant(
-                    "dinner", dinner_district, used_restaurants
-                )
-                
-                if dinner_restaurant:
-                    day_itinerary.dinner = MealAssignment(
-                        meal_type="dinner",
-                        restaurant=dinner_restaurant,
-                        meal_time="19:30",
-                        notes=f"Dinner near {dinner_district}"
-                    )
-                    used_restaurants.add(dinner_restaurant.id)
+            meal_districts = [
+                ("breakfast", morning_district),
+                ("lunch", afternoon_district or morning_district),
+                ("dinner", night_district or afternoon_district or morning_district)
+            ]
+            for meal_type, district in meal_districts:
+                if district:
+                    meal_slots.append((day_itinerary, day_name, meal_type, district))
         
-        self.logger.info(
-            f"Completed restaurant assignment with {len(used_restaurants)} unique restaurants"
+        return meal_slots
+
+    def _set_meal_assignment(
+        self,
+        day_itinerary: DayItinerary,
+        meal_type: str,
+        district: str,
+        restaurant: Restaurant
+    ) -> None:
+        """Store a restaurant as the given meal of a day.
+        
+        Args:
+            day_itinerary: Day to update
+            meal_type: Type of meal (breakfast, lunch, dinner)
+            district: District the restaurant was chosen for
+            restaurant: Restaurant to assign
+        """
+        setattr(day_itinerary, meal_type, MealAssignment(
+            meal_type=meal_type,
+            restaurant=restaurant,
+            meal_time=MEAL_TIMES[meal_type],
+            notes=f"{meal_type.capitalize()} near {district}"
+        ))
+
+    async def _assign_restaurants_sequentially(
+        self, meal_slots: List[Tuple[DayItinerary, str, str, str]]
+    ) -> Set[str]:
+        """Assign meals one at a time, excluding restaurants already used.
+        
+        Args:
+            meal_slots: Meals to assign from _get_meal_slots
+            
+        Returns:
+            IDs of the restaurants assigned
+        """
+        # Track used restaurants across all meals
+        used_restaurants: Set[str] = set()
+        
+        for day_itinerary, day_name, meal_type, district in meal_slots:
+            self.logger.debug(f"Assigning {meal_type} restaurant for {day_name}")
+            restaurant = await self._assign_meal_restaurant(
+                meal_type, district, used_restaurants
+            )
+            
+            if restaurant:
+                self._set_meal_assignment(day_itinerary, meal_type, district, restaurant)
+                used_restaurants.add(restaurant.id)
+        
+        return used_restaurants
+
+    async def _assign_restaurants_concurrently(
+        self, meal_slots: List[Tuple[DayItinerary, str, str, str]]
+    ) -> Set[str]:
+        """Assign meals from candidate pools fetched in parallel.
+        
+        The search results of each distinct (district, meal type) pair are
+        fetched and ranked once, all pairs concurrently. Uniqueness is then
+        resolved locally in itinerary order without further MCP calls: each
+        meal takes the best ranked restaurant of its pool that is not used
+        yet, so a meal whose pool has no used restaurant gets the pool's
+        recommendation and the result is deterministic.
+        
+        Args:
+            meal_slots: Meals to assign from _get_meal_slots
+            
+        Returns:
+            IDs of the restaurants assigned
+        """
+        pairs = list(dict.fromkeys(
+            (district, meal_type) for _, _, meal_type, district in meal_slots
+        ))
+        candidate_pools = await asyncio.gather(
+            *(self._fetch_meal_candidates(meal_type, district) for district, meal_type in pairs)
         )
+        pools = {
+            pair: (restaurants, self._rank_meal_candidates(restaurants, recommendation_result))
+            for pair, (restaurants, recommendation_result) in zip(pairs, candidate_pools)
+        }
+        
+        used_restaurants: Set[str] = set()
+        for day_itinerary, day_name, meal_type, district in meal_slots:
+            restaurants, ranked_restaurants = pools[(district, meal_type)]
+            if not restaurants:
+                continue
+            
+            restaurant = next(
+                (r for r in ranked_restaurants if r.id not in used_restaurants),
+                None
+            )
+            if restaurant is None:
+                self.logger.warning(
+                    f"No unused {meal_type} restaurants available in {district} district"
+                )
+                # Allow duplicates if necessary, as in sequential assignment
+                restaurant = restaurants[0]
+            
+            self.logger.debug(
+                f"Selected {meal_type} restaurant for {day_name}: "
+                f"{restaurant.name} in {district}"
+            )
+            self._set_meal_assignment(day_itinerary, meal_type, district, restaurant)
+            used_restaurants.add(restaurant.id)
+        
+        return used_restaurants
+
+    async def _fetch_meal_candidates(
+        self, meal_type: str, district: str
+    ) -> Tuple[List[Restaurant], Dict[str, Any]]:
+        """Search restaurants for a meal and district and rank the whole pool.
+        
+        Args:
+            meal_type: Type of meal (breakfast, lunch, dinner)
+            district: Target district for restaurant search
+            
+        Returns:
+            Tuple of search results (empty if the search failed or found
+            nothing) and the recommendation result for all of them (empty if
+            the reasoning MCP call failed)
+        """
+        try:
+            restaurants = await self.mcp_client.search_restaurants(
+                district=district,
+                meal_type=meal_type
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to search {meal_type} restaurants in {district}: {e}"
+            )
+            return [], {}
+        
+        if not restaurants:
+            self.logger.warning(
+                f"No {meal_type} restaurants found in {district} district"
+            )
+            return [], {}
+        
+        try:
+            recommendation_result = await self.mcp_client.get_restaurant_recommendations(
+                restaurants
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to get restaurant recommendations: {e}")
+            recommendation_result = {}
+        
+        return list(restaurants), recommendation_result or {}
+
+    def _rank_meal_candidates(
+        self,
+        restaurants: List[Restaurant],
+        recommendation_result: Dict[str, Any]
+    ) -> List[Restaurant]:
+        """Order search results by a recommendation result, best first.
+        
+        The recommendation comes first, then the ranked candidates, then the
+        remaining search results in search order; without a recommendation
+        result, search order is kept.
+        
+        Args:
+            restaurants: Search results for a meal and district
+            recommendation_result: Recommendation result for all of them
+            
+        Returns:
+            The search results, ranked
+        """
+        ranked = [recommendation_result.get('recommendation')]
+        ranked.extend(recommendation_result.get('candidates') or [])
+        
+        # Rank the search results, which may be returned as dicts or Restaurants
+        by_id = {restaurant.id: restaurant for restaurant in restaurants}
+        ranked_ids = [
+            item.get('id') if isinstance(item, dict) else getattr(item, 'id', None)
+            for item in ranked if item
+        ]
+        ordered_ids = list(dict.fromkeys(
+            [restaurant_id for restaurant_id in ranked_ids if restaurant_id in by_id]
+            + list(by_id)
+        ))
+        return [by_id[restaurant_id] for restaurant_id in ordered_ids]
 
     async def _assign_meal_restaurant(
         self,
@@ -612,43 +824,9 @@ class ItineraryGenerator:
                 )
                 return None
             
-            # Filter out already used restaurants
-            available_restaurants = [
-                restaurant for restaurant in restaurants
-                if restaurant.id not in used_restaurants
-            ]
-            
-            if not available_restaurants:
-                self.logger.warning(
-                    f"No unused {meal_type} restaurants available in {district} district"
-                )
-                # Return first restaurant as fallback (allowing duplicates if necessary)
-                return restaurants[0] if restaurants else None
-            
-            # Get restaurant recommendations
-            try:
-                recommendation_result = await self.mcp_client.get_restaurant_recommendations(
-                    available_restaurants
-                )
-                
-                if recommendation_result and recommendation_result.get('recommendation'):
-                    recommended_restaurant = recommendation_result['recommendation']
-                    self.logger.debug(
-                        f"Selected recommended {meal_type} restaurant: "
-                        f"{recommended_restaurant.name} in {district}"
-                    )
-                    return recommended_restaurant
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to get restaurant recommendations: {e}")
-            
-            # Fallback to first available restaurant
-            selected_restaurant = available_restaurants[0]
-            self.logger.debug(
-                f"Selected fallback {meal_type} restaurant: "
-                f"{selected_restaurant.name} in {district}"
+            return await self._select_meal_restaurant(
+                meal_type, district, restaurants, used_restaurants
             )
-            return selected_restaurant
             
         except Exception as e:
             self.logger.error(
@@ -656,6 +834,63 @@ class ItineraryGenerator:
             )
             return None
 
+    async def _select_meal_restaurant(
+        self,
+        meal_type: str,
+        district: str,
+        restaurants: List[Restaurant],
+        used_restaurants: Set[str]
+    ) -> Restaurant:
+        """Choose a restaurant for a meal from its search results.
+        
+        Args:
+            meal_type: Type of meal (breakfast, lunch, dinner)
+            district: Target district for restaurant search
+            restaurants: Non-empty search results for the meal and district
+            used_restaurants: Set of already used restaurant IDs
+            
+        Returns:
+            The recommended unused restaurant, else the first unused one,
+            else the first search result
+        """
+        # Filter out already used restaurants
+        available_restaurants = [
+            restaurant for restaurant in restaurants
+            if restaurant.id not in used_restaurants
+        ]
+        
+        if not available_restaurants:
+            self.logger.warning(
+                f"No unused {meal_type} restaurants available in {district} district"
+            )
+            # Return first restaurant as fallback (allowing duplicates if necessary)
+            return restaurants[0]
+        
+        # Get restaurant recommendations
+        try:
+            recommendation_result = await self.mcp_client.get_restaurant_recommendations(
+                available_restaurants
+            )
+            
+            if recommendation_result and recommendation_result.get('recommendation'):
+                recommended_restaurant = recommendation_result['recommendation']
+                self.logger.debug(
+                    f"Selected recommended {meal_type} restaurant: "
+                    f"{recommended_restaurant.name} in {district}"
+                )
+                return recommended_restaurant
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to get restaurant recommendations: {e}")
+        
+        # Fallback to first available restaurant
+        selected_restaurant = available_restaurants[0]
+        self.logger.debug(
+            f"Selected fallback {meal_type} restaurant: "
+            f"{selected_restaurant.name} in {district}"
+        )
+        return selected_restaurant
+
     def _validate_mbti_format(self, mbti_personality: str) -> bool:
         """Validate MBTI personality format.
         
@@ -0,0 +1,400 @@
+"""Local Knowledge Base Index for MBTI Travel Assistant.
+
+This module implements the LocalKnowledgeBaseIndex class, an offline retrieval
+backend over the organized_kb markdown corpus that the Bedrock knowledge base is
+built from. The index combines an inverted index keyed by MBTI filename prefix
+with a BM25 term index, and is persisted as a single file that is memory-mapped
+when loaded. Its retrieve() method returns the same response shape as the
+bedrock-agent-runtime retrieve API, so NovaProKnowledgeBaseClient can use it in
+place of the remote knowledge base.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import structlog
+    logger = structlog.get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_KB_PATH = PACKAGE_ROOT / "organized_kb"
+DEFAULT_INDEX_PATH = PACKAGE_ROOT / "data" / "local_kb_index.bin"
+DEFAULT_S3_PREFIX = "s3://mbti-knowledgebase-209803798463-us-east-1/"
+
+INDEX_MAGIC = b"MBTIKBX1"
+# File layout: magic, JSON header length, JSON header, document text, postings
+FILE_HEADER = struct.Struct("<8sQ")
+# One posting: document id, term frequency
+POSTING = struct.Struct("<II")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+MBTI_PATTERN = re.compile(r"^[EI][SN][TF][JP]$")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "into", "is", "it", "of", "on", "or", "that", "the", "their", "them",
+    "they", "this", "to", "who", "with"
+})
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms with stop words removed
+    """
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOP_WORDS
+    ]
+
+
+def corpus_fingerprint(kb_path: Path) -> str:
+    """Fingerprint the markdown files under kb_path by path, size and mtime.
+
+    Args:
+        kb_path: Root of the organized knowledge base
+
+    Returns:
+        Hex digest that changes whenever a file is added, removed or modified
+    """
+    digest = hashlib.sha256()
+    for file_path in sorted(kb_path.rglob("*.md")):
+        stat = file_path.stat()
+        relative_path = file_path.relative_to(kb_path).as_posix()
+        digest.update(f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LocalKnowledgeBaseIndex:
+    """Memory-mapped BM25 index over the organized_kb tourist spot files.
+
+    Documents are addressed by the S3 URI they have in the knowledge base
+    bucket, built from s3_prefix and the path relative to the corpus root,
+    so results can be merged with remote knowledge base results.
+
+    Attributes:
+        index_path: Path of the persisted index file
+        fingerprint: Corpus fingerprint the index was built from
+        s3_prefix: Prefix used to build document S3 URIs
+        document_count: Number of indexed documents
+    """
+
+    def __init__(self, index_path: Path):
+        """Open a persisted index file.
+
+        Args:
+            index_path: Path of an index written by build()
+
+        Raises:
+            ValueError: If the file is not a valid index
+        """
+        self.index_path = Path(index_path)
+
+        with open(self.index_path, "rb") as index_file:
+            self._mmap = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < FILE_HEADER.size:
+                raise ValueError(f"Index file is truncated: {self.index_path}")
+            magic, header_length = FILE_HEADER.unpack_from(self._mmap, 0)
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"Not a local knowledge base index: {self.index_path}")
+            header_end = FILE_HEADER.size + header_length
+            header = json.loads(self._mmap[FILE_HEADER.size:header_end].decode("utf-8"))
+        except Exception:
+            self._mmap.close()
+            raise
+
+        self._buffer = memoryview(self._mmap)
+        self.fingerprint: str = header["fingerprint"]
+        self.s3_prefix: str = header["s3_prefix"]
+        self._average_length: float = header["average_length"]
+        self._content_offset: int = header["content_offset"]
+        self._postings_offset: int = header["postings_offset"]
+        # [s3_uri, content start, content length, token count] per document
+        self._documents: List[List[Any]] = header["documents"]
+        # term -> [first posting, posting count]
+        self._terms: Dict[str, List[int]] = header["terms"]
+        # MBTI filename prefix -> sorted document ids
+        self._mbti_documents: Dict[str, List[int]] = header["mbti_documents"]
+
+    @property
+    def document_count(self) -> int:
+        """Number of indexed documents."""
+        return len(self._documents)
+
+    @classmethod
+    def build(
+        cls,
+        kb_path: Path = DEFAULT_KB_PATH,
+        index_path: Path = DEFAULT_INDEX_PATH,
+        s3_prefix: str = DEFAULT_S3_PREFIX
+    ) -> "LocalKnowledgeBaseIndex":
+        """Index the corpus under kb_path and write it to index_path.
+
+        Args:
+            kb_path: Root of the organized knowledge base
+            index_path: Path to write the index file to
+            s3_prefix: Prefix used to build document S3 URIs
+
+        Returns:
+            The newly built index, opened from index_path
+
+        Raises:
+            FileNotFoundError: If kb_path does not exist
+        """
+        kb_path = Path(kb_path)
+        index_path = Path(index_path)
+        if not kb_path.is_dir():
+            raise FileNotFoundError(f"Knowledge base path not found: {kb_path}")
+
+        fingerprint = corpus_fingerprint(kb_path)
+        documents: List[List[Any]] = []
+        mbti_documents: Dict[str, List[int]] = {}
+        term_postings: Dict[str, List[Tuple[int, int]]] = {}
+        content = bytearray()
+
+        for doc_id, file_path in enumerate(sorted(kb_path.rglob("*.md"))):
+            relative_path = file_path.relative_to(kb_path).as_posix()
+            text = file_path.read_text(encoding="utf-8")
+            encoded = text.encode("utf-8")
+            tokens = tokenize(text)
+
+            documents.append([s3_prefix + relative_path, len(content), len(encoded), len(tokens)])
+            content.extend(encoded)
+
+            mbti_prefix = file_path.name.split("_", 1)[0].upper()
+            if MBTI_PATTERN.match(mbti_prefix):
+                mbti_documents.setdefault(mbti_prefix, []).append(doc_id)
+
+            for term, frequency in Counter(tokens).items():
+                term_postings.setdefault(term, []).append((doc_id, frequency))
+
+        terms: Dict[str, List[int]] = {}
+        postings = bytearray()
+        for term in sorted(term_postings):
+            terms[term] = [len(postings) // POSTING.size, len(term_postings[term])]
+            for doc_id, frequency in term_postings[term]:
+                postings.extend(POSTING.pack(doc_id, frequency))
+
+        total_length = sum(document[3] for document in documents)
+        header = {
+            "fingerprint": fingerprint,
+            "s3_prefix": s3_prefix,
+            "average_length": total_length / len(documents) if documents else 0.0,
+            "documents": documents,
+            "terms": terms,
+            "mbti_documents": mbti_documents,
+            "content_offset": 0,
+            "postings_offset": 0
+        }
+
+        # Offsets depend on the header length, which depends on the offsets;
+        # pad the placeholders to a fixed width so one pass is enough
+        header["content_offset"] = header["postings_offset"] = 10 ** 15
+        header_length = len(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+        header["content_offset"] = FILE_HEADER.size + header_length
+        header["postings_offset"] = header["content_offset"] + len(content)
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        header_bytes = header_bytes.ljust(header_length)
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as index_file:
+            index_file.write(FILE_HEADER.pack(INDEX_MAGIC, len(header_bytes)))
+            index_file.write(header_bytes)
+            index_file.write(content)
+            index_file.write(postings)
+        os.replace(temp_path, index_path)
+
+        logger.info(
+            "Local knowledge base index built",
+            index_path=str(index_path),
+            documents=len(documents),
+            terms=len(terms)
+        )
+        return cls(index_path)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        kb_path: Path = DEFAULT_KB_PATH,
+        index_path: Path = DEFAULT_INDEX_PATH,
+        s3_prefix: str = DEFAULT_S3_PREFIX
+    ) -> "LocalKnowledgeBaseIndex":
+        """Open the persisted index, rebuilding it if the corpus has changed.
+
+        Args:
+            kb_path: Root of the organized knowledge base
+            index_path: Path of the index file
+            s3_prefix: Prefix used to build document S3 URIs
+
+        Returns:
+            An index that matches the current corpus
+        """
+        index_path = Path(index_path)
+        if index_path.exists():
+            try:
+                index = cls(index_path)
+                if index.fingerprint == corpus_fingerprint(Path(kb_path)) and index.s3_prefix == s3_prefix:
+                    return index
+                index.close()
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(
+                    "Discarding unreadable local knowledge base index",
+                    index_path=str(index_path),
+                    error=str(e)
+                )
+
+        return cls.build(kb_path, index_path, s3_prefix)
+
+    def close(self) -> None:
+        """Release the memory-mapped index file."""
+        self._buffer.release()
+        self._mmap.close()
+
+    def search(
+        self,
+        query_text: str,
+        max_results: int = 10,
+        mbti_types: Optional[Set[str]] = None
+    ) -> List[Tuple[int, float]]:
+        """Rank documents against a query with BM25.
+
+        Candidates are restricted to files of the given MBTI types, or of the
+        MBTI types named in the query when mbti_types is not given.
+
+        Args:
+            query_text: Free-text query
+            max_results: Maximum number of documents to return
+            mbti_types: MBTI filename prefixes to restrict the search to
+
+        Returns:
+            (document id, score) pairs, best first, with scores in (0, 1]
+        """
+        query_terms = set(tokenize(query_text))
+        if mbti_types is None:
+            mbti_types = {term.upper() for term in query_terms if MBTI_PATTERN.match(term.upper())}
+
+        candidates: Optional[Set[int]] = None
+        if mbti_types:
+            candidates = set()
+            for mbti_type in mbti_types:
+                candidates.update(self._mbti_documents.get(mbti_type.upper(), []))
+            if not candidates:
+                return []
+
+        document_count = len(self._documents)
+        scores: Dict[int, float] = {}
+        max_score = 0.0
+
+        for term in query_terms:
+            entry = self._terms.get(term)
+            if entry is None:
+                continue
+
+            document_frequency = entry[1]
+            idf = math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            max_score += idf * (BM25_K1 + 1)
+
+            for doc_id, frequency in self._postings(term):
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                length_ratio = self._documents[doc_id][3] / self._average_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * (1 - BM25_B + BM25_B * length_ratio)
+                )
+
+        if not scores or max_score <= 0:
+            return []
+
+        # Normalise by the largest score a document could reach for this query
+        # so scores are comparable across queries, like remote relevance scores
+        top = heapq.nlargest(max_results, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [(doc_id, score / max_score) for doc_id, score in top]
+
+    def retrieve(
+        self,
+        knowledgeBaseId: Optional[str] = None,
+        retrievalQuery: Optional[Dict[str, Any]] = None,
+        retrievalConfiguration: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Search the index with bedrock-agent-runtime retrieve arguments.
+
+        Args:
+            knowledgeBaseId: Ignored, accepted for API compatibility
+            retrievalQuery: Dictionary with the query 'text'
+            retrievalConfiguration: Dictionary with
+                vectorSearchConfiguration.numberOfResults
+            **kwargs: Ignored, accepted for API compatibility
+
+        Returns:
+            Dictionary with 'retrievalResults' in the retrieve API shape
+        """
+        query_text = (retrievalQuery or {}).get('text', '')
+        max_results = (
+            (retrievalConfiguration or {})
+            .get('vectorSearchConfiguration', {})
+            .get('numberOfResults', 10)
+        )
+
+        return {
+            'retrievalResults': [
+                self._retrieval_result(doc_id, score)
+                for doc_id, score in self.search(query_text, max_results)
+            ]
+        }
+
+    def get_document_text(self, doc_id: int) -> str:
+        """Get the markdown text of an indexed document.
+
+        Args:
+            doc_id: Document id returned by search()
+
+        Returns:
+            Document text
+        """
+        _, start, length, _ = self._documents[doc_id]
+        start += self._content_offset
+        return self._buffer[start:start + length].tobytes().decode("utf-8")
+
+    def _postings(self, term: str) -> Iterator[Tuple[int, int]]:
+        """Iterate over (document id, term frequency) postings for a term."""
+        first, count = self._terms[term]
+        start = self._postings_offset + first * POSTING.size
+        return POSTING.iter_unpack(self._buffer[start:start + count * POSTING.size])
+
+    def _retrieval_result(self, doc_id: int, score: float) -> Dict[str, Any]:
+        """Build one retrieve API result for a document."""
+        s3_uri = self._documents[doc_id][0]
+        return {
+            'content': {'text': self.get_document_text(doc_id)},
+            'location': {
+                'type': 'S3',
+                's3Location': {'uri': s3_uri}
+            },
+            'score': score,
+            'metadata': {
+                'x-amz-bedrock-kb-source-uri': s3_uri
+            }
+        }
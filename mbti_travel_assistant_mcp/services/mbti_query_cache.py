@@ -0,0 +1,273 @@
+"""Tiered MBTI Query Cache for MBTI Travel Assistant.
+
+This module implements the MBTIQueryCache class used by
+NovaProKnowledgeBaseClient to keep knowledge base results per MBTI query.
+Entries live in an in-memory LRU bounded by entry count, backed by an optional
+sqlite store so results survive restarts. Each entry has a fresh period (TTL)
+followed by a stale period in which it is still served while the caller
+refreshes it; entries past the stale period are discarded.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import structlog
+    logger = structlog.get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedQuery:
+    """A cached query value and when it was stored."""
+    value: Any
+    created_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored."""
+        return time.time() - self.created_at
+
+
+class MBTIQueryCache:
+    """In-memory LRU cache with TTL, stale serving and sqlite persistence.
+
+    Values are encoded with encode() before being written to sqlite and
+    decoded with decode() when read back, so the cache itself only deals
+    with JSON-compatible data on disk.
+
+    Attributes:
+        max_entries: Maximum number of entries kept in memory and on disk
+        ttl_seconds: Seconds an entry is fresh
+        stale_ttl_seconds: Seconds after going stale that an entry is still served
+        persistence_path: Path of the sqlite store, or None for memory only
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        ttl_seconds: float = 3600,
+        stale_ttl_seconds: float = 86400,
+        persistence_path: Optional[str] = None,
+        encode: Callable[[Any], Any] = lambda value: value,
+        decode: Callable[[Any], Any] = lambda data: data
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory and on disk
+            ttl_seconds: Seconds an entry is fresh
+            stale_ttl_seconds: Seconds after going stale that an entry is still served
+            persistence_path: Path of the sqlite store, or None for memory only
+            encode: Converts a value to JSON-compatible data for the sqlite store
+            decode: Converts JSON data from the sqlite store back to a value
+
+        Raises:
+            ValueError: If max_entries is not positive or a TTL is negative
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if ttl_seconds < 0 or stale_ttl_seconds < 0:
+            raise ValueError("ttl_seconds and stale_ttl_seconds must not be negative")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.persistence_path = persistence_path
+        self._encode = encode
+        self._decode = decode
+
+        self._entries: "OrderedDict[str, CachedQuery]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats: Dict[str, int] = {
+            'hits': 0,
+            'stale_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0
+        }
+
+        self._connection: Optional[sqlite3.Connection] = None
+        if persistence_path:
+            self._open_store(persistence_path)
+
+    def _open_store(self, persistence_path: str) -> None:
+        """Open the sqlite store, creating it if needed."""
+        try:
+            Path(persistence_path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(persistence_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS query_cache ("
+                "key TEXT PRIMARY KEY, created_at REAL NOT NULL, payload TEXT NOT NULL)"
+            )
+            self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Query cache store unavailable, using memory only",
+                persistence_path=persistence_path,
+                error=str(e)
+            )
+            self._connection = None
+
+    def is_stale(self, entry: CachedQuery) -> bool:
+        """Check whether an entry is past its TTL.
+
+        Args:
+            entry: Cached entry
+
+        Returns:
+            True if the entry should be refreshed
+        """
+        return entry.age > self.ttl_seconds
+
+    def _is_expired(self, entry: CachedQuery) -> bool:
+        """Check whether an entry is past its stale period."""
+        return entry.age > self.ttl_seconds + self.stale_ttl_seconds
+
+    def get(self, key: str) -> Optional[CachedQuery]:
+        """Get an entry, loading it from the sqlite store on a memory miss.
+
+        Stale entries are returned; use is_stale() to decide whether to
+        refresh them.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CachedQuery, or None if there is no usable entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            else:
+                entry = self._load(key)
+                if entry is not None:
+                    self._stats['disk_hits'] += 1
+                    self._store_in_memory(key, entry)
+
+            if entry is None or self._is_expired(entry):
+                if entry is not None:
+                    self._delete(key)
+                self._stats['misses'] += 1
+                return None
+
+            self._stats['stale_hits' if self.is_stale(entry) else 'hits'] += 1
+            return entry
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, writing it through to the sqlite store.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        entry = CachedQuery(value=value, created_at=time.time())
+        with self._lock:
+            self._store_in_memory(key, entry)
+            self._save(key, entry)
+
+    def keys(self) -> List[str]:
+        """Keys of the entries held in memory, least recently used first."""
+        with self._lock:
+            return list(self._entries.keys())
+
+    def values(self) -> List[Any]:
+        """Values of the entries held in memory, least recently used first."""
+        with self._lock:
+            return [entry.value for entry in self._entries.values()]
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all entries from memory and the sqlite store."""
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                try:
+                    self._connection.execute("DELETE FROM query_cache")
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning("Failed to clear query cache store", error=str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry counts, hit counters and hit rate
+        """
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['stale_hits'] + self._stats['misses']
+            served = self._stats['hits'] + self._stats['stale_hits']
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'persistent': self._connection is not None,
+                'hit_rate': (served / lookups * 100) if lookups else 0.0,
+                **self._stats
+            }
+
+    def _store_in_memory(self, key: str, entry: CachedQuery) -> None:
+        """Insert an entry as most recently used, evicting the LRU entry if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _load(self, key: str) -> Optional[CachedQuery]:
+        """Read an entry from the sqlite store."""
+        if self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT created_at, payload FROM query_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            return CachedQuery(value=self._decode(json.loads(row[1])), created_at=row[0])
+        except (sqlite3.Error, ValueError, KeyError, TypeError) as e:
+            logger.warning("Failed to load query cache entry", key=key, error=str(e))
+            return None
+
+    def _save(self, key: str, entry: CachedQuery) -> None:
+        """Write an entry to the sqlite store and trim the store to max_entries."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO query_cache (key, created_at, payload) VALUES (?, ?, ?)",
+                (key, entry.created_at, json.dumps(self._encode(entry.value)))
+            )
+            self._connection.execute(
+                "DELETE FROM query_cache WHERE created_at < ? OR key NOT IN "
+                "(SELECT key FROM query_cache ORDER BY created_at DESC LIMIT ?)",
+                (time.time() - self.ttl_seconds - self.stale_ttl_seconds, self.max_entries)
+            )
+            self._connection.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Failed to persist query cache entry", key=key, error=str(e))
+
+    def _delete(self, key: str) -> None:
+        """Remove an entry from memory and the sqlite store."""
+        self._entries.pop(key, None)
+        if self._connection is not None:
+            try:
+                self._connection.execute("DELETE FROM query_cache WHERE key = ?", (key,))
+                self._connection.commit()
+            except sqlite3.Error as e:
+                logger.warning("Failed to delete query cache entry", key=key, error=str(e))
@@ -18,6 +18,7 @@ from contextlib import asynccontextmanager
 from enum import Enum
 import time
 import random
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
 from mcp.client.session import ClientSession
@@ -411,6 +412,109 @@ class MCPCircuitBreaker:
         }
 
 
+class MCPSingleFlight:
+    """
+    Single-flight coalescing for identical MCP calls.
+    
+    Concurrent calls with the same key share one in-flight call. Successful
+    results are memoized for a short time so calls arriving just after it
+    completes are served without another round trip. Failures are never
+    memoized.
+    """
+    
+    def __init__(self, name: str, memo_ttl: float = 5.0, max_memo_entries: int = 256):
+        """
+        Initialize single-flight group.
+        
+        Args:
+            name: Name of the coalesced operation for logging and metrics
+            memo_ttl: Seconds a successful result is reused, 0 to disable
+            max_memo_entries: Maximum number of memoized results
+        """
+        self.name = name
+        self.memo_ttl = memo_ttl
+        self.max_memo_entries = max_memo_entries
+        self._in_flight: Dict[Any, asyncio.Task] = {}
+        self._memo: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self.executed_calls = 0
+        self.coalesced_calls = 0
+        self.memo_hits = 0
+        self.failed_calls = 0
+    
+    async def call(self, key: Any, operation_func, *args, **kwargs) -> Any:
+        """
+        Run operation_func once for all concurrent callers with the same key.
+        
+        Args:
+            key: Hashable identity of the call
+            operation_func: Async function to execute
+            *args: Arguments for the operation function
+            **kwargs: Keyword arguments for the operation function
+            
+        Returns:
+            Result of the shared operation
+        """
+        memoized = self._memo.get(key)
+        if memoized is not None:
+            stored_at, result = memoized
+            if time.monotonic() - stored_at <= self.memo_ttl:
+                self.memo_hits += 1
+                return result
+            del self._memo[key]
+        
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced_calls += 1
+            logger.debug(f"Coalesced {self.name} call for {key}")
+        else:
+            self.executed_calls += 1
+            task = asyncio.ensure_future(operation_func(*args, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._complete(key, done))
+        
+        # Shield so a cancelled caller does not cancel the call other callers share
+        return await asyncio.shield(task)
+    
+    def _complete(self, key: Any, task: asyncio.Task) -> None:
+        """Remove a finished call from the in-flight map and memoize its result."""
+        self._in_flight.pop(key, None)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.failed_calls += 1
+            return
+        
+        if self.memo_ttl > 0:
+            now = time.monotonic()
+            self._memo[key] = (now, task.result())
+            self._memo.move_to_end(key)
+            while self._memo and (
+                len(self._memo) > self.max_memo_entries
+                or now - next(iter(self._memo.values()))[0] > self.memo_ttl
+            ):
+                self._memo.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        self._memo.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalesced versus executed call metrics."""
+        total_calls = self.executed_calls + self.coalesced_calls + self.memo_hits
+        return {
+            "executed_calls": self.executed_calls,
+            "coalesced_calls": self.coalesced_calls,
+            "memo_hits": self.memo_hits,
+            "failed_calls": self.failed_calls,
+            "in_flight": len(self._in_flight),
+            "memoized_results": len(self._memo),
+            "memo_ttl": self.memo_ttl,
+            "coalescing_rate": (
+                (self.coalesced_calls + self.memo_hits) / total_calls if total_calls else 0.0
+            )
+        }
+
+
 class MCPClientManager:
     """
     Manages MCP client connections to restaurant search and reasoning MCP servers.
@@ -453,6 +557,12 @@ class MCPClientManager:
         self._search_semaphore = asyncio.Semaphore(self.search_config.max_concurrent_calls)
         self._reasoning_semaphore = asyncio.Semaphore(self.reasoning_config.max_concurrent_calls)
         
+        # Coalesce identical concurrent searches into one MCP call
+        self._search_single_flight = MCPSingleFlight(
+            "search_restaurants",
+            memo_ttl=getattr(settings.mcp_client, 'search_memo_ttl', 5.0)
+        )
+        
         # Initialize connection pool manager with server endpoints
         self._initialize_connection_pools()
         
@@ -905,6 +1015,9 @@ class MCPClientManager:
         """
         Call search_restaurants_combined MCP tool on restaurant-search-mcp server.
         
+        Concurrent searches for the same district and meal type share one MCP
+        call, and its result is reused for a few seconds afterwards.
+        
         Args:
             district: District name for search (e.g., "Central district")
             meal_type: Meal time filter (e.g., "breakfast", "lunch", "dinner")
@@ -916,6 +1029,30 @@ class MCPClientManager:
             MCPToolCallError: If the MCP tool call fails
             MCPConnectionError: If connection to MCP server fails
         """
+        restaurants = await self._search_single_flight.call(
+            (district, meal_type),
+            self._execute_search_restaurants,
+            district,
+            meal_type
+        )
+        # Each caller gets its own list so filtering it does not affect others
+        return list(restaurants)
+    
+    async def _execute_search_restaurants(
+        self,
+        district: Optional[str],
+        meal_type: Optional[str]
+    ) -> List[Restaurant]:
+        """
+        Execute one search_restaurants_combined call with retries and circuit breaking.
+        
+        Args:
+            district: District name for search
+            meal_type: Meal time filter
+            
+        Returns:
+            List of restaurants from search MCP server
+        """
         start_time = time.time()
         
         async def _search_operation():
@@ -1103,12 +1240,7 @@ class MCPClientManager:
         
         logger.info(f"Performance optimization completed: {len(optimization_results['actions_taken'])} actions taken")
         
-        return optimization_results MCPToolCallError(
-                f"Failed to execute search_restaurants_combined",
-                "search_restaurants_combined",
-                "restaurant-search-mcp",
-                e
-            )
+        return optimization_results
     
     async def analyze_restaurants(
         self,
@@ -1652,7 +1784,8 @@ class MCPClientManager:
                     for error_type, count in self.search_stats.error_counts_by_type.items()
                 },
                 "circuit_breaker": self.search_circuit_breaker.get_state_info(),
-                "connection_pool": self.search_pool.get_pool_stats()
+                "connection_pool": self.search_pool.get_pool_stats(),
+                "single_flight": self._search_single_flight.get_stats()
             },
             "reasoning_mcp": {
                 "total_calls": self.reasoning_stats.total_calls,
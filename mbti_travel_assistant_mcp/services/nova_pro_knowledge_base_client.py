@@ -8,9 +8,11 @@ Requirements: 5.1, 5.2, 5.3
 """
 
 import asyncio
+import copy
 import json
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
@@ -35,6 +37,8 @@ except ImportError:
     class TouristSpotOperatingHours:
         pass
 
+from .mbti_query_cache import MBTIQueryCache
+
 
 logger = structlog.get_logger(__name__)
 
@@ -79,6 +83,22 @@ class FallbackConfig:
     min_results_threshold: int = 5
 
 
+@dataclass
+class ConcurrencyConfig:
+    """Configuration for concurrent knowledge base retrieval."""
+    enabled: bool = True
+    max_concurrent_queries: int = 5
+
+
+@dataclass
+class QueryCacheConfig:
+    """Configuration for the MBTI query result cache."""
+    max_entries: int = 64
+    ttl_seconds: float = 3600
+    stale_ttl_seconds: float = 86400
+    persistence_path: Optional[str] = None
+
+
 @dataclass
 class MBTITraits:
     """MBTI personality traits for query optimization."""
@@ -100,6 +120,27 @@ class QueryResult:
     s3_uri: str
     query_used: str
     strategy: QueryStrategy
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary format for JSON serialization."""
+        return {
+            'tourist_spot': self.tourist_spot.to_dict(),
+            'relevance_score': self.relevance_score,
+            's3_uri': self.s3_uri,
+            'query_used': self.query_used,
+            'strategy': self.strategy.value
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QueryResult':
+        """Create QueryResult from dictionary data."""
+        return cls(
+            tourist_spot=TouristSpot.from_dict(data['tourist_spot']),
+            relevance_score=data['relevance_score'],
+            s3_uri=data['s3_uri'],
+            query_used=data['query_used'],
+            strategy=QueryStrategy(data['strategy'])
+        )
 
 
 class NovaProKnowledgeBaseClient:
@@ -125,7 +166,10 @@ class NovaProKnowledgeBaseClient:
         region: str = "us-east-1",
         nova_pro_model_id: str = "amazon.nova-pro-v1:0",
         retry_config: Optional[RetryConfig] = None,
-        fallback_config: Optional[FallbackConfig] = None
+        fallback_config: Optional[FallbackConfig] = None,
+        concurrency_config: Optional[ConcurrencyConfig] = None,
+        local_index: Optional[Any] = None,
+        query_cache_config: Optional[QueryCacheConfig] = None
     ):
         """Initialize Nova Pro Knowledge Base Client.
         
@@ -135,6 +179,10 @@ class NovaProKnowledgeBaseClient:
             nova_pro_model_id: Nova Pro model identifier
             retry_config: Configuration for retry logic
             fallback_config: Configuration for fallback strategies
+            concurrency_config: Configuration for concurrent retrieval
+            local_index: Offline retrieval backend queried before the remote
+                knowledge base, e.g. a LocalKnowledgeBaseIndex
+            query_cache_config: Configuration for the query result cache
         """
         self.knowledge_base_id = knowledge_base_id
         self.region = region
@@ -143,6 +191,14 @@ class NovaProKnowledgeBaseClient:
         # Error handling and resilience configuration
         self.retry_config = retry_config or RetryConfig()
         self.fallback_config = fallback_config or FallbackConfig()
+        self.concurrency_config = concurrency_config or ConcurrencyConfig()
+        self.local_index = local_index
+        self.query_cache_config = query_cache_config or QueryCacheConfig()
+        
+        # The boto3 retrieve call is synchronous, so it runs on a worker thread
+        # to keep the event loop responsive. The pool is created on first use
+        # and released by close().
+        self._retrieve_executor: Optional[ThreadPoolExecutor] = None
         
         # Initialize AWS clients with error handling
         try:
@@ -165,7 +221,15 @@ class NovaProKnowledgeBaseClient:
         self._initialize_mbti_traits_map()
         
         # Query performance tracking and error metrics
-        self._query_cache: Dict[str, List[QueryResult]] = {}
+        self._query_cache = MBTIQueryCache(
+            max_entries=self.query_cache_config.max_entries,
+            ttl_seconds=self.query_cache_config.ttl_seconds,
+            stale_ttl_seconds=self.query_cache_config.stale_ttl_seconds,
+            persistence_path=self.query_cache_config.persistence_path,
+            encode=lambda results: [result.to_dict() for result in results],
+            decode=lambda data: [QueryResult.from_dict(item) for item in data]
+        )
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
         self._performance_metrics: Dict[str, Any] = {}
         self._error_metrics: Dict[str, Any] = {
             'total_errors': 0,
@@ -181,7 +245,9 @@ class NovaProKnowledgeBaseClient:
             region=region,
             model_id=nova_pro_model_id,
             retry_config=retry_config,
-            fallback_config=fallback_config
+            fallback_config=fallback_config,
+            concurrency_config=concurrency_config,
+            local_index_enabled=local_index is not None
         )
     
     def _initialize_mbti_traits_map(self) -> None:
@@ -648,14 +714,19 @@ class NovaProKnowledgeBaseClient:
         mbti_upper = mbti_personality.upper().strip()
         cache_key = f"{mbti_upper}_{max_total_results}"
         
-        # Check cache
-        if use_cache and cache_key in self._query_cache:
+        # Check cache, serving stale entries while they are refreshed
+        cached = self._query_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            stale = self._query_cache.is_stale(cached)
+            if stale:
+                self._schedule_refresh(mbti_upper, max_total_results)
             logger.info(
                 "Returning cached results for MBTI query",
                 mbti_type=mbti_upper,
-                cached_results=len(self._query_cache[cache_key])
+                cached_results=len(cached.value),
+                stale=stale
             )
-            return self._query_cache[cache_key][:max_total_results]
+            return cached.value[:max_total_results]
         
         logger.info(
             "Starting Nova Pro knowledge base query",
@@ -664,21 +735,10 @@ class NovaProKnowledgeBaseClient:
         )
         
         try:
-            # Execute main query logic with retry handling
-            all_results = await self._execute_with_retry(
-                "knowledge_base_query",
-                self._execute_main_query_logic,
-                mbti_upper,
-                max_total_results
+            all_results = await self._query_knowledge_base(
+                mbti_upper, max_total_results, update_cache=use_cache
             )
             
-            # Sort results by relevance score
-            all_results.sort(key=lambda x: x.relevance_score, reverse=True)
-            
-            # Cache results
-            if use_cache:
-                self._query_cache[cache_key] = all_results
-            
             # Update performance metrics
             execution_time = time.time() - start_time
             self._performance_metrics[mbti_upper] = {
@@ -748,6 +808,121 @@ class NovaProKnowledgeBaseClient:
                 # Re-raise the original error
                 raise primary_error
     
+    async def _query_knowledge_base(
+        self,
+        mbti_upper: str,
+        max_total_results: int,
+        update_cache: bool = True
+    ) -> List[QueryResult]:
+        """Query the knowledge base with retries and optionally cache the results.
+        
+        Args:
+            mbti_upper: MBTI personality type in uppercase
+            max_total_results: Maximum number of results to return
+            update_cache: Whether to store the results in the query cache
+            
+        Returns:
+            List of QueryResult objects sorted by relevance score
+        """
+        # Execute main query logic with retry handling
+        all_results = await self._execute_with_retry(
+            "knowledge_base_query",
+            self._execute_main_query_logic,
+            mbti_upper,
+            max_total_results
+        )
+        
+        # Sort results by relevance score
+        all_results.sort(key=lambda x: x.relevance_score, reverse=True)
+        
+        if update_cache:
+            self._query_cache.set(f"{mbti_upper}_{max_total_results}", all_results)
+        
+        return all_results
+    
+    def _schedule_refresh(self, mbti_upper: str, max_total_results: int) -> None:
+        """Refresh a stale cache entry in the background, once per key.
+        
+        Args:
+            mbti_upper: MBTI personality type in uppercase
+            max_total_results: Maximum number of results for the cache key
+        """
+        cache_key = f"{mbti_upper}_{max_total_results}"
+        if cache_key in self._refresh_tasks:
+            return
+        
+        task = asyncio.ensure_future(
+            self._refresh_cache_entry(mbti_upper, max_total_results)
+        )
+        self._refresh_tasks[cache_key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
+    
+    async def _refresh_cache_entry(self, mbti_upper: str, max_total_results: int) -> None:
+        """Re-query the knowledge base for a cache entry, keeping it on failure.
+        
+        Args:
+            mbti_upper: MBTI personality type in uppercase
+            max_total_results: Maximum number of results for the cache key
+        """
+        try:
+            results = await self._query_knowledge_base(mbti_upper, max_total_results)
+            logger.info(
+                "Refreshed cached MBTI query",
+                mbti_type=mbti_upper,
+                results_found=len(results)
+            )
+        except Exception as e:
+            logger.warning(
+                "Background cache refresh failed, keeping stale results",
+                mbti_type=mbti_upper,
+                error=str(e)
+            )
+    
+    async def prewarm_cache(
+        self,
+        mbti_types: Optional[List[str]] = None,
+        max_total_results: int = 50
+    ) -> int:
+        """Populate the query cache for MBTI types without fresh entries.
+        
+        Args:
+            mbti_types: MBTI types to warm, defaults to all 16 types
+            max_total_results: Maximum number of results per type, matching
+                the max_total_results later passed to query_mbti_tourist_spots
+            
+        Returns:
+            Number of types queried from the knowledge base
+        """
+        if mbti_types is None:
+            mbti_types = [
+                e + n + t + j
+                for e in "EI" for n in "SN" for t in "TF" for j in "JP"
+            ]
+        
+        to_query = []
+        for mbti_type in mbti_types:
+            mbti_upper = mbti_type.upper().strip()
+            cached = self._query_cache.get(f"{mbti_upper}_{max_total_results}")
+            if cached is None or self._query_cache.is_stale(cached):
+                to_query.append(mbti_upper)
+        
+        outcomes = await asyncio.gather(
+            *(self._query_knowledge_base(mbti_upper, max_total_results) for mbti_upper in to_query),
+            return_exceptions=True
+        )
+        
+        failed = [
+            mbti_upper for mbti_upper, outcome in zip(to_query, outcomes)
+            if isinstance(outcome, Exception)
+        ]
+        logger.info(
+            "Query cache pre-warmed",
+            requested_types=len(mbti_types),
+            queried_types=len(to_query),
+            failed_types=failed
+        )
+        return len(to_query)
+    
     async def _execute_main_query_logic(
         self,
         mbti_upper: str,
@@ -765,7 +940,40 @@ class NovaProKnowledgeBaseClient:
         # Build optimized queries
         query_configs = self._build_optimized_queries(mbti_upper)
         
-        all_results = []
+        if self.concurrency_config.enabled and len(query_configs) > 1:
+            all_results = await self._execute_queries_concurrently(
+                query_configs, mbti_upper, max_total_results
+            )
+        else:
+            all_results = await self._execute_queries_sequentially(
+                query_configs, mbti_upper, max_total_results
+            )
+        
+        # Check if we got sufficient results
+        if len(all_results) < self.fallback_config.min_results_threshold:
+            raise ValueError(
+                f"Insufficient results found: {len(all_results)} < {self.fallback_config.min_results_threshold}"
+            )
+        
+        return all_results
+    
+    async def _execute_queries_sequentially(
+        self,
+        query_configs: List[Dict[str, Any]],
+        mbti_upper: str,
+        max_total_results: int
+    ) -> List[QueryResult]:
+        """Execute queries one after another until enough results are found.
+        
+        Args:
+            query_configs: Query dictionaries from _build_optimized_queries
+            mbti_upper: MBTI personality type in uppercase
+            max_total_results: Maximum number of results to return
+            
+        Returns:
+            List of unique QueryResult objects
+        """
+        all_results: List[QueryResult] = []
         unique_s3_uris: Set[str] = set()
         query_count = 0
         
@@ -773,49 +981,144 @@ class NovaProKnowledgeBaseClient:
             if len(all_results) >= max_total_results:
                 break
             
-            try:
-                query_results = await self._execute_single_query(
-                    query_config['prompt'],
-                    query_config['strategy'],
-                    query_config['max_results'],
-                    mbti_upper
-                )
-                
-                # Add unique results
-                new_results = 0
-                for result in query_results:
-                    if result.s3_uri not in unique_s3_uris and len(all_results) < max_total_results:
-                        unique_s3_uris.add(result.s3_uri)
-                        all_results.append(result)
-                        new_results += 1
+            query_results = await self._execute_query_config(query_config, mbti_upper)
+            if query_results is None:
+                continue
+            
+            query_count += 1
+            self._merge_query_results(
+                query_config, query_results, query_count,
+                all_results, unique_s3_uris, max_total_results
+            )
+        
+        return all_results
+    
+    async def _execute_queries_concurrently(
+        self,
+        query_configs: List[Dict[str, Any]],
+        mbti_upper: str,
+        max_total_results: int
+    ) -> List[QueryResult]:
+        """Execute queries in parallel and merge results as they arrive.
+        
+        At most max_concurrent_queries retrieve calls are in flight at once.
+        Queries still pending once max_total_results unique spots have been
+        collected are cancelled.
+        
+        Args:
+            query_configs: Query dictionaries from _build_optimized_queries
+            mbti_upper: MBTI personality type in uppercase
+            max_total_results: Maximum number of results to return
+            
+        Returns:
+            List of unique QueryResult objects in arrival order
+        """
+        semaphore = asyncio.Semaphore(max(1, self.concurrency_config.max_concurrent_queries))
+        
+        async def run_query(query_config: Dict[str, Any]):
+            async with semaphore:
+                return query_config, await self._execute_query_config(query_config, mbti_upper)
+        
+        all_results: List[QueryResult] = []
+        unique_s3_uris: Set[str] = set()
+        query_count = 0
+        tasks = [asyncio.ensure_future(run_query(query_config)) for query_config in query_configs]
+        
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                query_config, query_results = await next_completed
+                if query_results is None:
+                    continue
                 
                 query_count += 1
-                logger.debug(
-                    "Query executed",
-                    query_num=query_count,
-                    strategy=query_config['strategy'].value,
-                    new_results=new_results,
-                    total_results=len(all_results)
+                self._merge_query_results(
+                    query_config, query_results, query_count,
+                    all_results, unique_s3_uris, max_total_results
                 )
                 
-            except Exception as e:
-                logger.warning(
-                    "Individual query execution failed",
-                    query=query_config['prompt'][:50] + "...",
-                    error=str(e)
+                if len(all_results) >= max_total_results:
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.debug(
+                    "Cancelled outstanding queries",
+                    cancelled_queries=len(pending),
+                    total_results=len(all_results)
                 )
-                # Continue with other queries instead of failing completely
-                continue
-        
-        # Check if we got sufficient results
-        if len(all_results) < self.fallback_config.min_results_threshold:
-            raise ValueError(
-                f"Insufficient results found: {len(all_results)} < {self.fallback_config.min_results_threshold}"
-            )
         
         return all_results
+    
+    async def _execute_query_config(
+        self,
+        query_config: Dict[str, Any],
+        mbti_upper: str
+    ) -> Optional[List[QueryResult]]:
+        """Execute one optimized query, logging and absorbing its failure.
         
-        return all_results[:max_total_results]
+        Args:
+            query_config: Query dictionary with strategy, prompt and max_results
+            mbti_upper: MBTI personality type in uppercase
+            
+        Returns:
+            List of QueryResult objects, or None if the query failed
+        """
+        try:
+            return await self._execute_single_query(
+                query_config['prompt'],
+                query_config['strategy'],
+                query_config['max_results'],
+                mbti_upper
+            )
+        except Exception as e:
+            logger.warning(
+                "Individual query execution failed",
+                query=query_config['prompt'][:50] + "...",
+                error=str(e)
+            )
+            # Continue with other queries instead of failing completely
+            return None
+    
+    def _merge_query_results(
+        self,
+        query_config: Dict[str, Any],
+        query_results: List[QueryResult],
+        query_num: int,
+        all_results: List[QueryResult],
+        unique_s3_uris: Set[str],
+        max_total_results: int
+    ) -> int:
+        """Add results not seen before, de-duplicated by S3 URI.
+        
+        Args:
+            query_config: Query dictionary the results came from
+            query_results: Results of that query
+            query_num: Number of queries merged so far, for logging
+            all_results: Accumulated results, extended in place
+            unique_s3_uris: S3 URIs already in all_results, updated in place
+            max_total_results: Maximum number of results to keep
+            
+        Returns:
+            Number of new results added
+        """
+        new_results = 0
+        for result in query_results:
+            if result.s3_uri not in unique_s3_uris and len(all_results) < max_total_results:
+                unique_s3_uris.add(result.s3_uri)
+                all_results.append(result)
+                new_results += 1
+        
+        logger.debug(
+            "Query executed",
+            query_num=query_num,
+            strategy=query_config['strategy'].value,
+            new_results=new_results,
+            total_results=len(all_results)
+        )
+        return new_results
     
     async def _get_fallback_results(
         self,
@@ -907,14 +1210,13 @@ class NovaProKnowledgeBaseClient:
         similar_types = self._find_similar_mbti_types(mbti_personality)
         
         for similar_type in similar_types:
-            cache_key = f"{similar_type}_{max_results}"
-            if cache_key in self._query_cache:
-                cached_results = self._query_cache[cache_key]
-                
+            cached = self._query_cache.get(f"{similar_type}_{max_results}")
+            if cached is not None:
                 # Mark as fallback results and update MBTI match
-                for result in cached_results:
+                for result in cached.value:
                     fallback_result = QueryResult(
-                        tourist_spot=result.tourist_spot,
+                        # Copy so the cached entry for similar_type is not modified
+                        tourist_spot=copy.copy(result.tourist_spot),
                         relevance_score=result.relevance_score * 0.8,  # Reduce score for fallback
                         s3_uri=result.s3_uri,
                         query_used=f"FALLBACK: {result.query_used}",
@@ -999,15 +1301,7 @@ class NovaProKnowledgeBaseClient:
         for query_text in simple_queries:
             try:
                 # Use a simpler query execution without complex processing
-                response = self.bedrock_runtime_client.retrieve(
-                    knowledgeBaseId=self.knowledge_base_id,
-                    retrievalQuery={'text': query_text},
-                    retrievalConfiguration={
-                        'vectorSearchConfiguration': {
-                            'numberOfResults': min(max_results, 10)
-                        }
-                    }
-                )
+                response = await self._retrieve(query_text, min(max_results, 10))
                 
                 retrieval_results = response.get('retrievalResults', [])
                 
@@ -1101,15 +1395,7 @@ class NovaProKnowledgeBaseClient:
             List of QueryResult objects
         """
         try:
-            response = self.bedrock_runtime_client.retrieve(
-                knowledgeBaseId=self.knowledge_base_id,
-                retrievalQuery={'text': query_prompt},
-                retrievalConfiguration={
-                    'vectorSearchConfiguration': {
-                        'numberOfResults': max_results
-                    }
-                }
-            )
+            response = await self._retrieve(query_prompt, max_results)
             
             retrieval_results = response.get('retrievalResults', [])
             query_results = []
@@ -1168,6 +1454,63 @@ class NovaProKnowledgeBaseClient:
             )
             raise
     
+    async def _retrieve(self, query_prompt: str, max_results: int) -> Dict[str, Any]:
+        """Call the knowledge base retrieve API on the retrieve executor.
+        
+        The local index, when configured, is queried first; the remote
+        knowledge base is used if it fails or finds nothing.
+        
+        Args:
+            query_prompt: Query text to search for
+            max_results: Maximum results to request
+            
+        Returns:
+            Raw retrieve API response
+        """
+        if self.local_index is not None:
+            try:
+                response = self.local_index.retrieve(
+                    knowledgeBaseId=self.knowledge_base_id,
+                    retrievalQuery={'text': query_prompt},
+                    retrievalConfiguration={
+                        'vectorSearchConfiguration': {
+                            'numberOfResults': max_results
+                        }
+                    }
+                )
+                if response.get('retrievalResults'):
+                    return response
+                logger.debug(
+                    "Local index returned no results, querying remote knowledge base",
+                    query=query_prompt[:50] + "..."
+                )
+            except Exception as e:
+                logger.warning(
+                    "Local index retrieval failed, querying remote knowledge base",
+                    query=query_prompt[:50] + "...",
+                    error=str(e)
+                )
+        
+        if self._retrieve_executor is None:
+            self._retrieve_executor = ThreadPoolExecutor(
+                max_workers=max(1, self.concurrency_config.max_concurrent_queries),
+                thread_name_prefix="kb-retrieve"
+            )
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._retrieve_executor,
+            lambda: self.bedrock_runtime_client.retrieve(
+                knowledgeBaseId=self.knowledge_base_id,
+                retrievalQuery={'text': query_prompt},
+                retrievalConfiguration={
+                    'vectorSearchConfiguration': {
+                        'numberOfResults': max_results
+                    }
+                }
+            )
+        )
+    
     def _parse_tourist_spot_from_result(
         self,
         result: Dict[str, Any],
@@ -1265,6 +1608,17 @@ class NovaProKnowledgeBaseClient:
         self._query_cache.clear()
         logger.info("Query cache cleared")
     
+    def close(self) -> None:
+        """Shut down the retrieve worker threads.
+        
+        Queued retrieve calls are cancelled and running ones finish in the
+        background. A later remote query starts a new pool.
+        """
+        executor, self._retrieve_executor = self._retrieve_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info("Knowledge base retrieve executor shut down")
+    
     async def query_tourist_spots_by_location(
         self,
         districts: Optional[List[str]] = None,
@@ -1301,15 +1655,7 @@ class NovaProKnowledgeBaseClient:
                 max_results=max_results
             )
             
-            response = self.bedrock_runtime_client.retrieve(
-                knowledgeBaseId=self.knowledge_base_id,
-                retrievalQuery={'text': query_prompt},
-                retrievalConfiguration={
-                    'vectorSearchConfiguration': {
-                        'numberOfResults': max_results
-                    }
-                }
-            )
+            response = await self._retrieve(query_prompt, max_results)
             
             retrieval_results = response.get('retrievalResults', [])
             tourist_spots = []
@@ -1425,7 +1771,9 @@ class NovaProKnowledgeBaseClient:
             'cached_queries': len(self._query_cache),
             'total_cached_results': total_cached_results,
             'cache_hit_rate': self._calculate_cache_hit_rate(),
-            'cache_size_mb': self._estimate_cache_size()
+            'cache_size_mb': self._estimate_cache_size(),
+            'refreshes_in_progress': len(self._refresh_tasks),
+            'tiered_cache': self._query_cache.get_stats()
         }
     
     def _calculate_cache_hit_rate(self) -> float:
@@ -1434,9 +1782,7 @@ class NovaProKnowledgeBaseClient:
         Returns:
             Cache hit rate as a percentage
         """
-        # This would need to be tracked during actual usage
-        # For now, return 0 as placeholder
-        return 0.0
+        return self._query_cache.get_stats()['hit_rate']
     
     def _estimate_cache_size(self) -> float:
         """Estimate cache size in MB.
@@ -1447,6 +1793,4 @@ class NovaProKnowledgeBaseClient:
         # Rough estimation based on number of cached items
         total_items = sum(len(results) for results in self._query_cache.values())
         estimated_size_mb = total_items * 0.001  # Rough estimate: 1KB per item
-        return round(estimated_size_mb, 2)otal_cached_results': sum(len(results) for results in self._query_cache.values()),
-            'cache_keys': list(self._query_cache.keys())
-        }
\ No newline at end of file
+        return round(estimated_size_mb, 2)
@@ -0,0 +1,200 @@
+"""
+Unit tests for restaurant assignment in ItineraryGenerator.
+
+services.itinerary_generator uses package-relative imports, so it is loaded
+here as part of the mbti_travel_assistant_mcp package. The services package
+is registered under both names without running its __init__ module, because
+its modules mix absolute and package-relative imports. The two imports the
+tree cannot satisfy yet are stubbed: session_assignment_logic does not
+compile and mbti_request_response_models has no ItineraryMetadata.
+Restaurant assignment uses neither.
+"""
+
+import asyncio
+import importlib
+import sys
+import types
+from pathlib import Path
+from unittest.mock import DEFAULT, AsyncMock, Mock, patch
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = PROJECT_ROOT.name
+
+
+def _register_package(name: str, path: Path) -> None:
+    """Register a package by path without executing its __init__ module."""
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
+
+
+def _load_itinerary_generator() -> types.ModuleType:
+    """Import services.itinerary_generator with the broken imports stubbed."""
+    if str(PROJECT_ROOT.parent) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT.parent))
+    _register_package(PACKAGE, PROJECT_ROOT)
+    for subpackage in ("config", "models", "services"):
+        _register_package(f"{PACKAGE}.{subpackage}", PROJECT_ROOT / subpackage)
+    _register_package("services", PROJECT_ROOT / "services")
+
+    try:
+        importlib.import_module(f"{PACKAGE}.services.session_assignment_logic")
+    except SyntaxError:
+        session_assignment_logic = types.ModuleType(f"{PACKAGE}.services.session_assignment_logic")
+        session_assignment_logic.SessionAssignmentLogic = Mock
+        session_assignment_logic.AssignmentResult = Mock
+        sys.modules[session_assignment_logic.__name__] = session_assignment_logic
+
+    models = importlib.import_module(f"{PACKAGE}.models.mbti_request_response_models")
+    if not hasattr(models, "ItineraryMetadata"):
+        models.ItineraryMetadata = Mock
+
+    return importlib.import_module(f"{PACKAGE}.services.itinerary_generator")
+
+
+itinerary_module = _load_itinerary_generator()
+
+MEALS = ("breakfast", "lunch", "dinner")
+
+
+@pytest.fixture
+def itinerary_generator():
+    """Create an ItineraryGenerator with mocked services."""
+    with patch.multiple(
+        itinerary_module,
+        NovaProKnowledgeBaseClient=DEFAULT,
+        SessionAssignmentLogic=DEFAULT,
+        MCPClientManager=DEFAULT,
+        AssignmentValidator=DEFAULT,
+        ErrorHandler=DEFAULT
+    ):
+        yield itinerary_module.ItineraryGenerator()
+
+
+def make_itinerary(districts):
+    """Create an itinerary whose sessions are in the given districts per day."""
+    days = []
+    for day_number, (morning, afternoon, night) in enumerate(districts, start=1):
+        days.append(itinerary_module.DayItinerary(
+            day_number=day_number,
+            morning_session=itinerary_module.SessionAssignment("morning", Mock(district=morning)),
+            afternoon_session=itinerary_module.SessionAssignment("afternoon", Mock(district=afternoon)),
+            night_session=itinerary_module.SessionAssignment("night", Mock(district=night))
+        ))
+    return itinerary_module.MainItinerary("INFJ", *days)
+
+
+def make_restaurants(*restaurant_ids):
+    """Create restaurant stand-ins with the given IDs."""
+    restaurants = []
+    for restaurant_id in restaurant_ids:
+        restaurant = Mock(id=restaurant_id)
+        restaurant.name = restaurant_id
+        restaurants.append(restaurant)
+    return restaurants
+
+
+def recommend_last(restaurants):
+    """Recommendation stand-in that prefers the last restaurant given."""
+    return {
+        'recommendation': restaurants[-1],
+        'candidates': list(reversed(restaurants))
+    }
+
+
+def assigned_ids(itinerary):
+    """List the assigned restaurant IDs in itinerary order."""
+    return [
+        getattr(day, meal).restaurant.id
+        for day in (itinerary.day_1, itinerary.day_2, itinerary.day_3)
+        for meal in MEALS
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_assignment_fetches_pools_in_parallel(itinerary_generator):
+    """Test that each (district, meal) pool is fetched and ranked once, all overlapping."""
+    itinerary = make_itinerary([("Central", "Central", "Wan Chai")] * 3)
+
+    async def search_restaurants(district, meal_type):
+        await asyncio.sleep(0.1)
+        return make_restaurants(*(f"{district}_{meal_type}_{i}" for i in range(5)))
+
+    mcp_client = itinerary_generator.mcp_client
+    mcp_client.search_restaurants = AsyncMock(side_effect=search_restaurants)
+    mcp_client.get_restaurant_recommendations = AsyncMock(side_effect=recommend_last)
+
+    start = asyncio.get_event_loop().time()
+    await itinerary_generator._assign_restaurants_to_itinerary(itinerary)
+    elapsed = asyncio.get_event_loop().time() - start
+
+    assert mcp_client.search_restaurants.await_count == 3
+    assert mcp_client.get_restaurant_recommendations.await_count == 3
+    assert elapsed < 0.25
+    assert len(set(assigned_ids(itinerary))) == 9
+    assert [day.breakfast.restaurant.id for day in (itinerary.day_1, itinerary.day_2, itinerary.day_3)] == [
+        "Central_breakfast_4", "Central_breakfast_3", "Central_breakfast_2"
+    ]
+    assert itinerary.day_1.dinner.notes == "Dinner near Wan Chai"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_assignment_resolves_overlapping_pools_locally(itinerary_generator):
+    """Test that overlapping pools take the best unused restaurant without further MCP calls."""
+    pools = {
+        "Central": make_restaurants("c1", "shared1", "c2", "shared2", "c3"),
+        "Wan Chai": make_restaurants("shared1", "w1", "shared2", "w2")
+    }
+    mcp_client = itinerary_generator.mcp_client
+    mcp_client.search_restaurants = AsyncMock(side_effect=lambda district, meal_type: pools[district])
+    mcp_client.get_restaurant_recommendations = AsyncMock(side_effect=recommend_last)
+
+    results = []
+    for _ in range(2):
+        itinerary = make_itinerary([
+            ("Central", "Central", "Wan Chai"),
+            ("Wan Chai", "Central", "Central"),
+            ("Central", "Central", "Wan Chai")
+        ])
+        await itinerary_generator._assign_restaurants_to_itinerary(itinerary)
+        results.append(assigned_ids(itinerary))
+
+    # One ranking per distinct (district, meal) pair and run
+    assert mcp_client.get_restaurant_recommendations.await_count == 10
+    # Exhausted pools fall back to their first search result
+    assert results[0] == ["c3", "shared2", "w2", "w1", "c2", "shared1", "c1", "c1", "shared1"]
+    assert results[1] == results[0]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_assignment_reuses_restaurant_when_pool_exhausted(itinerary_generator):
+    """Test that a meal falls back to a used restaurant when its pool is exhausted."""
+    itinerary = make_itinerary([("Central", "Central", "Central")] * 3)
+    itinerary_generator.mcp_client.search_restaurants = AsyncMock(
+        return_value=make_restaurants("shared")
+    )
+    itinerary_generator.mcp_client.get_restaurant_recommendations = AsyncMock(
+        side_effect=Exception("reasoning unavailable")
+    )
+
+    await itinerary_generator._assign_restaurants_to_itinerary(itinerary)
+
+    assert assigned_ids(itinerary) == ["shared"] * 9
+
+
+@pytest.mark.asyncio
+async def test_sequential_assignment_mode(itinerary_generator):
+    """Test that disabling concurrency assigns meals one at a time."""
+    itinerary_generator.concurrent_restaurant_assignment = False
+    itinerary = make_itinerary([("Central", "Central", "Central")] * 3)
+    restaurants = make_restaurants(*(f"r{i}" for i in range(9)))
+    itinerary_generator._assign_meal_restaurant = AsyncMock(side_effect=restaurants)
+
+    await itinerary_generator._assign_restaurants_to_itinerary(itinerary)
+
+    assert itinerary_generator._assign_meal_restaurant.await_count == 9
+    assert itinerary.day_3.dinner.restaurant.id == "r8"
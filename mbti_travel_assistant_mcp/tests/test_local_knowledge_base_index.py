@@ -0,0 +1,196 @@
+"""
+Tests for the local knowledge base index.
+
+Covers building and reloading the memory-mapped index over a small
+organized_kb style corpus, BM25 retrieval in the retrieve API shape, MBTI
+prefix filtering, and NovaProKnowledgeBaseClient falling back to the remote
+knowledge base when the local index finds nothing.
+"""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.local_knowledge_base_index import (
+    DEFAULT_KB_PATH,
+    LocalKnowledgeBaseIndex
+)
+from services.nova_pro_knowledge_base_client import (
+    NovaProKnowledgeBaseClient,
+    QueryStrategy,
+    RetryConfig
+)
+
+
+S3_PREFIX = "s3://test-bucket/"
+
+SPOTS = {
+    "kowloon/tsim_sha_tsui/INFJ_Hong_Kong_Museum_of_Art.md": ("Hong Kong Museum of Art", "INFJ", "Museum, Art, Quiet"),
+    "kowloon/tsim_sha_tsui/ENFP_Avenue_of_Stars.md": ("Avenue of Stars", "ENFP", "Harbour, Promenade, Lively"),
+    "hong_kong_island/central_district/INFJ_Tai_Kwun.md": ("Tai Kwun", "INFJ", "Heritage, Art, Courtyard"),
+    "hong_kong_island/central_district/ENFP_Lan_Kwai_Fong.md": ("Lan Kwai Fong", "ENFP", "Nightlife, Bars, Lively"),
+}
+
+
+def write_spot(kb_path: Path, relative_path: str, name: str, mbti: str, keywords: str) -> None:
+    """Write one tourist spot file in the organized_kb format."""
+    file_path = kb_path / relative_path
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(
+        f"# {name}\n\n"
+        f"## MBTI Personality Match\n**Type:** {mbti}\n\n"
+        f"## Location Information\n**District:** {relative_path.split('/')[1].replace('_', ' ').title()}\n\n"
+        f"## Keywords\nMBTI: {mbti}, Hong Kong, Tourist Attraction, {keywords}\n",
+        encoding="utf-8"
+    )
+
+
+@pytest.fixture
+def kb_path(tmp_path):
+    """Create a small organized_kb corpus."""
+    root = tmp_path / "organized_kb"
+    for relative_path, (name, mbti, keywords) in SPOTS.items():
+        write_spot(root, relative_path, name, mbti, keywords)
+    return root
+
+
+@pytest.fixture
+def index(kb_path, tmp_path):
+    """Build an index over the small corpus."""
+    local_index = LocalKnowledgeBaseIndex.build(kb_path, tmp_path / "index.bin", S3_PREFIX)
+    yield local_index
+    local_index.close()
+
+
+def retrieve(local_index: LocalKnowledgeBaseIndex, text: str, max_results: int = 10):
+    """Call retrieve with bedrock-agent-runtime style arguments."""
+    return local_index.retrieve(
+        knowledgeBaseId="RCWW86CLM9",
+        retrievalQuery={'text': text},
+        retrievalConfiguration={'vectorSearchConfiguration': {'numberOfResults': max_results}}
+    )
+
+
+class TestLocalKnowledgeBaseIndex:
+    """Test cases for LocalKnowledgeBaseIndex."""
+
+    def test_retrieve_result_shape(self, index):
+        """Test that results match the retrieve API response shape."""
+        results = retrieve(index, "art museum")['retrievalResults']
+
+        assert results
+        first = results[0]
+        assert first['location']['s3Location']['uri'] == (
+            S3_PREFIX + "kowloon/tsim_sha_tsui/INFJ_Hong_Kong_Museum_of_Art.md"
+        )
+        assert first['content']['text'].startswith("# Hong Kong Museum of Art")
+        assert 0 < first['score'] <= 1
+
+    def test_mbti_in_query_restricts_candidates(self, index):
+        """Test that naming an MBTI type only returns that type's files."""
+        results = retrieve(index, "lively art attractions for INFJ personality")['retrievalResults']
+        filenames = [result['location']['s3Location']['uri'].split('/')[-1] for result in results]
+
+        assert filenames
+        assert all(filename.startswith("INFJ_") for filename in filenames)
+
+    def test_number_of_results_limit(self, index):
+        """Test that numberOfResults caps the result count."""
+        assert len(retrieve(index, "Hong Kong tourist attraction", max_results=2)['retrievalResults']) == 2
+
+    def test_unknown_terms_return_nothing(self, index):
+        """Test that a query with no indexed terms returns no results."""
+        assert retrieve(index, "zzzz qqqq")['retrievalResults'] == []
+
+    def test_load_or_build_reuses_persisted_index(self, kb_path, tmp_path, index):
+        """Test that an up-to-date index file is opened instead of rebuilt."""
+        with patch.object(LocalKnowledgeBaseIndex, 'build') as build:
+            reopened = LocalKnowledgeBaseIndex.load_or_build(kb_path, tmp_path / "index.bin", S3_PREFIX)
+
+        build.assert_not_called()
+        assert reopened.document_count == len(SPOTS)
+        reopened.close()
+
+    def test_load_or_build_rebuilds_after_corpus_change(self, kb_path, tmp_path, index):
+        """Test that adding a file to the corpus triggers a rebuild."""
+        write_spot(kb_path, "kowloon/mong_kok/ENFP_Ladies_Market.md", "Ladies' Market", "ENFP", "Market, Shopping")
+
+        rebuilt = LocalKnowledgeBaseIndex.load_or_build(kb_path, tmp_path / "index.bin", S3_PREFIX)
+
+        assert rebuilt.document_count == len(SPOTS) + 1
+        rebuilt.close()
+
+    def test_load_or_build_replaces_corrupt_file(self, kb_path, tmp_path):
+        """Test that an unreadable index file is rebuilt."""
+        index_path = tmp_path / "index.bin"
+        index_path.write_bytes(b"not an index")
+
+        rebuilt = LocalKnowledgeBaseIndex.load_or_build(kb_path, index_path, S3_PREFIX)
+
+        assert rebuilt.document_count == len(SPOTS)
+        rebuilt.close()
+
+    @pytest.mark.skipif(not DEFAULT_KB_PATH.is_dir(), reason="organized_kb corpus not available")
+    def test_bundled_corpus(self, tmp_path):
+        """Test indexing the bundled organized_kb corpus."""
+        bundled = LocalKnowledgeBaseIndex.build(DEFAULT_KB_PATH, tmp_path / "bundled.bin")
+
+        results = retrieve(bundled, "Hong Kong museum attractions for INFJ personality type", 5)['retrievalResults']
+
+        assert bundled.document_count == len(list(DEFAULT_KB_PATH.rglob("*.md")))
+        assert len(results) == 5
+        assert all(
+            result['location']['s3Location']['uri'].split('/')[-1].startswith("INFJ_")
+            for result in results
+        )
+        bundled.close()
+
+
+class TestClientLocalIndex:
+    """Test cases for NovaProKnowledgeBaseClient with a local index."""
+
+    def make_client(self, local_index) -> NovaProKnowledgeBaseClient:
+        """Create a client with a mocked remote knowledge base."""
+        with patch('services.nova_pro_knowledge_base_client.boto3'):
+            client = NovaProKnowledgeBaseClient(
+                retry_config=RetryConfig(max_retries=0),
+                local_index=local_index
+            )
+        client.bedrock_runtime_client.retrieve = Mock(return_value={'retrievalResults': []})
+        return client
+
+    @pytest.mark.asyncio
+    async def test_local_index_answers_without_remote_call(self, index):
+        """Test that local results are used without calling the remote KB."""
+        client = self.make_client(index)
+
+        results = await client._execute_single_query_impl(
+            "art attractions for INFJ personality", QueryStrategy.BROAD_PERSONALITY, 10, "INFJ"
+        )
+
+        assert {result.s3_uri.split('/')[-1] for result in results} == {
+            "INFJ_Hong_Kong_Museum_of_Art.md", "INFJ_Tai_Kwun.md"
+        }
+        client.bedrock_runtime_client.retrieve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_remote_when_local_finds_nothing(self, index):
+        """Test that the remote KB is queried when the local index has no match."""
+        client = self.make_client(index)
+
+        await client._retrieve("zzzz qqqq", 10)
+
+        client.bedrock_runtime_client.retrieve.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_remote_when_local_fails(self):
+        """Test that a failing local index does not fail the query."""
+        local_index = Mock()
+        local_index.retrieve.side_effect = OSError("index file missing")
+        client = self.make_client(local_index)
+
+        response = await client._retrieve("art attractions", 10)
+
+        assert response == {'retrievalResults': []}
+        client.bedrock_runtime_client.retrieve.assert_called_once()
@@ -0,0 +1,176 @@
+"""
+Tests for the tiered MBTI query cache.
+
+Covers LRU eviction, fresh/stale/expired entries and sqlite persistence of
+MBTIQueryCache, and stale-while-revalidate and pre-warming in
+NovaProKnowledgeBaseClient.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from services.mbti_query_cache import MBTIQueryCache
+from services.nova_pro_knowledge_base_client import (
+    NovaProKnowledgeBaseClient,
+    QueryCacheConfig,
+    QueryResult,
+    QueryStrategy,
+    RetryConfig
+)
+
+
+class TestMBTIQueryCache:
+    """Test cases for MBTIQueryCache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = MBTIQueryCache(max_entries=2)
+        cache.set("INFJ_50", [1])
+        cache.set("ENFP_50", [2])
+        cache.get("INFJ_50")
+        cache.set("INTJ_50", [3])
+
+        assert cache.keys() == ["INFJ_50", "INTJ_50"]
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_fresh_stale_and_expired_entries(self):
+        """Test that entries go stale after the TTL and expire after the stale period."""
+        cache = MBTIQueryCache(ttl_seconds=10, stale_ttl_seconds=20)
+        cache.set("INFJ_50", [1])
+
+        with patch('services.mbti_query_cache.time.time', return_value=cache.get("INFJ_50").created_at + 5):
+            assert not cache.is_stale(cache.get("INFJ_50"))
+        with patch('services.mbti_query_cache.time.time', return_value=cache.get("INFJ_50").created_at + 15):
+            entry = cache.get("INFJ_50")
+            assert entry.value == [1]
+            assert cache.is_stale(entry)
+        with patch('services.mbti_query_cache.time.time', return_value=cache.get("INFJ_50").created_at + 31):
+            assert cache.get("INFJ_50") is None
+
+        assert "INFJ_50" not in cache
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries written to sqlite are loaded by a new cache."""
+        path = str(tmp_path / "query_cache.sqlite")
+        encode = Mock(side_effect=lambda value: {'items': value})
+        decode = Mock(side_effect=lambda data: data['items'])
+
+        MBTIQueryCache(persistence_path=path, encode=encode, decode=decode).set("INFJ_50", [1, 2])
+        restarted = MBTIQueryCache(persistence_path=path, encode=encode, decode=decode)
+
+        assert restarted.get("INFJ_50").value == [1, 2]
+        assert restarted.get_stats()['disk_hits'] == 1
+        decode.assert_called_once_with({'items': [1, 2]})
+
+    def test_store_trimmed_to_max_entries(self, tmp_path):
+        """Test that the sqlite store keeps at most max_entries rows."""
+        path = str(tmp_path / "query_cache.sqlite")
+        cache = MBTIQueryCache(max_entries=2, persistence_path=path)
+        for key in ("INFJ_50", "ENFP_50", "INTJ_50"):
+            cache.set(key, [key])
+
+        restarted = MBTIQueryCache(max_entries=2, persistence_path=path)
+
+        assert restarted.get("INFJ_50") is None
+        assert restarted.get("INTJ_50").value == ["INTJ_50"]
+
+    def test_clear_removes_persisted_entries(self, tmp_path):
+        """Test that clear() empties memory and the sqlite store."""
+        path = str(tmp_path / "query_cache.sqlite")
+        cache = MBTIQueryCache(persistence_path=path)
+        cache.set("INFJ_50", [1])
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert MBTIQueryCache(persistence_path=path).get("INFJ_50") is None
+
+    def test_invalid_configuration(self):
+        """Test that invalid sizes and TTLs are rejected."""
+        with pytest.raises(ValueError):
+            MBTIQueryCache(max_entries=0)
+        with pytest.raises(ValueError):
+            MBTIQueryCache(ttl_seconds=-1)
+
+
+def make_results(mbti_type: str, count: int = 6):
+    """Create query results for an MBTI type."""
+    return [
+        QueryResult(
+            tourist_spot=Mock(),
+            relevance_score=0.5,
+            s3_uri=f"s3://kb/{mbti_type}_{i}.md",
+            query_used="test",
+            strategy=QueryStrategy.BROAD_PERSONALITY
+        )
+        for i in range(count)
+    ]
+
+
+def make_client(**cache_config) -> NovaProKnowledgeBaseClient:
+    """Create a client whose main query logic is mocked."""
+    with patch('services.nova_pro_knowledge_base_client.boto3'):
+        client = NovaProKnowledgeBaseClient(
+            retry_config=RetryConfig(max_retries=0),
+            query_cache_config=QueryCacheConfig(**cache_config)
+        )
+    client._execute_main_query_logic = AsyncMock(
+        side_effect=lambda mbti_type, max_results: make_results(mbti_type)
+    )
+    return client
+
+
+class TestClientQueryCache:
+    """Test cases for the query cache in NovaProKnowledgeBaseClient."""
+
+    @pytest.mark.asyncio
+    async def test_cached_query_skips_knowledge_base(self):
+        """Test that a repeated query is served from the cache."""
+        client = make_client()
+
+        await client.query_mbti_tourist_spots("INFJ")
+        await client.query_mbti_tourist_spots("infj")
+
+        assert client._execute_main_query_logic.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self):
+        """Test that a stale entry is returned at once and refreshed in the background."""
+        client = make_client(ttl_seconds=0)
+        first = await client.query_mbti_tourist_spots("INFJ")
+        await asyncio.sleep(0.01)
+
+        second = await client.query_mbti_tourist_spots("INFJ")
+
+        assert second == first
+        assert "INFJ_50" in client._refresh_tasks
+        await asyncio.gather(*client._refresh_tasks.values())
+        assert client._execute_main_query_logic.await_count == 2
+        assert not client._refresh_tasks
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_entry(self):
+        """Test that a failing refresh leaves the stale results in place."""
+        client = make_client(ttl_seconds=0)
+        first = await client.query_mbti_tourist_spots("INFJ")
+        client._execute_main_query_logic.side_effect = RuntimeError("KB unavailable")
+        await asyncio.sleep(0.01)
+
+        await client.query_mbti_tourist_spots("INFJ")
+        await asyncio.gather(*client._refresh_tasks.values())
+
+        assert client._query_cache.get("INFJ_50").value == first
+
+    @pytest.mark.asyncio
+    async def test_prewarm_queries_all_types_once(self):
+        """Test that pre-warming covers all 16 types and skips fresh entries."""
+        client = make_client()
+
+        assert await client.prewarm_cache() == 16
+        assert await client.prewarm_cache() == 0
+        await client.query_mbti_tourist_spots("ESTP")
+
+        assert client._execute_main_query_logic.await_count == 16
+        assert len(client._query_cache) == 16
@@ -8,6 +8,7 @@ connection management, retry logic, and MCP tool calls.
 import pytest
 import asyncio
 import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
@@ -16,7 +17,8 @@ from services.mcp_client_manager import (
     MCPConnectionError,
     MCPToolCallError,
     MCPConnectionConfig,
-    MCPConnectionStats
+    MCPConnectionStats,
+    MCPSingleFlight
 )
 from models.restaurant_models import Restaurant, Sentiment
 
@@ -32,6 +34,9 @@ class TestMCPClientManager:
             mock_settings.mcp_client.reasoning_mcp_endpoint = "http://test-reasoning-mcp:8000"
             mock_settings.mcp_client.mcp_connection_timeout = 30
             mock_settings.mcp_client.mcp_retry_attempts = 3
+            mock_settings.mcp_client.connection_pool_size = 10
+            mock_settings.mcp_client.max_concurrent_calls = 5
+            mock_settings.mcp_client.search_memo_ttl = 5.0
             
             return MCPClientManager()
     
@@ -291,6 +296,85 @@ class TestMCPClientManager:
         assert stats["search_mcp"]["success_rate"] == 0.8
         assert stats["search_mcp"]["average_response_time"] == 1.5
 
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_are_coalesced(self, mcp_manager):
+        """Test that identical concurrent searches share one MCP call"""
+        async def execute_search(district, meal_type):
+            await asyncio.sleep(0.05)
+            return [MagicMock(id=f"{district}_{meal_type}")]
+        
+        with patch.object(
+            mcp_manager, '_execute_search_restaurants', side_effect=execute_search
+        ) as mock_execute:
+            results = await asyncio.gather(
+                *[mcp_manager.search_restaurants("Central district", "lunch") for _ in range(4)],
+                mcp_manager.search_restaurants("Central district", "dinner")
+            )
+            
+            assert mock_execute.call_count == 2
+            assert results[0] == results[3]
+            assert results[0] is not results[3]
+            
+            stats = mcp_manager.get_connection_stats()["search_mcp"]["single_flight"]
+            assert stats["executed_calls"] == 2
+            assert stats["coalesced_calls"] == 3
+
+
+class TestMCPSingleFlight:
+    """Test cases for MCP single-flight coalescing"""
+    
+    @pytest.mark.asyncio
+    async def test_memoized_result_reused_until_ttl(self):
+        """Test that a finished call is reused within the memo TTL"""
+        single_flight = MCPSingleFlight("search", memo_ttl=5.0)
+        operation = AsyncMock(return_value=["result"])
+        
+        await single_flight.call("key", operation)
+        assert await single_flight.call("key", operation) == ["result"]
+        
+        with patch('services.mcp_client_manager.time.monotonic', return_value=time.monotonic() + 10):
+            await single_flight.call("key", operation)
+        
+        assert operation.await_count == 2
+        assert single_flight.get_stats()["memo_hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_memoized(self):
+        """Test that all waiters see a failure and the next call retries"""
+        single_flight = MCPSingleFlight("search")
+        
+        async def failing_operation():
+            await asyncio.sleep(0.01)
+            raise MCPToolCallError("boom", "search_restaurants_combined", "restaurant-search-mcp")
+        
+        results = await asyncio.gather(
+            single_flight.call("key", failing_operation),
+            single_flight.call("key", failing_operation),
+            return_exceptions=True
+        )
+        operation = AsyncMock(return_value=["recovered"])
+        
+        assert all(isinstance(result, MCPToolCallError) for result in results)
+        assert await single_flight.call("key", operation) == ["recovered"]
+        assert single_flight.get_stats()["failed_calls"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test that cancelling one waiter leaves the call running for others"""
+        single_flight = MCPSingleFlight("search")
+        
+        async def slow_operation():
+            await asyncio.sleep(0.05)
+            return ["result"]
+        
+        first = asyncio.ensure_future(single_flight.call("key", slow_operation))
+        second = asyncio.ensure_future(single_flight.call("key", slow_operation))
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        assert await second == ["result"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
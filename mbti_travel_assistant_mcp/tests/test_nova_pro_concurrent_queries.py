@@ -0,0 +1,159 @@
+"""
+Tests for concurrent knowledge base retrieval in NovaProKnowledgeBaseClient.
+
+The Bedrock retrieve call is replaced by a blocking stub that sleeps for a
+fixed time per query, so the tests check that the optimized queries run in
+parallel, that results are de-duplicated by S3 URI and that outstanding
+queries are cancelled once enough results have been collected.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.nova_pro_knowledge_base_client import (
+    ConcurrencyConfig,
+    NovaProKnowledgeBaseClient,
+    RetryConfig
+)
+
+
+QUERY_DELAY_SECONDS = 0.2
+
+
+class RetrieveStub:
+    """Blocking stand-in for bedrock-agent-runtime retrieve."""
+
+    def __init__(self, spots_per_query: int = 3, shared_spots: int = 1, delay: float = QUERY_DELAY_SECONDS):
+        self.spots_per_query = spots_per_query
+        self.shared_spots = shared_spots
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, knowledgeBaseId, retrievalQuery, retrievalConfiguration):
+        with self._lock:
+            self.calls += 1
+            query_num = self.calls
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        # The first shared_spots files are returned by every query
+        names = [f"shared_{i}" for i in range(self.shared_spots)]
+        names += [f"q{query_num}_{i}" for i in range(self.spots_per_query - self.shared_spots)]
+        return {
+            'retrievalResults': [
+                {
+                    'content': {'text': f"# Spot {name}\n**District:** Central"},
+                    'location': {'s3Location': {'uri': f"s3://kb/INFJ_{name}.md"}},
+                    'score': 0.5
+                }
+                for name in names
+            ]
+        }
+
+
+def make_client(stub: RetrieveStub, **concurrency) -> NovaProKnowledgeBaseClient:
+    """Create a client whose retrieve calls go to the stub."""
+    with patch('services.nova_pro_knowledge_base_client.boto3'):
+        client = NovaProKnowledgeBaseClient(
+            retry_config=RetryConfig(max_retries=0),
+            concurrency_config=ConcurrencyConfig(**concurrency)
+        )
+    client.bedrock_runtime_client.retrieve = stub
+    return client
+
+
+class TestConcurrentQueries:
+    """Test cases for the concurrent query execution mode."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_close_to_slowest_query(self):
+        """Test that queries overlap instead of running back to back."""
+        stub = RetrieveStub()
+        client = make_client(stub, max_concurrent_queries=10)
+        query_count = len(client._build_optimized_queries("INFJ"))
+
+        start = time.perf_counter()
+        results = await client.query_mbti_tourist_spots("INFJ", use_cache=False)
+        elapsed = time.perf_counter() - start
+
+        assert stub.calls == query_count
+        assert elapsed < QUERY_DELAY_SECONDS * 3
+        assert len(results) == 1 + query_count * 2
+
+    @pytest.mark.asyncio
+    async def test_results_deduplicated_by_s3_uri(self):
+        """Test that spots returned by several queries appear once."""
+        client = make_client(RetrieveStub(), max_concurrent_queries=4)
+
+        results = await client.query_mbti_tourist_spots("INFJ", use_cache=False)
+        s3_uris = [result.s3_uri for result in results]
+
+        assert len(s3_uris) == len(set(s3_uris))
+        assert "s3://kb/INFJ_shared_0.md" in s3_uris
+
+    @pytest.mark.asyncio
+    async def test_in_flight_queries_bounded(self):
+        """Test that no more than max_concurrent_queries retrieve calls overlap."""
+        stub = RetrieveStub(delay=0.05)
+        client = make_client(stub, max_concurrent_queries=2)
+
+        await client.query_mbti_tourist_spots("INFJ", use_cache=False)
+
+        assert stub.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_outstanding_queries_cancelled_at_limit(self):
+        """Test that queued queries are not started once max_total_results is reached."""
+        stub = RetrieveStub(spots_per_query=10, shared_spots=0)
+        client = make_client(stub, max_concurrent_queries=2)
+        query_count = len(client._build_optimized_queries("INFJ"))
+
+        results = await client.query_mbti_tourist_spots("INFJ", use_cache=False, max_total_results=10)
+        calls_at_return = stub.calls
+        time.sleep(QUERY_DELAY_SECONDS * 2)
+
+        assert len(results) == 10
+        assert calls_at_return <= 4 < query_count
+        assert stub.calls == calls_at_return
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_matches_concurrent_results(self):
+        """Test that disabling concurrency returns the same unique spots."""
+        sequential = make_client(RetrieveStub(delay=0.01), enabled=False)
+        concurrent = make_client(RetrieveStub(delay=0.01))
+
+        sequential_results = await sequential.query_mbti_tourist_spots("INFJ", use_cache=False)
+        concurrent_results = await concurrent.query_mbti_tourist_spots("INFJ", use_cache=False)
+
+        assert len(sequential_results) == len(concurrent_results)
+
+    @pytest.mark.asyncio
+    async def test_close_releases_retrieve_threads(self):
+        """Test that close() stops the worker threads and a later query starts new ones."""
+        stub = RetrieveStub(delay=0.01)
+        client = make_client(stub, max_concurrent_queries=3)
+        assert client._retrieve_executor is None
+
+        await client.query_mbti_tourist_spots("INFJ", use_cache=False)
+        executor = client._retrieve_executor
+        client.close()
+        executor.shutdown(wait=True)
+
+        assert client._retrieve_executor is None
+        assert not any(thread.is_alive() for thread in executor._threads)
+
+        calls_before = stub.calls
+        assert await client.query_mbti_tourist_spots("INFJ", use_cache=False)
+        assert stub.calls > calls_before
+        client.close()
@@ -6,7 +6,14 @@ from .restaurant_models import (
     RestaurantMetadata,
     Restaurant,
     FileMetadata,
-    RestaurantDataFile
+    RestaurantDataFile,
+    RESTAURANT_WIRE_FIELDS
+)
+
+from .restaurant_columns import (
+    RestaurantColumns,
+    RestaurantColumnView,
+    SORT_KEYS
 )
 
 from .district_models import (
@@ -38,6 +45,10 @@ __all__ = [
     "Restaurant",
     "FileMetadata",
     "RestaurantDataFile",
+    "RESTAURANT_WIRE_FIELDS",
+    "RestaurantColumns",
+    "RestaurantColumnView",
+    "SORT_KEYS",
     
     # District models
     "DistrictConfig",
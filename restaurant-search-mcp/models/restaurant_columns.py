@@ -0,0 +1,216 @@
+"""Columnar restaurant data for district-level filtering and ranking.
+
+This module contains RestaurantColumns, which stores the numeric fields of a
+district's restaurants (sentiment counts and quality scores) as compact typed
+arrays alongside the shared Restaurant records, and RestaurantColumnView, a
+lightweight selection of positions over those columns. Filtering produces a
+new view over the same arrays instead of copying restaurant records.
+
+RestaurantColumns also keeps the district's positions presorted for each
+supported ranking, so top-K queries can merge districts without sorting.
+"""
+
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .restaurant_models import Restaurant
+
+
+# Rankings with presorted positions, all descending:
+#   likes              - likes, then total responses
+#   combined_sentiment - (likes + neutral) / total responses, then likes
+#   quality_score      - data quality score, then likes
+SORT_KEYS = ('likes', 'combined_sentiment', 'quality_score')
+
+
+class RestaurantColumns:
+    """Typed column arrays for one district's restaurants.
+
+    Attributes:
+        restaurants: Restaurant records in file order
+        likes: Number of positive reviews per restaurant
+        dislikes: Number of negative reviews per restaurant
+        neutral: Number of neutral reviews per restaurant
+        quality_scores: Data quality score per restaurant
+    """
+
+    __slots__ = ('restaurants', 'likes', 'dislikes', 'neutral',
+                 'quality_scores', '_positions_by_id', '_rank_keys', '_sorted_positions')
+
+    def __init__(self, restaurants: Sequence[Restaurant]):
+        """Build columns from restaurant records.
+
+        Args:
+            restaurants: Restaurant records (typically one district file)
+        """
+        self.restaurants = tuple(restaurants)
+        self.likes = array('q', (r.sentiment.likes or 0 for r in self.restaurants))
+        self.dislikes = array('q', (r.sentiment.dislikes or 0 for r in self.restaurants))
+        self.neutral = array('q', (r.sentiment.neutral or 0 for r in self.restaurants))
+        self.quality_scores = array('d', (float(r.metadata.quality_score or 0) for r in self.restaurants))
+        self._positions_by_id: Dict[str, int] = {
+            restaurant.id: position for position, restaurant in enumerate(self.restaurants)
+        }
+        
+        # Ranking keys are negated so ascending order is best-first; sorting is
+        # stable, so ties keep file order
+        self._rank_keys: Dict[str, List[Tuple[float, float]]] = {}
+        self._sorted_positions: Dict[str, array] = {}
+        for sort_by in SORT_KEYS:
+            keys = [self._rank_key(sort_by, position) for position in range(len(self.restaurants))]
+            self._rank_keys[sort_by] = keys
+            self._sorted_positions[sort_by] = array(
+                'l', sorted(range(len(self.restaurants)), key=keys.__getitem__)
+            )
+
+    def __len__(self) -> int:
+        return len(self.restaurants)
+
+    def position_of(self, restaurant_id: str) -> Optional[int]:
+        """Get the position of a restaurant in the columns.
+
+        Args:
+            restaurant_id: Restaurant identifier
+
+        Returns:
+            Position, or None if the restaurant is not in this district
+        """
+        return self._positions_by_id.get(restaurant_id)
+
+    def total_responses(self, position: int) -> int:
+        """Get the total number of reviews for the restaurant at a position."""
+        return self.likes[position] + self.dislikes[position] + self.neutral[position]
+
+    def _rank_key(self, sort_by: str, position: int) -> Tuple[float, float]:
+        """Compute the negated ranking key for the restaurant at a position."""
+        likes = self.likes[position]
+        if sort_by == 'likes':
+            return (-likes, -self.total_responses(position))
+        if sort_by == 'combined_sentiment':
+            total = self.total_responses(position)
+            combined = (likes + self.neutral[position]) / total if total else 0.0
+            return (-combined, -likes)
+        return (-self.quality_scores[position], -likes)
+
+    def rank_keys(self, sort_by: str) -> List[Tuple[float, float]]:
+        """Get ranking keys by position; smaller keys rank higher.
+
+        Args:
+            sort_by: One of SORT_KEYS
+
+        Returns:
+            List of comparable keys indexed by position
+
+        Raises:
+            KeyError: If sort_by is not supported
+        """
+        return self._rank_keys[sort_by]
+
+    def sorted_positions(self, sort_by: str) -> array:
+        """Get positions ordered best-first for a ranking.
+
+        Args:
+            sort_by: One of SORT_KEYS
+
+        Returns:
+            Array of positions; ties keep file order
+
+        Raises:
+            KeyError: If sort_by is not supported
+        """
+        return self._sorted_positions[sort_by]
+
+    def view(self, positions: Optional[Iterable[int]] = None) -> 'RestaurantColumnView':
+        """Create a view over selected positions.
+
+        Args:
+            positions: Positions to include, in order (all if omitted)
+
+        Returns:
+            RestaurantColumnView sharing these columns
+        """
+        if positions is None:
+            selected = array('l', range(len(self.restaurants)))
+        else:
+            selected = array('l', positions)
+        return RestaurantColumnView(self, selected)
+
+    def view_of(self, restaurants: Iterable[Restaurant]) -> 'RestaurantColumnView':
+        """Create a view selecting the given restaurants of this district.
+
+        Args:
+            restaurants: Restaurants from this district, in the desired order
+
+        Returns:
+            RestaurantColumnView over their positions (unknown ids are skipped)
+        """
+        positions = (self._positions_by_id.get(restaurant.id) for restaurant in restaurants)
+        return self.view(position for position in positions if position is not None)
+
+
+class RestaurantColumnView:
+    """Ordered selection of positions over RestaurantColumns.
+
+    Views hold only an array of positions; restaurant records and column
+    arrays stay shared with the underlying RestaurantColumns.
+    """
+
+    __slots__ = ('columns', 'positions')
+
+    def __init__(self, columns: RestaurantColumns, positions: array):
+        self.columns = columns
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __iter__(self) -> Iterator[Restaurant]:
+        restaurants = self.columns.restaurants
+        for position in self.positions:
+            yield restaurants[position]
+
+    def restaurants(self) -> List[Restaurant]:
+        """Materialize the selected restaurants as a list."""
+        return list(self)
+
+    def filter(self, predicate: Callable[[int], bool]) -> 'RestaurantColumnView':
+        """Keep positions for which a predicate over the columns holds.
+
+        Args:
+            predicate: Function taking a position and returning True to keep it
+
+        Returns:
+            New view over the same columns
+        """
+        return RestaurantColumnView(
+            self.columns,
+            array('l', (position for position in self.positions if predicate(position)))
+        )
+
+    def where(self, min_likes: Optional[int] = None,
+              min_quality_score: Optional[float] = None) -> 'RestaurantColumnView':
+        """Filter by minimum likes and/or quality score.
+
+        Args:
+            min_likes: Minimum number of likes
+            min_quality_score: Minimum data quality score
+
+        Returns:
+            New view over the same columns
+        """
+        likes = self.columns.likes
+        quality_scores = self.columns.quality_scores
+        positions = self.positions
+        if min_likes is not None:
+            positions = array('l', (p for p in positions if likes[p] >= min_likes))
+        if min_quality_score is not None:
+            positions = array('l', (p for p in positions if quality_scores[p] >= min_quality_score))
+        return RestaurantColumnView(self.columns, positions)
+
+    def to_wire(self) -> str:
+        """Serialize the selected restaurants as a compact JSON array.
+
+        Returns:
+            JSON array string of Restaurant.to_wire() documents
+        """
+        return '[' + ','.join(restaurant.to_wire() for restaurant in self) + ']'
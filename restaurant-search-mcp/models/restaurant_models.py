@@ -3,14 +3,45 @@
 This module contains dataclass models for restaurant data structure,
 including operating hours, sentiment, metadata, and complete restaurant records.
 Follows PEP8 style guidelines and includes JSON serialization support.
+
+Per-restaurant models are slotted and frozen, so their fields cannot be
+reassigned. List fields (meal_type and the operating hours ranges) are still
+plain lists: parsed records are shared between requests through the dataset
+cache, so callers must not modify those lists in place either.
+Each provides to_wire(), which writes the MCP tool response JSON for the
+record directly instead of building intermediate dictionaries.
 """
 
 import json
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from json.encoder import encode_basestring_ascii
+from typing import List, Dict, Any, Collection, Optional, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from .restaurant_columns import RestaurantColumns
 
-@dataclass
+
+# Top-level keys of a restaurant in MCP tool responses, in response order.
+# These are the names accepted by the search tools' fields projection.
+RESTAURANT_WIRE_FIELDS = (
+    'id', 'name', 'address', 'meal_type', 'sentiment', 'location_category',
+    'district', 'price_range', 'operating_hours', 'metadata'
+)
+
+
+def _wire_value(value: Any) -> str:
+    """Encode a scalar or list of strings as compact JSON."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return '[' + ','.join(map(encode_basestring_ascii, value)) + ']'
+    return json.dumps(value, separators=(',', ':'))
+
+
+@dataclass(frozen=True, slots=True)
 class OperatingHours:
     """Operating hours for different day types.
     
@@ -51,8 +82,20 @@ class OperatingHours:
             'Public Holiday': self.public_holiday
         }
 
+    def to_wire(self) -> str:
+        """Serialize to compact MCP response JSON.
+        
+        Returns:
+            JSON object string with snake_case day type keys
+        """
+        return (
+            '{"mon_fri":' + _wire_value(self.mon_fri) +
+            ',"sat_sun":' + _wire_value(self.sat_sun) +
+            ',"public_holiday":' + _wire_value(self.public_holiday) + '}'
+        )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Sentiment:
     """Sentiment analysis data for restaurant reviews.
     
@@ -89,8 +132,20 @@ class Sentiment:
         """
         return asdict(self)
 
+    def to_wire(self) -> str:
+        """Serialize to compact MCP response JSON.
+        
+        Returns:
+            JSON object string with likes, dislikes and neutral counts
+        """
+        return (
+            '{"likes":' + _wire_value(self.likes) +
+            ',"dislikes":' + _wire_value(self.dislikes) +
+            ',"neutral":' + _wire_value(self.neutral) + '}'
+        )
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RestaurantMetadata:
     """Metadata for individual restaurant records.
     
@@ -131,8 +186,20 @@ class RestaurantMetadata:
             'qualityScore': self.quality_score
         }
 
+    def to_wire(self) -> str:
+        """Serialize to compact MCP response JSON.
+        
+        Returns:
+            JSON object string with snake_case metadata keys
+        """
+        return (
+            '{"data_quality":' + _wire_value(self.data_quality) +
+            ',"version":' + _wire_value(self.version) +
+            ',"quality_score":' + _wire_value(self.quality_score) + '}'
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Restaurant:
     """Complete restaurant record with all associated data.
     
@@ -211,6 +278,45 @@ class Restaurant:
         """
         return json.dumps(self.to_dict(), indent=2)
 
+    def to_wire(self, fields: Optional[Collection[str]] = None) -> str:
+        """Serialize to compact MCP tool response JSON.
+        
+        Produces the same document as the per-restaurant dictionary in
+        format_restaurant_response (snake_case keys) without building it.
+        
+        Args:
+            fields: Optional projection; only these RESTAURANT_WIRE_FIELDS are
+                written, in response order
+        
+        Returns:
+            Compact JSON object string
+        """
+        if fields is not None:
+            return '{' + ','.join(
+                '"' + name + '":' + self._wire_field(name)
+                for name in RESTAURANT_WIRE_FIELDS if name in fields
+            ) + '}'
+        
+        return (
+            '{"id":' + _wire_value(self.id) +
+            ',"name":' + _wire_value(self.name) +
+            ',"address":' + _wire_value(self.address) +
+            ',"meal_type":' + _wire_value(self.meal_type) +
+            ',"sentiment":' + self.sentiment.to_wire() +
+            ',"location_category":' + _wire_value(self.location_category) +
+            ',"district":' + _wire_value(self.district) +
+            ',"price_range":' + _wire_value(self.price_range) +
+            ',"operating_hours":' + self.operating_hours.to_wire() +
+            ',"metadata":' + self.metadata.to_wire() + '}'
+        )
+
+    def _wire_field(self, name: str) -> str:
+        """Serialize a single top-level field to compact JSON."""
+        value = getattr(self, name)
+        if name in ('sentiment', 'operating_hours', 'metadata'):
+            return value.to_wire()
+        return _wire_value(value)
+
 
 @dataclass
 class FileMetadata:
@@ -285,6 +391,16 @@ class RestaurantDataFile:
     metadata: FileMetadata
     restaurants: List[Restaurant]
 
+    @cached_property
+    def columns(self) -> 'RestaurantColumns':
+        """Columnar view of the restaurants, built on first access.
+        
+        Returns:
+            RestaurantColumns over this file's restaurants
+        """
+        from .restaurant_columns import RestaurantColumns
+        return RestaurantColumns(self.restaurants)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'RestaurantDataFile':
         """Create RestaurantDataFile from dictionary data.
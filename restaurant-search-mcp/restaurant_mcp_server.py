@@ -12,13 +12,14 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 
 from mcp.server.fastmcp import FastMCP
 
 from services.restaurant_service import RestaurantService, RestaurantSearchError
 from services.auth_middleware import create_authentication_middleware, AuthenticationHelper
 from services.security_monitor import get_security_monitor
+from services.response_encoder import ResponseEncoder
 from models.restaurant_models import Restaurant
 
 
@@ -89,65 +90,30 @@ else:
 # Initialize restaurant service
 restaurant_service = RestaurantService()
 
+# Initialize response encoder (MCP_RESPONSE_STYLE, MCP_JSON_BACKEND)
+response_encoder = ResponseEncoder.from_environment()
+
 # Initialize security monitor
 security_monitor = get_security_monitor()
 
 
 def format_restaurant_response(restaurants: List[Restaurant], 
-                             metadata: Optional[Dict[str, Any]] = None) -> str:
+                             metadata: Optional[Dict[str, Any]] = None,
+                             fields: Optional[Sequence[str]] = None) -> str:
     """Format restaurant data for MCP tool response.
     
     Args:
         restaurants: List of Restaurant objects
         metadata: Optional metadata to include in response
+        fields: Optional projection of restaurant fields to include
         
     Returns:
         JSON string containing formatted restaurant data
     """
     try:
-        # Convert restaurants to dictionaries
-        restaurant_dicts = []
-        for restaurant in restaurants:
-            restaurant_dict = {
-                'id': restaurant.id,
-                'name': restaurant.name,
-                'address': restaurant.address,
-                'meal_type': restaurant.meal_type,
-                'sentiment': {
-                    'likes': restaurant.sentiment.likes,
-                    'dislikes': restaurant.sentiment.dislikes,
-                    'neutral': restaurant.sentiment.neutral
-                },
-                'location_category': restaurant.location_category,
-                'district': restaurant.district,
-                'price_range': restaurant.price_range,
-                'operating_hours': {
-                    'mon_fri': restaurant.operating_hours.mon_fri,
-                    'sat_sun': restaurant.operating_hours.sat_sun,
-                    'public_holiday': restaurant.operating_hours.public_holiday
-                },
-                'metadata': {
-                    'data_quality': restaurant.metadata.data_quality,
-                    'version': restaurant.metadata.version,
-                    'quality_score': restaurant.metadata.quality_score
-                }
-            }
-            restaurant_dicts.append(restaurant_dict)
-        
-        # Create response structure
-        response = {
-            'success': True,
-            'data': {
-                'restaurants': restaurant_dicts,
-                'count': len(restaurant_dicts)
-            }
-        }
-        
-        # Add metadata if provided
-        if metadata:
-            response['data']['metadata'] = metadata
-            
-        return json.dumps(response, indent=2)
+        # Restaurant fragments are cached by the encoder and spliced into the
+        # response envelope, without building per-restaurant dicts
+        return response_encoder.encode_restaurant_response(restaurants, metadata, fields)
         
     except Exception as e:
         logger.error(f"Error formatting restaurant response: {e}")
@@ -181,7 +147,7 @@ def format_error_response(error_message: str,
     if details:
         response['error']['details'] = details
         
-    return json.dumps(response, indent=2)
+    return response_encoder.encode(response)
 
 
 # Note: FastMCP doesn't support custom HTTP endpoints like health checks
@@ -234,6 +200,8 @@ def get_server_metrics() -> dict:
                 'suspicious_activities': security_metrics.suspicious_activities,
                 'blocked_ips': security_metrics.blocked_ips
             },
+            'dataset_cache': restaurant_service.data_access_client.get_cache_stats(),
+            'response_encoder': response_encoder.get_stats(),
             'timestamp': datetime.now().isoformat()
         }
         
@@ -287,8 +255,10 @@ def log_mcp_tool_invocation(tool_name: str, parameters: Dict[str, Any]) -> None:
 def normalize_district_names(districts: List[str]) -> List[str]:
     """Normalize district names to match the configuration format.
     
-    This function handles common variations in district names to ensure
-    consistent matching with the district configuration data.
+    Resolves case, "district" suffix, hyphen/space and abbreviation variants
+    and small typos through the district alias index built from
+    config/districts. Unrecognized names are kept so the search can report
+    them as invalid.
     
     Args:
         districts: List of district names to normalize
@@ -299,65 +269,21 @@ def normalize_district_names(districts: List[str]) -> List[str]:
     if not districts:
         return districts
     
-    # District name normalization mapping
-    district_mapping = {
-        # Central variations
-        "Central": "Central district",
-        "central": "Central district", 
-        "CENTRAL": "Central district",
-        "Central District": "Central district",
-        "central district": "Central district",
-        "CENTRAL DISTRICT": "Central district",
-        
-        # Western variations  
-        "Western": "Western District",
-        "western": "Western District",
-        "WESTERN": "Western District", 
-        "Western district": "Western District",
-        "western district": "Western District",
-        "WESTERN DISTRICT": "Western District",
-        
-        # Admiralty variations (keep as is, but handle case)
-        "admiralty": "Admiralty",
-        "ADMIRALTY": "Admiralty",
-        
-        # Causeway Bay variations
-        "causeway bay": "Causeway Bay",
-        "CAUSEWAY BAY": "Causeway Bay",
-        "Causeway bay": "Causeway Bay",
-        
-        # Wan Chai variations
-        "wan chai": "Wan Chai",
-        "WAN CHAI": "Wan Chai",
-        "Wan chai": "Wan Chai",
-        
-        # Tsim Sha Tsui variations
-        "tsim sha tsui": "Tsim Sha Tsui",
-        "TSIM SHA TSUI": "Tsim Sha Tsui",
-        "Tsim sha tsui": "Tsim Sha Tsui",
-        
-        # Sheung Wan variations
-        "sheung wan": "Sheung Wan",
-        "SHEUNG WAN": "Sheung Wan",
-        "Sheung wan": "Sheung Wan"
-    }
-    
-    normalized_districts = []
-    for district in districts:
-        # First check if there's a direct mapping
-        if district in district_mapping:
-            normalized_district = district_mapping[district]
-            logger.info(f"Normalized district '{district}' to '{normalized_district}'")
-            normalized_districts.append(normalized_district)
-        else:
-            # Keep the original if no mapping found
-            normalized_districts.append(district)
-    
-    return normalized_districts
+    try:
+        return restaurant_service.normalize_district_names(districts)
+    except RestaurantSearchError as e:
+        logger.warning(f"District normalization unavailable: {e}")
+        return districts
 
 
 @mcp.tool()
-def search_restaurants_by_district(districts: List[str]) -> str:
+def search_restaurants_by_district(districts: List[str],
+                                   sort_by: Optional[str] = None,
+                                   top_k: Optional[int] = None,
+                                   limit: Optional[int] = None,
+                                   offset: Optional[int] = None,
+                                   cursor: Optional[str] = None,
+                                   fields: Optional[List[str]] = None) -> str:
     """Search for restaurants in specific districts.
     
     This tool searches for restaurants located in the specified districts.
@@ -366,16 +292,31 @@ def search_restaurants_by_district(districts: List[str]) -> str:
     
     Args:
         districts: List of district names to search (e.g., ["Central district", "Admiralty"])
+        sort_by: Optional ranking, best first: "likes", "combined_sentiment" or "quality_score"
+        top_k: Optional maximum number of ranked restaurants to return
+        limit: Optional maximum number of restaurants to return (1-500)
+        offset: Optional number of matching restaurants to skip
+        cursor: Optional next_cursor from a previous page of the same search
+        fields: Optional list of restaurant fields to return (e.g., ["id", "name", "sentiment"])
         
     Returns:
-        JSON string containing restaurant data and metadata
+        JSON string containing restaurant data and metadata; metadata.pagination
+        carries total_results and next_cursor when more results are available
         
     Example:
         search_restaurants_by_district(["Central district", "Admiralty"])
     """
     try:
         # Log MCP tool invocation for security audit
-        log_mcp_tool_invocation('search_restaurants_by_district', {'districts': districts})
+        log_mcp_tool_invocation('search_restaurants_by_district', {
+            'districts': districts,
+            'sort_by': sort_by,
+            'top_k': top_k,
+            'limit': limit,
+            'offset': offset,
+            'cursor': cursor,
+            'fields': fields
+        })
         
         logger.info(f"Searching restaurants by districts: {districts}")
         
@@ -406,24 +347,31 @@ def search_restaurants_by_district(districts: List[str]) -> str:
         logger.info(f"Normalized districts: {normalized_districts}")
         
         # Search for restaurants
-        restaurants = restaurant_service.search_by_districts(normalized_districts)
+        page = restaurant_service.search_page(
+            districts=normalized_districts, sort_by=sort_by, top_k=top_k,
+            limit=limit, offset=offset, cursor=cursor, fields=fields,
+            include_district_counts=True
+        )
         
         # Get additional metadata
         available_districts = restaurant_service.get_available_districts()
-        district_counts = restaurant_service.get_restaurant_count_by_district(normalized_districts)
+        district_counts = page.district_counts
         
         metadata = {
             'search_criteria': {
                 'districts': districts,
                 'normalized_districts': normalized_districts,
+                'sort_by': sort_by,
+                'top_k': top_k,
                 'search_type': 'district'
             },
             'district_counts': district_counts,
-            'available_districts': available_districts
+            'available_districts': available_districts,
+            'pagination': page.to_metadata()
         }
         
-        logger.info(f"Found {len(restaurants)} restaurants in districts: {districts}")
-        return format_restaurant_response(restaurants, metadata)
+        logger.info(f"Found {page.total_count} restaurants in districts: {districts}")
+        return format_restaurant_response(page.restaurants, metadata, page.fields)
         
     except RestaurantSearchError as e:
         logger.error(f"Restaurant search error: {e}")
@@ -451,7 +399,13 @@ def search_restaurants_by_district(districts: List[str]) -> str:
 
 
 @mcp.tool()
-def search_restaurants_by_meal_type(meal_types: List[str]) -> str:
+def search_restaurants_by_meal_type(meal_types: List[str],
+                                    sort_by: Optional[str] = None,
+                                    top_k: Optional[int] = None,
+                                    limit: Optional[int] = None,
+                                    offset: Optional[int] = None,
+                                    cursor: Optional[str] = None,
+                                    fields: Optional[List[str]] = None) -> str:
     """Search for restaurants by meal type based on operating hours.
     
     This tool searches for restaurants that serve specific meal types by analyzing
@@ -460,16 +414,31 @@ def search_restaurants_by_meal_type(meal_types: List[str]) -> str:
     
     Args:
         meal_types: List of meal types to search for (valid values: "breakfast", "lunch", "dinner")
+        sort_by: Optional ranking, best first: "likes", "combined_sentiment" or "quality_score"
+        top_k: Optional maximum number of ranked restaurants to return
+        limit: Optional maximum number of restaurants to return (1-500)
+        offset: Optional number of matching restaurants to skip
+        cursor: Optional next_cursor from a previous page of the same search
+        fields: Optional list of restaurant fields to return (e.g., ["id", "name", "sentiment"])
         
     Returns:
-        JSON string containing restaurant data filtered by meal type availability
+        JSON string containing restaurant data filtered by meal type availability;
+        metadata.pagination carries total_results and next_cursor
         
     Example:
         search_restaurants_by_meal_type(["breakfast", "lunch"])
     """
     try:
         # Log MCP tool invocation for security audit
-        log_mcp_tool_invocation('search_restaurants_by_meal_type', {'meal_types': meal_types})
+        log_mcp_tool_invocation('search_restaurants_by_meal_type', {
+            'meal_types': meal_types,
+            'sort_by': sort_by,
+            'top_k': top_k,
+            'limit': limit,
+            'offset': offset,
+            'cursor': cursor,
+            'fields': fields
+        })
         
         logger.info(f"Searching restaurants by meal types: {meal_types}")
         
@@ -514,26 +483,30 @@ def search_restaurants_by_meal_type(meal_types: List[str]) -> str:
             )
         
         # Search for restaurants
-        restaurants = restaurant_service.search_by_meal_types(meal_types)
-        
-        # Get meal type analysis
-        meal_analysis = restaurant_service.get_meal_type_analysis(restaurants)
+        page = restaurant_service.search_page(
+            meal_types=meal_types, sort_by=sort_by, top_k=top_k,
+            limit=limit, offset=offset, cursor=cursor, fields=fields,
+            include_meal_analysis=True
+        )
         
         metadata = {
             'search_criteria': {
                 'meal_types': meal_types,
+                'sort_by': sort_by,
+                'top_k': top_k,
                 'search_type': 'meal_type'
             },
-            'meal_analysis': meal_analysis,
+            'meal_analysis': page.meal_analysis,
             'meal_periods': {
                 'breakfast': '07:00 - 11:29',
                 'lunch': '11:30 - 17:29',
                 'dinner': '17:30 - 22:30'
-            }
+            },
+            'pagination': page.to_metadata()
         }
         
-        logger.info(f"Found {len(restaurants)} restaurants serving meal types: {meal_types}")
-        return format_restaurant_response(restaurants, metadata)
+        logger.info(f"Found {page.total_count} restaurants serving meal types: {meal_types}")
+        return format_restaurant_response(page.restaurants, metadata, page.fields)
         
     except RestaurantSearchError as e:
         logger.error(f"Restaurant search error: {e}")
@@ -558,7 +531,13 @@ def search_restaurants_by_meal_type(meal_types: List[str]) -> str:
 
 @mcp.tool()
 def search_restaurants_combined(districts: Optional[List[str]] = None, 
-                               meal_types: Optional[List[str]] = None) -> str:
+                               meal_types: Optional[List[str]] = None,
+                               sort_by: Optional[str] = None,
+                               top_k: Optional[int] = None,
+                               limit: Optional[int] = None,
+                               offset: Optional[int] = None,
+                               cursor: Optional[str] = None,
+                               fields: Optional[List[str]] = None) -> str:
     """Search for restaurants by both district and meal type criteria.
     
     This tool provides flexible restaurant search by combining district and meal type
@@ -568,20 +547,35 @@ def search_restaurants_combined(districts: Optional[List[str]] = None,
     Args:
         districts: Optional list of district names to search (e.g., ["Central district", "Admiralty"])
         meal_types: Optional list of meal types to filter by (valid values: "breakfast", "lunch", "dinner")
+        sort_by: Optional ranking, best first: "likes", "combined_sentiment" or "quality_score"
+        top_k: Optional maximum number of ranked restaurants to return
+        limit: Optional maximum number of restaurants to return (1-500)
+        offset: Optional number of matching restaurants to skip
+        cursor: Optional next_cursor from a previous page of the same search
+        fields: Optional list of restaurant fields to return (e.g., ["id", "name", "sentiment"])
         
     Returns:
-        JSON string containing restaurant data matching the specified criteria
+        JSON string containing restaurant data matching the specified criteria;
+        metadata.pagination carries total_results and next_cursor
         
     Examples:
         search_restaurants_combined(districts=["Central district"], meal_types=["breakfast"])
         search_restaurants_combined(districts=["Admiralty", "Causeway Bay"])
         search_restaurants_combined(meal_types=["lunch", "dinner"])
+        search_restaurants_combined(districts=["Central district"], limit=20, fields=["id", "name"])
+        search_restaurants_combined(meal_types=["dinner"], sort_by="likes", top_k=10)
     """
     try:
         # Log MCP tool invocation for security audit
         log_mcp_tool_invocation('search_restaurants_combined', {
             'districts': districts,
-            'meal_types': meal_types
+            'meal_types': meal_types,
+            'sort_by': sort_by,
+            'top_k': top_k,
+            'limit': limit,
+            'offset': offset,
+            'cursor': cursor,
+            'fields': fields
         })
         
         logger.info(f"Combined search - districts: {districts}, meal_types: {meal_types}")
@@ -664,7 +658,14 @@ def search_restaurants_combined(districts: Optional[List[str]] = None,
             logger.info(f"Normalized districts: {normalized_districts}")
         
         # Perform combined search
-        restaurants = restaurant_service.search_combined(normalized_districts, meal_types)
+        page = restaurant_service.search_page(
+            districts=normalized_districts, meal_types=meal_types,
+            sort_by=sort_by, top_k=top_k,
+            limit=limit, offset=offset, cursor=cursor, fields=fields,
+            include_meal_analysis=bool(meal_types),
+            include_district_counts=bool(districts)
+        )
+        restaurants = page.restaurants
         
         # Build comprehensive metadata
         metadata = {
@@ -672,6 +673,8 @@ def search_restaurants_combined(districts: Optional[List[str]] = None,
                 'districts': districts,
                 'normalized_districts': normalized_districts,
                 'meal_types': meal_types,
+                'sort_by': sort_by,
+                'top_k': top_k,
                 'search_type': 'combined'
             }
         }
@@ -680,26 +683,21 @@ def search_restaurants_combined(districts: Optional[List[str]] = None,
         if districts:
             try:
                 available_districts = restaurant_service.get_available_districts()
-                district_counts = restaurant_service.get_restaurant_count_by_district(normalized_districts)
                 metadata['district_info'] = {
                     'available_districts': available_districts,
-                    'district_counts': district_counts
+                    'district_counts': page.district_counts
                 }
             except Exception as e:
                 logger.warning(f"Could not get district metadata: {e}")
         
         # Add meal type analysis if meal types were provided
         if meal_types:
-            try:
-                meal_analysis = restaurant_service.get_meal_type_analysis(restaurants)
-                metadata['meal_analysis'] = meal_analysis
-                metadata['meal_periods'] = {
-                    'breakfast': '07:00 - 11:29',
-                    'lunch': '11:30 - 17:29',
-                    'dinner': '17:30 - 22:30'
-                }
-            except Exception as e:
-                logger.warning(f"Could not get meal type analysis: {e}")
+            metadata['meal_analysis'] = page.meal_analysis
+            metadata['meal_periods'] = {
+                'breakfast': '07:00 - 11:29',
+                'lunch': '11:30 - 17:29',
+                'dinner': '17:30 - 22:30'
+            }
         
         # Add search summary
         search_summary = []
@@ -710,11 +708,12 @@ def search_restaurants_combined(districts: Optional[List[str]] = None,
         
         metadata['search_summary'] = {
             'criteria': " and ".join(search_summary),
-            'results_count': len(restaurants)
+            'results_count': page.total_count
         }
+        metadata['pagination'] = page.to_metadata()
         
-        logger.info(f"Combined search found {len(restaurants)} restaurants")
-        return format_restaurant_response(restaurants, metadata)
+        logger.info(f"Combined search found {page.total_count} restaurants")
+        return format_restaurant_response(restaurants, metadata, page.fields)
         
     except RestaurantSearchError as e:
         logger.error(f"Restaurant search error: {e}")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for MCP restaurant response encoding.
+
+Loads the shipped district files from config/restaurants and encodes them the
+way format_restaurant_response does, comparing the original pretty-printed
+dict-based encoding against the ResponseEncoder styles and backends. Reports
+response size and encode time per variant.
+"""
+
+import os
+import sys
+import time
+import json
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.data_access import DataAccessClient
+from services.response_encoder import ResponseEncoder
+from services.storage_backends import LocalFileStorageBackend
+
+
+def legacy_encode(restaurants, metadata):
+    """Original encoding: build a dict per restaurant and pretty-print it."""
+    restaurant_dicts = []
+    for restaurant in restaurants:
+        restaurant_dicts.append({
+            'id': restaurant.id,
+            'name': restaurant.name,
+            'address': restaurant.address,
+            'meal_type': restaurant.meal_type,
+            'sentiment': {
+                'likes': restaurant.sentiment.likes,
+                'dislikes': restaurant.sentiment.dislikes,
+                'neutral': restaurant.sentiment.neutral
+            },
+            'location_category': restaurant.location_category,
+            'district': restaurant.district,
+            'price_range': restaurant.price_range,
+            'operating_hours': {
+                'mon_fri': restaurant.operating_hours.mon_fri,
+                'sat_sun': restaurant.operating_hours.sat_sun,
+                'public_holiday': restaurant.operating_hours.public_holiday
+            },
+            'metadata': {
+                'data_quality': restaurant.metadata.data_quality,
+                'version': restaurant.metadata.version,
+                'quality_score': restaurant.metadata.quality_score
+            }
+        })
+    response = {
+        'success': True,
+        'data': {
+            'restaurants': restaurant_dicts,
+            'count': len(restaurant_dicts),
+            'metadata': metadata
+        }
+    }
+    return json.dumps(response, indent=2)
+
+
+def load_restaurants(source):
+    """Load every district file under source into a flat restaurant list."""
+    client = DataAccessClient(storage_backend=LocalFileStorageBackend(source))
+    pairs = [
+        (region, district)
+        for region, districts in sorted(client.get_available_districts_from_s3().items())
+        for district in sorted(districts)
+    ]
+    data_files = client.get_multiple_restaurant_data(pairs)
+    restaurants = []
+    for data_file in data_files.values():
+        restaurants.extend(data_file.restaurants)
+    return restaurants, len(data_files)
+
+
+def time_variant(encode, iterations):
+    """Run encode() iterations times and return (best ms, output)."""
+    output = encode()
+    best = float('inf')
+    for _ in range(iterations):
+        start = time.perf_counter()
+        encode()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000.0, output
+
+
+def main():
+    """Main function to run the benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark MCP restaurant response encoding')
+    parser.add_argument('--source', default='config/restaurants',
+                       help='Directory of <region>/<district>.json files (default: config/restaurants)')
+    parser.add_argument('--iterations', type=int, default=20,
+                       help='Timed iterations per variant; the best run is reported (default: 20)')
+
+    args = parser.parse_args()
+
+    restaurants, district_count = load_restaurants(args.source)
+    if not restaurants:
+        print(f"❌ No restaurant data found under {args.source}")
+        return 1
+
+    metadata = {'search_type': 'benchmark', 'total_results': len(restaurants)}
+    print(f"Encoding {len(restaurants)} restaurants from {district_count} districts "
+          f"(best of {args.iterations})\n")
+
+    uncached = ResponseEncoder(style='compact', backend='json', fragment_cache_size=0)
+    variants = [
+        ('legacy dict + indent=2', lambda: legacy_encode(restaurants, metadata)),
+        ('json compact, no fragment cache', lambda: uncached.encode_restaurant_response(restaurants, metadata))
+    ]
+    for backend in ('json', 'orjson', 'msgspec'):
+        for style in ('compact', 'pretty'):
+            try:
+                encoder = ResponseEncoder(style=style, backend=backend)
+            except ImportError:
+                print(f"   (skipping {backend}: not installed)")
+                break
+            variants.append((f"{backend} {style}",
+                             lambda e=encoder: e.encode_restaurant_response(restaurants, metadata)))
+
+    expected = json.loads(variants[0][1]())
+    print(f"{'variant':<34} {'ms':>9} {'bytes':>11}")
+    for name, encode in variants:
+        elapsed_ms, output = time_variant(encode, args.iterations)
+        if json.loads(output) != expected:
+            print(f"❌ {name}: output differs from legacy encoding")
+            return 1
+        print(f"{name:<34} {elapsed_ms:>9.2f} {len(output.encode('utf-8')):>11}")
+
+    print("\n✅ All variants produce the same document")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
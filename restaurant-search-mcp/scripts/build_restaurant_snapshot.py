@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Build a packed restaurant data snapshot for the snapshot storage backend.
+
+Packs config/restaurants/<region>/<district>.json into one file that the
+restaurant search MCP server memory-maps at startup, so searches can be served
+without S3 access. Run the server with:
+
+    RESTAURANT_DATA_BACKEND=snapshot RESTAURANT_DATA_SNAPSHOT_PATH=<output> \
+        python -m restaurant_mcp_server
+"""
+
+import os
+import sys
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.storage_backends import build_packed_snapshot, StorageBackendError
+
+
+def main():
+    """Main function to build the snapshot."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Build a packed restaurant data snapshot')
+    parser.add_argument('--source', default='config/restaurants',
+                       help='Directory of <region>/<district>.json files (default: config/restaurants)')
+    parser.add_argument('--output', default='config/restaurants.snapshot',
+                       help='Snapshot file to write (default: config/restaurants.snapshot)')
+    
+    args = parser.parse_args()
+    
+    try:
+        table = build_packed_snapshot(args.source, args.output)
+    except StorageBackendError as e:
+        print(f"❌ {e}")
+        return 1
+    
+    total_bytes = sum(length for _, length, _ in table.values())
+    print(f"✅ Wrote {args.output}: {len(table)} districts, {total_bytes} bytes of restaurant data")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
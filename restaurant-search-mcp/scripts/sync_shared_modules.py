@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Copy modules shared with other subprojects out of restaurant-search-mcp.
+
+Each subproject is built and deployed from its own directory, so the modules
+and district configuration that other projects reuse are vendored into them.
+This project holds the canonical versions; edit them here and run:
+
+    python scripts/sync_shared_modules.py
+
+Use --check (as the test suite does) to fail when a copy has drifted.
+"""
+
+import filecmp
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REPOSITORY_ROOT = PROJECT_ROOT.parent
+
+# Canonical path in this project -> vendored copies, relative to the repository root
+SHARED_PATHS: Dict[str, List[str]] = {
+    'services/district_aliases.py': [
+        'agentcore-gateway-mcp-tools/models/district_aliases.py',
+        'mbti-travel-planner-agent/services/district_aliases.py',
+        'restaurant-search-result-reasoning-mcp/services/district_aliases.py',
+    ],
+    'services/storage_backends.py': [
+        'restaurant-search-result-reasoning-mcp/services/storage_backends.py',
+    ],
+    'config/districts': [
+        'agentcore-gateway-mcp-tools/config/districts',
+        'mbti-travel-planner-agent/config/districts',
+        'restaurant-search-result-reasoning-mcp/config/districts',
+    ],
+}
+
+
+def _shared_files() -> List[Tuple[Path, Path]]:
+    """List (canonical file, vendored copy) pairs, expanding shared directories."""
+    pairs = []
+    for source, copies in SHARED_PATHS.items():
+        source_path = PROJECT_ROOT / source
+        for copy in copies:
+            copy_path = REPOSITORY_ROOT / copy
+            if source_path.is_dir():
+                for file_path in sorted(source_path.rglob('*.json')):
+                    pairs.append((file_path, copy_path / file_path.relative_to(source_path)))
+            else:
+                pairs.append((source_path, copy_path))
+    return pairs
+
+
+def find_drifted_copies() -> List[Path]:
+    """
+    Find vendored copies that are missing or differ from the canonical file.
+
+    Returns:
+        Paths of the out-of-date copies
+    """
+    return [
+        copy_path for source_path, copy_path in _shared_files()
+        if not copy_path.is_file() or not filecmp.cmp(source_path, copy_path, shallow=False)
+    ]
+
+
+def sync_shared_modules() -> List[Path]:
+    """
+    Overwrite out-of-date vendored copies with the canonical files.
+
+    Returns:
+        Paths of the copies that were written
+    """
+    drifted = set(find_drifted_copies())
+    for source_path, copy_path in _shared_files():
+        if copy_path in drifted:
+            copy_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source_path, copy_path)
+    return sorted(drifted)
+
+
+def main():
+    """Main function to check or sync the vendored copies."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Sync modules shared with other subprojects')
+    parser.add_argument('--check', action='store_true',
+                       help='Only report out-of-date copies and exit non-zero if there are any')
+
+    args = parser.parse_args()
+
+    if args.check:
+        drifted = find_drifted_copies()
+        for copy_path in drifted:
+            print(f"❌ Out of date: {os.path.relpath(copy_path, REPOSITORY_ROOT)}")
+        if not drifted:
+            print("✅ All shared copies are up to date")
+        return 1 if drifted else 0
+
+    for copy_path in sync_shared_modules():
+        print(f"✅ Updated {os.path.relpath(copy_path, REPOSITORY_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
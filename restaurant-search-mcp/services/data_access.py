@@ -1,58 +1,122 @@
 """
-Data access client for restaurant data stored in AWS S3.
+Data access client for restaurant data.
 
 This module provides the DataAccessClient class for retrieving restaurant data
-from S3 bucket restaurant-data-209803798463-us-east-1/restaurants/ while
-loading district configuration from local files.
+through a pluggable storage backend (S3 bucket
+restaurant-data-209803798463-us-east-1/restaurants/ by default, or local files
+and packed snapshots for offline use) while loading district configuration
+from local files.
 """
 
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
-
 from models.restaurant_models import RestaurantDataFile, Restaurant, FileMetadata
+from services.dataset_cache import DatasetCache
+from services.storage_backends import (
+    StorageBackend,
+    S3StorageBackend,
+    DatasetNotModified,
+    create_storage_backend
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached district dataset is served before it is revalidated against storage
+DEFAULT_CACHE_REVALIDATE_SECONDS = float(
+    os.getenv('RESTAURANT_DATA_CACHE_REVALIDATE_SECONDS', '300')
+)
+
+# Maximum number of district files fetched from storage in parallel per call
+DEFAULT_FETCH_CONCURRENCY = int(os.getenv('RESTAURANT_DATA_FETCH_CONCURRENCY', '8'))
+
+# Storage backend selection: 's3', 'local' or 'snapshot'
+DEFAULT_STORAGE_BACKEND = os.getenv('RESTAURANT_DATA_BACKEND', 's3')
+DEFAULT_LOCAL_DATA_PATH = os.getenv('RESTAURANT_DATA_LOCAL_PATH', 'config/restaurants')
+DEFAULT_SNAPSHOT_PATH = os.getenv('RESTAURANT_DATA_SNAPSHOT_PATH')
+
+
+@dataclass
+class MultiDistrictFetchResult:
+    """Outcome of fetching several districts in one call.
+    
+    Attributes:
+        data: District name to RestaurantDataFile, in the order requested
+        missing: (region, district) pairs that have no data file
+        errors: (region, district) pairs that failed, mapped to the error message
+    """
+    data: Dict[str, RestaurantDataFile] = field(default_factory=dict)
+    missing: List[Tuple[str, str]] = field(default_factory=list)
+    errors: Dict[Tuple[str, str], str] = field(default_factory=dict)
+    
+    @property
+    def is_partial(self) -> bool:
+        """True if any requested district could not be returned."""
+        return bool(self.missing or self.errors)
+
 
 class DataAccessClient:
-    """Client for accessing restaurant data from S3 and district config locally."""
+    """Client for accessing restaurant data from storage and district config locally."""
     
-    def __init__(self, s3_bucket: str = "restaurant-data-209803798463-us-east-1"):
+    def __init__(self, s3_bucket: str = "restaurant-data-209803798463-us-east-1",
+                 enable_cache: bool = True,
+                 cache_revalidate_seconds: float = DEFAULT_CACHE_REVALIDATE_SECONDS,
+                 max_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+                 storage_backend: Optional[StorageBackend] = None):
         """
         Initialize the data access client.
         
         Args:
             s3_bucket: S3 bucket name containing restaurant data
+            enable_cache: Keep parsed district data resident between calls
+            cache_revalidate_seconds: Seconds a cached district is served before
+                it is revalidated with a conditional request
+            max_concurrency: Default limit on parallel storage requests when
+                fetching multiple districts
+            storage_backend: Backend to read district files from. Defaults to the
+                backend named by RESTAURANT_DATA_BACKEND (S3 unless configured)
         """
         self.s3_bucket = s3_bucket
         self.s3_prefix = "restaurants"
-        self._s3_client = None
         self._district_config = None
+        self._dataset_cache = DatasetCache(cache_revalidate_seconds) if enable_cache else None
+        self.max_concurrency = max(1, max_concurrency)
+        
+        if storage_backend is None:
+            storage_backend = create_storage_backend(
+                DEFAULT_STORAGE_BACKEND,
+                s3_bucket=self.s3_bucket,
+                s3_prefix=self.s3_prefix,
+                local_path=DEFAULT_LOCAL_DATA_PATH,
+                snapshot_path=DEFAULT_SNAPSHOT_PATH
+            )
+        self.storage_backend = storage_backend
+        logger.info(f"Restaurant data storage backend: {storage_backend.name} "
+                    f"({storage_backend.describe()})")
         
     @property
     def s3_client(self):
-        """Lazy initialization of S3 client."""
-        if self._s3_client is None:
-            try:
-                self._s3_client = boto3.client('s3')
-                logger.info("S3 client initialized successfully")
-            except NoCredentialsError as e:
-                logger.error(f"AWS credentials not found: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Failed to initialize S3 client: {e}")
-                raise
-        return self._s3_client
+        """S3 client of the S3 storage backend."""
+        if not isinstance(self.storage_backend, S3StorageBackend):
+            raise AttributeError(
+                f"s3_client is not available with the {self.storage_backend.name} storage backend"
+            )
+        return self.storage_backend.client
     
     def get_restaurant_data(self, region: str, district: str) -> Optional[RestaurantDataFile]:
         """
-        Retrieve restaurant data from S3 for a specific region and district.
+        Retrieve restaurant data for a specific region and district.
+        
+        Parsed data is kept in the dataset cache and shared between calls. Once a
+        cached entry is older than the revalidation interval it is checked with a
+        conditional request (If-None-Match) and only re-parsed if the storage
+        backend reports a change.
         
         Args:
             region: Region name (e.g., 'hong-kong-island')
@@ -63,77 +127,139 @@ class DataAccessClient:
             
         Raises:
             ClientError: If S3 access fails
+            StorageBackendError: If a local or snapshot backend cannot be read
             ValueError: If JSON data is malformed
         """
-        s3_key = f"{self.s3_prefix}/{region}/{district}.json"
+        cache_key = (region, district)
+        location = f"{self.storage_backend.describe()}/{region}/{district}.json"
+        
+        etag = None
+        if self._dataset_cache is not None:
+            cached_data = self._dataset_cache.get(cache_key)
+            if cached_data is not None:
+                return cached_data
+            etag = self._dataset_cache.get_etag(cache_key)
         
         try:
-            logger.info(f"Retrieving restaurant data from s3://{self.s3_bucket}/{s3_key}")
+            logger.info(f"Retrieving restaurant data from {location}")
+            
+            try:
+                stored = self.storage_backend.get_dataset(region, district, if_none_match=etag)
+            except DatasetNotModified:
+                cached_data = self._dataset_cache.mark_not_modified(cache_key)
+                if cached_data is not None:
+                    logger.debug(f"Restaurant data unchanged: {location}")
+                    return cached_data
+                # Entry was invalidated while the request was in flight
+                stored = self.storage_backend.get_dataset(region, district)
             
-            response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=s3_key)
-            content = response['Body'].read().decode('utf-8')
+            if stored is None:
+                if self._dataset_cache is not None:
+                    self._dataset_cache.invalidate(cache_key)
+                return None
             
             # Parse JSON data
-            data = json.loads(content)
+            data = json.loads(stored.content)
             
             # Validate required structure
             if 'metadata' not in data or 'restaurants' not in data:
-                raise ValueError(f"Invalid restaurant data structure in {s3_key}")
+                raise ValueError(f"Invalid restaurant data structure in {location}")
             
             # Convert to data model
             restaurant_data = self._parse_restaurant_data(data)
             
+            # Build columns and presorted rankings once, before the data is shared
+            restaurant_data.columns
+            
+            if self._dataset_cache is not None:
+                self._dataset_cache.put(cache_key, restaurant_data, stored.etag)
+            
             logger.info(f"Successfully retrieved {len(restaurant_data.restaurants)} restaurants from {district}")
             return restaurant_data
             
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'NoSuchKey':
-                logger.warning(f"Restaurant data not found: s3://{self.s3_bucket}/{s3_key}")
-                return None
-            elif error_code == 'NoSuchBucket':
-                logger.error(f"S3 bucket not found: {self.s3_bucket}")
-                raise
-            elif error_code == 'AccessDenied':
-                logger.error(f"Access denied to S3 bucket: {self.s3_bucket}")
-                raise
-            else:
-                logger.error(f"S3 client error: {e}")
-                raise
-                
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in restaurant data file {s3_key}: {e}")
-            raise ValueError(f"Malformed JSON data in {s3_key}: {e}")
+            logger.error(f"Invalid JSON in restaurant data file {location}: {e}")
+            raise ValueError(f"Malformed JSON data in {location}: {e}")
             
         except Exception as e:
             logger.error(f"Unexpected error retrieving restaurant data: {e}")
             raise
     
-    def get_multiple_restaurant_data(self, region_district_pairs: List[tuple]) -> Dict[str, RestaurantDataFile]:
+    def get_multiple_restaurant_data(self, region_district_pairs: List[tuple],
+                                     max_concurrency: Optional[int] = None) -> Dict[str, RestaurantDataFile]:
         """
         Retrieve restaurant data for multiple region/district pairs.
         
+        Districts are fetched concurrently (see fetch_multiple_restaurant_data).
+        Failed or missing districts are logged and left out of the result.
+        
+        Args:
+            region_district_pairs: List of (region, district) tuples
+            max_concurrency: Maximum parallel storage requests (defaults to the client setting)
+            
+        Returns:
+            Dictionary mapping district names to RestaurantDataFile objects,
+            in the same order as the input pairs
+        """
+        return self.fetch_multiple_restaurant_data(region_district_pairs, max_concurrency).data
+    
+    def fetch_multiple_restaurant_data(self, region_district_pairs: List[tuple],
+                                       max_concurrency: Optional[int] = None) -> MultiDistrictFetchResult:
+        """
+        Retrieve restaurant data for multiple districts with bounded concurrency.
+        
+        Each district is fetched on a worker thread sharing the same storage
+        backend client, so an all-district search costs roughly one S3 round trip
+        instead of one per district. Cached districts are served without touching
+        storage.
+        
         Args:
             region_district_pairs: List of (region, district) tuples
+            max_concurrency: Maximum parallel storage requests (defaults to the client setting)
             
         Returns:
-            Dictionary mapping district names to RestaurantDataFile objects
+            MultiDistrictFetchResult with data in input order plus any missing
+            districts and per-district errors
         """
-        results = {}
+        result = MultiDistrictFetchResult()
+        if not region_district_pairs:
+            return result
         
-        for region, district in region_district_pairs:
+        workers = max_concurrency if max_concurrency is not None else self.max_concurrency
+        workers = max(1, min(workers, len(region_district_pairs)))
+        
+        def fetch(pair: Tuple[str, str]) -> Tuple[Optional[RestaurantDataFile], Optional[Exception]]:
             try:
-                data = self.get_restaurant_data(region, district)
-                if data:
-                    results[district] = data
-                else:
-                    logger.warning(f"No data found for {region}/{district}")
+                return self.get_restaurant_data(pair[0], pair[1]), None
             except Exception as e:
-                logger.error(f"Failed to retrieve data for {region}/{district}: {e}")
+                return None, e
+        
+        if workers == 1:
+            outcomes = [fetch(pair) for pair in region_district_pairs]
+        else:
+            # Acquire shared clients/handles once before fanning out
+            self.storage_backend.prepare()
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-fetch") as executor:
+                outcomes = list(executor.map(fetch, region_district_pairs))
+        
+        for (region, district), (data, error) in zip(region_district_pairs, outcomes):
+            if error is not None:
+                logger.error(f"Failed to retrieve data for {region}/{district}: {error}")
                 # Continue with other districts rather than failing completely
-                continue
-                
-        return results
+                result.errors[(region, district)] = str(error)
+            elif data:
+                result.data[district] = data
+            else:
+                logger.warning(f"No data found for {region}/{district}")
+                result.missing.append((region, district))
+        
+        if result.is_partial:
+            logger.warning(
+                f"Partial district fetch: {len(result.data)} succeeded, "
+                f"{len(result.missing)} missing, {len(result.errors)} failed"
+            )
+        
+        return result
     
     def _parse_restaurant_data(self, data: Dict[str, Any]) -> RestaurantDataFile:
         """
@@ -242,61 +368,81 @@ class DataAccessClient:
     
     def test_s3_connection(self) -> bool:
         """
-        Test S3 connection and bucket access.
+        Test storage connection (S3 bucket access for the default backend).
         
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            # Test bucket access by listing objects with limit
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.s3_bucket,
-                Prefix=self.s3_prefix,
-                MaxKeys=1
-            )
-            
-            logger.info(f"S3 connection test successful for bucket: {self.s3_bucket}")
-            return True
-            
-        except ClientError as e:
-            logger.error(f"S3 connection test failed: {e}")
-            return False
+            return self.storage_backend.test_connection()
         except Exception as e:
-            logger.error(f"Unexpected error testing S3 connection: {e}")
+            logger.error(f"Unexpected error testing storage connection: {e}")
             return False
     
     def get_available_districts_from_s3(self) -> Dict[str, List[str]]:
         """
-        Get available districts by listing S3 objects.
+        Get available districts by listing the storage backend.
         
         Returns:
             Dictionary mapping regions to lists of available districts
         """
         try:
-            districts_by_region = {}
-            
-            # List all objects in the restaurants prefix
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.s3_bucket, Prefix=f"{self.s3_prefix}/")
-            
-            for page in pages:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        key = obj['Key']
-                        # Parse key format: restaurants/region/district.json
-                        if key.endswith('.json'):
-                            parts = key.split('/')
-                            if len(parts) >= 3:
-                                region = parts[1]
-                                district = parts[2].replace('.json', '')
-                                
-                                if region not in districts_by_region:
-                                    districts_by_region[region] = []
-                                districts_by_region[region].append(district)
-            
-            logger.info(f"Found districts in S3: {districts_by_region}")
+            districts_by_region = self.storage_backend.list_datasets()
+            logger.info(f"Found districts in {self.storage_backend.name} storage: {districts_by_region}")
             return districts_by_region
             
         except Exception as e:
-            logger.error(f"Error listing districts from S3: {e}")
-            return {}
\ No newline at end of file
+            logger.error(f"Error listing districts from {self.storage_backend.name} storage: {e}")
+            return {}
+    
+    def get_dataset_version(self, region: str, district: str) -> Optional[str]:
+        """
+        Get a version token for the cached data of a district.
+        
+        The storage ETag is used when the backend provides one, so the token is
+        stable across server restarts; otherwise the cache's content version.
+        
+        Args:
+            region: Region name
+            district: District name
+            
+        Returns:
+            Version token, or None if the district is not cached
+        """
+        if self._dataset_cache is None:
+            return None
+        
+        entry = self._dataset_cache.peek((region, district))
+        if entry is None:
+            return None
+        return entry.etag if entry.etag is not None else f"v{entry.version}"
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get dataset cache statistics.
+        
+        Returns:
+            Dictionary with cache size, revalidation interval and hit/miss counters
+        """
+        if self._dataset_cache is None:
+            return {'enabled': False}
+        
+        stats = self._dataset_cache.to_dict()
+        stats['enabled'] = True
+        return stats
+    
+    def invalidate_cache(self, region: Optional[str] = None, district: Optional[str] = None) -> None:
+        """
+        Drop cached district data so the next call re-fetches it.
+        
+        Args:
+            region: Region of the district to drop (all districts if omitted)
+            district: District to drop (all districts if omitted)
+        """
+        if self._dataset_cache is None:
+            return
+        
+        if region and district:
+            self._dataset_cache.invalidate((region, district))
+        else:
+            self._dataset_cache.invalidate()
@@ -0,0 +1,231 @@
+"""In-process cache for parsed district restaurant datasets.
+
+This module provides the DatasetCache class used by DataAccessClient to keep
+parsed RestaurantDataFile objects resident between MCP tool calls. Entries are
+keyed by (region, district) and carry the ETag of the object they were built
+from so that stale entries can be revalidated with a conditional GET instead
+of being downloaded and parsed again.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple, Any
+
+from models.restaurant_models import RestaurantDataFile
+
+
+DatasetKey = Tuple[str, str]
+
+
+@dataclass
+class DatasetCacheStats:
+    """Counters for dataset cache operation."""
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    not_modified: int = 0
+    refreshes: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate as percentage of lookups served without a full fetch."""
+        served = self.hits + self.not_modified
+        total = served + self.misses + self.refreshes
+        if total == 0:
+            return 0.0
+        return (served / total) * 100.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "not_modified": self.not_modified,
+            "refreshes": self.refreshes,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate
+        }
+
+
+@dataclass
+class CachedDataset:
+    """A parsed district dataset held in the cache.
+
+    Attributes:
+        data: Parsed restaurant data shared between requests
+        etag: ETag of the source object, if the backend provided one
+        version: Monotonic version, bumped whenever the content changes
+        loaded_at: Clock time when the content was last (re)loaded
+        checked_at: Clock time when the content was last confirmed current
+    """
+    data: RestaurantDataFile
+    etag: Optional[str]
+    version: int
+    loaded_at: float
+    checked_at: float
+
+
+class DatasetCache:
+    """Thread-safe cache of parsed district datasets.
+
+    A cached entry is served directly while it is younger than the
+    revalidation interval. Once it is older, callers should issue a
+    conditional request using ``get_etag`` and report the outcome with
+    ``mark_not_modified`` or ``put``.
+    """
+
+    def __init__(self, revalidate_interval: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the dataset cache.
+
+        Args:
+            revalidate_interval: Seconds an entry is served before it must be
+                revalidated. Zero revalidates on every lookup.
+            clock: Monotonic clock used for entry ages (injectable for tests)
+        """
+        if revalidate_interval < 0:
+            raise ValueError("revalidate_interval must be non-negative")
+
+        self.revalidate_interval = revalidate_interval
+        self._clock = clock
+        self._entries: Dict[DatasetKey, CachedDataset] = {}
+        self._next_version = 1
+        self._lock = threading.Lock()
+        self.stats = DatasetCacheStats()
+
+    def _is_fresh(self, entry: CachedDataset) -> bool:
+        """Check whether an entry can be served without revalidation."""
+        return (self._clock() - entry.checked_at) < self.revalidate_interval
+
+    def get(self, key: DatasetKey) -> Optional[RestaurantDataFile]:
+        """Return cached data for a key if it does not need revalidation.
+
+        Args:
+            key: (region, district) tuple
+
+        Returns:
+            Cached RestaurantDataFile, or None if missing or stale
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_fresh(entry):
+                self.stats.hits += 1
+                return entry.data
+            return None
+
+    def peek(self, key: DatasetKey) -> Optional[CachedDataset]:
+        """Return a cached entry regardless of freshness, without counting stats.
+
+        Args:
+            key: (region, district) tuple
+
+        Returns:
+            CachedDataset, or None if the key is not cached
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def get_etag(self, key: DatasetKey) -> Optional[str]:
+        """Return the ETag of a cached entry for use in a conditional request.
+
+        Args:
+            key: (region, district) tuple
+
+        Returns:
+            ETag string, or None if there is no entry or it has no ETag
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.etag is not None:
+                self.stats.revalidations += 1
+            return entry.etag
+
+    def mark_not_modified(self, key: DatasetKey) -> Optional[RestaurantDataFile]:
+        """Record that a conditional request found the source unchanged.
+
+        Args:
+            key: (region, district) tuple
+
+        Returns:
+            The cached RestaurantDataFile, or None if the entry was evicted
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.checked_at = self._clock()
+            self.stats.not_modified += 1
+            return entry.data
+
+    def put(self, key: DatasetKey, data: RestaurantDataFile,
+            etag: Optional[str] = None) -> CachedDataset:
+        """Store freshly loaded data for a key.
+
+        Args:
+            key: (region, district) tuple
+            data: Parsed restaurant data
+            etag: ETag of the source object, if available
+
+        Returns:
+            The new cache entry
+        """
+        with self._lock:
+            now = self._clock()
+            if key in self._entries:
+                self.stats.refreshes += 1
+            else:
+                self.stats.misses += 1
+            entry = CachedDataset(
+                data=data,
+                etag=etag,
+                version=self._next_version,
+                loaded_at=now,
+                checked_at=now
+            )
+            self._next_version += 1
+            self._entries[key] = entry
+            return entry
+
+    def get_version(self, key: DatasetKey) -> Optional[int]:
+        """Return the content version of a cached entry.
+
+        Args:
+            key: (region, district) tuple
+
+        Returns:
+            Version number, or None if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.version if entry is not None else None
+
+    def invalidate(self, key: Optional[DatasetKey] = None) -> None:
+        """Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: (region, district) tuple to drop, or None for all
+        """
+        with self._lock:
+            if key is None:
+                self.stats.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert cache state to dictionary for JSON serialization."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "revalidate_interval": self.revalidate_interval,
+                "stats": self.stats.to_dict()
+            }
@@ -19,6 +19,7 @@ from models.district_models import (
     get_all_district_names_from_regions,
     validate_district_name_across_regions
 )
+from services.district_aliases import DistrictAliasIndex
 
 
 class DistrictConfigurationError(Exception):
@@ -46,13 +47,15 @@ class DistrictService:
         self._master_config: Optional[MasterConfig] = None
         self._region_configs: Dict[str, RegionConfig] = {}
         self._district_to_region_map: Dict[str, str] = {}
+        self._alias_index: Optional[DistrictAliasIndex] = None
         self._loaded = False
     
     def load_district_config(self) -> None:
         """Load district configuration from local files.
         
         Loads master configuration and all region configuration files.
-        Creates district-to-region mapping for fast lookups.
+        Creates district-to-region mapping and the district alias index
+        for fast lookups.
         
         Raises:
             DistrictConfigurationError: If configuration files are missing or invalid
@@ -110,6 +113,8 @@ class DistrictService:
                     if district.name not in self._district_to_region_map:
                         self._district_to_region_map[district.name] = region_name
             
+            self._alias_index = DistrictAliasIndex(self._district_to_region_map.items())
+            
             self._loaded = True
             
         except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
@@ -155,9 +160,45 @@ class DistrictService:
         self._ensure_loaded()
         return list(self._district_to_region_map.keys())
     
+    def resolve_district_name(self, district_name: str) -> Optional[str]:
+        """Resolve a district name or common variant to its configured name.
+        
+        Handles case, "district" suffixes, hyphen/space variants, common
+        abbreviations and small typos (see DistrictAliasIndex).
+        
+        Args:
+            district_name: District name as supplied by the caller
+            
+        Returns:
+            Configured district name, or None if it cannot be resolved
+            
+        Raises:
+            DistrictConfigurationError: If configuration is not loaded
+        """
+        self._ensure_loaded()
+        return self._alias_index.resolve(district_name)
+    
+    def suggest_district_names(self, district_name: str, limit: int = 3) -> List[str]:
+        """Suggest configured district names close to an unresolvable name.
+        
+        Args:
+            district_name: District name that could not be resolved
+            limit: Maximum number of suggestions
+            
+        Returns:
+            List of configured district names, closest first
+            
+        Raises:
+            DistrictConfigurationError: If configuration is not loaded
+        """
+        self._ensure_loaded()
+        return self._alias_index.suggest(district_name, limit)
+    
     def validate_district(self, district_name: str) -> bool:
         """Validate if a district name exists in configuration.
         
+        Name variants accepted by resolve_district_name are considered valid.
+        
         Args:
             district_name: Name of the district to validate
             
@@ -167,8 +208,7 @@ class DistrictService:
         Raises:
             DistrictConfigurationError: If configuration is not loaded
         """
-        self._ensure_loaded()
-        return district_name in self._district_to_region_map
+        return self.resolve_district_name(district_name) is not None
     
     def validate_districts(self, district_names: List[str]) -> Tuple[List[str], List[str]]:
         """Validate multiple district names.
@@ -177,7 +217,8 @@ class DistrictService:
             district_names: List of district names to validate
             
         Returns:
-            Tuple of (valid_districts, invalid_districts)
+            Tuple of (valid_districts, invalid_districts); valid districts are
+            returned under their configured names
             
         Raises:
             DistrictConfigurationError: If configuration is not loaded
@@ -188,8 +229,9 @@ class DistrictService:
         invalid_districts = []
         
         for district_name in district_names:
-            if self.validate_district(district_name):
-                valid_districts.append(district_name)
+            canonical_name = self._alias_index.resolve(district_name)
+            if canonical_name is not None:
+                valid_districts.append(canonical_name)
             else:
                 invalid_districts.append(district_name)
         
@@ -375,6 +417,7 @@ class DistrictService:
         self._master_config = None
         self._region_configs = {}
         self._district_to_region_map = {}
+        self._alias_index = None
         
         self.load_district_config()
     
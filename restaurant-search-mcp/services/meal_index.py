@@ -0,0 +1,132 @@
+"""Precomputed meal-type index over restaurant datasets.
+
+This module provides the MealTypeIndex class, which computes a meal coverage
+bitmask (meal type x day type) for every restaurant once when a district
+dataset is loaded, and keeps an inverted index from each mask bit to the set
+of restaurant ids. Meal-type filtering then becomes a set lookup instead of
+re-parsing operating hours for every restaurant on every request.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Set, FrozenSet
+
+from models.restaurant_models import Restaurant
+from services.time_service import TimeService
+
+
+class MealTypeIndex:
+    """Meal coverage masks and inverted index for a list of restaurants."""
+
+    def __init__(self, restaurants: Iterable[Restaurant],
+                 time_service: Optional[TimeService] = None):
+        """Build the index.
+
+        Args:
+            restaurants: Restaurants to index (typically one district file)
+            time_service: TimeService used to compute masks
+        """
+        self.time_service = time_service or TimeService()
+        self._restaurants: Dict[str, Restaurant] = {
+            restaurant.id: restaurant for restaurant in restaurants
+        }
+        self._masks: Dict[str, int] = self.time_service.compute_meal_masks(self._restaurants.values())
+
+        bit_count = len(TimeService.MEAL_TYPE_ORDER) * len(TimeService.DAY_TYPES)
+        ids_by_bit: List[Set[str]] = [set() for _ in range(bit_count)]
+
+        for restaurant_id, mask in self._masks.items():
+            bit = 0
+            while mask:
+                if mask & 1:
+                    ids_by_bit[bit].add(restaurant_id)
+                mask >>= 1
+                bit += 1
+
+        self._ids_by_bit: List[FrozenSet[str]] = [frozenset(ids) for ids in ids_by_bit]
+        self._ids_by_meal: Dict[str, FrozenSet[str]] = {}
+        for meal_type in TimeService.MEAL_TYPE_ORDER:
+            meal_ids: Set[str] = set()
+            for day_type in TimeService.DAY_TYPES:
+                meal_ids |= self._ids_for_bit(meal_type, day_type)
+            self._ids_by_meal[meal_type] = frozenset(meal_ids)
+
+    def _ids_for_bit(self, meal_type: str, day_type: str) -> FrozenSet[str]:
+        """Get ids of restaurants serving a meal on a day type."""
+        bit = self.time_service.meal_type_bit(meal_type, day_type)
+        return self._ids_by_bit[bit.bit_length() - 1]
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def __contains__(self, restaurant_id: str) -> bool:
+        return restaurant_id in self._masks
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._masks)
+
+    def get_mask(self, restaurant_id: str) -> Optional[int]:
+        """Get the meal coverage mask of an indexed restaurant.
+
+        Args:
+            restaurant_id: Restaurant identifier
+
+        Returns:
+            Meal coverage bitmask, or None if the restaurant is not indexed
+        """
+        return self._masks.get(restaurant_id)
+
+    def get_restaurant_mask(self, restaurant: Restaurant) -> Optional[int]:
+        """Get the meal coverage mask of a restaurant record from this index.
+
+        Only the record the index was built from matches, so a record with
+        the same id from a newer dataset is not given a stale mask.
+
+        Args:
+            restaurant: Restaurant record
+
+        Returns:
+            Meal coverage bitmask, or None if the record was not indexed here
+        """
+        if self._restaurants.get(restaurant.id) is not restaurant:
+            return None
+        return self._masks.get(restaurant.id)
+
+    def ids_for_meal_types(self, meal_types: Iterable[str],
+                           day_types: Optional[Iterable[str]] = None) -> Set[str]:
+        """Get ids of restaurants serving any of the given meal types.
+
+        Args:
+            meal_types: Meal types to match (any of them)
+            day_types: Restrict matching to these day types (all if omitted)
+
+        Returns:
+            Set of matching restaurant ids
+        """
+        result: Set[str] = set()
+        for meal_type in meal_types:
+            meal_type = meal_type.lower()
+            if meal_type not in self._ids_by_meal:
+                continue
+            if day_types is None:
+                result |= self._ids_by_meal[meal_type]
+            else:
+                for day_type in day_types:
+                    result |= self._ids_for_bit(meal_type, day_type)
+        return result
+
+    def filter_restaurants(self, restaurants: Iterable[Restaurant],
+                           meal_types: Iterable[str]) -> List[Restaurant]:
+        """Keep restaurants that serve any of the given meal types.
+
+        Args:
+            restaurants: Candidate restaurants, all present in this index
+            meal_types: Meal types to match (any of them)
+
+        Returns:
+            Matching restaurants in their original order
+        """
+        matching_ids = self.ids_for_meal_types(meal_types)
+        return [restaurant for restaurant in restaurants if restaurant.id in matching_ids]
+
+    def get_meal_type_counts(self) -> Dict[str, int]:
+        """Get the number of indexed restaurants serving each meal type."""
+        return {meal_type: len(ids) for meal_type, ids in self._ids_by_meal.items()}
@@ -0,0 +1,239 @@
+"""Pagination and field projection for restaurant search results.
+
+This module provides opaque page cursors and the RestaurantPage result used by
+RestaurantService.search_page. A cursor records the offset of the next page
+together with a fingerprint of the query and of the dataset versions the first
+page was computed from. If the underlying district data changes between pages
+the cursor is rejected instead of silently skipping or repeating restaurants.
+"""
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from models.restaurant_models import Restaurant, RESTAURANT_WIRE_FIELDS
+
+
+# Upper bound on a single page
+MAX_PAGE_LIMIT = 500
+
+
+class PaginationError(Exception):
+    """Exception raised for invalid limits, offsets, cursors or fields."""
+    pass
+
+
+def fingerprint(*parts: Any) -> str:
+    """Build a short fingerprint of query parameters or dataset versions.
+
+    Args:
+        *parts: JSON-serializable values; order is significant
+
+    Returns:
+        Hex fingerprint string
+    """
+    payload = json.dumps(parts, separators=(',', ':'), default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def encode_cursor(offset: int, query_key: str, dataset_version: str) -> str:
+    """Encode an opaque cursor for the page starting at offset.
+
+    Args:
+        offset: Offset of the next page
+        query_key: Fingerprint of the query (see fingerprint)
+        dataset_version: Version token of the data the results came from
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({'o': offset, 'q': query_key, 'v': dataset_version},
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, query_key: str, dataset_version: str) -> int:
+    """Decode a cursor and check it belongs to this query and dataset version.
+
+    Args:
+        cursor: Cursor returned with a previous page
+        query_key: Fingerprint of the current query
+        dataset_version: Current dataset version token
+
+    Returns:
+        Offset encoded in the cursor
+
+    Raises:
+        PaginationError: If the cursor is malformed, was issued for another
+            query, or the dataset has changed since it was issued
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        offset = int(payload['o'])
+        cursor_query = payload['q']
+        cursor_version = payload['v']
+    except (ValueError, KeyError, TypeError, UnicodeError):
+        raise PaginationError("Invalid cursor")
+
+    if offset < 0:
+        raise PaginationError("Invalid cursor: negative offset")
+    if cursor_query != query_key:
+        raise PaginationError("Cursor was issued for a different query")
+    if cursor_version != dataset_version:
+        raise PaginationError(
+            "Restaurant data has changed since the cursor was issued; restart from the first page"
+        )
+    return offset
+
+
+def validate_fields(fields: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+    """Validate a field projection.
+
+    Args:
+        fields: Requested restaurant fields, or None for all fields
+
+    Returns:
+        Tuple of lowercased field names in response order, or None for all
+
+    Raises:
+        PaginationError: If the projection is empty or names unknown fields
+    """
+    if fields is None:
+        return None
+
+    requested = {str(name).strip().lower() for name in fields}
+    if not requested:
+        raise PaginationError("Fields projection cannot be empty")
+
+    unknown = requested.difference(RESTAURANT_WIRE_FIELDS)
+    if unknown:
+        raise PaginationError(
+            f"Invalid fields: {sorted(unknown)}. Valid fields: {list(RESTAURANT_WIRE_FIELDS)}"
+        )
+    return tuple(name for name in RESTAURANT_WIRE_FIELDS if name in requested)
+
+
+def validate_limit(limit: Optional[int]) -> Optional[int]:
+    """Validate a page size.
+
+    Args:
+        limit: Requested page size, or None for all remaining results
+
+    Returns:
+        The validated limit
+
+    Raises:
+        PaginationError: If limit is outside 1..MAX_PAGE_LIMIT
+    """
+    if limit is None:
+        return None
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1 or limit > MAX_PAGE_LIMIT:
+        raise PaginationError(f"limit must be an integer between 1 and {MAX_PAGE_LIMIT}")
+    return limit
+
+
+@dataclass
+class RestaurantPage:
+    """One page of restaurant search results.
+
+    Attributes:
+        restaurants: Restaurants on this page
+        total_count: Number of restaurants matching the query
+        offset: Offset of the first restaurant on this page
+        limit: Requested page size (None means all remaining results)
+        dataset_version: Version token of the data the page was built from
+        next_cursor: Cursor for the next page, or None on the last page
+        fields: Field projection to apply when serializing, or None for all
+        meal_analysis: Meal type analysis of all matching restaurants, not
+            just this page, or None if it was not requested
+        district_counts: Restaurants per requested district, or None if
+            they were not requested
+    """
+    restaurants: List[Restaurant]
+    total_count: int
+    offset: int
+    limit: Optional[int]
+    dataset_version: str
+    next_cursor: Optional[str] = None
+    fields: Optional[Tuple[str, ...]] = None
+    meal_analysis: Optional[Dict[str, Any]] = None
+    district_counts: Optional[Dict[str, int]] = None
+
+    @property
+    def has_more(self) -> bool:
+        """True if more results follow this page."""
+        return self.next_cursor is not None
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """Pagination metadata for MCP tool responses.
+
+        Returns:
+            Dictionary with total_results, returned, offset, limit, has_more,
+            next_cursor, next_offset, dataset_version and fields
+        """
+        return {
+            'total_results': self.total_count,
+            'returned': len(self.restaurants),
+            'offset': self.offset,
+            'limit': self.limit,
+            'has_more': self.has_more,
+            'next_cursor': self.next_cursor,
+            'next_offset': self.offset + len(self.restaurants) if self.has_more else None,
+            'dataset_version': self.dataset_version,
+            'fields': list(self.fields) if self.fields is not None else None
+        }
+
+
+def paginate(restaurants: List[Restaurant], query_key: str, dataset_version: str,
+             limit: Optional[int] = None, offset: Optional[int] = None,
+             cursor: Optional[str] = None,
+             fields: Optional[Iterable[str]] = None) -> RestaurantPage:
+    """Slice search results into a page.
+
+    Args:
+        restaurants: All matching restaurants, in result order
+        query_key: Fingerprint of the query
+        dataset_version: Version token of the data the results came from
+        limit: Page size (all remaining results if omitted)
+        offset: Offset of the first result (cannot be combined with cursor)
+        cursor: Cursor from a previous page of the same query
+        fields: Field projection
+
+    Returns:
+        RestaurantPage
+
+    Raises:
+        PaginationError: If parameters are invalid or the cursor is stale
+    """
+    limit = validate_limit(limit)
+    projected_fields = validate_fields(fields)
+
+    if cursor:
+        if offset:
+            raise PaginationError("Specify either cursor or offset, not both")
+        start = decode_cursor(cursor, query_key, dataset_version)
+    else:
+        start = offset or 0
+        if isinstance(start, bool) or not isinstance(start, int) or start < 0:
+            raise PaginationError("offset must be a non-negative integer")
+
+    total_count = len(restaurants)
+    end = total_count if limit is None else min(start + limit, total_count)
+    page_restaurants = restaurants[start:end]
+
+    next_cursor = None
+    if end < total_count:
+        next_cursor = encode_cursor(end, query_key, dataset_version)
+
+    return RestaurantPage(
+        restaurants=page_restaurants,
+        total_count=total_count,
+        offset=start,
+        limit=limit,
+        dataset_version=dataset_version,
+        next_cursor=next_cursor,
+        fields=projected_fields
+    )
@@ -0,0 +1,307 @@
+"""JSON response encoding for MCP tool results.
+
+This module provides the ResponseEncoder class used by the MCP server to turn
+search results into JSON strings. Output is pretty-printed with 2-space
+indentation by default, as the server always returned it; compact output is
+opt-in. orjson or msgspec is used when installed, falling back to the
+standard library.
+
+Restaurant records are serialized through Restaurant.to_wire(). Records are
+shared through the dataset cache and are not modified in place (see
+models.restaurant_models), so the encoder keeps their serialized fragments in
+a bounded cache and splices them into later responses instead of encoding the
+same restaurant again.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, Iterable, Optional, Tuple
+
+from models.restaurant_models import Restaurant
+
+
+logger = logging.getLogger(__name__)
+
+VALID_STYLES = ('compact', 'pretty')
+VALID_BACKENDS = ('auto', 'orjson', 'msgspec', 'json')
+
+# Default bound on cached per-restaurant fragments (all shipped districts fit)
+DEFAULT_FRAGMENT_CACHE_SIZE = 4096
+
+# Indentation of each restaurant object in a pretty response
+# (root -> data -> restaurants array)
+RESTAURANT_INDENT = 6
+
+
+def _indent(text: str, spaces: int) -> str:
+    """Indent every line of pretty JSON after the first.
+
+    JSON strings cannot contain raw newlines, so every newline is a line break.
+    """
+    return text.replace('\n', '\n' + ' ' * spaces)
+
+
+def _load_backend(backend: str) -> Tuple[str, Callable[[Any], str], Callable[[Any], str]]:
+    """Resolve a JSON backend to (name, compact encoder, pretty encoder).
+
+    Args:
+        backend: One of VALID_BACKENDS
+
+    Returns:
+        Tuple of backend name and encoding functions
+
+    Raises:
+        ImportError: If an explicitly requested backend is not installed
+    """
+    if backend in ('auto', 'orjson'):
+        try:
+            import orjson
+
+            def orjson_compact(obj: Any) -> str:
+                return orjson.dumps(obj, default=str).decode('utf-8')
+
+            def orjson_pretty(obj: Any) -> str:
+                return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+            return 'orjson', orjson_compact, orjson_pretty
+        except ImportError:
+            if backend == 'orjson':
+                raise
+
+    if backend in ('auto', 'msgspec'):
+        try:
+            import msgspec
+
+            msgspec_encoder = msgspec.json.Encoder(enc_hook=str)
+
+            def msgspec_compact(obj: Any) -> str:
+                return msgspec_encoder.encode(obj).decode('utf-8')
+
+            def msgspec_pretty(obj: Any) -> str:
+                return msgspec.json.format(msgspec_encoder.encode(obj), indent=2).decode('utf-8')
+
+            return 'msgspec', msgspec_compact, msgspec_pretty
+        except ImportError:
+            if backend == 'msgspec':
+                raise
+
+    def json_compact(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), default=str)
+
+    def json_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2, default=str)
+
+    return 'json', json_compact, json_pretty
+
+
+@dataclass
+class FragmentCacheStats:
+    """Counters for the restaurant fragment cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate as percentage."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits / total) * 100.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate
+        }
+
+
+class ResponseEncoder:
+    """Encoder for MCP tool JSON responses."""
+
+    def __init__(self, style: str = 'pretty', backend: str = 'auto',
+                 fragment_cache_size: int = DEFAULT_FRAGMENT_CACHE_SIZE):
+        """Initialize the response encoder.
+
+        Args:
+            style: 'pretty' for 2-space indentation or 'compact' for minimal whitespace
+            backend: JSON library: 'auto' (orjson, then msgspec, then json),
+                'orjson', 'msgspec' or 'json'
+            fragment_cache_size: Maximum cached restaurant fragments (0 disables)
+
+        Raises:
+            ValueError: If style or backend is not recognised
+            ImportError: If an explicitly requested backend is not installed
+        """
+        if style not in VALID_STYLES:
+            raise ValueError(f"Invalid response style: {style}. Valid styles: {list(VALID_STYLES)}")
+        if backend not in VALID_BACKENDS:
+            raise ValueError(f"Invalid JSON backend: {backend}. Valid backends: {list(VALID_BACKENDS)}")
+
+        self.style = style
+        self.backend, self._compact, self._pretty = _load_backend(backend)
+        self.fragment_cache_size = max(0, fragment_cache_size)
+        # Restaurant id -> (restaurant object the fragment was built from, fragment)
+        self._fragments: "OrderedDict[str, Tuple[Restaurant, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = FragmentCacheStats()
+        logger.info(f"Response encoder: style={self.style}, backend={self.backend}")
+
+    @classmethod
+    def from_environment(cls) -> 'ResponseEncoder':
+        """Create an encoder configured from environment variables.
+
+        MCP_RESPONSE_STYLE selects pretty/compact output (default pretty) and
+        MCP_JSON_BACKEND selects the JSON library (default auto).
+
+        Returns:
+            Configured ResponseEncoder
+        """
+        return cls(
+            style=os.getenv('MCP_RESPONSE_STYLE', 'pretty').lower(),
+            backend=os.getenv('MCP_JSON_BACKEND', 'auto').lower(),
+            fragment_cache_size=int(os.getenv('MCP_FRAGMENT_CACHE_SIZE', str(DEFAULT_FRAGMENT_CACHE_SIZE)))
+        )
+
+    def encode(self, obj: Any) -> str:
+        """Encode an arbitrary JSON-compatible object in the configured style.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            JSON string
+        """
+        if self.style == 'pretty':
+            return self._pretty(obj)
+        return self._compact(obj)
+
+    def _wire_fragment(self, restaurant: Restaurant,
+                       fields: Optional[Collection[str]] = None) -> str:
+        """Serialize a restaurant in the configured style.
+
+        Pretty fragments are indented for their position in the restaurants
+        array of encode_restaurant_response.
+        """
+        fragment = restaurant.to_wire(fields)
+        if self.style == 'pretty':
+            fragment = _indent(self._pretty(json.loads(fragment)), RESTAURANT_INDENT)
+        return fragment
+
+    def restaurant_fragment(self, restaurant: Restaurant) -> str:
+        """Get the JSON fragment for a restaurant, using the cache.
+
+        A cached fragment is reused only if it was built from the very same
+        restaurant object, so refreshed district data is never served stale.
+
+        Args:
+            restaurant: Restaurant to serialize
+
+        Returns:
+            JSON object string in the configured style
+        """
+        if self.fragment_cache_size == 0:
+            return self._wire_fragment(restaurant)
+
+        with self._lock:
+            cached = self._fragments.get(restaurant.id)
+            if cached is not None and cached[0] is restaurant:
+                self._fragments.move_to_end(restaurant.id)
+                self.stats.hits += 1
+                return cached[1]
+
+        fragment = self._wire_fragment(restaurant)
+        with self._lock:
+            self.stats.misses += 1
+            self._fragments[restaurant.id] = (restaurant, fragment)
+            self._fragments.move_to_end(restaurant.id)
+            while len(self._fragments) > self.fragment_cache_size:
+                self._fragments.popitem(last=False)
+                self.stats.evictions += 1
+        return fragment
+
+    def encode_restaurants(self, restaurants: Iterable[Restaurant],
+                           fields: Optional[Collection[str]] = None) -> str:
+        """Encode restaurants as a JSON array of cached fragments.
+
+        Args:
+            restaurants: Restaurants to encode
+            fields: Optional projection of RESTAURANT_WIRE_FIELDS; projected
+                fragments are small and are not cached
+
+        Returns:
+            JSON array string, indented for the restaurants field of
+            encode_restaurant_response in pretty style
+        """
+        if fields is not None:
+            fragments = [self._wire_fragment(r, fields) for r in restaurants]
+        else:
+            fragments = [self.restaurant_fragment(r) for r in restaurants]
+
+        if self.style == 'pretty':
+            if not fragments:
+                return '[]'
+            item_separator = '\n' + ' ' * RESTAURANT_INDENT
+            return ('[' + item_separator + (',' + item_separator).join(fragments) +
+                    '\n' + ' ' * (RESTAURANT_INDENT - 2) + ']')
+        return '[' + ','.join(fragments) + ']'
+
+    def encode_restaurant_response(self, restaurants: Iterable[Restaurant],
+                                   metadata: Optional[Dict[str, Any]] = None,
+                                   fields: Optional[Collection[str]] = None) -> str:
+        """Encode the standard restaurant search response envelope.
+
+        The envelope is spliced around the restaurant fragments. Pretty
+        output is the same document json.dumps(response, indent=2) produces.
+
+        Args:
+            restaurants: Restaurants to include
+            metadata: Optional metadata to include under data.metadata
+            fields: Optional projection of restaurant fields
+
+        Returns:
+            JSON string with success, data.restaurants, data.count and
+            optionally data.metadata
+        """
+        restaurants = list(restaurants)
+        restaurants_json = self.encode_restaurants(restaurants, fields)
+
+        if self.style == 'pretty':
+            response_json = (
+                '{\n  "success": true,\n  "data": {\n    "restaurants": ' + restaurants_json +
+                ',\n    "count": ' + str(len(restaurants))
+            )
+            if metadata:
+                response_json += ',\n    "metadata": ' + _indent(self._pretty(metadata), 4)
+            return response_json + '\n  }\n}'
+
+        response_json = (
+            '{"success":true,"data":{"restaurants":' + restaurants_json +
+            ',"count":' + str(len(restaurants))
+        )
+        if metadata:
+            response_json += ',"metadata":' + self._compact(metadata)
+        return response_json + '}}'
+
+    def clear_cache(self) -> None:
+        """Drop all cached restaurant fragments."""
+        with self._lock:
+            self._fragments.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get encoder configuration and fragment cache statistics."""
+        with self._lock:
+            return {
+                "style": self.style,
+                "backend": self.backend,
+                "fragment_cache_size": self.fragment_cache_size,
+                "cached_fragments": len(self._fragments),
+                "fragment_cache": self.stats.to_dict()
+            }
@@ -6,13 +6,18 @@ service, time service, and data access client to provide comprehensive search
 capabilities for the MCP server.
 """
 
+import heapq
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+from itertools import islice
+from typing import Iterator, List, Dict, Optional, Set, Tuple, Any
 
 from models.restaurant_models import Restaurant, RestaurantDataFile
+from models.restaurant_columns import SORT_KEYS
 from services.district_service import DistrictService, DistrictConfigurationError
 from services.time_service import TimeService
 from services.data_access import DataAccessClient
+from services.meal_index import MealTypeIndex
+from services.pagination import RestaurantPage, PaginationError, fingerprint, paginate
 
 
 logger = logging.getLogger(__name__)
@@ -41,6 +46,12 @@ class RestaurantService:
         self.time_service = TimeService()
         self.data_access_client = DataAccessClient()
         self._initialized = False
+        # District key -> (dataset version and data file the index was built from, index)
+        self._meal_indexes: Dict[str, Tuple[str, RestaurantDataFile, MealTypeIndex]] = {}
+        # Restaurant id -> meal-type index of its district, replaced with that index
+        self._meal_indexes_by_id: Dict[str, MealTypeIndex] = {}
+        # District key -> region key, filled as districts are resolved
+        self._district_regions: Dict[str, str] = {}
     
     def _ensure_initialized(self) -> None:
         """Ensure services are initialized before operations.
@@ -68,6 +79,29 @@ class RestaurantService:
         Raises:
             RestaurantSearchError: If search fails or districts are invalid
         """
+        restaurant_data_files = self._get_district_data(districts)
+        
+        # Combine all restaurants from all districts
+        all_restaurants = []
+        for district_key, data_file in restaurant_data_files.items():
+            all_restaurants.extend(data_file.restaurants)
+            logger.info(f"Retrieved {len(data_file.restaurants)} restaurants from {district_key}")
+        
+        logger.info(f"Total restaurants found: {len(all_restaurants)}")
+        return all_restaurants
+    
+    def _get_district_data(self, districts: List[str]) -> Dict[str, RestaurantDataFile]:
+        """Validate districts and retrieve their restaurant data files.
+        
+        Args:
+            districts: List of district names to search
+            
+        Returns:
+            Dictionary mapping district keys to RestaurantDataFile objects
+            
+        Raises:
+            RestaurantSearchError: If retrieval fails or districts are invalid
+        """
         self._ensure_initialized()
         
         if not districts:
@@ -77,9 +111,15 @@ class RestaurantService:
         valid_districts, invalid_districts = self.district_service.validate_districts(districts)
         
         if invalid_districts:
+            suggestions = {
+                district: self.district_service.suggest_district_names(district)
+                for district in invalid_districts
+            }
+            suggestions = {district: names for district, names in suggestions.items() if names}
+            hint = f"Did you mean: {suggestions}. " if suggestions else ""
             available_districts = self.district_service.get_all_district_names()
             raise RestaurantSearchError(
-                f"Invalid districts: {invalid_districts}. "
+                f"Invalid districts: {invalid_districts}. {hint}"
                 f"Available districts: {available_districts}"
             )
         
@@ -94,50 +134,33 @@ class RestaurantService:
                 region_key = region.lower().replace(' ', '-')
                 district_key = district.lower().replace(' ', '-')
                 region_district_pairs.append((region_key, district_key))
+                self._district_regions[district_key] = region_key
             else:
                 logger.warning(f"No region found for district: {district}")
         
         if not region_district_pairs:
             logger.warning("No valid region-district pairs found")
-            return []
+            return {}
         
         # Retrieve restaurant data from S3
         try:
-            restaurant_data_files = self.data_access_client.get_multiple_restaurant_data(
-                region_district_pairs
-            )
-            
-            # Combine all restaurants from all districts
-            all_restaurants = []
-            for district_key, data_file in restaurant_data_files.items():
-                all_restaurants.extend(data_file.restaurants)
-                logger.info(f"Retrieved {len(data_file.restaurants)} restaurants from {district_key}")
-            
-            logger.info(f"Total restaurants found: {len(all_restaurants)}")
-            return all_restaurants
-            
+            return self.data_access_client.get_multiple_restaurant_data(region_district_pairs)
         except Exception as e:
             logger.error(f"Error retrieving restaurant data: {e}")
             raise RestaurantSearchError(f"Failed to retrieve restaurant data: {e}")
     
-    def search_by_meal_types(self, meal_types: List[str]) -> List[Restaurant]:
-        """Search for restaurants by meal type based on operating hours.
+    def _validate_meal_types(self, meal_types: List[str]) -> List[str]:
+        """Validate and lowercase meal types.
         
         Args:
-            meal_types: List of meal types ("breakfast", "lunch", "dinner")
+            meal_types: List of meal types to validate
             
         Returns:
-            List of Restaurant objects that serve the specified meal types
+            List of lowercased meal types
             
         Raises:
-            RestaurantSearchError: If search fails or meal types are invalid
+            RestaurantSearchError: If any meal type is invalid
         """
-        self._ensure_initialized()
-        
-        if not meal_types:
-            raise RestaurantSearchError("Meal types list cannot be empty")
-        
-        # Validate meal types
         valid_meal_types = []
         invalid_meal_types = []
         
@@ -153,6 +176,97 @@ class RestaurantService:
                 f"Valid meal types: {list(self.time_service.VALID_MEAL_TYPES)}"
             )
         
+        return valid_meal_types
+    
+    def _get_meal_index(self, district_key: str, data_file: RestaurantDataFile) -> MealTypeIndex:
+        """Get the meal-type index for a district data file, building it if needed.
+        
+        Indexes are rebuilt when the district's dataset version changes or the
+        data access layer hands back a different data file object. The
+        restaurant id lookup used by get_meal_type_analysis is updated at the
+        same time, dropping ids that are no longer in the district.
+        
+        Args:
+            district_key: District key the data file was loaded under
+            data_file: Restaurant data file for the district
+            
+        Returns:
+            MealTypeIndex over the district's restaurants
+        """
+        version = self._get_district_version(district_key, data_file)
+        cached = self._meal_indexes.get(district_key)
+        if cached is not None and cached[0] == version and cached[1] is data_file:
+            return cached[2]
+        
+        index = MealTypeIndex(data_file.restaurants, self.time_service)
+        if cached is not None:
+            stale_index = cached[2]
+            for restaurant_id in stale_index:
+                if self._meal_indexes_by_id.get(restaurant_id) is stale_index:
+                    del self._meal_indexes_by_id[restaurant_id]
+        for restaurant_id in index:
+            self._meal_indexes_by_id[restaurant_id] = index
+        self._meal_indexes[district_key] = (version, data_file, index)
+        logger.debug(f"Built meal-type index for {district_key} ({len(index)} restaurants)")
+        return index
+    
+    def _filter_by_meal_types(self, restaurant_data_files: Dict[str, RestaurantDataFile],
+                              meal_types: List[str]) -> List[Restaurant]:
+        """Filter district data files down to restaurants serving any meal type.
+        
+        Args:
+            restaurant_data_files: Dictionary mapping district keys to data files
+            meal_types: Validated, lowercased meal types
+            
+        Returns:
+            Matching restaurants in district order
+        """
+        matching_restaurants = []
+        for district_key, data_file in restaurant_data_files.items():
+            index = self._get_meal_index(district_key, data_file)
+            matching_restaurants.extend(
+                index.filter_restaurants(data_file.restaurants, meal_types)
+            )
+        return matching_restaurants
+    
+    def _get_meal_mask(self, restaurant: Restaurant) -> int:
+        """Get the meal coverage mask for a restaurant.
+        
+        Uses the precomputed mask when the restaurant record is the one its
+        district's current index was built from, otherwise computes it from
+        the operating hours.
+        
+        Args:
+            restaurant: Restaurant to look up
+            
+        Returns:
+            Meal coverage bitmask
+        """
+        index = self._meal_indexes_by_id.get(restaurant.id)
+        mask = index.get_restaurant_mask(restaurant) if index is not None else None
+        if mask is None:
+            mask = self.time_service.compute_meal_mask(restaurant.operating_hours)
+        return mask
+    
+    def search_by_meal_types(self, meal_types: List[str]) -> List[Restaurant]:
+        """Search for restaurants by meal type based on operating hours.
+        
+        Args:
+            meal_types: List of meal types ("breakfast", "lunch", "dinner")
+            
+        Returns:
+            List of Restaurant objects that serve the specified meal types
+            
+        Raises:
+            RestaurantSearchError: If search fails or meal types are invalid
+        """
+        self._ensure_initialized()
+        
+        if not meal_types:
+            raise RestaurantSearchError("Meal types list cannot be empty")
+        
+        valid_meal_types = self._validate_meal_types(meal_types)
+        
         logger.info(f"Searching restaurants for meal types: {valid_meal_types}")
         
         # Get all districts to search across all available data
@@ -160,20 +274,10 @@ class RestaurantService:
         
         # Get all restaurant data
         try:
-            all_restaurants = self.search_by_districts(all_districts)
-            
-            # Filter restaurants by meal type
-            matching_restaurants = []
-            for restaurant in all_restaurants:
-                # Check if restaurant serves any of the requested meal types
-                serves_meal = False
-                for meal_type in valid_meal_types:
-                    if self.time_service.is_open_for_meal(restaurant.operating_hours, meal_type):
-                        serves_meal = True
-                        break
-                
-                if serves_meal:
-                    matching_restaurants.append(restaurant)
+            restaurant_data_files = self._get_district_data(all_districts)
+            matching_restaurants = self._filter_by_meal_types(
+                restaurant_data_files, valid_meal_types
+            )
             
             logger.info(f"Found {len(matching_restaurants)} restaurants serving meal types: {valid_meal_types}")
             return matching_restaurants
@@ -183,12 +287,17 @@ class RestaurantService:
             raise RestaurantSearchError(f"Failed to search by meal types: {e}")
     
     def search_combined(self, districts: Optional[List[str]] = None, 
-                       meal_types: Optional[List[str]] = None) -> List[Restaurant]:
+                       meal_types: Optional[List[str]] = None,
+                       sort_by: Optional[str] = None,
+                       top_k: Optional[int] = None) -> List[Restaurant]:
         """Search for restaurants by both district and meal type criteria.
         
         Args:
             districts: Optional list of district names to search
             meal_types: Optional list of meal types to filter by
+            sort_by: Optional ranking, best first: "likes", "combined_sentiment"
+                or "quality_score" (district order if omitted)
+            top_k: Optional maximum number of restaurants to return
             
         Returns:
             List of Restaurant objects matching both criteria
@@ -201,52 +310,237 @@ class RestaurantService:
         if not districts and not meal_types:
             raise RestaurantSearchError("At least one of districts or meal_types must be provided")
         
-        logger.info(f"Combined search - districts: {districts}, meal_types: {meal_types}")
+        logger.info(f"Combined search - districts: {districts}, meal_types: {meal_types}, "
+                    f"sort_by: {sort_by}, top_k: {top_k}")
         
-        # Start with district-based search if districts are specified
-        if districts:
-            restaurants = self.search_by_districts(districts)
-        else:
-            # If no districts specified, get all restaurants
-            all_districts = self.district_service.get_all_district_names()
-            restaurants = self.search_by_districts(all_districts)
-        
-        # Filter by meal types if specified
-        if meal_types:
-            # Validate meal types
-            valid_meal_types = []
-            invalid_meal_types = []
-            
-            for meal_type in meal_types:
-                if self.time_service.validate_meal_type(meal_type):
-                    valid_meal_types.append(meal_type.lower())
-                else:
-                    invalid_meal_types.append(meal_type)
-            
-            if invalid_meal_types:
-                raise RestaurantSearchError(
-                    f"Invalid meal types: {invalid_meal_types}. "
-                    f"Valid meal types: {list(self.time_service.VALID_MEAL_TYPES)}"
-                )
-            
-            # Filter restaurants by meal type
-            filtered_restaurants = []
-            for restaurant in restaurants:
-                # Check if restaurant serves any of the requested meal types
-                serves_meal = False
-                for meal_type in valid_meal_types:
-                    if self.time_service.is_open_for_meal(restaurant.operating_hours, meal_type):
-                        serves_meal = True
-                        break
-                
-                if serves_meal:
-                    filtered_restaurants.append(restaurant)
-            
-            restaurants = filtered_restaurants
+        restaurants, _ = self._search_data_files(districts, meal_types, sort_by, top_k)
         
         logger.info(f"Combined search found {len(restaurants)} restaurants")
         return restaurants
     
+    def _search_data_files(self, districts: Optional[List[str]],
+                           meal_types: Optional[List[str]],
+                           sort_by: Optional[str] = None,
+                           top_k: Optional[int] = None) -> Tuple[List[Restaurant], Dict[str, RestaurantDataFile]]:
+        """Run a combined search and also return the data files it read.
+        
+        Args:
+            districts: Optional list of district names (all districts if omitted)
+            meal_types: Optional list of meal types to filter by
+            sort_by: Optional ranking (see search_combined)
+            top_k: Optional maximum number of restaurants to return
+            
+        Returns:
+            Tuple of matching restaurants and the district data files searched
+            
+        Raises:
+            RestaurantSearchError: If search fails or parameters are invalid
+        """
+        self._validate_ranking(sort_by, top_k)
+        valid_meal_types = self._validate_meal_types(meal_types) if meal_types else None
+        
+        # Start with district-based search if districts are specified,
+        # otherwise get all restaurants
+        if not districts:
+            districts = self.district_service.get_all_district_names()
+        
+        restaurant_data_files = self._get_district_data(districts)
+        
+        if sort_by:
+            restaurants = self._rank_restaurants(restaurant_data_files, valid_meal_types, sort_by, top_k)
+        elif valid_meal_types:
+            # Filter by meal types if specified
+            restaurants = self._filter_by_meal_types(restaurant_data_files, valid_meal_types)
+        else:
+            restaurants = []
+            for data_file in restaurant_data_files.values():
+                restaurants.extend(data_file.restaurants)
+        
+        if top_k is not None:
+            restaurants = restaurants[:top_k]
+        
+        return restaurants, restaurant_data_files
+    
+    def _validate_ranking(self, sort_by: Optional[str], top_k: Optional[int]) -> None:
+        """Validate ranking parameters.
+        
+        Args:
+            sort_by: Requested ranking
+            top_k: Requested maximum number of results
+            
+        Raises:
+            RestaurantSearchError: If sort_by is unknown or top_k is not positive
+        """
+        if sort_by is not None and sort_by not in SORT_KEYS:
+            raise RestaurantSearchError(
+                f"Invalid sort_by: {sort_by}. Valid values: {list(SORT_KEYS)}"
+            )
+        
+        if top_k is not None and (isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1):
+            raise RestaurantSearchError("top_k must be a positive integer")
+    
+    def _rank_restaurants(self, restaurant_data_files: Dict[str, RestaurantDataFile],
+                          meal_types: Optional[List[str]], sort_by: str,
+                          top_k: Optional[int] = None) -> List[Restaurant]:
+        """Rank restaurants across districts using the presorted district columns.
+        
+        Each district contributes its positions in presorted order (filtered to
+        the meal types if given); the streams are heap-merged and only the first
+        top_k are materialized. Ties keep district order, then file order.
+        
+        Args:
+            restaurant_data_files: Dictionary mapping district keys to data files
+            meal_types: Validated, lowercased meal types, or None for all
+            sort_by: One of SORT_KEYS
+            top_k: Maximum number of restaurants to return (all if omitted)
+            
+        Returns:
+            Ranked restaurants, best first
+        """
+        all_columns = []
+        streams = []
+        for district_index, (district_key, data_file) in enumerate(restaurant_data_files.items()):
+            columns = data_file.columns
+            all_columns.append(columns)
+            matching_ids = None
+            if meal_types:
+                matching_ids = self._get_meal_index(district_key, data_file).ids_for_meal_types(meal_types)
+            streams.append(self._ranked_stream(columns.rank_keys(sort_by),
+                                               columns.sorted_positions(sort_by),
+                                               columns.restaurants, district_index, matching_ids))
+        
+        ranked = heapq.merge(*streams)
+        if top_k is not None:
+            ranked = islice(ranked, top_k)
+        
+        return [all_columns[district_index].restaurants[position]
+                for _, district_index, position in ranked]
+    
+    @staticmethod
+    def _ranked_stream(rank_keys: List[Tuple[float, float]], sorted_positions: Any,
+                       restaurants: Tuple[Restaurant, ...], district_index: int,
+                       matching_ids: Optional[Set[str]]) -> Iterator[Tuple[Tuple[float, float], int, int]]:
+        """Yield (rank key, district index, position) for one district, best first."""
+        for position in sorted_positions:
+            if matching_ids is None or restaurants[position].id in matching_ids:
+                yield rank_keys[position], district_index, position
+    
+    def _get_dataset_version(self, restaurant_data_files: Dict[str, RestaurantDataFile]) -> str:
+        """Build a version token for the district data behind a search.
+        
+        Args:
+            restaurant_data_files: Dictionary mapping district keys to data files
+            
+        Returns:
+            Fingerprint of the per-district dataset versions
+        """
+        return fingerprint(*(
+            f"{district_key}={self._get_district_version(district_key, data_file)}"
+            for district_key, data_file in restaurant_data_files.items()
+        ))
+    
+    def _get_district_version(self, district_key: str, data_file: RestaurantDataFile) -> str:
+        """Get the version token of one district's data.
+        
+        Args:
+            district_key: District key the data file was loaded under
+            data_file: Restaurant data file for the district
+            
+        Returns:
+            Dataset cache version, or a token from the file metadata if the
+            district is not cached
+        """
+        region_key = self._district_regions.get(district_key)
+        version = None
+        if region_key:
+            version = self.data_access_client.get_dataset_version(region_key, district_key)
+        if version is None:
+            # Dataset cache disabled: fall back to the file's own metadata
+            metadata = data_file.metadata
+            version = f"{metadata.timestamp}/{metadata.version}/{len(data_file.restaurants)}"
+        return version
+    
+    def search_page(self, districts: Optional[List[str]] = None,
+                    meal_types: Optional[List[str]] = None,
+                    sort_by: Optional[str] = None,
+                    top_k: Optional[int] = None,
+                    limit: Optional[int] = None,
+                    offset: Optional[int] = None,
+                    cursor: Optional[str] = None,
+                    fields: Optional[List[str]] = None,
+                    include_meal_analysis: bool = False,
+                    include_district_counts: bool = False) -> RestaurantPage:
+        """Search by district and/or meal type and return one page of results.
+        
+        Results are ordered as in search_combined. Cursors are tied to the
+        query and to the version of the cached district data; a cursor issued
+        before the data changed is rejected.
+        
+        The full match list is built for every page, since total_count,
+        ranking and the meal analysis counts all cover every match; only the
+        page slice is returned and serialized. When the request is paginated
+        (limit, offset or cursor given), the meal analysis lists only the
+        names of the restaurants on the page.
+        
+        Args:
+            districts: Optional list of district names (all districts if omitted)
+            meal_types: Optional list of meal types to filter by
+            sort_by: Optional ranking (see search_combined)
+            top_k: Optional cap on the number of ranked results across all pages
+            limit: Maximum restaurants to return (all remaining if omitted)
+            offset: Offset of the first restaurant (cannot be combined with cursor)
+            cursor: next_cursor from a previous page of the same query
+            fields: Restaurant fields to include when serializing (all if omitted)
+            include_meal_analysis: Set page.meal_analysis to the meal type
+                analysis of all matching restaurants
+            include_district_counts: Set page.district_counts to the number
+                of restaurants in each requested district, counted from the
+                data files already read for the search
+            
+        Returns:
+            RestaurantPage with the selected restaurants and next_cursor
+            
+        Raises:
+            RestaurantSearchError: If search fails or parameters are invalid
+        """
+        self._ensure_initialized()
+        
+        if not districts and not meal_types:
+            raise RestaurantSearchError("At least one of districts or meal_types must be provided")
+        
+        restaurants, restaurant_data_files = self._search_data_files(
+            districts, meal_types, sort_by, top_k
+        )
+        
+        # District order determines result order; meal type order does not
+        query_key = fingerprint(
+            list(districts or []),
+            sorted(meal_type.lower() for meal_type in meal_types or []),
+            sort_by,
+            top_k
+        )
+        dataset_version = self._get_dataset_version(restaurant_data_files)
+        
+        try:
+            page = paginate(restaurants, query_key, dataset_version,
+                            limit=limit, offset=offset, cursor=cursor, fields=fields)
+        except PaginationError as e:
+            raise RestaurantSearchError(str(e))
+        
+        if include_meal_analysis:
+            paginated = limit is not None or offset is not None or cursor is not None
+            page.meal_analysis = self.get_meal_type_analysis(
+                restaurants, page.restaurants if paginated else None
+            )
+        
+        if include_district_counts and districts:
+            valid_districts, _ = self.district_service.validate_districts(districts)
+            page.district_counts = self._count_by_district(valid_districts, restaurant_data_files)
+        
+        logger.info(f"Search page: {len(page.restaurants)} of {page.total_count} restaurants "
+                    f"from offset {page.offset}")
+        return page
+    
     def get_available_districts(self) -> Dict[str, List[str]]:
         """Get all available districts organized by region.
         
@@ -263,6 +557,31 @@ class RestaurantService:
         except DistrictConfigurationError as e:
             raise RestaurantSearchError(f"Failed to get available districts: {e}")
     
+    def normalize_district_names(self, districts: List[str]) -> List[str]:
+        """Map district name variants to their configured names.
+        
+        Names that cannot be resolved are returned unchanged so that the
+        search reports them as invalid.
+        
+        Args:
+            districts: District names as supplied by the caller
+            
+        Returns:
+            List of district names in the same order
+            
+        Raises:
+            RestaurantSearchError: If district configuration is not available
+        """
+        self._ensure_initialized()
+        
+        normalized_districts = []
+        for district in districts:
+            canonical_name = self.district_service.resolve_district_name(district)
+            if canonical_name and canonical_name != district:
+                logger.info(f"Normalized district '{district}' to '{canonical_name}'")
+            normalized_districts.append(canonical_name or district)
+        return normalized_districts
+    
     def get_restaurant_count_by_district(self, districts: List[str]) -> Dict[str, int]:
         """Get count of restaurants in each district.
         
@@ -298,29 +617,45 @@ class RestaurantService:
                 region_district_pairs
             )
             
-            # Count restaurants by district
-            counts = {}
-            for district in valid_districts:
-                district_key = district.lower().replace(' ', '-')
-                if district_key in restaurant_data_files:
-                    counts[district] = len(restaurant_data_files[district_key].restaurants)
-                else:
-                    counts[district] = 0
-            
-            return counts
+            return self._count_by_district(valid_districts, restaurant_data_files)
             
         except Exception as e:
             logger.error(f"Error getting restaurant counts: {e}")
             raise RestaurantSearchError(f"Failed to get restaurant counts: {e}")
     
-    def get_meal_type_analysis(self, restaurants: List[Restaurant]) -> Dict[str, Any]:
+    def _count_by_district(self, districts: List[str],
+                           restaurant_data_files: Dict[str, RestaurantDataFile]) -> Dict[str, int]:
+        """Count restaurants per district in data files already retrieved.
+        
+        Args:
+            districts: Validated district names
+            restaurant_data_files: Data files keyed by district key
+            
+        Returns:
+            Dictionary mapping district names to restaurant counts (0 if no
+            data file was found)
+        """
+        counts = {}
+        for district in districts:
+            district_key = district.lower().replace(' ', '-')
+            if district_key in restaurant_data_files:
+                counts[district] = len(restaurant_data_files[district_key].restaurants)
+            else:
+                counts[district] = 0
+        return counts
+    
+    def get_meal_type_analysis(self, restaurants: List[Restaurant],
+                               listed_restaurants: Optional[List[Restaurant]] = None) -> Dict[str, Any]:
         """Analyze meal type coverage across restaurants.
         
         Args:
             restaurants: List of restaurants to analyze
+            listed_restaurants: Restaurants whose names are listed per meal
+                type, e.g. one page of the results (all restaurants if omitted)
             
         Returns:
-            Dictionary containing meal type analysis
+            Dictionary containing meal type analysis; the counts always cover
+            all restaurants
         """
         if not restaurants:
             return {
@@ -332,10 +667,23 @@ class RestaurantService:
         meal_type_counts = {'breakfast': 0, 'lunch': 0, 'dinner': 0}
         restaurants_by_meal_type = {'breakfast': [], 'lunch': [], 'dinner': []}
         
+        meal_type_masks = {
+            meal_type: self.time_service.meal_type_mask(meal_type)
+            for meal_type in self.time_service.MEAL_TYPE_ORDER
+        }
+        
         for restaurant in restaurants:
-            for meal_type in self.time_service.VALID_MEAL_TYPES:
-                if self.time_service.is_open_for_meal(restaurant.operating_hours, meal_type):
+            mask = self._get_meal_mask(restaurant)
+            for meal_type, meal_mask in meal_type_masks.items():
+                if mask & meal_mask:
                     meal_type_counts[meal_type] += 1
+                    if listed_restaurants is None:
+                        restaurants_by_meal_type[meal_type].append(restaurant.name)
+        
+        for restaurant in listed_restaurants or []:
+            mask = self._get_meal_mask(restaurant)
+            for meal_type, meal_mask in meal_type_masks.items():
+                if mask & meal_mask:
                     restaurants_by_meal_type[meal_type].append(restaurant.name)
         
         return {
@@ -0,0 +1,467 @@
+"""Storage backends for district restaurant data files.
+
+This module provides the storage layer behind DataAccessClient. A backend
+returns the raw bytes of a district file addressed by (region, district),
+together with an ETag used for conditional revalidation.
+
+Available backends:
+    S3StorageBackend: district files in the restaurant data S3 bucket
+    LocalFileStorageBackend: config/restaurants/<region>/<district>.json on disk
+    PackedSnapshotStorageBackend: all districts packed into one memory-mapped
+        snapshot file with an offset table, for cold starts without network I/O
+
+Snapshot file layout (see build_packed_snapshot):
+    8 bytes   magic b"RSNAP001"
+    4 bytes   big-endian length N of the offset table
+    N bytes   UTF-8 JSON offset table {"region/district": [offset, length, etag]}
+    ...       concatenated district JSON documents
+
+The restaurant reasoning MCP server reads the same district files, so it
+vendors this module. restaurant-search-mcp holds the canonical copy; the copy
+is kept in sync by scripts/sync_shared_modules.py in that project.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"RSNAP001"
+_TABLE_LENGTH = struct.Struct(">I")
+
+
+class StorageBackendError(Exception):
+    """Exception raised for storage backend errors."""
+    pass
+
+
+class DatasetNotModified(Exception):
+    """Raised when a conditional request finds the stored dataset unchanged."""
+    pass
+
+
+@dataclass
+class StoredDataset:
+    """Raw district file returned by a storage backend.
+
+    Attributes:
+        content: Raw JSON document bytes
+        etag: Opaque version tag for conditional requests, if available
+    """
+    content: bytes
+    etag: Optional[str] = None
+
+
+class StorageBackend(ABC):
+    """Interface for district restaurant data storage."""
+
+    name = "base"
+
+    def prepare(self) -> None:
+        """Acquire clients or file handles before concurrent use.
+
+        Backends that lazily create shared resources override this so that
+        multi-district fetches can fan out across threads safely.
+        """
+        pass
+
+    @abstractmethod
+    def get_dataset(self, region: str, district: str,
+                    if_none_match: Optional[str] = None) -> Optional[StoredDataset]:
+        """Read a district data file.
+
+        Args:
+            region: Region key (e.g., 'hong-kong-island')
+            district: District key (e.g., 'admiralty')
+            if_none_match: ETag of a cached copy; if it is still current the
+                backend raises DatasetNotModified instead of returning content
+
+        Returns:
+            StoredDataset, or None if the district has no data file
+
+        Raises:
+            DatasetNotModified: If if_none_match matches the stored version
+        """
+
+    @abstractmethod
+    def list_datasets(self) -> Dict[str, List[str]]:
+        """List available district files.
+
+        Returns:
+            Dictionary mapping region keys to lists of district keys
+        """
+
+    @abstractmethod
+    def test_connection(self) -> bool:
+        """Check that the storage is reachable.
+
+        Returns:
+            True if the backend can serve data, False otherwise
+        """
+
+    def describe(self) -> str:
+        """Get a human readable location for log messages."""
+        return self.name
+
+
+class S3StorageBackend(StorageBackend):
+    """District data files stored in S3 under <prefix>/<region>/<district>.json."""
+
+    name = "s3"
+
+    def __init__(self, bucket: str, prefix: str = "restaurants"):
+        """Initialize the S3 backend.
+
+        Args:
+            bucket: S3 bucket name containing restaurant data
+            prefix: Key prefix of the district files
+        """
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """Lazy initialization of S3 client."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+                    try:
+                        self._client = boto3.client('s3')
+                        logger.info("S3 client initialized successfully")
+                    except Exception as e:
+                        logger.error(f"Failed to initialize S3 client: {e}")
+                        raise
+        return self._client
+
+    @client.setter
+    def client(self, value) -> None:
+        self._client = value
+
+    def prepare(self) -> None:
+        """Create the shared S3 client."""
+        _ = self.client
+
+    def _key(self, region: str, district: str) -> str:
+        return f"{self.prefix}/{region}/{district}.json"
+
+    def describe(self) -> str:
+        return f"s3://{self.bucket}/{self.prefix}"
+
+    def get_dataset(self, region: str, district: str,
+                    if_none_match: Optional[str] = None) -> Optional[StoredDataset]:
+        from botocore.exceptions import ClientError
+
+        s3_key = self._key(region, district)
+        request_params = {'Bucket': self.bucket, 'Key': s3_key}
+        if if_none_match:
+            request_params['IfNoneMatch'] = if_none_match
+
+        try:
+            response = self.client.get_object(**request_params)
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('304', 'NotModified'):
+                raise DatasetNotModified(s3_key)
+            if error_code == 'NoSuchKey':
+                logger.warning(f"Restaurant data not found: s3://{self.bucket}/{s3_key}")
+                return None
+            elif error_code == 'NoSuchBucket':
+                logger.error(f"S3 bucket not found: {self.bucket}")
+            elif error_code == 'AccessDenied':
+                logger.error(f"Access denied to S3 bucket: {self.bucket}")
+            else:
+                logger.error(f"S3 client error: {e}")
+            raise
+
+        return StoredDataset(content=response['Body'].read(), etag=response.get('ETag'))
+
+    def list_datasets(self) -> Dict[str, List[str]]:
+        districts_by_region: Dict[str, List[str]] = {}
+
+        # List all objects in the restaurants prefix
+        paginator = self.client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=self.bucket, Prefix=f"{self.prefix}/")
+
+        for page in pages:
+            for obj in page.get('Contents', []):
+                key = obj['Key']
+                # Parse key format: restaurants/region/district.json
+                if key.endswith('.json'):
+                    parts = key.split('/')
+                    if len(parts) >= 3:
+                        region = parts[1]
+                        district = parts[2].replace('.json', '')
+                        districts_by_region.setdefault(region, []).append(district)
+
+        return districts_by_region
+
+    def test_connection(self) -> bool:
+        try:
+            # Test bucket access by listing objects with limit
+            self.client.list_objects_v2(Bucket=self.bucket, Prefix=self.prefix, MaxKeys=1)
+            logger.info(f"S3 connection test successful for bucket: {self.bucket}")
+            return True
+        except Exception as e:
+            logger.error(f"S3 connection test failed: {e}")
+            return False
+
+
+class LocalFileStorageBackend(StorageBackend):
+    """District data files on local disk under <base_path>/<region>/<district>.json."""
+
+    name = "local"
+
+    def __init__(self, base_path: Union[str, Path] = "config/restaurants"):
+        """Initialize the local file backend.
+
+        Args:
+            base_path: Directory containing one sub-directory per region
+        """
+        self.base_path = Path(base_path)
+
+    def _path(self, region: str, district: str) -> Path:
+        return self.base_path / region / f"{district}.json"
+
+    def describe(self) -> str:
+        return str(self.base_path)
+
+    def get_dataset(self, region: str, district: str,
+                    if_none_match: Optional[str] = None) -> Optional[StoredDataset]:
+        file_path = self._path(region, district)
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            logger.warning(f"Restaurant data not found: {file_path}")
+            return None
+
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        if if_none_match and if_none_match == etag:
+            raise DatasetNotModified(str(file_path))
+
+        return StoredDataset(content=file_path.read_bytes(), etag=etag)
+
+    def list_datasets(self) -> Dict[str, List[str]]:
+        districts_by_region: Dict[str, List[str]] = {}
+        if not self.base_path.is_dir():
+            return districts_by_region
+
+        for region_dir in sorted(p for p in self.base_path.iterdir() if p.is_dir()):
+            districts = sorted(f.stem for f in region_dir.glob('*.json'))
+            if districts:
+                districts_by_region[region_dir.name] = districts
+        return districts_by_region
+
+    def test_connection(self) -> bool:
+        return self.base_path.is_dir()
+
+
+class PackedSnapshotStorageBackend(StorageBackend):
+    """All district files packed into one memory-mapped snapshot file.
+
+    The snapshot is opened once and district documents are sliced out of the
+    mapping through the offset table, so a cold container serves searches
+    without network I/O or per-district file opens. Swapping the snapshot file
+    on disk and calling reload() picks up new data.
+    """
+
+    name = "snapshot"
+
+    def __init__(self, snapshot_path: Union[str, Path]):
+        """Initialize the snapshot backend.
+
+        Args:
+            snapshot_path: Path to a snapshot built with build_packed_snapshot
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self._mmap: Optional[mmap.mmap] = None
+        self._table: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def describe(self) -> str:
+        return str(self.snapshot_path)
+
+    def prepare(self) -> None:
+        """Open and map the snapshot file."""
+        self._ensure_open()
+
+    def _ensure_open(self) -> None:
+        with self._lock:
+            self._open_locked()
+
+    def _open_locked(self) -> None:
+        """Map the snapshot if it is not mapped yet. The caller holds self._lock."""
+        if self._mmap is not None:
+            return
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise StorageBackendError(f"Cannot open snapshot {self.snapshot_path}: {e}")
+
+        header_size = len(SNAPSHOT_MAGIC) + _TABLE_LENGTH.size
+        if mapped[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or len(mapped) < header_size:
+            mapped.close()
+            raise StorageBackendError(f"Not a restaurant data snapshot: {self.snapshot_path}")
+
+        (table_length,) = _TABLE_LENGTH.unpack_from(mapped, len(SNAPSHOT_MAGIC))
+        table_bytes = mapped[header_size:header_size + table_length]
+        try:
+            table = json.loads(table_bytes.decode('utf-8'))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            mapped.close()
+            raise StorageBackendError(f"Corrupt snapshot offset table in {self.snapshot_path}: {e}")
+
+        self._table = {key: (int(offset), int(length), etag)
+                       for key, (offset, length, etag) in table.items()}
+        self._mmap = mapped
+        logger.info(f"Opened restaurant data snapshot {self.snapshot_path} "
+                    f"with {len(self._table)} districts")
+
+    def reload(self) -> None:
+        """Close the current mapping so the next read reopens the snapshot.
+
+        Reads hold the same lock as reload(), so a mapping is never closed
+        while a district is being sliced out of it.
+        """
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = None
+            self._table = {}
+
+    def get_dataset(self, region: str, district: str,
+                    if_none_match: Optional[str] = None) -> Optional[StoredDataset]:
+        with self._lock:
+            self._open_locked()
+            entry = self._table.get(f"{region}/{district}")
+            if entry is not None:
+                offset, length, etag = entry
+                if if_none_match and if_none_match == etag:
+                    raise DatasetNotModified(f"{region}/{district}")
+                content = self._mmap[offset:offset + length]
+
+        if entry is None:
+            logger.warning(f"Restaurant data not found in snapshot: {region}/{district}")
+            return None
+
+        return StoredDataset(content=content, etag=etag)
+
+    def list_datasets(self) -> Dict[str, List[str]]:
+        with self._lock:
+            self._open_locked()
+            keys = sorted(self._table)
+
+        districts_by_region: Dict[str, List[str]] = {}
+        for key in keys:
+            region, district = key.split('/', 1)
+            districts_by_region.setdefault(region, []).append(district)
+        return districts_by_region
+
+    def test_connection(self) -> bool:
+        try:
+            self._ensure_open()
+            return True
+        except StorageBackendError as e:
+            logger.error(f"Snapshot backend test failed: {e}")
+            return False
+
+
+def build_packed_snapshot(source_path: Union[str, Path],
+                          output_path: Union[str, Path]) -> Dict[str, Tuple[int, int, str]]:
+    """Pack local district files into a single snapshot file.
+
+    Args:
+        source_path: Directory laid out as <region>/<district>.json
+        output_path: Snapshot file to write (replaced atomically)
+
+    Returns:
+        Offset table mapping "region/district" to (offset, length, etag)
+
+    Raises:
+        StorageBackendError: If no district files are found
+    """
+    source = LocalFileStorageBackend(source_path)
+    documents: List[Tuple[str, bytes]] = []
+    for region, districts in source.list_datasets().items():
+        for district in districts:
+            content = source._path(region, district).read_bytes()
+            documents.append((f"{region}/{district}", content))
+
+    if not documents:
+        raise StorageBackendError(f"No district files found under {source_path}")
+
+    def encode_table(base: int) -> Tuple[bytes, Dict[str, Tuple[int, int, str]]]:
+        table = {}
+        offset = base
+        for key, content in documents:
+            etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+            table[key] = (offset, len(content), etag)
+            offset += len(content)
+        return json.dumps(table, sort_keys=True).encode('utf-8'), table
+
+    # Offsets depend on the table length, so size the table until it is stable
+    header_size = len(SNAPSHOT_MAGIC) + _TABLE_LENGTH.size
+    table_bytes, table = encode_table(header_size)
+    while True:
+        resized_bytes, resized_table = encode_table(header_size + len(table_bytes))
+        if len(resized_bytes) == len(table_bytes):
+            table_bytes, table = resized_bytes, resized_table
+            break
+        table_bytes = resized_bytes
+
+    output = Path(output_path)
+    temp_output = output.with_name(output.name + '.tmp')
+    with open(temp_output, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(_TABLE_LENGTH.pack(len(table_bytes)))
+        f.write(table_bytes)
+        for _, content in documents:
+            f.write(content)
+    os.replace(temp_output, output)
+
+    logger.info(f"Wrote restaurant data snapshot {output} with {len(documents)} districts")
+    return table
+
+
+def create_storage_backend(backend_type: str, s3_bucket: str,
+                           s3_prefix: str = "restaurants",
+                           local_path: Union[str, Path] = "config/restaurants",
+                           snapshot_path: Optional[Union[str, Path]] = None) -> StorageBackend:
+    """Create a storage backend by name.
+
+    Args:
+        backend_type: One of 's3', 'local' or 'snapshot'
+        s3_bucket: Bucket for the S3 backend
+        s3_prefix: Key prefix for the S3 backend
+        local_path: Directory for the local backend
+        snapshot_path: Snapshot file for the snapshot backend
+
+    Returns:
+        Configured StorageBackend
+
+    Raises:
+        ValueError: If the backend type is unknown or misconfigured
+    """
+    backend_type = (backend_type or 's3').lower()
+    if backend_type == 's3':
+        return S3StorageBackend(s3_bucket, s3_prefix)
+    if backend_type == 'local':
+        return LocalFileStorageBackend(local_path)
+    if backend_type == 'snapshot':
+        if not snapshot_path:
+            raise ValueError("snapshot_path is required for the snapshot storage backend")
+        return PackedSnapshotStorageBackend(snapshot_path)
+    raise ValueError(f"Unknown storage backend: {backend_type}. Valid backends: s3, local, snapshot")
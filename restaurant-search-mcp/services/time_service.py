@@ -6,9 +6,11 @@ Follows PEP8 style guidelines and handles various time format edge cases.
 """
 
 import re
+import threading
+from collections import OrderedDict
 from datetime import time
-from typing import List, Tuple, Optional
-from models.restaurant_models import OperatingHours
+from typing import Dict, Iterable, List, Tuple, Optional
+from models.restaurant_models import OperatingHours, Restaurant
 
 
 class TimeService:
@@ -29,13 +31,139 @@ class TimeService:
     # Valid meal types
     VALID_MEAL_TYPES = {'breakfast', 'lunch', 'dinner'}
     
-    def __init__(self):
-        """Initialize the TimeService."""
+    # Bit layout for meal coverage masks: one bit per (meal type, day type)
+    MEAL_TYPE_ORDER = ('breakfast', 'lunch', 'dinner')
+    DAY_TYPES = ('mon_fri', 'sat_sun', 'public_holiday')
+    
+    # Meal periods as inclusive (start, end) minutes since midnight. Parsed
+    # ranges have minute precision, so an inclusive end minute compares exactly
+    # like the hh:mm:59 boundaries in MEAL_PERIODS.
+    MEAL_PERIOD_MINUTES = {
+        meal_type: (start.hour * 60 + start.minute, end.hour * 60 + end.minute)
+        for meal_type, (start, end) in MEAL_PERIODS.items()
+    }
+    
+    # Default bound on memoized time range strings
+    DEFAULT_PARSE_CACHE_SIZE = 1024
+    
+    def __init__(self, parse_cache_size: int = DEFAULT_PARSE_CACHE_SIZE):
+        """Initialize the TimeService.
+        
+        Args:
+            parse_cache_size: Maximum number of distinct time range strings
+                whose parse results are memoized
+        """
         # Regex pattern for time range parsing
         # Matches formats like "11:30 - 15:30", "07:00-11:29", "18:00 - 22:30"
         self._time_range_pattern = re.compile(
             r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})'
         )
+        self._parse_cache_size = parse_cache_size
+        # Time range string -> (minutes parsed, meal bits) or None if invalid.
+        # One TimeService is shared by concurrent searches, so the memo is
+        # only touched under the lock; parsing itself happens outside it.
+        self._parse_cache: "OrderedDict[str, Optional[Tuple[Tuple[int, int], int]]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+    
+    def _lookup_time_range(self, time_range: str) -> Optional[Tuple[Tuple[int, int], int]]:
+        """Parse a time range string through the bounded memo.
+        
+        Args:
+            time_range: Time range string (e.g., "11:30 - 15:30")
+            
+        Returns:
+            Tuple of ((start_minute, end_minute), meal_bits) or None if invalid,
+            where bit i of meal_bits is set when the range overlaps
+            MEAL_TYPE_ORDER[i]
+        """
+        with self._parse_cache_lock:
+            try:
+                entry = self._parse_cache[time_range]
+                self._parse_cache.move_to_end(time_range)
+                return entry
+            except KeyError:
+                pass
+        
+        entry = None
+        minutes = self._parse_minutes(time_range)
+        if minutes is not None:
+            entry = (minutes, self.meal_overlap_bits(minutes))
+        
+        self._store_time_ranges({time_range: entry})
+        return entry
+    
+    def _store_time_ranges(self, entries: Dict[str, Optional[Tuple[Tuple[int, int], int]]]) -> None:
+        """Add parse results to the memo, evicting the least recently used."""
+        with self._parse_cache_lock:
+            for time_range, entry in entries.items():
+                self._parse_cache[time_range] = entry
+                self._parse_cache.move_to_end(time_range)
+            while len(self._parse_cache) > self._parse_cache_size:
+                self._parse_cache.popitem(last=False)
+    
+    def _memoize_time_ranges(self, time_ranges: Iterable[str]) -> None:
+        """Parse and classify every time range string not yet memoized.
+        
+        Missing strings are regex-parsed once each and checked against the
+        meal periods in a single meal_overlap_bits_batch call.
+        
+        Args:
+            time_ranges: Time range strings, duplicates allowed
+        """
+        with self._parse_cache_lock:
+            missing = [
+                time_range for time_range in dict.fromkeys(time_ranges)
+                if time_range and isinstance(time_range, str)
+                and time_range not in self._parse_cache
+            ]
+        if not missing:
+            return
+        
+        parsed = [(time_range, self._parse_minutes(time_range)) for time_range in missing]
+        valid = [minutes for _, minutes in parsed if minutes is not None]
+        bits = iter(self.meal_overlap_bits_batch(valid))
+        self._store_time_ranges({
+            time_range: (minutes, next(bits)) if minutes is not None else None
+            for time_range, minutes in parsed
+        })
+    
+    def _parse_minutes(self, time_range: str) -> Optional[Tuple[int, int]]:
+        """Regex-parse a time range string into minutes since midnight."""
+        match = self._time_range_pattern.match(time_range.strip())
+        if not match:
+            return None
+        
+        start_hour, start_min, end_hour, end_min = map(int, match.groups())
+        
+        # Validate time components
+        if not (0 <= start_hour <= 23 and 0 <= start_min <= 59):
+            return None
+        if not (0 <= end_hour <= 23 and 0 <= end_min <= 59):
+            return None
+        
+        return (start_hour * 60 + start_min, end_hour * 60 + end_min)
+    
+    def parse_time_range_minutes(self, time_range: str) -> Optional[Tuple[int, int]]:
+        """Parse a time range string into minutes since midnight.
+        
+        Results are memoized, so repeated strings cost a dictionary lookup.
+        
+        Args:
+            time_range: Time range string (e.g., "11:30 - 15:30")
+            
+        Returns:
+            Tuple of (start_minute, end_minute) or None if parsing fails
+            
+        Examples:
+            >>> service = TimeService()
+            >>> service.parse_time_range_minutes("11:30 - 15:30")
+            (690, 930)
+        """
+        if not time_range or not isinstance(time_range, str):
+            return None
+        
+        entry = self._lookup_time_range(time_range)
+        return entry[0] if entry else None
     
     def parse_time_range(self, time_range: str) -> Optional[Tuple[time, time]]:
         """Parse a time range string into start and end time objects.
@@ -51,29 +179,12 @@ class TimeService:
             >>> service.parse_time_range("11:30 - 15:30")
             (datetime.time(11, 30), datetime.time(15, 30))
         """
-        if not time_range or not isinstance(time_range, str):
-            return None
-            
-        match = self._time_range_pattern.match(time_range.strip())
-        if not match:
-            return None
-            
-        try:
-            start_hour, start_min, end_hour, end_min = map(int, match.groups())
-            
-            # Validate time components
-            if not (0 <= start_hour <= 23 and 0 <= start_min <= 59):
-                return None
-            if not (0 <= end_hour <= 23 and 0 <= end_min <= 59):
-                return None
-                
-            start_time = time(start_hour, start_min)
-            end_time = time(end_hour, end_min)
-            
-            return (start_time, end_time)
-            
-        except (ValueError, TypeError):
+        minutes = self.parse_time_range_minutes(time_range)
+        if minutes is None:
             return None
+        
+        start_minute, end_minute = minutes
+        return (time(*divmod(start_minute, 60)), time(*divmod(end_minute, 60)))
     
     def check_time_overlap(self, range1: Tuple[time, time], 
                           range2: Tuple[time, time]) -> bool:
@@ -89,6 +200,7 @@ class TimeService:
         Note:
             Handles midnight crossover by treating times as continuous.
             For example, 22:00-02:00 overlaps with 01:00-03:00.
+            Only comparisons are used, so ranges of integer minutes work too.
         """
         start1, end1 = range1
         start2, end2 = range2
@@ -123,6 +235,52 @@ class TimeService:
             # Neither range crosses midnight - normal overlap check
             return start1 <= end2 and start2 <= end1
     
+    def meal_overlap_bits(self, range_minutes: Tuple[int, int]) -> int:
+        """Check one time range against every meal period at once.
+        
+        Args:
+            range_minutes: Time range as (start_minute, end_minute)
+            
+        Returns:
+            Bits where bit i is set when the range overlaps MEAL_TYPE_ORDER[i]
+        """
+        return self.meal_overlap_bits_batch([range_minutes])[0]
+    
+    def meal_overlap_bits_batch(self, ranges: Iterable[Tuple[int, int]]) -> List[int]:
+        """Check many time ranges against every meal period in one pass.
+        
+        Gives the same result as check_time_overlap for each (range, meal)
+        pair, but compares plain integers inline instead of making one call
+        per pair. Meal periods never cross midnight, so a range crossing
+        midnight overlaps a meal when the meal ends at or after the range
+        starts, or starts at or before the range ends.
+        
+        Args:
+            ranges: Time ranges as (start_minute, end_minute)
+            
+        Returns:
+            Meal bits for each range, in input order, where bit i is set when
+            the range overlaps MEAL_TYPE_ORDER[i]
+        """
+        periods = [
+            (1 << meal_index, self.MEAL_PERIOD_MINUTES[meal_type])
+            for meal_index, meal_type in enumerate(self.MEAL_TYPE_ORDER)
+        ]
+        
+        results = []
+        for start, end in ranges:
+            bits = 0
+            if end < start:
+                for bit, (meal_start, meal_end) in periods:
+                    if meal_end >= start or meal_start <= end:
+                        bits |= bit
+            else:
+                for bit, (meal_start, meal_end) in periods:
+                    if start <= meal_end and meal_start <= end:
+                        bits |= bit
+            results.append(bits)
+        return results
+    
     def validate_meal_type(self, meal_type: str) -> bool:
         """Validate if a meal type is supported.
         
@@ -153,21 +311,140 @@ class TimeService:
         """
         if not self.validate_meal_type(meal_type):
             return False
+        
+        mask = self.compute_meal_mask(operating_hours)
+        return self.mask_serves_meal(mask, meal_type)
+    
+    def meal_type_bit(self, meal_type: str, day_type: str) -> int:
+        """Get the mask bit for a meal type on a day type.
+        
+        Args:
+            meal_type: Meal type ("breakfast", "lunch", "dinner")
+            day_type: Day type ("mon_fri", "sat_sun", "public_holiday")
+            
+        Returns:
+            Integer with the single bit for the pair set
+            
+        Raises:
+            ValueError: If meal type or day type is not recognised
+        """
+        meal_index = self.MEAL_TYPE_ORDER.index(meal_type.lower())
+        day_index = self.DAY_TYPES.index(day_type)
+        return 1 << (meal_index * len(self.DAY_TYPES) + day_index)
+    
+    def meal_type_mask(self, meal_type: str) -> int:
+        """Get the mask covering a meal type on any day type.
+        
+        Args:
+            meal_type: Meal type ("breakfast", "lunch", "dinner")
+            
+        Returns:
+            Integer with the bits for every day type of the meal set
+        """
+        mask = 0
+        for day_type in self.DAY_TYPES:
+            mask |= self.meal_type_bit(meal_type, day_type)
+        return mask
+    
+    def compute_meal_mask(self, operating_hours: OperatingHours) -> int:
+        """Compute the meal coverage bitmask for a restaurant's operating hours.
+        
+        Each (meal type, day type) pair gets one bit, set when any time range
+        for that day type overlaps the meal period.
+        
+        Args:
+            operating_hours: Restaurant operating hours
             
-        meal_period = self.MEAL_PERIODS[meal_type.lower()]
+        Returns:
+            Meal coverage bitmask
+        """
+        mask = 0
+        day_count = len(self.DAY_TYPES)
+        day_ranges = (
+            operating_hours.mon_fri,
+            operating_hours.sat_sun,
+            operating_hours.public_holiday
+        )
         
-        # Check all day types for overlap
-        all_time_ranges = []
-        all_time_ranges.extend(operating_hours.mon_fri)
-        all_time_ranges.extend(operating_hours.sat_sun)
-        all_time_ranges.extend(operating_hours.public_holiday)
+        for day_index, time_ranges in enumerate(day_ranges):
+            meal_bits = 0
+            for time_range_str in time_ranges:
+                if not time_range_str or not isinstance(time_range_str, str):
+                    continue
+                entry = self._lookup_time_range(time_range_str)
+                if entry:
+                    meal_bits |= entry[1]
+            
+            # Spread per-meal bits into the (meal type, day type) layout
+            meal_index = 0
+            while meal_bits:
+                if meal_bits & 1:
+                    mask |= 1 << (meal_index * day_count + day_index)
+                meal_bits >>= 1
+                meal_index += 1
         
-        for time_range_str in all_time_ranges:
-            parsed_range = self.parse_time_range(time_range_str)
-            if parsed_range and self.check_time_overlap(parsed_range, meal_period):
-                return True
-                
-        return False
+        return mask
+    
+    def compute_meal_masks(self, restaurants: Iterable[Restaurant]) -> Dict[str, int]:
+        """Compute meal coverage bitmasks for many restaurants in one pass.
+        
+        Args:
+            restaurants: Restaurants to classify (e.g., a whole district)
+            
+        Returns:
+            Dictionary mapping restaurant ids to meal coverage bitmasks
+        """
+        restaurants = list(restaurants)
+        self._memoize_time_ranges(
+            time_range
+            for restaurant in restaurants
+            for time_ranges in (
+                restaurant.operating_hours.mon_fri,
+                restaurant.operating_hours.sat_sun,
+                restaurant.operating_hours.public_holiday
+            )
+            for time_range in time_ranges
+        )
+        return {
+            restaurant.id: self.compute_meal_mask(restaurant.operating_hours)
+            for restaurant in restaurants
+        }
+    
+    def classify_operating_hours(self, restaurants: Iterable[Restaurant]) -> Dict[str, List[str]]:
+        """Get the meal types served by each restaurant in one pass.
+        
+        Args:
+            restaurants: Restaurants to classify (e.g., a whole district)
+            
+        Returns:
+            Dictionary mapping restaurant ids to sorted lists of meal types,
+            matching get_meal_types_for_hours for each restaurant
+        """
+        meal_type_masks = [
+            (meal_type, self.meal_type_mask(meal_type))
+            for meal_type in sorted(self.MEAL_TYPE_ORDER)
+        ]
+        
+        coverage = {}
+        for restaurant_id, mask in self.compute_meal_masks(restaurants).items():
+            coverage[restaurant_id] = [
+                meal_type for meal_type, meal_mask in meal_type_masks if mask & meal_mask
+            ]
+        return coverage
+    
+    def mask_serves_meal(self, mask: int, meal_type: str) -> bool:
+        """Check if a meal coverage mask includes a meal type on any day.
+        
+        Args:
+            mask: Meal coverage bitmask from compute_meal_mask
+            meal_type: Meal type to check
+            
+        Returns:
+            True if any day type serves the meal, False otherwise
+        """
+        if not self.validate_meal_type(meal_type):
+            return False
+        return bool(mask & self.meal_type_mask(meal_type))
     
     def get_meal_types_for_hours(self, operating_hours: OperatingHours) -> List[str]:
         """Get all meal types that a restaurant serves based on operating hours.
@@ -217,23 +494,24 @@ class TimeService:
         """
         if not self.validate_meal_type(meal_type):
             return {'mon_fri': False, 'sat_sun': False, 'public_holiday': False}
-            
-        meal_period = self.MEAL_PERIODS[meal_type.lower()]
         
-        result = {}
-        day_types = {
-            'mon_fri': operating_hours.mon_fri,
-            'sat_sun': operating_hours.sat_sun,
-            'public_holiday': operating_hours.public_holiday
-        }
+        mask = self.compute_meal_mask(operating_hours)
+        return self.mask_overlap_by_day(mask, meal_type)
+    
+    def mask_overlap_by_day(self, mask: int, meal_type: str) -> dict:
+        """Break a meal coverage mask down by day type for one meal.
         
-        for day_type, time_ranges in day_types.items():
-            has_overlap = False
-            for time_range_str in time_ranges:
-                parsed_range = self.parse_time_range(time_range_str)
-                if parsed_range and self.check_time_overlap(parsed_range, meal_period):
-                    has_overlap = True
-                    break
-            result[day_type] = has_overlap
+        Args:
+            mask: Meal coverage bitmask from compute_meal_mask
+            meal_type: Meal type to check
             
-        return result
\ No newline at end of file
+        Returns:
+            Dictionary with day types as keys and boolean overlap as values
+        """
+        if not self.validate_meal_type(meal_type):
+            return {day_type: False for day_type in self.DAY_TYPES}
+        
+        return {
+            day_type: bool(mask & self.meal_type_bit(meal_type, day_type))
+            for day_type in self.DAY_TYPES
+        }
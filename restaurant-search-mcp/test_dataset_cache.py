@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process district dataset cache.
+
+Covers DatasetCache freshness, revalidation and invalidation with an injected
+clock, and DataAccessClient serving, revalidating and reloading district
+files through LocalFileStorageBackend over a copy of config/restaurants.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.dataset_cache import DatasetCache
+from services.storage_backends import LocalFileStorageBackend
+
+
+RESTAURANT_DATA_PATH = Path(__file__).resolve().parent / "config" / "restaurants"
+KEY = ("hong-kong-island", "admiralty")
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    """Copy two district files into a temporary data directory."""
+    for region, district in (KEY, ("kowloon", "mong-kok")):
+        target = tmp_path / region
+        target.mkdir(exist_ok=True)
+        shutil.copy(RESTAURANT_DATA_PATH / region / f"{district}.json", target)
+    return tmp_path
+
+
+def make_client(data_path: Path, revalidate_seconds: float = 300.0) -> DataAccessClient:
+    """Create a client reading local files with the dataset cache enabled."""
+    return DataAccessClient(
+        cache_revalidate_seconds=revalidate_seconds,
+        storage_backend=LocalFileStorageBackend(data_path)
+    )
+
+
+def touch(path: Path) -> None:
+    """Change a file's content so its ETag changes."""
+    path.write_bytes(path.read_bytes() + b"\n")
+
+
+class TestDatasetCache:
+    """Test cases for DatasetCache."""
+
+    def test_miss_then_hit(self):
+        """A key is a miss until it is stored, then a hit."""
+        cache = DatasetCache(clock=FakeClock())
+
+        assert cache.get(KEY) is None
+        data = object()
+        cache.put(KEY, data, etag='"a"')
+
+        assert cache.get(KEY) is data
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    def test_stale_entry_requires_revalidation(self):
+        """After the interval an entry is only returned through revalidation."""
+        clock = FakeClock()
+        cache = DatasetCache(revalidate_interval=10, clock=clock)
+        data = object()
+        cache.put(KEY, data, etag='"a"')
+        clock.now += 11
+
+        assert cache.get(KEY) is None
+        assert cache.get_etag(KEY) == '"a"'
+        assert cache.mark_not_modified(KEY) is data
+        assert cache.get(KEY) is data
+        assert cache.stats.revalidations == 1
+        assert cache.stats.not_modified == 1
+
+    def test_refresh_bumps_version(self):
+        """Storing new content for a key gives it a new version."""
+        cache = DatasetCache(clock=FakeClock())
+        first = cache.put(KEY, object(), etag='"a"')
+        second = cache.put(KEY, object(), etag='"b"')
+
+        assert second.version > first.version
+        assert cache.get_version(KEY) == second.version
+        assert cache.stats.refreshes == 1
+
+    def test_invalidate_evicts_entries(self):
+        """Invalidated entries are gone and cannot be revalidated."""
+        cache = DatasetCache(clock=FakeClock())
+        cache.put(KEY, object())
+        cache.put(("kowloon", "mong-kok"), object())
+
+        cache.invalidate(KEY)
+        assert cache.peek(KEY) is None
+        assert cache.mark_not_modified(KEY) is None
+        assert len(cache) == 1
+
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.stats.invalidations == 2
+
+    def test_negative_interval_rejected(self):
+        """A negative revalidation interval is invalid."""
+        with pytest.raises(ValueError):
+            DatasetCache(revalidate_interval=-1)
+
+
+class TestDataAccessClientCache:
+    """Test cases for DataAccessClient with the dataset cache."""
+
+    def test_repeated_fetch_is_served_from_cache(self, data_path):
+        """A second fetch returns the same parsed object without reading storage."""
+        client = make_client(data_path)
+
+        first = client.get_restaurant_data(*KEY)
+        second = client.get_restaurant_data(*KEY)
+
+        assert second is first
+        assert client.get_cache_stats()['stats']['hits'] == 1
+
+    def test_unchanged_file_is_revalidated_not_reparsed(self, data_path):
+        """A stale entry whose file did not change is kept after a conditional read."""
+        client = make_client(data_path, revalidate_seconds=0)
+
+        first = client.get_restaurant_data(*KEY)
+        second = client.get_restaurant_data(*KEY)
+
+        assert second is first
+        stats = client.get_cache_stats()['stats']
+        assert stats['not_modified'] == 1
+        assert stats['refreshes'] == 0
+
+    def test_changed_file_is_reloaded(self, data_path):
+        """A stale entry whose file changed is replaced by the new content."""
+        client = make_client(data_path, revalidate_seconds=0)
+        first = client.get_restaurant_data(*KEY)
+        version = client.get_dataset_version(*KEY)
+
+        touch(data_path / KEY[0] / f"{KEY[1]}.json")
+        second = client.get_restaurant_data(*KEY)
+
+        assert second is not first
+        assert client.get_dataset_version(*KEY) != version
+        assert client.get_cache_stats()['stats']['refreshes'] == 1
+
+    def test_deleted_file_is_evicted(self, data_path):
+        """A district whose file disappeared is dropped from the cache."""
+        client = make_client(data_path, revalidate_seconds=0)
+        client.get_restaurant_data(*KEY)
+
+        (data_path / KEY[0] / f"{KEY[1]}.json").unlink()
+
+        assert client.get_restaurant_data(*KEY) is None
+        assert client.get_dataset_version(*KEY) is None
+
+    def test_invalidate_cache_forces_refetch(self, data_path):
+        """invalidate_cache() drops entries so the next fetch parses again."""
+        client = make_client(data_path)
+        first = client.get_restaurant_data(*KEY)
+
+        client.invalidate_cache(*KEY)
+
+        assert client.get_restaurant_data(*KEY) is not first
+        assert client.get_cache_stats()['entries'] == 1
+
+    def test_cache_disabled(self, data_path):
+        """Without the cache every fetch parses the file again."""
+        client = DataAccessClient(enable_cache=False, storage_backend=LocalFileStorageBackend(data_path))
+
+        assert client.get_restaurant_data(*KEY) is not client.get_restaurant_data(*KEY)
+        assert client.get_cache_stats() == {'enabled': False}
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for meal-type indexes in RestaurantService across dataset refreshes.
+
+Serves a copy of the Admiralty district file through LocalFileStorageBackend
+with revalidation on every call, edits it, and checks that meal filtering and
+get_meal_type_analysis use masks built from the current data.
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.restaurant_service import RestaurantService
+from services.storage_backends import LocalFileStorageBackend
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+DINNER_ONLY_HOURS = {"Mon - Fri": ["18:00 - 22:00"], "Sat - Sun": ["18:00 - 22:00"]}
+
+
+@pytest.fixture
+def district_file(tmp_path):
+    """Copy of the Admiralty data file served by the service."""
+    target = tmp_path / "hong-kong-island"
+    target.mkdir()
+    shutil.copy(PROJECT_ROOT / "config" / "restaurants" / "hong-kong-island" / "admiralty.json", target)
+    return target / "admiralty.json"
+
+
+@pytest.fixture
+def service(district_file):
+    """Restaurant service that revalidates district data on every search."""
+    restaurant_service = RestaurantService(str(PROJECT_ROOT / "config"))
+    restaurant_service.data_access_client = DataAccessClient(
+        cache_revalidate_seconds=0,
+        storage_backend=LocalFileStorageBackend(district_file.parent.parent)
+    )
+    return restaurant_service
+
+
+def edit_restaurants(district_file: Path, edit) -> None:
+    """Apply edit() to the district file's restaurant list and save it."""
+    data = json.loads(district_file.read_text(encoding='utf-8'))
+    edit(data['restaurants'])
+    district_file.write_text(json.dumps(data), encoding='utf-8')
+
+
+def breakfast_ids(service):
+    """Ids of Admiralty restaurants found by a breakfast search."""
+    return {r.id for r in service.search_combined(districts=["Admiralty"], meal_types=["breakfast"])}
+
+
+def test_changed_hours_rebuild_masks(service, district_file):
+    """After a refresh, filtering and analysis use the new operating hours."""
+    before = service.search_combined(districts=["Admiralty"], meal_types=["breakfast"])
+    changed = before[0]
+
+    edit_restaurants(district_file, lambda restaurants: next(
+        r for r in restaurants if r['id'] == changed.id
+    ).update(operatingHours=DINNER_ONLY_HOURS))
+    after = service.search_combined(districts=["Admiralty"], meal_types=["dinner"])
+    refreshed = next(r for r in after if r.id == changed.id)
+
+    assert changed.id not in breakfast_ids(service)
+    analysis = service.get_meal_type_analysis([refreshed])
+    assert analysis['meal_type_counts'] == {'breakfast': 0, 'lunch': 0, 'dinner': 1}
+    # The record from before the refresh keeps its own hours
+    assert service.get_meal_type_analysis([changed])['meal_type_counts']['breakfast'] == 1
+
+
+def test_removed_restaurants_are_dropped(service, district_file):
+    """Ids removed from a district are dropped when its index is rebuilt."""
+    restaurants = service.search_combined(districts=["Admiralty"], meal_types=["lunch"])
+    removed_id = restaurants[0].id
+    indexed_count = len(service._meal_indexes_by_id)
+
+    edit_restaurants(district_file, lambda rs: rs.remove(next(r for r in rs if r['id'] == removed_id)))
+    service.search_combined(districts=["Admiralty"], meal_types=["lunch"])
+
+    assert removed_id not in service._meal_indexes_by_id
+    assert len(service._meal_indexes_by_id) == indexed_count - 1
+
+
+def test_unchanged_data_reuses_index(service):
+    """The index is reused while the district's dataset version is unchanged."""
+    service.search_combined(districts=["Admiralty"], meal_types=["lunch"])
+    index = service._meal_indexes["admiralty"][-1]
+
+    service.search_combined(districts=["Admiralty"], meal_types=["dinner"])
+
+    assert service._meal_indexes["admiralty"][-1] is index
+
+
+def test_analysis_without_index_uses_operating_hours(service):
+    """Restaurants from a district-only search are analyzed from their hours."""
+    restaurants = service.search_combined(districts=["Admiralty"])
+    indexed = RestaurantService(str(PROJECT_ROOT / "config"))
+    indexed.data_access_client = service.data_access_client
+    indexed.search_combined(districts=["Admiralty"], meal_types=["lunch"])
+
+    assert not service._meal_indexes
+    assert (service.get_meal_type_analysis(restaurants)
+            == indexed.get_meal_type_analysis(restaurants))
+
+
+def test_page_meal_analysis_covers_all_matches(service):
+    """search_page counts every matching restaurant but lists only the page's names."""
+    restaurants = service.search_combined(districts=["Admiralty"], meal_types=["lunch"])
+    full_analysis = service.get_meal_type_analysis(restaurants)
+
+    page = service.search_page(districts=["Admiralty"], meal_types=["lunch"], limit=3,
+                               include_meal_analysis=True)
+
+    assert len(page.restaurants) == 3
+    assert page.meal_analysis['total_restaurants'] == page.total_count
+    assert page.meal_analysis['meal_type_counts'] == full_analysis['meal_type_counts']
+    assert page.meal_analysis['restaurants_by_meal_type']['lunch'] == [r.name for r in page.restaurants]
+    assert service.search_page(districts=["Admiralty"], limit=3).meal_analysis is None
+    # Without pagination every name is listed, as before
+    assert (service.search_page(districts=["Admiralty"], meal_types=["lunch"],
+                                include_meal_analysis=True).meal_analysis == full_analysis)
+
+
+def test_page_district_counts_use_searched_data(service, monkeypatch):
+    """search_page counts district restaurants without fetching the data again."""
+    expected = service.get_restaurant_count_by_district(["Admiralty"])
+    fetch = service.data_access_client.get_multiple_restaurant_data
+    calls = []
+    monkeypatch.setattr(service.data_access_client, "get_multiple_restaurant_data",
+                        lambda pairs: calls.append(pairs) or fetch(pairs))
+
+    page = service.search_page(districts=["Admiralty"], meal_types=["lunch"], limit=3,
+                               include_district_counts=True)
+
+    assert page.district_counts == expected
+    assert len(calls) == 1
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent multi-district fetching in DataAccessClient.
+
+Uses LocalFileStorageBackend over config/restaurants, wrapped to add delays
+and failures, to check that results keep the requested order and that a
+failing or missing district does not fail the others.
+"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.storage_backends import LocalFileStorageBackend
+
+
+RESTAURANT_DATA_PATH = Path(__file__).resolve().parent / "config" / "restaurants"
+
+PAIRS = [
+    ("hong-kong-island", "admiralty"),
+    ("kowloon", "mong-kok"),
+    ("hong-kong-island", "central-district"),
+    ("kowloon", "sham-shui-po"),
+]
+
+
+class SlowLocalBackend(LocalFileStorageBackend):
+    """Local backend that answers earlier requests later and can fail districts."""
+
+    def __init__(self, base_path, failing=()):
+        super().__init__(base_path)
+        self.failing = set(failing)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_dataset(self, region, district, if_none_match=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            # Requests listed first finish last
+            position = next((i for i, pair in enumerate(PAIRS) if pair == (region, district)), 0)
+            time.sleep(0.02 * (len(PAIRS) - position))
+            if district in self.failing:
+                raise ConnectionError(f"storage unavailable for {district}")
+            return super().get_dataset(region, district, if_none_match)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_client(backend) -> DataAccessClient:
+    """Create a client without the dataset cache so every call reads storage."""
+    return DataAccessClient(enable_cache=False, max_concurrency=4, storage_backend=backend)
+
+
+def test_results_keep_requested_order():
+    """Concurrent results are returned in input order, matching a sequential fetch."""
+    client = make_client(SlowLocalBackend(RESTAURANT_DATA_PATH))
+
+    concurrent = client.get_multiple_restaurant_data(PAIRS)
+    sequential = client.get_multiple_restaurant_data(PAIRS, max_concurrency=1)
+
+    assert list(concurrent) == [district for _, district in PAIRS]
+    assert list(concurrent) == list(sequential)
+    for district in concurrent:
+        assert ([r.id for r in concurrent[district].restaurants]
+                == [r.id for r in sequential[district].restaurants])
+
+
+def test_fetches_run_concurrently_within_limit():
+    """Districts are fetched in parallel, up to max_concurrency at a time."""
+    backend = SlowLocalBackend(RESTAURANT_DATA_PATH)
+    client = make_client(backend)
+
+    client.get_multiple_restaurant_data(PAIRS, max_concurrency=2)
+
+    assert backend.max_active == 2
+
+
+def test_partial_failure_returns_remaining_districts():
+    """A failing and a missing district are reported while the rest are returned in order."""
+    backend = SlowLocalBackend(RESTAURANT_DATA_PATH, failing={"mong-kok"})
+    client = make_client(backend)
+    pairs = PAIRS + [("islands", "no-such-district")]
+
+    result = client.fetch_multiple_restaurant_data(pairs)
+
+    assert result.is_partial
+    assert list(result.data) == ["admiralty", "central-district", "sham-shui-po"]
+    assert list(result.errors) == [("kowloon", "mong-kok")]
+    assert "storage unavailable" in result.errors[("kowloon", "mong-kok")]
+    assert result.missing == [("islands", "no-such-district")]
+
+
+def test_empty_request():
+    """Fetching no districts returns an empty, complete result."""
+    result = make_client(SlowLocalBackend(RESTAURANT_DATA_PATH)).fetch_multiple_restaurant_data([])
+
+    assert result.data == {}
+    assert not result.is_partial
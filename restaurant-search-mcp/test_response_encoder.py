@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP response encoder.
+
+Encodes restaurants from config/restaurants and checks that the default
+output is the indent=2 document the server has always returned, and that
+compact output is the same document without whitespace.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.response_encoder import ResponseEncoder
+from services.storage_backends import LocalFileStorageBackend
+
+
+RESTAURANT_DATA_PATH = Path(__file__).resolve().parent / "config" / "restaurants"
+METADATA = {'search_criteria': {'meal_types': ['lunch']}, 'pagination': {'limit': None}}
+
+
+@pytest.fixture(scope="module")
+def restaurants():
+    """Restaurants from two bundled districts."""
+    client = DataAccessClient(storage_backend=LocalFileStorageBackend(RESTAURANT_DATA_PATH))
+    data = client.get_multiple_restaurant_data([("hong-kong-island", "admiralty"), ("kowloon", "mong-kok")])
+    return [restaurant for data_file in data.values() for restaurant in data_file.restaurants]
+
+
+def response_document(restaurants, metadata, fields=None):
+    """Response envelope built as plain dictionaries."""
+    data = {
+        'restaurants': [json.loads(restaurant.to_wire(fields)) for restaurant in restaurants],
+        'count': len(restaurants)
+    }
+    if metadata:
+        data['metadata'] = metadata
+    return {'success': True, 'data': data}
+
+
+@pytest.mark.parametrize("count", [0, 1, None])
+def test_default_output_is_indented(restaurants, count):
+    """By default responses match json.dumps(indent=2), with and without cached fragments."""
+    encoder = ResponseEncoder(backend='json')
+    selected = restaurants[:count]
+    expected = json.dumps(response_document(selected, METADATA), indent=2)
+
+    assert encoder.style == 'pretty'
+    assert encoder.encode_restaurant_response(selected, METADATA) == expected
+    assert encoder.encode_restaurant_response(selected, METADATA) == expected
+
+
+def test_projected_output_is_indented(restaurants):
+    """Projected fields are indented the same way."""
+    encoder = ResponseEncoder(backend='json')
+    fields = ['id', 'name']
+
+    assert (encoder.encode_restaurant_response(restaurants[:3], None, fields)
+            == json.dumps(response_document(restaurants[:3], None, fields), indent=2))
+
+
+def test_compact_output_is_opt_in(restaurants, monkeypatch):
+    """MCP_RESPONSE_STYLE=compact gives the same document without whitespace."""
+    monkeypatch.setenv('MCP_RESPONSE_STYLE', 'compact')
+    encoder = ResponseEncoder.from_environment()
+
+    output = encoder.encode_restaurant_response(restaurants, METADATA)
+
+    assert encoder.style == 'compact'
+    assert json.loads(output) == response_document(restaurants, METADATA)
+    assert '\n' not in output
@@ -0,0 +1,43 @@
+"""
+Tests that modules vendored into other subprojects match this project's copies.
+
+Run scripts/sync_shared_modules.py to update the copies after editing a
+shared module or config/districts.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from scripts.sync_shared_modules import (
+    PROJECT_ROOT,
+    REPOSITORY_ROOT,
+    SHARED_PATHS,
+    find_drifted_copies
+)
+
+
+CONSUMER_PROJECTS = sorted({copy.split('/')[0] for copies in SHARED_PATHS.values() for copy in copies})
+
+
+def test_shared_sources_exist():
+    """Every canonical shared path exists in this project."""
+    for source in SHARED_PATHS:
+        assert (PROJECT_ROOT / source).exists(), source
+
+
+@pytest.mark.skipif(
+    not any((REPOSITORY_ROOT / project).is_dir() for project in CONSUMER_PROJECTS),
+    reason="other subprojects are not checked out"
+)
+def test_vendored_copies_match():
+    """Vendored copies are identical to the canonical files."""
+    drifted = [os.path.relpath(path, REPOSITORY_ROOT) for path in find_drifted_copies()]
+
+    assert drifted == [], (
+        f"Out-of-date copies {drifted}; run scripts/sync_shared_modules.py in restaurant-search-mcp"
+    )
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for the local and packed snapshot storage backends.
+
+Builds a snapshot from config/restaurants and checks that it serves the same
+district documents as LocalFileStorageBackend, supports conditional reads,
+and picks up a rebuilt snapshot after reload().
+"""
+
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.storage_backends import (
+    DatasetNotModified,
+    LocalFileStorageBackend,
+    PackedSnapshotStorageBackend,
+    StorageBackendError,
+    build_packed_snapshot,
+    create_storage_backend
+)
+
+
+RESTAURANT_DATA_PATH = Path(__file__).resolve().parent / "config" / "restaurants"
+
+
+@pytest.fixture
+def local_backend():
+    """Local backend over the bundled district files."""
+    return LocalFileStorageBackend(RESTAURANT_DATA_PATH)
+
+
+@pytest.fixture
+def snapshot_backend(tmp_path):
+    """Snapshot backend over a snapshot of the bundled district files."""
+    snapshot_path = tmp_path / "restaurants.snapshot"
+    build_packed_snapshot(RESTAURANT_DATA_PATH, snapshot_path)
+    backend = PackedSnapshotStorageBackend(snapshot_path)
+    yield backend
+    backend.reload()
+
+
+class TestLocalFileStorageBackend:
+    """Test cases for LocalFileStorageBackend."""
+
+    def test_lists_bundled_districts(self, local_backend):
+        """All region directories and district files are listed."""
+        districts = local_backend.list_datasets()
+
+        assert set(districts) == {"hong-kong-island", "islands", "kowloon", "new-territories"}
+        assert "admiralty" in districts["hong-kong-island"]
+
+    def test_conditional_read(self, local_backend):
+        """A matching ETag raises DatasetNotModified."""
+        stored = local_backend.get_dataset("hong-kong-island", "admiralty")
+
+        with pytest.raises(DatasetNotModified):
+            local_backend.get_dataset("hong-kong-island", "admiralty", if_none_match=stored.etag)
+
+    def test_missing_district(self, local_backend):
+        """A district without a file returns None."""
+        assert local_backend.get_dataset("islands", "no-such-district") is None
+
+
+class TestPackedSnapshotStorageBackend:
+    """Test cases for PackedSnapshotStorageBackend."""
+
+    def test_round_trip_matches_local_files(self, local_backend, snapshot_backend):
+        """Every district in the snapshot has the same bytes as its local file."""
+        districts = local_backend.list_datasets()
+
+        assert snapshot_backend.list_datasets() == districts
+        for region, names in districts.items():
+            for district in names:
+                expected = local_backend.get_dataset(region, district).content
+                assert snapshot_backend.get_dataset(region, district).content == expected
+
+    def test_conditional_read(self, snapshot_backend):
+        """A matching ETag raises DatasetNotModified; another ETag returns content."""
+        stored = snapshot_backend.get_dataset("kowloon", "mong-kok")
+
+        with pytest.raises(DatasetNotModified):
+            snapshot_backend.get_dataset("kowloon", "mong-kok", if_none_match=stored.etag)
+        assert snapshot_backend.get_dataset("kowloon", "mong-kok", if_none_match='"old"') == stored
+
+    def test_missing_district(self, snapshot_backend):
+        """A district not in the snapshot returns None."""
+        assert snapshot_backend.get_dataset("islands", "no-such-district") is None
+
+    def test_reload_picks_up_rebuilt_snapshot(self, tmp_path, snapshot_backend):
+        """After the snapshot file is replaced, reload() serves the new data."""
+        source = tmp_path / "source"
+        shutil.copytree(RESTAURANT_DATA_PATH / "kowloon", source / "kowloon")
+        old = snapshot_backend.get_dataset("kowloon", "mong-kok")
+
+        district_file = source / "kowloon" / "mong-kok.json"
+        district_file.write_bytes(district_file.read_bytes() + b"\n")
+        build_packed_snapshot(source, snapshot_backend.snapshot_path)
+
+        assert snapshot_backend.get_dataset("kowloon", "mong-kok") == old
+        snapshot_backend.reload()
+        new = snapshot_backend.get_dataset("kowloon", "mong-kok")
+
+        assert new.content == district_file.read_bytes()
+        assert new.etag != old.etag
+        assert list(snapshot_backend.list_datasets()) == ["kowloon"]
+
+    def test_reads_during_reload(self, local_backend, snapshot_backend):
+        """Concurrent reads never see a mapping closed by reload()."""
+        expected = local_backend.get_dataset("hong-kong-island", "central-district").content
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            try:
+                while not stop.is_set():
+                    stored = snapshot_backend.get_dataset("hong-kong-island", "central-district")
+                    assert stored.content == expected
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        # Switch threads often so reads interleave with reload()
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            readers = [threading.Thread(target=read) for _ in range(4)]
+            for reader in readers:
+                reader.start()
+            for _ in range(300):
+                snapshot_backend.reload()
+            stop.set()
+            for reader in readers:
+                reader.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+
+    def test_invalid_snapshot_file(self, tmp_path):
+        """A file that is not a snapshot is rejected."""
+        bad_path = tmp_path / "bad.snapshot"
+        bad_path.write_bytes(b"not a snapshot")
+        backend = PackedSnapshotStorageBackend(bad_path)
+
+        with pytest.raises(StorageBackendError):
+            backend.prepare()
+        assert not backend.test_connection()
+
+    def test_build_without_district_files(self, tmp_path):
+        """Building a snapshot from an empty directory fails."""
+        with pytest.raises(StorageBackendError):
+            build_packed_snapshot(tmp_path, tmp_path / "empty.snapshot")
+
+    def test_data_access_client_reads_snapshot(self, local_backend, snapshot_backend):
+        """DataAccessClient parses the same restaurants from a snapshot as from local files."""
+        pairs = [("hong-kong-island", "admiralty"), ("kowloon", "mong-kok")]
+        from_snapshot = DataAccessClient(storage_backend=snapshot_backend).get_multiple_restaurant_data(pairs)
+        from_local = DataAccessClient(storage_backend=local_backend).get_multiple_restaurant_data(pairs)
+
+        assert list(from_snapshot) == list(from_local)
+        for district in from_local:
+            assert ([r.id for r in from_snapshot[district].restaurants]
+                    == [r.id for r in from_local[district].restaurants])
+
+
+class TestCreateStorageBackend:
+    """Test cases for create_storage_backend."""
+
+    def test_backend_names(self, tmp_path):
+        """Each backend name creates the matching backend."""
+        assert create_storage_backend("s3", s3_bucket="bucket").name == "s3"
+        assert create_storage_backend("LOCAL", s3_bucket="bucket", local_path=tmp_path).name == "local"
+        assert create_storage_backend(
+            "snapshot", s3_bucket="bucket", snapshot_path=tmp_path / "x.snapshot"
+        ).name == "snapshot"
+
+    def test_invalid_configuration(self):
+        """Unknown backends and a snapshot backend without a path are rejected."""
+        with pytest.raises(ValueError):
+            create_storage_backend("ftp", s3_bucket="bucket")
+        with pytest.raises(ValueError):
+            create_storage_backend("snapshot", s3_bucket="bucket")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for memoized time range parsing and batch meal classification in TimeService.
+
+Checks that meal_overlap_bits_batch agrees with check_time_overlap for every
+meal period, that bulk classification matches per-restaurant results over
+config/restaurants, and that the parse memo stays bounded under concurrent use.
+"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.storage_backends import LocalFileStorageBackend
+from services.time_service import TimeService
+
+
+RESTAURANT_DATA_PATH = Path(__file__).resolve().parent / "config" / "restaurants"
+
+
+def scalar_bits(service: TimeService, range_minutes) -> int:
+    """Meal bits from one check_time_overlap call per meal period."""
+    bits = 0
+    for meal_index, meal_type in enumerate(TimeService.MEAL_TYPE_ORDER):
+        if service.check_time_overlap(range_minutes, TimeService.MEAL_PERIOD_MINUTES[meal_type]):
+            bits |= 1 << meal_index
+    return bits
+
+
+def test_batch_overlap_matches_scalar_check():
+    """Batch results equal the scalar check, including ranges crossing midnight."""
+    service = TimeService()
+    ranges = [(start, end) for start in range(0, 1440, 15) for end in range(0, 1440, 15)]
+    ranges += [(659, 689), (690, 690), (1350, 1351), (1380, 419)]
+
+    assert service.meal_overlap_bits_batch(ranges) == [scalar_bits(service, r) for r in ranges]
+
+
+def test_bulk_classification_matches_per_restaurant():
+    """classify_operating_hours equals get_meal_types_for_hours for every restaurant."""
+    client = DataAccessClient(storage_backend=LocalFileStorageBackend(RESTAURANT_DATA_PATH))
+    restaurants = client.get_restaurant_data("hong-kong-island", "central-district").restaurants
+    service = TimeService()
+
+    coverage = service.classify_operating_hours(restaurants)
+
+    assert coverage == {
+        r.id: TimeService().get_meal_types_for_hours(r.operating_hours) for r in restaurants
+    }
+
+
+def test_parse_memo_is_bounded_under_concurrent_use():
+    """Concurrent parsing of more strings than the memo holds stays bounded and correct."""
+    service = TimeService(parse_cache_size=50)
+    ranges = [f"{hour:02d}:{minute:02d} - 23:00" for hour in range(7, 22) for minute in (0, 15, 30, 45)]
+    errors = []
+
+    def parse():
+        try:
+            for _ in range(20):
+                for time_range in ranges:
+                    start, end = service.parse_time_range_minutes(time_range)
+                    assert (start, end) == (int(time_range[:2]) * 60 + int(time_range[3:5]), 1380)
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=parse) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert errors == []
+    assert len(service._parse_cache) == 50
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for server-side sort_by/top_k ranking in RestaurantService.
+
+Searches config/restaurants through LocalFileStorageBackend and checks that
+the heap-merged top-K results equal a full stable sort of the unranked
+results truncated to K, including at cut-offs that fall inside ties.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.data_access import DataAccessClient
+from services.restaurant_service import RestaurantService, RestaurantSearchError
+from services.storage_backends import LocalFileStorageBackend
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+
+def reference_key(sort_by: str):
+    """Ranking key computed from the restaurant records, smaller is better."""
+    def key(restaurant):
+        likes = restaurant.sentiment.likes or 0
+        total = likes + (restaurant.sentiment.dislikes or 0) + (restaurant.sentiment.neutral or 0)
+        if sort_by == 'likes':
+            return (-likes, -total)
+        if sort_by == 'combined_sentiment':
+            combined = (likes + (restaurant.sentiment.neutral or 0)) / total if total else 0.0
+            return (-combined, -likes)
+        return (-float(restaurant.metadata.quality_score or 0), -likes)
+    return key
+
+
+def full_sort(restaurants, sort_by: str, top_k=None):
+    """Stable sort of all restaurants, truncated to top_k."""
+    ranked = sorted(restaurants, key=reference_key(sort_by))
+    return ranked if top_k is None else ranked[:top_k]
+
+
+def tie_cutoffs(restaurants, sort_by: str):
+    """Values of K at which the K-th and (K+1)-th ranked restaurants tie."""
+    keys = [reference_key(sort_by)(r) for r in full_sort(restaurants, sort_by)]
+    return [k for k in range(1, len(keys)) if keys[k - 1] == keys[k]]
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Restaurant service reading the bundled district files."""
+    restaurant_service = RestaurantService(str(PROJECT_ROOT / "config"))
+    restaurant_service.data_access_client = DataAccessClient(
+        storage_backend=LocalFileStorageBackend(PROJECT_ROOT / "config" / "restaurants")
+    )
+    return restaurant_service
+
+
+SEARCHES = [
+    {"meal_types": ["lunch"]},
+    {"districts": ["Central district", "Admiralty", "Mong Kok"]},
+    {"districts": ["Central district", "Mong Kok"], "meal_types": ["breakfast", "dinner"]},
+]
+
+
+@pytest.mark.parametrize("sort_by", ["likes", "combined_sentiment", "quality_score"])
+@pytest.mark.parametrize("search", SEARCHES)
+def test_ranking_matches_full_sort(service, search, sort_by):
+    """Ranking without top_k equals a full stable sort of the unranked results."""
+    unranked = service.search_combined(**search)
+
+    ranked = service.search_combined(**search, sort_by=sort_by)
+
+    assert [r.id for r in ranked] == [r.id for r in full_sort(unranked, sort_by)]
+
+
+@pytest.mark.parametrize("sort_by", ["likes", "combined_sentiment", "quality_score"])
+@pytest.mark.parametrize("search", SEARCHES)
+def test_top_k_matches_truncated_full_sort(service, search, sort_by):
+    """Top-K results equal the full sort truncated to K, including cut-offs inside ties."""
+    unranked = service.search_combined(**search)
+    ties = tie_cutoffs(unranked, sort_by)
+    assert ties, "expected tied rankings in the bundled data"
+
+    for top_k in sorted({1, 5, ties[0], ties[len(ties) // 2], ties[-1], len(unranked), len(unranked) + 10}):
+        ranked = service.search_combined(**search, sort_by=sort_by, top_k=top_k)
+
+        assert [r.id for r in ranked] == [r.id for r in full_sort(unranked, sort_by, top_k)], top_k
+
+
+def test_top_k_without_ranking_keeps_district_order(service):
+    """top_k alone truncates the results in district order."""
+    unranked = service.search_combined(districts=["Admiralty", "Central district"])
+
+    assert service.search_combined(districts=["Admiralty", "Central district"], top_k=7) == unranked[:7]
+
+
+@pytest.mark.parametrize("ranking", [{"sort_by": "price"}, {"top_k": 0}, {"top_k": True}])
+def test_invalid_ranking_parameters(service, ranking):
+    """Unknown rankings and non-positive top_k are rejected."""
+    with pytest.raises(RestaurantSearchError):
+        service.search_combined(meal_types=["lunch"], **ranking)
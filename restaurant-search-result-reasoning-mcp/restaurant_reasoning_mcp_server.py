@@ -22,6 +22,9 @@ from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 
 from services.restaurant_reasoning_service import RestaurantReasoningService
+from services.result_cache import ResultCache
+from services.restaurant_dataset import RestaurantDatasetLoader, RestaurantDatasetError
+from services.scoring_engine import SentimentPriors
 from services.auth_middleware import AuthenticationMiddleware, AuthenticationConfig, AuthenticationHelper
 from models.restaurant_models import Restaurant, Sentiment, RecommendationResult, SentimentAnalysis
 from models.validation_models import ValidationResult, ValidationError
@@ -82,14 +85,33 @@ auth_config = AuthenticationConfig(
 # Note: Authentication middleware will be configured during server startup
 # FastMCP handles middleware differently than direct FastAPI apps
 
+# Cache rankings and sentiment analyses of restaurant lists that are sent repeatedly
+result_cache = None
+if os.getenv('REASONING_RESULT_CACHE_ENABLED', 'true').lower() != 'false':
+    result_cache = ResultCache(
+        max_entries=int(os.getenv('REASONING_RESULT_CACHE_MAX_ENTRIES', '256')),
+        max_bytes=int(os.getenv('REASONING_RESULT_CACHE_MAX_BYTES', str(16 * 1024 * 1024))),
+        ttl_seconds=float(os.getenv('REASONING_RESULT_CACHE_TTL_SECONDS', '300'))
+    )
+
 # Initialize restaurant reasoning service
 reasoning_service = RestaurantReasoningService(
     minimum_responses=1,
     default_candidate_count=20,
     random_seed=None,  # Use random seed for production
-    strict_validation=False
+    strict_validation=False,
+    result_cache=result_cache
 )
 
+# Maximum number of items in a recommend_restaurants_batch call
+MAX_BATCH_SIZE = 50
+
+# Sentiment analyses of lists larger than this use the constant-memory streaming path
+STREAMING_SENTIMENT_THRESHOLD = 500
+
+# Read-only restaurant dataset for reference-by-id and district/meal type inputs
+restaurant_dataset = RestaurantDatasetLoader.from_environment()
+
 # Initialize status check system components
 status_manager = get_reasoning_status_manager()
 config_loader = get_config_loader()
@@ -123,6 +145,59 @@ def validate_restaurant_list_parameter(restaurants: Any) -> tuple[bool, str]:
     return True, ""
 
 
+def resolve_restaurant_input(
+    restaurants: Optional[List[Dict[str, Any]]],
+    restaurant_ids: Optional[List[str]],
+    districts: Optional[List[str]],
+    meal_types: Optional[List[str]]
+) -> tuple[Optional[List[Dict[str, Any]]], str]:
+    """
+    Resolve the restaurants to analyze from one of the supported input modes.
+    
+    Callers either send full restaurant objects, or reference restaurants in the
+    shared restaurant dataset by id (optionally narrowed to some districts) or
+    by a districts/meal types query.
+    
+    Args:
+        restaurants: Full restaurant objects
+        restaurant_ids: Restaurant ids to look up
+        districts: Districts to take restaurants from, or to look ids up in
+        meal_types: Meal types to filter district restaurants by
+        
+    Returns:
+        Tuple of (restaurant list or None, error_message)
+    """
+    if restaurants is not None:
+        if restaurant_ids or districts or meal_types:
+            return None, "Provide either 'restaurants' or 'restaurant_ids'/'districts', not both"
+        return restaurants, ""
+    
+    for name, value in (('restaurant_ids', restaurant_ids), ('districts', districts), ('meal_types', meal_types)):
+        if value is not None and (not isinstance(value, list) or not all(isinstance(v, str) for v in value)):
+            return None, f"{name} must be a list of strings"
+    
+    try:
+        if restaurant_ids:
+            if meal_types:
+                return None, "meal_types cannot be combined with restaurant_ids"
+            found, missing = restaurant_dataset.find_by_ids(restaurant_ids, districts)
+            if missing:
+                return None, f"Unknown restaurant ids: {missing}"
+            return found, ""
+        
+        if districts:
+            found = restaurant_dataset.find_restaurants(districts, meal_types)
+            if not found:
+                return None, f"No restaurants found for districts {districts} and meal types {meal_types or 'any'}"
+            return found, ""
+    except RestaurantDatasetError as e:
+        return None, str(e)
+    
+    if meal_types:
+        return None, "meal_types requires districts"
+    return None, "One of 'restaurants', 'restaurant_ids' or 'districts' is required"
+
+
 def validate_ranking_method_parameter(ranking_method: str) -> tuple[bool, str]:
     """
     Validate that the ranking method parameter is valid.
@@ -133,7 +208,7 @@ def validate_ranking_method_parameter(ranking_method: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    valid_methods = ["sentiment_likes", "combined_sentiment"]
+    valid_methods = ["sentiment_likes", "combined_sentiment", "bayesian_average"]
     
     if not isinstance(ranking_method, str):
         return False, f"Ranking method must be a string, got {type(ranking_method).__name__}"
@@ -144,6 +219,50 @@ def validate_ranking_method_parameter(ranking_method: str) -> tuple[bool, str]:
     return True, ""
 
 
+def resolve_ranking_priors(ranking_method: str, references_dataset: bool) -> Optional[SentimentPriors]:
+    """
+    Get the priors to rank with for a recommendation request.
+    
+    bayesian_average requests that reference the shared restaurant dataset are
+    ranked against priors of the whole dataset, which are computed once per
+    dataset version; other requests use priors of their own restaurants.
+    
+    Args:
+        ranking_method: Requested ranking method
+        references_dataset: Whether the restaurants were resolved from the dataset
+        
+    Returns:
+        Dataset priors, or None to derive priors from the restaurants
+    """
+    if ranking_method != "bayesian_average" or not references_dataset:
+        return None
+    try:
+        return restaurant_dataset.sentiment_priors()
+    except RestaurantDatasetError as e:
+        logger.warning(f"Using priors of the requested restaurants, dataset priors unavailable: {e}")
+        return None
+
+
+def format_recommendation_data(recommendation_result: RecommendationResult) -> Dict[str, Any]:
+    """
+    Format a recommendation result as the data of a tool response.
+    
+    Args:
+        recommendation_result: Result to format
+        
+    Returns:
+        Dictionary with recommendation, candidates and analysis summary
+    """
+    return {
+        'recommendation': recommendation_result.recommendation.to_dict(),
+        'candidates': [restaurant.to_dict() for restaurant in recommendation_result.candidates],
+        'ranking_method': recommendation_result.ranking_method,
+        'candidate_count': len(recommendation_result.candidates),
+        'analysis_summary': recommendation_result.analysis_summary,
+        'timestamp': datetime.utcnow().isoformat() + "Z"
+    }
+
+
 def format_error_response(
     error_message: str, 
     error_type: str = "ValidationError",
@@ -360,8 +479,11 @@ except Exception as e:
 
 @mcp.tool()
 def recommend_restaurants(
-    restaurants: List[Dict[str, Any]], 
-    ranking_method: str = "sentiment_likes"
+    restaurants: Optional[List[Dict[str, Any]]] = None, 
+    ranking_method: str = "sentiment_likes",
+    restaurant_ids: Optional[List[str]] = None,
+    districts: Optional[List[str]] = None,
+    meal_types: Optional[List[str]] = None
 ) -> str:
     """
     Analyze restaurant sentiment data and provide intelligent recommendations.
@@ -370,6 +492,9 @@ def recommend_restaurants(
     and provides both a ranked list of top candidates and a single recommendation.
     The ranking can be based on either highest sentiment likes or combined positive sentiment.
     
+    Instead of sending full restaurant objects, callers can reference restaurants
+    in the shared restaurant dataset by id, or select them by districts and meal types.
+    
     Args:
         restaurants: List of restaurant objects with sentiment data. Each restaurant must have:
                     - id: string identifier
@@ -379,6 +504,13 @@ def recommend_restaurants(
         ranking_method: Ranking method to use:
                        - "sentiment_likes": Rank by highest likes count
                        - "combined_sentiment": Rank by (likes + neutral) percentage
+                       - "bayesian_average": Rank by like rate shrunk towards the
+                         average like rate, so a few reviews cannot beat many
+        restaurant_ids: Restaurant ids to look up instead of sending restaurants
+                       (optionally narrowed with districts)
+        districts: District names to take restaurants from instead of sending restaurants
+        meal_types: Optional meal types ("breakfast", "lunch", "dinner") to filter
+                   district restaurants by
                        
     Returns:
         JSON string containing:
@@ -397,14 +529,27 @@ def recommend_restaurants(
                 "district": "Central"
             }
         ], "sentiment_likes")
+        
+        recommend_restaurants(districts=["Central district"], meal_types=["lunch"])
     """
     try:
         # Log tool invocation (no request context available in MCP tools)
         log_mcp_tool_invocation('recommend_restaurants', {
             'restaurants': restaurants,
-            'ranking_method': ranking_method
+            'ranking_method': ranking_method,
+            'restaurant_ids': restaurant_ids,
+            'districts': districts,
+            'meal_types': meal_types
         }, None)
         
+        # Resolve referenced restaurants from the shared dataset
+        references_dataset = restaurants is None
+        restaurants, error_msg = resolve_restaurant_input(
+            restaurants, restaurant_ids, districts, meal_types
+        )
+        if restaurants is None:
+            return format_error_response(error_msg, "ValidationError")
+        
         logger.info(f"Processing recommendation request for {len(restaurants) if isinstance(restaurants, list) else 0} restaurants")
         
         # Validate input parameters
@@ -420,20 +565,14 @@ def recommend_restaurants(
         recommendation_result = reasoning_service.analyze_and_recommend(
             restaurant_data=restaurants,
             ranking_method=ranking_method,
-            candidate_count=20
+            candidate_count=20,
+            priors=resolve_ranking_priors(ranking_method, references_dataset)
         )
         
         # Format successful response
         response = {
             'success': True,
-            'data': {
-                'recommendation': recommendation_result.recommendation.to_dict(),
-                'candidates': [restaurant.to_dict() for restaurant in recommendation_result.candidates],
-                'ranking_method': recommendation_result.ranking_method,
-                'candidate_count': len(recommendation_result.candidates),
-                'analysis_summary': recommendation_result.analysis_summary,
-                'timestamp': datetime.utcnow().isoformat() + "Z"
-            }
+            'data': format_recommendation_data(recommendation_result)
         }
         
         logger.info(
@@ -464,7 +603,131 @@ def recommend_restaurants(
 
 
 @mcp.tool()
-def analyze_restaurant_sentiment(restaurants: List[Dict[str, Any]]) -> str:
+def recommend_restaurants_batch(requests: List[Dict[str, Any]]) -> str:
+    """
+    Provide recommendations for several independent restaurant lists in one call.
+    
+    Each item is processed like a recommend_restaurants call, so a caller that
+    needs one recommendation per meal or day pays the session, authentication
+    and JSON overhead once. Identical lists in a batch are ranked once. Items
+    succeed or fail independently.
+    
+    Args:
+        requests: List of up to 50 items, each with:
+                 - restaurants, restaurant_ids or districts (+ optional meal_types):
+                   the restaurants to analyze, as in recommend_restaurants
+                 - ranking_method: "sentiment_likes" (default), "combined_sentiment"
+                   or "bayesian_average"
+                 - candidate_count: number of candidates, 1-100 (default: 20)
+                 
+    Returns:
+        JSON string containing:
+        - results: One entry per item with index, success and either the
+          recommend_restaurants data or an error
+        - succeeded / failed: Item counts
+        
+    Example:
+        recommend_restaurants_batch([
+            {"districts": ["Central district"], "meal_types": ["breakfast"]},
+            {"districts": ["Admiralty"], "meal_types": ["lunch"], "ranking_method": "combined_sentiment"}
+        ])
+    """
+    try:
+        if not isinstance(requests, list) or not requests:
+            return format_error_response("Requests must be a non-empty list", "ValidationError")
+        if len(requests) > MAX_BATCH_SIZE:
+            return format_error_response(
+                f"Too many requests in batch: {len(requests)} (maximum {MAX_BATCH_SIZE})",
+                "ValidationError"
+            )
+        
+        log_mcp_tool_invocation('recommend_restaurants_batch', {
+            'request_count': len(requests)
+        }, None)
+        
+        # Validate every item first; only valid items are analyzed
+        errors: Dict[int, str] = {}
+        batch_items = []
+        batch_indexes = []
+        for index, item in enumerate(requests):
+            if not isinstance(item, dict):
+                errors[index] = f"Request must be a dictionary, got {type(item).__name__}"
+                continue
+            
+            ranking_method = item.get('ranking_method', 'sentiment_likes')
+            candidate_count = item.get('candidate_count', 20)
+            restaurants, error_msg = resolve_restaurant_input(
+                item.get('restaurants'), item.get('restaurant_ids'),
+                item.get('districts'), item.get('meal_types')
+            )
+            if restaurants is not None:
+                is_valid, error_msg = validate_restaurant_list_parameter(restaurants)
+                if is_valid:
+                    is_valid, error_msg = validate_ranking_method_parameter(ranking_method)
+                if is_valid and (
+                    not isinstance(candidate_count, int) or isinstance(candidate_count, bool)
+                    or not 1 <= candidate_count <= 100
+                ):
+                    is_valid, error_msg = False, "candidate_count must be an integer between 1 and 100"
+                if is_valid:
+                    priors = resolve_ranking_priors(ranking_method, item.get('restaurants') is None)
+                    batch_items.append((restaurants, ranking_method, candidate_count, priors))
+                    batch_indexes.append(index)
+                    continue
+            errors[index] = error_msg
+        
+        batch_results = dict(zip(batch_indexes, reasoning_service.analyze_and_recommend_batch(batch_items)))
+        
+        results = []
+        for index in range(len(requests)):
+            if index in errors:
+                recommendation_result, error_msg = None, errors[index]
+            else:
+                recommendation_result, error_msg = batch_results[index]
+            
+            if recommendation_result is not None:
+                results.append({
+                    'index': index,
+                    'success': True,
+                    'data': format_recommendation_data(recommendation_result)
+                })
+            else:
+                results.append({
+                    'index': index,
+                    'success': False,
+                    'error': {'type': 'ValidationError', 'message': error_msg}
+                })
+        
+        succeeded = sum(1 for result in results if result['success'])
+        response = {
+            'success': True,
+            'data': {
+                'results': results,
+                'succeeded': succeeded,
+                'failed': len(results) - succeeded,
+                'timestamp': datetime.utcnow().isoformat() + "Z"
+            }
+        }
+        
+        logger.info(f"Completed batch recommendation: {succeeded} of {len(results)} items succeeded")
+        
+        return json.dumps(response, indent=2)
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in recommend_restaurants_batch: {e}")
+        return format_error_response(
+            f"An unexpected error occurred during batch recommendation analysis: {str(e)}",
+            "ProcessingError"
+        )
+
+
+@mcp.tool()
+def analyze_restaurant_sentiment(
+    restaurants: Optional[List[Dict[str, Any]]] = None,
+    districts: Optional[List[str]] = None,
+    meal_types: Optional[List[str]] = None,
+    include_score_statistics: bool = False
+) -> str:
     """
     Analyze sentiment data for a list of restaurants without providing recommendations.
     
@@ -472,18 +735,27 @@ def analyze_restaurant_sentiment(restaurants: List[Dict[str, Any]]) -> str:
     insights about customer satisfaction metrics without selecting specific recommendations.
     Useful for understanding overall sentiment patterns in a restaurant dataset.
     
+    Large lists (for example every district of the shared restaurant dataset) are
+    aggregated in a single streaming pass with constant memory use.
+    
     Args:
         restaurants: List of restaurant objects with sentiment data. Each restaurant must have:
                     - id: string identifier
                     - name: restaurant name
                     - sentiment: object with likes, dislikes, neutral (integers)
                     - Other fields are optional for analysis
+        districts: District names to take restaurants from instead of sending restaurants
+        meal_types: Optional meal types ("breakfast", "lunch", "dinner") to filter
+                   district restaurants by
+        include_score_statistics: Also return score mean, standard deviation,
+                                 percentiles and the top restaurants (default: False)
                     
     Returns:
         JSON string containing:
         - sentiment_analysis: Statistical analysis including averages and score ranges
         - restaurant_count: Number of restaurants analyzed
         - ranking_method: Method used for analysis (defaults to sentiment_likes)
+        - score_statistics: Score distribution (only if include_score_statistics)
         
     Example:
         analyze_restaurant_sentiment([
@@ -498,13 +770,23 @@ def analyze_restaurant_sentiment(restaurants: List[Dict[str, Any]]) -> str:
                 "sentiment": {"likes": 70, "dislikes": 20, "neutral": 10}
             }
         ])
+        
+        analyze_restaurant_sentiment(districts=["Central district"], include_score_statistics=True)
     """
     try:
         # Log tool invocation (no request context available in MCP tools)
         log_mcp_tool_invocation('analyze_restaurant_sentiment', {
-            'restaurants': restaurants
+            'restaurants': restaurants,
+            'districts': districts,
+            'meal_types': meal_types,
+            'include_score_statistics': include_score_statistics
         }, None)
         
+        # Resolve referenced restaurants from the shared dataset
+        restaurants, error_msg = resolve_restaurant_input(restaurants, None, districts, meal_types)
+        if restaurants is None:
+            return format_error_response(error_msg, "ValidationError")
+        
         logger.info(f"Processing sentiment analysis for {len(restaurants) if isinstance(restaurants, list) else 0} restaurants")
         
         # Validate input parameters
@@ -513,10 +795,20 @@ def analyze_restaurant_sentiment(restaurants: List[Dict[str, Any]]) -> str:
             return format_error_response(error_msg, "ValidationError")
         
         # Perform sentiment analysis
-        sentiment_analysis = reasoning_service.analyze_sentiment_only(
-            restaurant_data=restaurants,
-            ranking_method="sentiment_likes"  # Default method for analysis
-        )
+        score_statistics = None
+        if include_score_statistics or len(restaurants) > STREAMING_SENTIMENT_THRESHOLD:
+            aggregator = reasoning_service.aggregate_sentiment_stream(
+                restaurant_data=restaurants,
+                ranking_method="sentiment_likes"  # Default method for analysis
+            )
+            sentiment_analysis = aggregator.to_analysis()
+            if include_score_statistics:
+                score_statistics = aggregator.score_statistics()
+        else:
+            sentiment_analysis = reasoning_service.analyze_sentiment_only(
+                restaurant_data=restaurants,
+                ranking_method="sentiment_likes"  # Default method for analysis
+            )
         
         # Format successful response
         response = {
@@ -528,6 +820,8 @@ def analyze_restaurant_sentiment(restaurants: List[Dict[str, Any]]) -> str:
                 'timestamp': datetime.utcnow().isoformat() + "Z"
             }
         }
+        if score_statistics is not None:
+            response['data']['score_statistics'] = score_statistics
         
         logger.info(
             f"Completed sentiment analysis for {sentiment_analysis.restaurant_count} restaurants"
@@ -615,13 +909,15 @@ def get_server_metrics() -> Dict[str, Any]:
         metrics = {
             'mcp_server_status': 'running',
             'server_type': 'restaurant_reasoning_mcp',
-            'available_tools': ['recommend_restaurants', 'analyze_restaurant_sentiment'],
-            'tool_count': 2,
+            'available_tools': ['recommend_restaurants', 'recommend_restaurants_batch', 'analyze_restaurant_sentiment'],
+            'tool_count': 3,
             'reasoning_service_config': {
                 'minimum_responses': reasoning_service.minimum_responses,
                 'default_candidate_count': reasoning_service.default_candidate_count,
                 'strict_validation': reasoning_service.strict_validation
             },
+            'result_cache': reasoning_service.get_result_cache_metrics(),
+            'restaurant_dataset': restaurant_dataset.get_stats(),
             'timestamp': datetime.utcnow().isoformat() + "Z"
         }
         
@@ -651,6 +947,7 @@ if __name__ == "__main__":
     logger.info(f"  - Minimum responses: {reasoning_service.minimum_responses}")
     logger.info(f"  - Default candidate count: {reasoning_service.default_candidate_count}")
     logger.info(f"  - Strict validation: {reasoning_service.strict_validation}")
+    logger.info(f"  - Result cache: {'Enabled' if result_cache is not None else 'Disabled'}")
     
     # Test service initialization
     try:
@@ -694,7 +991,7 @@ if __name__ == "__main__":
     logger.info(f"  - Health check (bypass): GET /health")
     logger.info(f"  - Metrics (bypass): GET /metrics")
     logger.info(f"  - Status endpoints (bypass): GET /status/*")
-    logger.info(f"  - MCP tools (authenticated): recommend_restaurants, analyze_restaurant_sentiment")
+    logger.info(f"  - MCP tools (authenticated): recommend_restaurants, recommend_restaurants_batch, analyze_restaurant_sentiment")
     
     try:
         mcp.run()
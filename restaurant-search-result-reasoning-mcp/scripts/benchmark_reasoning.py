@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Load-test and micro-benchmark harness for the restaurant reasoning MCP server.
+
+Drives RestaurantReasoningService and the MCP tool functions in-process with
+the shipped request files (tests/tests/request/dataset_size_*.json and
+performance_test_*.json). For every workload it reports p50/p95/p99 latency,
+throughput and memory allocated per call (tracemalloc), writes the results as
+JSON and compares them against a stored baseline, exiting with status 1 on a
+regression.
+
+Everything runs offline: the result cache is disabled so every call does the
+full work, and the restaurant dataset uses the local storage backend.
+"""
+
+import os
+import sys
+import json
+import time
+import glob
+import logging
+import platform
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add the project root to Python path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Benchmark the uncached code paths without touching S3
+os.environ.setdefault('REASONING_RESULT_CACHE_ENABLED', 'false')
+os.environ.setdefault('RESTAURANT_DATA_BACKEND', 'local')
+
+from services.restaurant_reasoning_service import RestaurantReasoningService
+
+
+DEFAULT_REQUEST_DIR = os.path.join(PROJECT_ROOT, 'tests', 'tests', 'request')
+DEFAULT_REQUEST_PATTERNS = ('dataset_size_*.json', 'performance_test_*.json')
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, 'tests', 'results', 'benchmark_results.json')
+DEFAULT_BASELINE = os.path.join(PROJECT_ROOT, 'tests', 'results', 'benchmark_baseline.json')
+
+# Metrics compared against the baseline, with the allowed relative increase
+REGRESSION_METRICS = {
+    'p50_ms': 'latency_tolerance',
+    'p95_ms': 'latency_tolerance',
+    'allocated_bytes': 'memory_tolerance'
+}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Get a percentile of sorted values by linear interpolation.
+
+    Args:
+        sorted_values: Values in ascending order
+        fraction: Percentile as a fraction from 0.0 to 1.0
+
+    Returns:
+        Interpolated value, or 0.0 for no values
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def load_workloads(request_dir: str, patterns=DEFAULT_REQUEST_PATTERNS) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Load benchmark request files.
+
+    Args:
+        request_dir: Directory of request JSON files
+        patterns: Glob patterns of the files to load
+
+    Returns:
+        (workload name, tool parameters) pairs ordered by restaurant count
+    """
+    workloads = []
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(request_dir, pattern)):
+            with open(path, 'r', encoding='utf-8') as f:
+                request = json.load(f)
+            parameters = request.get('parameters', {})
+            if isinstance(parameters.get('restaurants'), list):
+                name = os.path.splitext(os.path.basename(path))[0]
+                workloads.append((name, parameters))
+    workloads.sort(key=lambda workload: (len(workload[1]['restaurants']), workload[0]))
+    return workloads
+
+
+def measure(call: Callable[[], Any], iterations: int, warmup: int) -> Dict[str, Any]:
+    """
+    Measure latency, throughput and allocations of a call.
+
+    Timings and allocations are taken in separate runs so that tracemalloc
+    overhead does not distort the latency figures.
+
+    Args:
+        call: Function to benchmark
+        iterations: Timed calls
+        warmup: Untimed calls made first
+
+    Returns:
+        Dictionary of latency percentiles (ms), throughput, peak bytes
+        allocated during a call and bytes still held afterwards (the response)
+    """
+    for _ in range(warmup):
+        call()
+
+    timings = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    elapsed = time.perf_counter() - started
+    timings.sort()
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        response = call()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del response
+
+    return {
+        'iterations': iterations,
+        'p50_ms': round(percentile(timings, 0.50), 4),
+        'p95_ms': round(percentile(timings, 0.95), 4),
+        'p99_ms': round(percentile(timings, 0.99), 4),
+        'mean_ms': round(sum(timings) / len(timings), 4),
+        'max_ms': round(timings[-1], 4),
+        'throughput_per_second': round(iterations / elapsed, 2) if elapsed > 0 else 0.0,
+        'allocated_bytes': peak - before,
+        'retained_bytes': current - before
+    }
+
+
+def load_tool_functions() -> Optional[Dict[str, Callable[..., str]]]:
+    """
+    Import the MCP tool functions from the server module.
+
+    Returns:
+        Tool functions by name, or None if the server dependencies are missing
+    """
+    try:
+        import restaurant_reasoning_mcp_server as server
+    except ImportError as e:
+        print(f"   (skipping MCP tool benchmarks: {e})")
+        return None
+    return {
+        'recommend_restaurants': server.recommend_restaurants,
+        'analyze_restaurant_sentiment': server.analyze_restaurant_sentiment
+    }
+
+
+def build_cases(
+    workloads: List[Tuple[str, Dict[str, Any]]],
+    tools: Optional[Dict[str, Callable[..., str]]]
+) -> List[Tuple[str, str, int, Callable[[], Any]]]:
+    """
+    Build the benchmark cases for every workload.
+
+    Args:
+        workloads: (workload name, tool parameters) pairs
+        tools: MCP tool functions, or None to benchmark the service only
+
+    Returns:
+        (case name, workload name, restaurant count, call) tuples
+    """
+    service = RestaurantReasoningService(random_seed=42)
+    cases = []
+    for name, parameters in workloads:
+        restaurants = parameters['restaurants']
+        ranking_method = parameters.get('ranking_method', 'sentiment_likes')
+        count = len(restaurants)
+        cases.append((
+            'service.analyze_and_recommend', name, count,
+            lambda r=restaurants, m=ranking_method: service.analyze_and_recommend(r, m)
+        ))
+        cases.append((
+            'service.analyze_sentiment_only', name, count,
+            lambda r=restaurants, m=ranking_method: service.analyze_sentiment_only(r, m)
+        ))
+        if tools:
+            cases.append((
+                'tool.recommend_restaurants', name, count,
+                lambda r=restaurants, m=ranking_method: tools['recommend_restaurants'](r, m)
+            ))
+            cases.append((
+                'tool.analyze_restaurant_sentiment', name, count,
+                lambda r=restaurants: tools['analyze_restaurant_sentiment'](r)
+            ))
+    return cases
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Any],
+    latency_tolerance: float,
+    memory_tolerance: float,
+    min_latency_delta_ms: float = 0.5
+) -> List[str]:
+    """
+    Find results that regressed against a baseline.
+
+    Cases missing from either side are ignored. Latency regressions must
+    also exceed min_latency_delta_ms, so timer noise on sub-millisecond
+    cases is not reported.
+
+    Args:
+        results: Benchmark results of this run
+        baseline: Previously written benchmark results document
+        latency_tolerance: Allowed relative latency increase (0.25 = 25%)
+        memory_tolerance: Allowed relative allocation increase
+        min_latency_delta_ms: Latency increase always allowed, in milliseconds
+
+    Returns:
+        One message per regressed metric
+    """
+    tolerances = {'latency_tolerance': latency_tolerance, 'memory_tolerance': memory_tolerance}
+    baseline_results = {
+        (result['case'], result['workload']): result for result in baseline.get('results', [])
+    }
+
+    regressions = []
+    for result in results:
+        previous = baseline_results.get((result['case'], result['workload']))
+        if previous is None:
+            continue
+        for metric, tolerance_name in REGRESSION_METRICS.items():
+            if metric not in previous:
+                continue
+            limit = previous[metric] * (1 + tolerances[tolerance_name])
+            if metric.endswith('_ms'):
+                limit = max(limit, previous[metric] + min_latency_delta_ms)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{result['case']}[{result['workload']}] {metric}: "
+                    f"{result[metric]} > {previous[metric]} (+{tolerances[tolerance_name]:.0%})"
+                )
+    return regressions
+
+
+def write_json(path: str, document: Dict[str, Any]) -> None:
+    """Write a JSON document, creating the parent directory if needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2)
+
+
+def main():
+    """Main function to run the benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the restaurant reasoning service and MCP tools')
+    parser.add_argument('--requests', default=DEFAULT_REQUEST_DIR,
+                       help='Directory of request JSON files (default: tests/tests/request)')
+    parser.add_argument('--pattern', action='append',
+                       help='Request file glob pattern; repeatable '
+                            '(default: dataset_size_*.json and performance_test_*.json)')
+    parser.add_argument('--iterations', type=int, default=30,
+                       help='Timed iterations per case (default: 30)')
+    parser.add_argument('--warmup', type=int, default=3,
+                       help='Untimed iterations per case (default: 3)')
+    parser.add_argument('--service-only', action='store_true',
+                       help='Do not benchmark the MCP tool functions')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                       help='Results JSON file (default: tests/results/benchmark_results.json)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                       help='Baseline JSON file (default: tests/results/benchmark_baseline.json)')
+    parser.add_argument('--update-baseline', action='store_true',
+                       help='Write this run as the new baseline instead of comparing')
+    parser.add_argument('--latency-tolerance', type=float, default=0.25,
+                       help='Allowed relative p50/p95 latency increase (default: 0.25)')
+    parser.add_argument('--memory-tolerance', type=float, default=0.10,
+                       help='Allowed relative allocation increase (default: 0.10)')
+    parser.add_argument('--min-latency-delta', type=float, default=0.5,
+                       help='Latency increase in ms that is never a regression (default: 0.5)')
+
+    args = parser.parse_args()
+    if args.iterations < 1:
+        parser.error("--iterations must be at least 1")
+
+    # Per-request log lines would dominate the timings
+    logging.disable(logging.INFO)
+
+    workloads = load_workloads(args.requests, tuple(args.pattern or DEFAULT_REQUEST_PATTERNS))
+    if not workloads:
+        print(f"❌ No benchmark requests found under {args.requests}")
+        return 1
+
+    tools = None if args.service_only else load_tool_functions()
+    cases = build_cases(workloads, tools)
+    print(f"Running {len(cases)} cases over {len(workloads)} workloads "
+          f"({args.iterations} iterations, {args.warmup} warmup)\n")
+
+    results = []
+    print(f"{'case':<36} {'workload':<22} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'calls/s':>9} {'alloc KiB':>10}")
+    for case, workload, count, call in cases:
+        metrics = measure(call, args.iterations, args.warmup)
+        result = {'case': case, 'workload': workload, 'restaurant_count': count, **metrics}
+        result['restaurants_per_second'] = round(metrics['throughput_per_second'] * count, 2)
+        results.append(result)
+        print(f"{case:<36} {workload:<22} {count:>5} {metrics['p50_ms']:>9.3f} "
+              f"{metrics['p95_ms']:>9.3f} {metrics['p99_ms']:>9.3f} "
+              f"{metrics['throughput_per_second']:>9.1f} {metrics['allocated_bytes'] / 1024:>10.1f}")
+
+    document = {
+        'metadata': {
+            'timestamp': datetime.utcnow().isoformat() + "Z",
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': args.iterations,
+            'warmup': args.warmup
+        },
+        'results': results
+    }
+    write_json(args.output, document)
+    print(f"\n📄 Results written to {args.output}")
+
+    if args.update_baseline:
+        write_json(args.baseline, document)
+        print(f"📄 Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️  No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(
+        results, baseline, args.latency_tolerance, args.memory_tolerance,
+        args.min_latency_delta
+    )
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressions against {args.baseline}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+
+    print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
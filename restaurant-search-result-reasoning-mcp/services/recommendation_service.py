@@ -8,14 +8,16 @@ based on sentiment analysis and selecting candidates for recommendations.
 import random
 from typing import List, Dict, Any, Optional
 from models.restaurant_models import Restaurant, RecommendationResult, SentimentAnalysis
+from services.scoring_engine import RANKING_METHODS, SentimentColumns, SentimentPriors
 
 
 class RecommendationAlgorithm:
     """
     Core recommendation algorithm for restaurant sentiment analysis.
     
-    Provides ranking methods based on sentiment likes and combined sentiment,
-    candidate selection, and random recommendation logic.
+    Provides ranking methods based on sentiment likes, combined sentiment and
+    a Bayesian average of the like rate, candidate selection, and random
+    recommendation logic.
     """
     
     def __init__(self, random_seed: Optional[int] = None):
@@ -48,18 +50,9 @@ class RecommendationAlgorithm:
         if not restaurants:
             return []
         
-        # Filter out restaurants with invalid sentiment data
-        valid_restaurants = [
-            r for r in restaurants 
-            if r.sentiment.total_responses() > 0
-        ]
-        
-        # Sort by likes (descending), then by total responses (descending) for tie-breaking
-        return sorted(
-            valid_restaurants,
-            key=lambda r: (r.sentiment.likes, r.sentiment.total_responses()),
-            reverse=True
-        )
+        # Restaurants without sentiment data are excluded; ties on likes are
+        # broken by total responses (descending)
+        return SentimentColumns(restaurants).rank("sentiment_likes")
     
     def rank_by_combined_sentiment(self, restaurants: List[Restaurant]) -> List[Restaurant]:
         """
@@ -82,26 +75,35 @@ class RecommendationAlgorithm:
         if not restaurants:
             return []
         
-        # Filter out restaurants with invalid sentiment data
-        valid_restaurants = [
-            r for r in restaurants 
-            if r.sentiment.total_responses() > 0
-        ]
+        # Restaurants without sentiment data are excluded; ties on the combined
+        # score are broken by likes (descending)
+        return SentimentColumns(restaurants).rank("combined_sentiment")
+    
+    def rank_by_bayesian_average(
+        self, 
+        restaurants: List[Restaurant], 
+        priors: Optional[SentimentPriors] = None
+    ) -> List[Restaurant]:
+        """
+        Rank restaurants by like rate shrunk towards a prior like rate.
         
-        def combined_score(restaurant: Restaurant) -> float:
-            """Calculate combined sentiment score."""
-            sentiment = restaurant.sentiment
-            total = sentiment.total_responses()
-            if total == 0:
-                return 0.0
-            return (sentiment.likes + sentiment.neutral) / total
+        Algorithm:
+        1. Score (likes + weight * like_rate) / (total_responses + weight)
+        2. Sort by score in descending order
+        3. Handle ties by secondary sort on total responses
+        4. Return ranked list
         
-        # Sort by combined score (descending), then by likes (descending) for tie-breaking
-        return sorted(
-            valid_restaurants,
-            key=lambda r: (combined_score(r), r.sentiment.likes),
-            reverse=True
-        )
+        Args:
+            restaurants: List of restaurants to rank.
+            priors: Priors to shrink towards; derived from the restaurants if None.
+            
+        Returns:
+            List of restaurants sorted by Bayesian average (highest first).
+        """
+        if not restaurants:
+            return []
+        
+        return SentimentColumns(restaurants, priors=priors).rank("bayesian_average")
     
     def select_candidates(self, ranked_restaurants: List[Restaurant], count: int = 20) -> List[Restaurant]:
         """
@@ -146,46 +148,41 @@ class RecommendationAlgorithm:
         
         return self._random.choice(candidates)
     
-    def calculate_ranking_scores(self, restaurants: List[Restaurant], method: str) -> Dict[str, float]:
+    def calculate_ranking_scores(
+        self, 
+        restaurants: List[Restaurant], 
+        method: str,
+        priors: Optional[SentimentPriors] = None
+    ) -> Dict[str, float]:
         """
         Calculate ranking scores for restaurants based on method.
         
         Args:
             restaurants: List of restaurants to score.
-            method: Ranking method ("sentiment_likes" or "combined_sentiment").
+            method: Ranking method ("sentiment_likes", "combined_sentiment" or "bayesian_average").
+            priors: Priors of bayesian_average; derived from the restaurants if None.
             
         Returns:
             Dictionary mapping restaurant IDs to their scores.
         """
-        scores = {}
-        
-        for restaurant in restaurants:
-            if restaurant.sentiment.total_responses() == 0:
-                scores[restaurant.id] = 0.0
-                continue
-                
-            if method == "sentiment_likes":
-                scores[restaurant.id] = restaurant.sentiment.likes_percentage()
-            elif method == "combined_sentiment":
-                scores[restaurant.id] = restaurant.sentiment.combined_positive_percentage()
-            else:
-                scores[restaurant.id] = 0.0
-        
-        return scores
+        return SentimentColumns(restaurants, priors=priors).score_map(method)
     
     def analyze_and_recommend(
         self, 
         restaurants: List[Restaurant], 
         ranking_method: str = "sentiment_likes",
-        candidate_count: int = 20
+        candidate_count: int = 20,
+        priors: Optional[SentimentPriors] = None
     ) -> RecommendationResult:
         """
         Complete analysis and recommendation workflow.
         
         Args:
             restaurants: List of restaurants to analyze.
-            ranking_method: Method for ranking ("sentiment_likes" or "combined_sentiment").
+            ranking_method: Method for ranking ("sentiment_likes", "combined_sentiment"
+                or "bayesian_average").
             candidate_count: Number of candidates to select.
+            priors: Priors of bayesian_average; derived from the restaurants if None.
             
         Returns:
             RecommendationResult with candidates and recommendation.
@@ -198,26 +195,28 @@ class RecommendationAlgorithm:
         if not restaurants:
             raise ValueError("No restaurants provided for analysis")
         
-        # Rank restaurants based on method
-        if ranking_method == "sentiment_likes":
-            ranked_restaurants = self.rank_by_likes(restaurants)
-        elif ranking_method == "combined_sentiment":
-            ranked_restaurants = self.rank_by_combined_sentiment(restaurants)
-        else:
+        if ranking_method not in RANKING_METHODS:
             raise ValueError(f"Invalid ranking method: {ranking_method}")
         
-        if not ranked_restaurants:
+        # Load sentiment columns once and reuse them for ranking and the summary
+        columns = SentimentColumns(restaurants, priors=priors)
+        
+        if columns.valid_count == 0:
             raise ValueError("No valid restaurants with sentiment data found")
         
-        # Select top candidates
-        candidates = self.select_candidates(ranked_restaurants, candidate_count)
+        # Only the top candidates need to be ordered: select them with a bounded
+        # heap (or argpartition) instead of sorting every valid restaurant
+        if 0 < candidate_count < columns.valid_count:
+            candidates = columns.rank(ranking_method, top_k=candidate_count)
+        else:
+            candidates = self.select_candidates(columns.rank(ranking_method), candidate_count)
         
         # Random recommendation from candidates
         recommendation = self.random_select(candidates)
         
         # Generate analysis summary
         analysis_summary = self._generate_analysis_summary(
-            restaurants, ranked_restaurants, candidates, ranking_method
+            restaurants, candidates, candidates, ranking_method, columns
         )
         
         return RecommendationResult(
@@ -232,24 +231,29 @@ class RecommendationAlgorithm:
         original_restaurants: List[Restaurant],
         ranked_restaurants: List[Restaurant],
         candidates: List[Restaurant],
-        ranking_method: str
+        ranking_method: str,
+        columns: Optional[SentimentColumns] = None
     ) -> Dict[str, Any]:
         """
         Generate analysis summary for recommendation result.
         
         Args:
             original_restaurants: Original input restaurants.
-            ranked_restaurants: Restaurants after ranking.
+            ranked_restaurants: Restaurants after ranking (at least the candidates).
             candidates: Selected candidates.
             ranking_method: Method used for ranking.
+            columns: Sentiment columns already loaded for original_restaurants.
             
         Returns:
             Dictionary containing analysis metadata.
         """
-        # Calculate sentiment statistics
-        valid_restaurants = [r for r in original_restaurants if r.sentiment.total_responses() > 0]
+        if columns is None:
+            columns = SentimentColumns(original_restaurants)
         
-        if not valid_restaurants:
+        # Sentiment averages and score extremes in a single pass
+        stats = columns.summarize(ranking_method)
+        
+        if stats["valid_count"] == 0:
             return {
                 "total_restaurants": len(original_restaurants),
                 "valid_restaurants": 0,
@@ -260,30 +264,23 @@ class RecommendationAlgorithm:
                 "bottom_score": 0.0
             }
         
-        # Calculate average sentiment
-        total_likes = sum(r.sentiment.likes for r in valid_restaurants)
-        total_dislikes = sum(r.sentiment.dislikes for r in valid_restaurants)
-        total_neutral = sum(r.sentiment.neutral for r in valid_restaurants)
-        count = len(valid_restaurants)
-        
-        # Calculate scores for top and bottom
-        scores = self.calculate_ranking_scores(valid_restaurants, ranking_method)
-        score_values = list(scores.values())
-        
-        return {
+        summary = {
             "total_restaurants": len(original_restaurants),
-            "valid_restaurants": len(valid_restaurants),
+            "valid_restaurants": stats["valid_count"],
             "candidates_selected": len(candidates),
             "ranking_method": ranking_method,
             "average_sentiment": {
-                "likes": total_likes / count,
-                "dislikes": total_dislikes / count,
-                "neutral": total_neutral / count
+                "likes": stats["average_likes"],
+                "dislikes": stats["average_dislikes"],
+                "neutral": stats["average_neutral"]
             },
-            "top_score": max(score_values) if score_values else 0.0,
-            "bottom_score": min(score_values) if score_values else 0.0,
-            "score_range": max(score_values) - min(score_values) if score_values else 0.0
+            "top_score": stats["top_score"],
+            "bottom_score": stats["bottom_score"],
+            "score_range": stats["top_score"] - stats["bottom_score"]
         }
+        if ranking_method == "bayesian_average":
+            summary["priors"] = columns.priors.to_dict()
+        return summary
 
 
 def create_sentiment_analysis(
@@ -311,10 +308,10 @@ def create_sentiment_analysis(
             ranking_method=ranking_method
         )
     
-    # Filter valid restaurants
-    valid_restaurants = [r for r in restaurants if r.sentiment.total_responses() > 0]
+    # Averages and score extremes in a single pass over the sentiment columns
+    stats = SentimentColumns(restaurants).summarize(ranking_method)
     
-    if not valid_restaurants:
+    if stats["valid_count"] == 0:
         return SentimentAnalysis(
             restaurant_count=len(restaurants),
             average_likes=0.0,
@@ -325,23 +322,12 @@ def create_sentiment_analysis(
             ranking_method=ranking_method
         )
     
-    # Calculate averages
-    count = len(valid_restaurants)
-    avg_likes = sum(r.sentiment.likes for r in valid_restaurants) / count
-    avg_dislikes = sum(r.sentiment.dislikes for r in valid_restaurants) / count
-    avg_neutral = sum(r.sentiment.neutral for r in valid_restaurants) / count
-    
-    # Calculate sentiment scores based on method
-    algorithm = RecommendationAlgorithm()
-    scores = algorithm.calculate_ranking_scores(valid_restaurants, ranking_method)
-    score_values = list(scores.values())
-    
     return SentimentAnalysis(
         restaurant_count=len(restaurants),
-        average_likes=avg_likes,
-        average_dislikes=avg_dislikes,
-        average_neutral=avg_neutral,
-        top_sentiment_score=max(score_values) if score_values else 0.0,
-        bottom_sentiment_score=min(score_values) if score_values else 0.0,
+        average_likes=stats["average_likes"],
+        average_dislikes=stats["average_dislikes"],
+        average_neutral=stats["average_neutral"],
+        top_sentiment_score=stats["top_score"],
+        bottom_sentiment_score=stats["bottom_score"],
         ranking_method=ranking_method
     )
\ No newline at end of file
@@ -0,0 +1,454 @@
+"""
+Read-only restaurant dataset for reference-by-id and query inputs.
+
+This module provides the RestaurantDatasetLoader class, which lets the
+reasoning tools resolve restaurant ids or a (districts, meal_types) query
+against the district data files published for the restaurant search MCP
+server, instead of receiving every restaurant in the request payload.
+
+District files are read through the same storage backends as the search
+server (S3, local files or a packed snapshot) and district names are resolved
+with the shared district alias index. Each district is converted once into the
+restaurant dictionaries accepted by the reasoning tools and kept resident;
+entries older than the refresh interval are revalidated with a conditional
+request.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from services.district_aliases import DistrictAliasIndex, get_district_alias_index
+from services.scoring_engine import SentimentPriors
+from services.storage_backends import (
+    DatasetNotModified,
+    StorageBackend,
+    StorageBackendError,
+    create_storage_backend
+)
+from services.time_service import TimeService
+
+
+logger = logging.getLogger(__name__)
+
+# Storage backend selection, shared with the restaurant search MCP server
+DEFAULT_STORAGE_BACKEND = os.getenv('RESTAURANT_DATA_BACKEND', 's3')
+DEFAULT_S3_BUCKET = os.getenv('RESTAURANT_DATA_BUCKET', 'restaurant-data-209803798463-us-east-1')
+DEFAULT_LOCAL_DATA_PATH = os.getenv('RESTAURANT_DATA_LOCAL_PATH', 'config/restaurants')
+DEFAULT_SNAPSHOT_PATH = os.getenv('RESTAURANT_DATA_SNAPSHOT_PATH')
+
+# Seconds a loaded district is served before it is revalidated against storage
+DEFAULT_REFRESH_SECONDS = float(os.getenv('RESTAURANT_DATA_CACHE_REVALIDATE_SECONDS', '300'))
+
+# Maximum number of district files fetched from storage in parallel
+DEFAULT_FETCH_CONCURRENCY = int(os.getenv('RESTAURANT_DATA_FETCH_CONCURRENCY', '8'))
+
+
+class RestaurantDatasetError(Exception):
+    """Exception raised when restaurants cannot be resolved from the dataset."""
+    pass
+
+
+@dataclass(frozen=True)
+class _SourceOperatingHours:
+    """Operating hours in the district file format, as read by TimeService."""
+    mon_fri: Tuple[str, ...]
+    sat_sun: Tuple[str, ...]
+    public_holiday: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DistrictDataset:
+    """
+    Restaurants of one district, converted for the reasoning tools.
+
+    Attributes:
+        district: Canonical district name
+        restaurants: Restaurant dictionaries in the reasoning tool input format
+        served_meals: Meal types each restaurant is open for, by position
+        etag: Version tag of the source file, if the backend provided one
+        sentiment_totals: (restaurants with responses, likes, responses),
+            the inputs of the bayesian_average priors
+    """
+    district: str
+    restaurants: Tuple[Dict[str, Any], ...]
+    served_meals: Tuple[FrozenSet[str], ...]
+    etag: Optional[str] = None
+    sentiment_totals: Tuple[int, int, int] = (0, 0, 0)
+
+
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a shared restaurant dictionary so callers can modify it."""
+    return {**record, "sentiment": dict(record["sentiment"]), "meal_type": list(record["meal_type"])}
+
+
+class RestaurantDatasetLoader:
+    """
+    Thread-safe, read-only view of the district restaurant data files.
+    """
+
+    def __init__(
+        self,
+        storage_backend: StorageBackend,
+        alias_index: Optional[DistrictAliasIndex] = None,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+        max_concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the dataset loader.
+
+        Args:
+            storage_backend: Backend serving <region>/<district>.json files
+            alias_index: District alias index (defaults to the shared index)
+            refresh_seconds: Seconds a loaded district is served before it is
+                revalidated with a conditional request
+            max_concurrency: Maximum number of districts fetched in parallel
+            clock: Monotonic clock used for entry ages (injectable for tests)
+        """
+        self.storage_backend = storage_backend
+        self._alias_index = alias_index
+        self.refresh_seconds = refresh_seconds
+        self.max_concurrency = max(1, max_concurrency)
+        self._clock = clock
+        self._time_service = TimeService()
+
+        self._districts: Dict[str, Tuple[DistrictDataset, float]] = {}
+        self._id_index: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> "RestaurantDatasetLoader":
+        """
+        Create a loader using the RESTAURANT_DATA_* environment configuration.
+
+        Returns:
+            RestaurantDatasetLoader over the configured storage backend
+        """
+        backend = create_storage_backend(
+            DEFAULT_STORAGE_BACKEND,
+            DEFAULT_S3_BUCKET,
+            local_path=DEFAULT_LOCAL_DATA_PATH,
+            snapshot_path=DEFAULT_SNAPSHOT_PATH
+        )
+        return cls(backend)
+
+    @property
+    def alias_index(self) -> DistrictAliasIndex:
+        """District alias index used to resolve district names."""
+        if self._alias_index is None:
+            self._alias_index = get_district_alias_index()
+            if self._alias_index is None:
+                raise RestaurantDatasetError("District configuration is not available")
+        return self._alias_index
+
+    def resolve_districts(self, districts: Iterable[str]) -> List[str]:
+        """
+        Resolve district names and aliases to canonical names.
+
+        Args:
+            districts: District names as written by the caller
+
+        Returns:
+            Canonical district names without duplicates
+
+        Raises:
+            RestaurantDatasetError: If a district cannot be resolved
+        """
+        resolved, unresolved = self.alias_index.resolve_all(districts)
+        if unresolved:
+            suggestions = {name: self.alias_index.suggest(name) for name in unresolved}
+            suggestions = {name: names for name, names in suggestions.items() if names}
+            hint = f" Did you mean: {suggestions}." if suggestions else ""
+            raise RestaurantDatasetError(f"Invalid districts: {unresolved}.{hint}")
+        return resolved
+
+    def find_restaurants(
+        self,
+        districts: List[str],
+        meal_types: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the restaurants of some districts, optionally filtered by meal type.
+
+        A restaurant matches the meal filter if it is open for any of the
+        meal types, as in the restaurant search MCP server.
+
+        Args:
+            districts: District names or aliases
+            meal_types: Optional meal types ("breakfast", "lunch", "dinner")
+
+        Returns:
+            Restaurant dictionaries in the reasoning tool input format
+
+        Raises:
+            RestaurantDatasetError: If a district or meal type is invalid, or
+                the data cannot be loaded
+        """
+        if not districts:
+            raise RestaurantDatasetError("Districts list cannot be empty")
+
+        wanted_meals = None
+        if meal_types:
+            invalid_meals = [m for m in meal_types if not self._time_service.validate_meal_type(m)]
+            if invalid_meals:
+                raise RestaurantDatasetError(
+                    f"Invalid meal types: {invalid_meals}. "
+                    f"Valid meal types: {sorted(self._time_service.VALID_MEAL_TYPES)}"
+                )
+            wanted_meals = frozenset(m.lower() for m in meal_types)
+
+        datasets = self._load_districts(self.resolve_districts(districts))
+
+        restaurants = []
+        for dataset in datasets:
+            for record, served in zip(dataset.restaurants, dataset.served_meals):
+                if wanted_meals is None or served & wanted_meals:
+                    restaurants.append(_copy_record(record))
+        return restaurants
+
+    def find_by_ids(
+        self,
+        restaurant_ids: List[str],
+        districts: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Look up restaurants by id.
+
+        Ids not found in districts that are already loaded are searched in the
+        given districts, or in every configured district if none are given.
+
+        Args:
+            restaurant_ids: Restaurant ids, in the order results should follow
+            districts: Optional district names or aliases the ids belong to
+
+        Returns:
+            Tuple of (restaurant dictionaries without duplicates, ids not found)
+
+        Raises:
+            RestaurantDatasetError: If a district is invalid or the data cannot be loaded
+        """
+        wanted = list(dict.fromkeys(restaurant_ids))
+
+        with self._lock:
+            unknown = [rid for rid in wanted if rid not in self._id_index]
+        if unknown:
+            search_districts = (
+                self.resolve_districts(districts) if districts
+                else self.alias_index.canonical_names
+            )
+            self._load_districts(search_districts)
+
+        found: List[Dict[str, Any]] = []
+        missing: List[str] = []
+        with self._lock:
+            for rid in wanted:
+                location = self._id_index.get(rid)
+                if location is None:
+                    missing.append(rid)
+                    continue
+                district, position = location
+                found.append(_copy_record(self._districts[district][0].restaurants[position]))
+        return found, missing
+
+    def sentiment_priors(self, districts: Optional[List[str]] = None) -> SentimentPriors:
+        """
+        Get bayesian_average priors of the dataset.
+
+        Sentiment totals are computed once when a district file version is
+        loaded, so priors of the same districts stay identical (and results
+        ranked with them stay cacheable) until a district file changes.
+
+        Args:
+            districts: District names or aliases; every configured district if None
+
+        Returns:
+            SentimentPriors of the restaurants in the districts
+
+        Raises:
+            RestaurantDatasetError: If a district is invalid or the data cannot be loaded
+        """
+        names = self.resolve_districts(districts) if districts else self.alias_index.canonical_names
+        count = likes = responses = 0
+        for dataset in self._load_districts(list(names)):
+            dataset_count, dataset_likes, dataset_responses = dataset.sentiment_totals
+            count += dataset_count
+            likes += dataset_likes
+            responses += dataset_responses
+        return SentimentPriors.from_counts(count, likes, responses)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get loader state for metrics.
+
+        Returns:
+            Dictionary with the backend, loaded district and restaurant counts
+        """
+        with self._lock:
+            return {
+                "backend": self.storage_backend.name,
+                "loaded_districts": len(self._districts),
+                "indexed_restaurants": len(self._id_index),
+                "refresh_seconds": self.refresh_seconds
+            }
+
+    def _load_districts(self, districts: List[str]) -> List[DistrictDataset]:
+        """
+        Load districts, fetching missing or stale ones in parallel.
+
+        Args:
+            districts: Canonical district names
+
+        Returns:
+            DistrictDataset for each district, in the order given
+
+        Raises:
+            RestaurantDatasetError: If a district cannot be loaded
+        """
+        now = self._clock()
+        with self._lock:
+            stale = [
+                district for district in districts
+                if district not in self._districts
+                or now - self._districts[district][1] >= self.refresh_seconds
+            ]
+
+        if stale:
+            self.storage_backend.prepare()
+            workers = min(self.max_concurrency, len(stale))
+            if workers == 1:
+                loaded = [self._fetch_district(district) for district in stale]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    loaded = list(executor.map(self._fetch_district, stale))
+
+            checked_at = self._clock()
+            with self._lock:
+                for dataset in loaded:
+                    previous = self._districts.get(dataset.district)
+                    if previous is not None and previous[0] is not dataset:
+                        for record in previous[0].restaurants:
+                            self._id_index.pop(record["id"], None)
+                    for position, record in enumerate(dataset.restaurants):
+                        self._id_index.setdefault(record["id"], (dataset.district, position))
+                    self._districts[dataset.district] = (dataset, checked_at)
+
+        with self._lock:
+            return [self._districts[district][0] for district in districts]
+
+    def _fetch_district(self, district: str) -> DistrictDataset:
+        """
+        Fetch and convert one district file.
+
+        Args:
+            district: Canonical district name
+
+        Returns:
+            DistrictDataset (the cached one if storage reports it unchanged)
+
+        Raises:
+            RestaurantDatasetError: If the file cannot be read or parsed
+        """
+        region = self.alias_index.region_for(district) or ""
+        region_key = region.lower().replace(' ', '-')
+        district_key = district.lower().replace(' ', '-')
+
+        with self._lock:
+            cached = self._districts.get(district)
+        etag = cached[0].etag if cached else None
+
+        try:
+            stored = self.storage_backend.get_dataset(region_key, district_key, if_none_match=etag)
+        except DatasetNotModified:
+            return cached[0]
+        except StorageBackendError as e:
+            raise RestaurantDatasetError(f"Failed to load restaurant data for {district}: {e}")
+
+        if stored is None:
+            logger.warning(f"No restaurant data for district {district} ({region_key}/{district_key})")
+            return DistrictDataset(district=district, restaurants=(), served_meals=())
+
+        try:
+            data = json.loads(stored.content)
+        except ValueError as e:
+            raise RestaurantDatasetError(f"Invalid restaurant data for {district}: {e}")
+
+        restaurants = []
+        served_meals = []
+        rated_count = total_likes = total_responses = 0
+        for record in data.get('restaurants', []):
+            converted = self._convert_record(record)
+            if converted is None:
+                continue
+            restaurants.append(converted)
+            served_meals.append(self._served_meals(record.get('operatingHours') or {}))
+
+            counts = converted["sentiment"]
+            if all(isinstance(value, int) and value >= 0 for value in counts.values()):
+                responses = counts["likes"] + counts["dislikes"] + counts["neutral"]
+                if responses > 0:
+                    rated_count += 1
+                    total_likes += counts["likes"]
+                    total_responses += responses
+
+        logger.info(f"Loaded {len(restaurants)} restaurants for {district} from {self.storage_backend.describe()}")
+        return DistrictDataset(
+            district=district,
+            restaurants=tuple(restaurants),
+            served_meals=tuple(served_meals),
+            etag=stored.etag,
+            sentiment_totals=(rated_count, total_likes, total_responses)
+        )
+
+    def _convert_record(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Convert a district file record to the reasoning tool input format.
+
+        Operating hours and file metadata use a different schema from the
+        reasoning models and are not passed on.
+
+        Args:
+            record: Restaurant record from a district file
+
+        Returns:
+            Restaurant dictionary, or None if the record has no id
+        """
+        if not isinstance(record, dict) or not record.get('id'):
+            return None
+        sentiment = record.get('sentiment') or {}
+        return {
+            "id": record['id'],
+            "name": record.get('name', ''),
+            "address": record.get('address', ''),
+            "meal_type": list(record.get('mealType', [])),
+            "sentiment": {
+                "likes": sentiment.get('likes', 0),
+                "dislikes": sentiment.get('dislikes', 0),
+                "neutral": sentiment.get('neutral', 0)
+            },
+            "location_category": record.get('locationCategory', ''),
+            "district": record.get('district', ''),
+            "price_range": record.get('priceRange', '')
+        }
+
+    def _served_meals(self, operating_hours: Dict[str, Any]) -> FrozenSet[str]:
+        """
+        Get the meal types a restaurant is open for.
+
+        Args:
+            operating_hours: operatingHours object from a district file
+
+        Returns:
+            Meal types served on any day type
+        """
+        hours = _SourceOperatingHours(
+            mon_fri=tuple(operating_hours.get('Mon - Fri', [])),
+            sat_sun=tuple(operating_hours.get('Sat - Sun', [])),
+            public_holiday=tuple(operating_hours.get('Public Holiday', []))
+        )
+        return frozenset(self._time_service.get_meal_types_for_hours(hours))
@@ -8,19 +8,70 @@ algorithms to provide structured recommendation results.
 
 import json
 import logging
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import asdict
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from dataclasses import asdict, dataclass
 
 from models.restaurant_models import Restaurant, Sentiment, RecommendationResult, SentimentAnalysis
 from models.validation_models import ValidationResult, ValidationError, ValidationErrorType
 from services.validation_service import RestaurantDataValidator
-from services.sentiment_service import SentimentAnalysisService
+from services.sentiment_service import (
+    DEFAULT_RESERVOIR_SIZE,
+    DEFAULT_STREAM_TOP_K,
+    SentimentAnalysisService,
+    StreamingSentimentAggregator
+)
 from services.recommendation_service import RecommendationAlgorithm
+from services.scoring_engine import RANKING_METHODS, ScoreDistribution, SentimentColumns, SentimentPriors
+from services.result_cache import ResultCache, estimate_result_size, fingerprint_restaurants
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RankedCandidates:
+    """
+    Ranking outcome of a restaurant list, reusable across recommendations.
+    
+    Holds everything about a recommendation except the restaurants and the
+    random pick, so a cached instance can serve repeated requests for the
+    same sentiment data. Candidates are positions in the validated restaurant
+    list of a request and are resolved against the current request's list.
+    
+    Attributes:
+        candidate_positions: Positions of the top ranked restaurants, in rank order
+        ranking_method: Method used for ranking
+        analysis_summary: Analysis summary including data quality metrics
+        scores: Candidate scores by restaurant id
+        distribution: Distribution of the candidate scores
+    """
+    candidate_positions: List[int]
+    ranking_method: str
+    analysis_summary: Dict[str, Any]
+    scores: Dict[str, float]
+    distribution: ScoreDistribution
+    
+    def resolve_candidates(self, valid_restaurants: List[Restaurant]) -> List[Restaurant]:
+        """Get the ranked candidates from a request's validated restaurants."""
+        return [valid_restaurants[position] for position in self.candidate_positions]
+    
+    def size_bytes(self) -> int:
+        """Estimate the memory held by this ranking for cache accounting."""
+        return estimate_result_size(
+            [self.candidate_positions, self.scores],
+            self.analysis_summary
+        )
+
+
+@dataclass
+class _PreparationProgress:
+    """Counters of a validate-sanitize-convert pass over restaurant records."""
+    total_count: int = 0
+    valid_count: int = 0
+    converted_count: int = 0
+    conversion_error: Optional[str] = None
+
+
 class RestaurantReasoningService:
     """
     Core service for restaurant sentiment analysis and intelligent recommendations.
@@ -34,7 +85,8 @@ class RestaurantReasoningService:
         minimum_responses: int = 1,
         default_candidate_count: int = 20,
         random_seed: Optional[int] = None,
-        strict_validation: bool = False
+        strict_validation: bool = False,
+        result_cache: Optional[ResultCache] = None
     ):
         """
         Initialize the restaurant reasoning service.
@@ -44,11 +96,14 @@ class RestaurantReasoningService:
             default_candidate_count: Default number of candidates to select
             random_seed: Optional seed for reproducible random selection
             strict_validation: If True, treat validation warnings as errors
+            result_cache: Optional cache of rankings and sentiment analyses for
+                repeated restaurant lists (disabled if None)
         """
         self.minimum_responses = minimum_responses
         self.default_candidate_count = default_candidate_count
         self.random_seed = random_seed
         self.strict_validation = strict_validation
+        self.result_cache = result_cache
         
         # Initialize service components
         self.validator = RestaurantDataValidator(strict_mode=strict_validation)
@@ -69,18 +124,24 @@ class RestaurantReasoningService:
         self, 
         restaurant_data: List[Dict[str, Any]], 
         ranking_method: str = "sentiment_likes",
-        candidate_count: Optional[int] = None
+        candidate_count: Optional[int] = None,
+        priors: Optional[SentimentPriors] = None
     ) -> RecommendationResult:
         """
         Analyze restaurant sentiment data and provide intelligent recommendations.
         
         This is the main entry point for the reasoning service, integrating
-        validation, sentiment analysis, and recommendation algorithms.
+        validation, sentiment analysis, and recommendation algorithms. With a
+        result cache, a repeated restaurant list reuses the cached ranking and
+        only the random recommendation is drawn again.
         
         Args:
             restaurant_data: List of restaurant dictionaries with sentiment data
-            ranking_method: Ranking method ("sentiment_likes" or "combined_sentiment")
+            ranking_method: Ranking method ("sentiment_likes", "combined_sentiment"
+                or "bayesian_average")
             candidate_count: Number of candidates to select (uses default if None)
+            priors: Priors of bayesian_average, e.g. of the whole restaurant
+                dataset; derived from the valid restaurants if None
             
         Returns:
             RecommendationResult with candidates, recommendation, and analysis
@@ -90,44 +151,136 @@ class RestaurantReasoningService:
             
         Requirements: 1.1, 1.2, 1.6, 1.7, 2.1
         """
+        return self._analyze_and_recommend(
+            restaurant_data, ranking_method, candidate_count, self.result_cache, priors
+        )
+    
+    def analyze_and_recommend_batch(
+        self, 
+        requests: List[Tuple[Any, ...]]
+    ) -> List[Tuple[Optional[RecommendationResult], Optional[str]]]:
+        """
+        Analyze several independent restaurant lists in one call.
+        
+        Items are processed in order. Identical restaurant lists in a batch are
+        validated and ranked once (through the result cache, or a cache local
+        to the batch if the service has none) and only the random
+        recommendation is drawn for each item, so a failing item does not
+        affect the others.
+        
+        Args:
+            requests: (restaurant_data, ranking_method, candidate_count) tuples,
+                optionally followed by SentimentPriors for bayesian_average
+            
+        Returns:
+            (RecommendationResult, None) or (None, error message) for each request
+        """
+        result_cache = self.result_cache
+        if result_cache is None:
+            result_cache = ResultCache(max_entries=max(1, len(requests)))
+        
+        results: List[Tuple[Optional[RecommendationResult], Optional[str]]] = []
+        for restaurant_data, ranking_method, candidate_count, *options in requests:
+            priors = options[0] if options else None
+            try:
+                results.append((
+                    self._analyze_and_recommend(
+                        restaurant_data, ranking_method, candidate_count, result_cache, priors
+                    ),
+                    None
+                ))
+            except Exception as e:
+                results.append((None, str(e)))
+        
+        self.logger.info(
+            f"Completed batch of {len(requests)} recommendations, "
+            f"{sum(1 for result, _ in results if result is None)} failed"
+        )
+        return results
+    
+    def _analyze_and_recommend(
+        self, 
+        restaurant_data: List[Dict[str, Any]], 
+        ranking_method: str,
+        candidate_count: Optional[int],
+        result_cache: Optional[ResultCache],
+        priors: Optional[SentimentPriors] = None
+    ) -> RecommendationResult:
+        """
+        Analyze and recommend using the given result cache (None disables caching).
+        
+        Args:
+            restaurant_data: List of restaurant dictionaries with sentiment data
+            ranking_method: Ranking method ("sentiment_likes", "combined_sentiment"
+                or "bayesian_average")
+            candidate_count: Number of candidates to select (uses default if None)
+            result_cache: Cache of rankings for repeated restaurant lists
+            priors: Priors of bayesian_average (derived from the valid restaurants if None)
+            
+        Returns:
+            RecommendationResult with candidates, recommendation, and analysis
+            
+        Raises:
+            ValueError: If restaurant data is invalid or no valid restaurants found
+        """
         try:
+            candidate_count = candidate_count or self.default_candidate_count
             self.logger.info(
                 f"Starting restaurant analysis with {len(restaurant_data)} restaurants, "
-                f"method={ranking_method}, candidate_count={candidate_count or self.default_candidate_count}"
+                f"method={ranking_method}, candidate_count={candidate_count}"
             )
             
-            # Step 1: Validate input data
-            validation_result = self._validate_input_data(restaurant_data, ranking_method)
+            # Steps 1-3: Validate, convert and filter the input in a single pass
+            validation_result, converted_count, valid_restaurants = self._prepare_restaurants(
+                restaurant_data, ranking_method
+            )
             if not validation_result.is_valid:
                 error_summary = self._format_validation_errors(validation_result)
                 raise ValueError(f"Invalid restaurant data: {error_summary}")
             
-            # Step 2: Convert to Restaurant objects
-            restaurants = self._convert_to_restaurant_objects(restaurant_data)
-            
-            # Step 3: Filter valid restaurants with sentiment data
-            valid_restaurants = self._filter_valid_restaurants(restaurants)
             if not valid_restaurants:
                 raise ValueError("No valid restaurants with sentiment data found")
             
             self.logger.info(
-                f"Validated {len(valid_restaurants)} out of {len(restaurants)} restaurants"
-            )
-            
-            # Step 4: Perform sentiment analysis and ranking
-            candidate_count = candidate_count or self.default_candidate_count
-            recommendation_result = self.recommendation_algorithm.analyze_and_recommend(
-                restaurants=valid_restaurants,
-                ranking_method=ranking_method,
-                candidate_count=candidate_count
+                f"Validated {len(valid_restaurants)} out of {converted_count} restaurants"
             )
             
-            # Step 5: Enhance result with additional analysis
-            enhanced_result = self._enhance_recommendation_result(
-                recommendation_result, 
-                restaurant_data, 
-                valid_restaurants
+            cache_key = self._result_cache_key(
+                result_cache, valid_restaurants, "recommend", len(restaurant_data),
+                ranking_method, candidate_count, self._priors_cache_part(ranking_method, priors)
             )
+            ranked = result_cache.get(cache_key) if cache_key else None
+            if ranked is not None:
+                self.logger.info(
+                    f"Reusing cached ranking of {len(ranked.candidate_positions)} candidates"
+                )
+                candidates = ranked.resolve_candidates(valid_restaurants)
+                enhanced_result = self._complete_recommendation(
+                    ranked, candidates, self.recommendation_algorithm.random_select(candidates)
+                )
+            else:
+                # Step 4: Perform sentiment analysis and ranking
+                if ranking_method == "bayesian_average" and priors is None:
+                    priors = SentimentPriors.from_restaurants(valid_restaurants)
+                recommendation_result = self.recommendation_algorithm.analyze_and_recommend(
+                    restaurants=valid_restaurants,
+                    ranking_method=ranking_method,
+                    candidate_count=candidate_count,
+                    priors=priors
+                )
+                
+                # Step 5: Enhance result with additional analysis
+                ranked = self._build_ranked_candidates(
+                    recommendation_result, 
+                    restaurant_data, 
+                    valid_restaurants,
+                    priors
+                )
+                if cache_key:
+                    result_cache.put(cache_key, ranked, ranked.size_bytes())
+                enhanced_result = self._complete_recommendation(
+                    ranked, recommendation_result.candidates, recommendation_result.recommendation
+                )
             
             self.logger.info(
                 f"Generated recommendation: {enhanced_result.recommendation.name} "
@@ -143,7 +296,8 @@ class RestaurantReasoningService:
     def analyze_sentiment_only(
         self, 
         restaurant_data: List[Dict[str, Any]], 
-        ranking_method: str = "sentiment_likes"
+        ranking_method: str = "sentiment_likes",
+        priors: Optional[SentimentPriors] = None
     ) -> SentimentAnalysis:
         """
         Analyze restaurant sentiment data without providing recommendations.
@@ -151,6 +305,7 @@ class RestaurantReasoningService:
         Args:
             restaurant_data: List of restaurant dictionaries with sentiment data
             ranking_method: Ranking method for analysis
+            priors: Priors of bayesian_average (derived from the valid restaurants if None)
             
         Returns:
             SentimentAnalysis object with aggregate statistics
@@ -164,19 +319,34 @@ class RestaurantReasoningService:
                 f"method={ranking_method}"
             )
             
-            # Validate and convert data
-            validation_result = self._validate_input_data(restaurant_data, ranking_method)
+            # Validate, convert and filter data in a single pass
+            validation_result, _, valid_restaurants = self._prepare_restaurants(
+                restaurant_data, ranking_method
+            )
             if not validation_result.is_valid:
                 error_summary = self._format_validation_errors(validation_result)
                 raise ValueError(f"Invalid restaurant data: {error_summary}")
             
-            restaurants = self._convert_to_restaurant_objects(restaurant_data)
-            valid_restaurants = self._filter_valid_restaurants(restaurants)
+            cache_key = self._result_cache_key(
+                self.result_cache, valid_restaurants, "sentiment", ranking_method,
+                self._priors_cache_part(ranking_method, priors)
+            )
+            cached_analysis = self.result_cache.get(cache_key) if cache_key else None
+            if cached_analysis is not None:
+                self.logger.info(
+                    f"Reusing cached sentiment analysis for {cached_analysis.restaurant_count} restaurants"
+                )
+                return cached_analysis
             
             # Perform sentiment analysis
             sentiment_analysis = self.sentiment_service.analyze_restaurant_list(
-                valid_restaurants, ranking_method
+                valid_restaurants, ranking_method, priors
             )
+            if cache_key:
+                self.result_cache.put(
+                    cache_key, sentiment_analysis,
+                    estimate_result_size([], sentiment_analysis.to_dict())
+                )
             
             self.logger.info(
                 f"Completed sentiment analysis for {sentiment_analysis.restaurant_count} restaurants"
@@ -188,6 +358,78 @@ class RestaurantReasoningService:
             self.logger.error(f"Error in analyze_sentiment_only: {str(e)}")
             raise
     
+    def aggregate_sentiment_stream(
+        self, 
+        restaurant_data: Iterable[Dict[str, Any]], 
+        ranking_method: str = "sentiment_likes",
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+        top_k: int = DEFAULT_STREAM_TOP_K,
+        priors: Optional[SentimentPriors] = None
+    ) -> StreamingSentimentAggregator:
+        """
+        Analyze restaurant sentiment data of any size in constant memory.
+        
+        Records are validated, converted and folded into a streaming aggregate
+        one at a time, so restaurant_data may be a generator and neither the
+        restaurants nor per-item score results are kept. Validation follows
+        analyze_sentiment_only, and the aggregate's to_analysis() matches its
+        result. The result cache is not used.
+        
+        Args:
+            restaurant_data: Restaurant dictionaries with sentiment data
+            ranking_method: Ranking method for analysis
+            reservoir_size: Number of scores kept for percentile estimates
+            top_k: Number of top restaurants kept
+            priors: Priors of bayesian_average (required for that method)
+            
+        Returns:
+            StreamingSentimentAggregator with the sentiment statistics
+            
+        Raises:
+            ValueError: If restaurant data is invalid, or bayesian_average is
+                requested without priors
+        """
+        try:
+            self.logger.info(f"Starting streaming sentiment analysis, method={ranking_method}")
+            
+            validation_result = self._validate_ranking_method(ranking_method)
+            if validation_result is None and (
+                isinstance(restaurant_data, (str, bytes, dict))
+                or not isinstance(restaurant_data, Iterable)
+            ):
+                validation_result = self.validator.validate_list_container(restaurant_data)
+            if validation_result is not None:
+                error_summary = self._format_validation_errors(validation_result)
+                raise ValueError(f"Invalid restaurant data: {error_summary}")
+            
+            validation_result = ValidationResult(is_valid=True)
+            progress = _PreparationProgress()
+            aggregator = self.sentiment_service.aggregate_restaurant_stream(
+                self._iter_prepared_restaurants(restaurant_data, validation_result, progress),
+                ranking_method, reservoir_size=reservoir_size, top_k=top_k, priors=priors
+            )
+            
+            # Emptiness of a generator is only known once it has been consumed
+            if progress.total_count == 0:
+                validation_result = self.validator.validate_list_container([])
+            else:
+                validation_result.total_count = progress.total_count
+                self._finish_preparation(validation_result, progress)
+            
+            if not validation_result.is_valid:
+                error_summary = self._format_validation_errors(validation_result)
+                raise ValueError(f"Invalid restaurant data: {error_summary}")
+            
+            self.logger.info(
+                f"Completed streaming sentiment analysis for {aggregator.restaurant_count} restaurants"
+            )
+            
+            return aggregator
+            
+        except Exception as e:
+            self.logger.error(f"Error in aggregate_sentiment_stream: {str(e)}")
+            raise
+    
     def validate_restaurant_data(self, restaurant_data: List[Dict[str, Any]]) -> ValidationResult:
         """
         Validate restaurant data structure and content.
@@ -212,6 +454,17 @@ class RestaurantReasoningService:
             result.add_error(error)
             return result
     
+    def get_result_cache_metrics(self) -> Dict[str, Any]:
+        """
+        Get result cache state and hit-rate metrics.
+        
+        Returns:
+            Dictionary with cache metrics, or {"enabled": False} without a cache
+        """
+        if self.result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.result_cache.to_dict()}
+    
     def format_recommendation_response(
         self, 
         result: RecommendationResult, 
@@ -322,110 +575,206 @@ class RestaurantReasoningService:
             }
             return json.dumps(fallback_response, indent=2)
     
-    def _validate_input_data(
+    def _prepare_restaurants(
         self, 
         restaurant_data: List[Dict[str, Any]], 
         ranking_method: str
-    ) -> ValidationResult:
+    ) -> Tuple[ValidationResult, int, List[Restaurant]]:
         """
-        Validate input data and parameters.
+        Validate, sanitize, convert and filter restaurant data in one pass.
+        
+        Each record is validated, sanitized, converted to a Restaurant and
+        checked against minimum_responses exactly once. The ValidationResult
+        matches RestaurantDataValidator.validate_restaurant_list. Once a
+        record fails validation the request cannot succeed, so later records
+        are only validated (not converted); in strict mode validation stops
+        at the first invalid record.
         
         Args:
-            restaurant_data: Restaurant data to validate
+            restaurant_data: Restaurant data to process
             ranking_method: Ranking method to validate
             
         Returns:
-            ValidationResult with validation status
+            Tuple of (ValidationResult, number of converted restaurants,
+            restaurants with sufficient sentiment responses)
+            
+        Raises:
+            ValueError: In strict mode, if a valid record cannot be converted
         """
-        # Validate ranking method
-        valid_methods = ["sentiment_likes", "combined_sentiment"]
-        if ranking_method not in valid_methods:
-            result = ValidationResult(is_valid=False, total_count=0)
-            error = ValidationError(
-                restaurant_id="parameter",
-                field="ranking_method",
-                error_type=ValidationErrorType.INVALID_VALUE,
-                message=f"Invalid ranking method: {ranking_method}",
-                expected_value=f"one of {valid_methods}",
-                actual_value=ranking_method
-            )
-            result.add_error(error)
-            return result
+        method_result = self._validate_ranking_method(ranking_method)
+        if method_result is not None:
+            return method_result, 0, []
+        
+        container_result = self.validator.validate_list_container(restaurant_data)
+        if container_result is not None:
+            return container_result, 0, []
+        
+        validation_result = ValidationResult(is_valid=True, total_count=len(restaurant_data))
+        progress = _PreparationProgress()
+        valid_restaurants = list(
+            self._iter_prepared_restaurants(restaurant_data, validation_result, progress)
+        )
+        self._finish_preparation(validation_result, progress)
         
-        # Validate restaurant data structure
-        return self.validator.validate_restaurant_list(restaurant_data)
+        return validation_result, progress.converted_count, valid_restaurants
     
-    def _convert_to_restaurant_objects(self, restaurant_data: List[Dict[str, Any]]) -> List[Restaurant]:
+    def _iter_prepared_restaurants(
+        self, 
+        restaurant_data: Iterable[Dict[str, Any]], 
+        validation_result: ValidationResult,
+        progress: "_PreparationProgress"
+    ) -> Iterator[Restaurant]:
         """
-        Convert restaurant dictionaries to Restaurant objects.
+        Validate, sanitize and convert records lazily, yielding usable restaurants.
+        
+        Validation errors are recorded in validation_result and counts in
+        progress; call _finish_preparation once the iterator is exhausted.
         
         Args:
-            restaurant_data: List of restaurant dictionaries
+            restaurant_data: Restaurant records, in order
+            validation_result: ValidationResult collecting the list outcome
+            progress: Counters updated as records are processed
             
-        Returns:
-            List of Restaurant objects
+        Yields:
+            Restaurants with sufficient sentiment responses
         """
-        restaurants = []
-        
         for i, data in enumerate(restaurant_data):
+            progress.total_count += 1
+            if not self.validator.validate_list_entry(i, data, validation_result):
+                if self.strict_validation:
+                    break
+                continue
+            progress.valid_count += 1
+            
+            # Results are discarded once any record is invalid
+            if validation_result.has_errors() or progress.conversion_error:
+                continue
+            
             try:
-                # Sanitize data first
-                sanitized_data = self.validator.sanitize_restaurant_data(data)
-                
-                # Create Restaurant object
-                restaurant = Restaurant.from_dict(sanitized_data)
-                restaurants.append(restaurant)
-                
+                restaurant = Restaurant.from_dict(self.validator.sanitize_restaurant_data(data))
             except Exception as e:
                 self.logger.warning(
                     f"Failed to convert restaurant at index {i} to Restaurant object: {str(e)}"
                 )
                 # Skip invalid restaurants in non-strict mode
                 if self.strict_validation:
-                    raise ValueError(f"Failed to convert restaurant at index {i}: {str(e)}")
+                    progress.conversion_error = f"Failed to convert restaurant at index {i}: {str(e)}"
+                continue
+            
+            progress.converted_count += 1
+            total_responses = restaurant.sentiment.total_responses()
+            if total_responses >= self.minimum_responses:
+                yield restaurant
+            else:
+                self.logger.debug(
+                    f"Filtered out restaurant {restaurant.name} "
+                    f"(insufficient sentiment responses: {total_responses})"
+                )
+    
+    def _finish_preparation(
+        self, 
+        validation_result: ValidationResult, 
+        progress: "_PreparationProgress"
+    ) -> None:
+        """
+        Complete a validation result once all records have been processed.
+        
+        Args:
+            validation_result: ValidationResult collecting the list outcome
+            progress: Counters of the processed records
+            
+        Raises:
+            ValueError: In strict mode, if a valid record could not be converted
+        """
+        validation_result.valid_count = progress.valid_count
+        validation_result.is_valid = (progress.valid_count == validation_result.total_count)
         
-        return restaurants
+        if validation_result.is_valid and progress.conversion_error:
+            raise ValueError(progress.conversion_error)
     
-    def _filter_valid_restaurants(self, restaurants: List[Restaurant]) -> List[Restaurant]:
+    def _validate_ranking_method(self, ranking_method: str) -> Optional[ValidationResult]:
         """
-        Filter restaurants with valid sentiment data.
+        Validate the ranking method parameter.
         
         Args:
-            restaurants: List of Restaurant objects
+            ranking_method: Ranking method to validate
             
         Returns:
-            List of restaurants with valid sentiment data
+            Failed ValidationResult if the method is invalid, None otherwise
         """
-        valid_restaurants = []
+        if ranking_method not in RANKING_METHODS:
+            result = ValidationResult(is_valid=False, total_count=0)
+            error = ValidationError(
+                restaurant_id="parameter",
+                field="ranking_method",
+                error_type=ValidationErrorType.INVALID_VALUE,
+                message=f"Invalid ranking method: {ranking_method}",
+                expected_value=f"one of {list(RANKING_METHODS)}",
+                actual_value=ranking_method
+            )
+            result.add_error(error)
+            return result
+        return None
+    
+    def _priors_cache_part(
+        self, 
+        ranking_method: str, 
+        priors: Optional[SentimentPriors]
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Get the result cache key part for explicit priors.
         
-        for restaurant in restaurants:
-            # Check if restaurant has valid sentiment data
-            if restaurant.sentiment.total_responses() >= self.minimum_responses:
-                valid_restaurants.append(restaurant)
-            else:
-                self.logger.debug(
-                    f"Filtered out restaurant {restaurant.name} "
-                    f"(insufficient sentiment responses: {restaurant.sentiment.total_responses()})"
-                )
+        Args:
+            ranking_method: Ranking method of the request
+            priors: Priors passed by the caller
+            
+        Returns:
+            (like_rate, weight), or None if the priors do not affect the result
+        """
+        # Derived priors are a function of the restaurant data already in the key
+        if priors is None or ranking_method != "bayesian_average":
+            return None
+        return (priors.like_rate, priors.weight)
+    
+    def _result_cache_key(
+        self, 
+        result_cache: Optional[ResultCache], 
+        valid_restaurants: List[Restaurant], 
+        *parts: Any
+    ) -> Optional[str]:
+        """
+        Build the result cache key for a validated request.
         
-        return valid_restaurants
+        Args:
+            result_cache: Cache the key is used with (None disables caching)
+            valid_restaurants: Restaurants that passed validation and filtering
+            *parts: Values that select the result (operation, ranking method, ...)
+            
+        Returns:
+            Cache key, or None if caching is disabled or the data cannot be fingerprinted
+        """
+        if result_cache is None:
+            return None
+        return fingerprint_restaurants(valid_restaurants, *parts)
     
-    def _enhance_recommendation_result(
+    def _build_ranked_candidates(
         self, 
         result: RecommendationResult, 
         original_data: List[Dict[str, Any]], 
-        valid_restaurants: List[Restaurant]
-    ) -> RecommendationResult:
+        valid_restaurants: List[Restaurant],
+        priors: Optional[SentimentPriors] = None
+    ) -> RankedCandidates:
         """
-        Enhance recommendation result with additional analysis information.
+        Collect the reusable parts of a recommendation result with data quality metrics.
         
         Args:
             result: Original RecommendationResult
             original_data: Original input data
             valid_restaurants: Filtered valid restaurants
+            priors: Priors the candidates were ranked with (bayesian_average)
             
         Returns:
-            Enhanced RecommendationResult
+            RankedCandidates for the result's candidates
         """
         # Add additional analysis information
         enhanced_summary = result.analysis_summary.copy()
@@ -438,31 +787,50 @@ class RestaurantReasoningService:
             "data_completeness_rate": len(valid_restaurants) / len(original_data) if original_data else 0.0
         }
         
-        # Add recommendation confidence metrics
-        if result.candidates:
-            scores = self.recommendation_algorithm.calculate_ranking_scores(
-                result.candidates, result.ranking_method
-            )
-            score_values = list(scores.values())
-            
-            if score_values:
-                recommendation_score = scores.get(result.recommendation.id, 0.0)
-                enhanced_summary["recommendation_confidence"] = {
-                    "recommendation_score": recommendation_score,
-                    "score_percentile": self._calculate_percentile(recommendation_score, score_values),
-                    "score_above_average": recommendation_score > (sum(score_values) / len(score_values)),
-                    "candidates_with_higher_score": sum(1 for s in score_values if s > recommendation_score)
-                }
+        scores = SentimentColumns(result.candidates, priors=priors).score_map(result.ranking_method)
+        positions = {id(restaurant): i for i, restaurant in enumerate(valid_restaurants)}
         
-        # Create enhanced result
-        enhanced_result = RecommendationResult(
-            candidates=result.candidates,
-            recommendation=result.recommendation,
+        return RankedCandidates(
+            candidate_positions=[positions[id(candidate)] for candidate in result.candidates],
             ranking_method=result.ranking_method,
-            analysis_summary=enhanced_summary
+            analysis_summary=enhanced_summary,
+            scores=scores,
+            # One sorted distribution answers every confidence query
+            distribution=ScoreDistribution(scores.values())
         )
+    
+    def _complete_recommendation(
+        self, 
+        ranked: RankedCandidates, 
+        candidates: List[Restaurant],
+        recommendation: Restaurant
+    ) -> RecommendationResult:
+        """
+        Build the recommendation result for a pick from ranked candidates.
+        
+        Args:
+            ranked: Ranked candidates, possibly shared through the result cache
+            candidates: Candidate restaurants of the current request, in rank order
+            recommendation: Restaurant picked from the candidates
+            
+        Returns:
+            RecommendationResult with recommendation confidence metrics
+        """
+        analysis_summary = ranked.analysis_summary.copy()
+        
+        # Add recommendation confidence metrics
+        if ranked.scores:
+            recommendation_score = ranked.scores.get(recommendation.id, 0.0)
+            analysis_summary["recommendation_confidence"] = self._recommendation_confidence(
+                recommendation_score, ranked.distribution
+            )
         
-        return enhanced_result
+        return RecommendationResult(
+            candidates=list(candidates),
+            recommendation=recommendation,
+            ranking_method=ranked.ranking_method,
+            analysis_summary=analysis_summary
+        )
     
     def _format_validation_errors(self, validation_result: ValidationResult) -> str:
         """
@@ -497,10 +865,35 @@ class RestaurantReasoningService:
         
         return error_summary
     
+    def _recommendation_confidence(
+        self, 
+        recommendation_score: float, 
+        distribution: ScoreDistribution
+    ) -> Dict[str, Any]:
+        """
+        Describe how the recommendation scores against a score distribution.
+        
+        Args:
+            recommendation_score: Score of the recommended restaurant
+            distribution: Scores of the candidates it was chosen from
+            
+        Returns:
+            Dictionary with recommendation_score, score_percentile,
+            score_above_average and candidates_with_higher_score
+        """
+        return {
+            "recommendation_score": recommendation_score,
+            "score_percentile": distribution.percentile(recommendation_score),
+            "score_above_average": distribution.is_above_average(recommendation_score),
+            "candidates_with_higher_score": distribution.count_above(recommendation_score)
+        }
+    
     def _calculate_percentile(self, value: float, values: List[float]) -> float:
         """
         Calculate percentile rank of a value within a list of values.
         
+        For repeated queries build a ScoreDistribution once instead.
+        
         Args:
             value: Value to calculate percentile for
             values: List of all values
@@ -508,14 +901,7 @@ class RestaurantReasoningService:
         Returns:
             Percentile rank (0.0 to 100.0)
         """
-        if not values:
-            return 0.0
-        
-        sorted_values = sorted(values)
-        rank = sum(1 for v in sorted_values if v <= value)
-        percentile = (rank / len(sorted_values)) * 100
-        
-        return round(percentile, 2)
+        return ScoreDistribution(values).percentile(value)
     
     def _get_current_timestamp(self) -> str:
         """
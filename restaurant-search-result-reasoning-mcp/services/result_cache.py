@@ -0,0 +1,241 @@
+"""Content-addressed cache for restaurant analysis results.
+
+The planner and the MBTI assistant send the same restaurant list (the result
+of the same district/meal search) to the reasoning tools again and again. This
+module provides the ResultCache class, which keeps candidate rankings and
+analysis summaries keyed by a fingerprint of the validated restaurants, so
+repeated lists skip ranking and summary generation. Requests are still
+validated every time, and results are rebuilt from their own restaurants.
+
+Entries are evicted least-recently-used first once either the entry or the
+byte budget is exceeded, and expire after a time-to-live.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence
+
+
+@dataclass
+class ResultCacheStats:
+    """Counters for result cache operation."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate hit rate as percentage of lookups served from the cache."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits / total) * 100.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "rejections": self.rejections,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hit_rate
+        }
+
+
+@dataclass
+class CachedResult:
+    """A value held in the result cache.
+
+    Attributes:
+        value: Cached result shared between requests (treated as read-only)
+        size_bytes: Estimated size counted against the byte budget
+        stored_at: Clock time when the value was stored
+    """
+    value: Any
+    size_bytes: int
+    stored_at: float
+
+
+def fingerprint_restaurants(restaurants: Sequence[Any], *parts: Any) -> Optional[str]:
+    """Compute a stable fingerprint of validated restaurants for cache lookups.
+
+    The fingerprint covers the order, ids and sentiment counts of the
+    restaurants plus any extra parts (ranking method, candidate count, ...).
+    These are all that rankings and sentiment analyses depend on; results
+    built from a cached entry take every other field from the restaurants of
+    the current request.
+
+    Args:
+        restaurants: Validated restaurants (objects with id and sentiment)
+        *parts: Additional JSON-serializable values that select the result
+
+    Returns:
+        Hex digest, or None if a value cannot be serialized (such requests
+        are not cached)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        digest.update(json.dumps(parts).encode("utf-8"))
+        for restaurant in restaurants:
+            sentiment = restaurant.sentiment
+            record = (restaurant.id, sentiment.likes, sentiment.dislikes, sentiment.neutral)
+            digest.update(json.dumps(record).encode("utf-8"))
+            digest.update(b"\x1e")
+    except (TypeError, ValueError):
+        return None
+    return digest.hexdigest()
+
+
+def estimate_result_size(records: Sequence[Any], summary: Dict[str, Any]) -> int:
+    """Estimate the memory held by a cached result from its JSON size.
+
+    Args:
+        records: JSON-serializable values held by the result besides the summary
+        summary: Analysis summary held by the result
+
+    Returns:
+        Approximate size in bytes
+    """
+    size = len(json.dumps(summary, default=str))
+    for record in records:
+        size += len(json.dumps(record, default=str))
+    return size
+
+
+class ResultCache:
+    """Thread-safe LRU cache with a time-to-live and a byte budget."""
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024,
+                 ttl_seconds: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total estimated size of cached results
+            ttl_seconds: Seconds a result is served after it was stored
+            clock: Monotonic clock used for entry ages (injectable for tests)
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.stats = ResultCacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key and mark it recently used.
+
+        Args:
+            key: Result fingerprint
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if self._clock() - entry.stored_at >= self.ttl_seconds:
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def put(self, key: str, value: Any, size_bytes: int) -> bool:
+        """Store a value, evicting least recently used entries to make room.
+
+        Args:
+            key: Result fingerprint
+            value: Result to cache
+            size_bytes: Estimated size of the value
+
+        Returns:
+            True if the value was stored, False if it exceeds the byte budget
+        """
+        with self._lock:
+            if size_bytes > self.max_bytes:
+                self.stats.rejections += 1
+                return False
+
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and (
+                len(self._entries) >= self.max_entries
+                or self._total_bytes + size_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+            self._entries[key] = CachedResult(
+                value=value, size_bytes=size_bytes, stored_at=self._clock()
+            )
+            self._total_bytes += size_bytes
+            self.stats.stores += 1
+            return True
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or every entry when no key is given.
+
+        Args:
+            key: Result fingerprint to drop, or None for all
+        """
+        with self._lock:
+            if key is None:
+                self.stats.invalidations += len(self._entries)
+                self._entries.clear()
+                self._total_bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+                self.stats.invalidations += 1
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry and release its bytes (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated size of all cached results."""
+        with self._lock:
+            return self._total_bytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert cache state to dictionary for JSON serialization."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "stats": self.stats.to_dict()
+            }
@@ -0,0 +1,514 @@
+"""
+Columnar sentiment scoring engine.
+
+This module loads the sentiment counts of a restaurant list into columns once
+and computes ranking scores, rank orders and top-K selections for both ranking
+methods from those columns. When NumPy is installed and the input is large
+enough, the computations are vectorised and top-K selection uses argpartition;
+otherwise an equivalent pure-Python implementation is used, which selects the
+top K with a bounded heap in O(n log k) instead of sorting every restaurant.
+
+Rank orders match the original sort-based ranking exactly:
+- sentiment_likes: likes, then total responses (descending)
+- combined_sentiment: (likes + neutral) / total, then likes (descending)
+- bayesian_average: like rate shrunk towards a prior like rate, then total
+  responses (descending)
+Ties keep the input order, and restaurants without responses are excluded.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models.restaurant_models import Restaurant
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+RANKING_METHODS = ("sentiment_likes", "combined_sentiment", "bayesian_average")
+
+# Inputs smaller than this are scored in pure Python; array setup costs more
+# than it saves for a handful of restaurants
+VECTORIZE_THRESHOLD = 64
+
+
+def numpy_available() -> bool:
+    """Check whether the vectorised NumPy engine can be used."""
+    return np is not None
+
+
+@dataclass(frozen=True)
+class SentimentPriors:
+    """
+    Prior of the bayesian_average ranking method.
+
+    Every restaurant is scored as if it also had `weight` extra responses
+    liked at `like_rate`, so a few enthusiastic reviews no longer outrank a
+    consistently liked restaurant with many reviews. Priors depend only on
+    the reference data set, so they can be computed once per dataset version
+    and reused for every request.
+
+    Attributes:
+        like_rate: Share of likes among all responses of the reference data
+        weight: Pseudo-responses added per restaurant (the mean number of
+            responses per restaurant of the reference data)
+    """
+    like_rate: float = 0.5
+    weight: float = 1.0
+
+    @classmethod
+    def from_counts(cls, restaurant_count: int, likes: int, responses: int) -> "SentimentPriors":
+        """
+        Build priors from sentiment totals of restaurants with responses.
+
+        Args:
+            restaurant_count: Number of restaurants with at least one response
+            likes: Sum of their likes
+            responses: Sum of their responses
+
+        Returns:
+            SentimentPriors (the defaults if there are no responses)
+        """
+        if restaurant_count <= 0 or responses <= 0:
+            return cls()
+        return cls(like_rate=likes / responses, weight=responses / restaurant_count)
+
+    @classmethod
+    def from_restaurants(cls, restaurants: Iterable[Restaurant]) -> "SentimentPriors":
+        """
+        Build priors from the restaurants themselves.
+
+        Args:
+            restaurants: Reference restaurants (those without responses are ignored)
+
+        Returns:
+            SentimentPriors of the restaurants
+        """
+        count = likes = responses = 0
+        for restaurant in restaurants:
+            total = restaurant.sentiment.total_responses()
+            if total > 0:
+                count += 1
+                likes += restaurant.sentiment.likes
+                responses += total
+        return cls.from_counts(count, likes, responses)
+
+    def score(self, likes: int, total: int) -> float:
+        """
+        Calculate the Bayesian average like percentage.
+
+        Args:
+            likes: Likes of the restaurant
+            total: Total responses of the restaurant
+
+        Returns:
+            Score from 0.0 to 100.0
+        """
+        return (likes + self.weight * self.like_rate) / (total + self.weight) * 100
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert priors to a dictionary."""
+        return {"like_rate": self.like_rate, "weight": self.weight}
+
+
+class ScoreDistribution:
+    """
+    Sorted distribution of scores answering rank queries by binary search.
+
+    Build it once per analysis and reuse it for percentile, average and
+    "how many scored higher" queries instead of sorting or scanning the
+    score list for each one.
+    """
+
+    def __init__(self, scores: Iterable[float]):
+        """
+        Build the distribution.
+
+        Args:
+            scores: Score values (duplicates are kept).
+        """
+        values = list(scores)
+        # Summed in input order so the mean matches sum(values) / len(values)
+        self._total = sum(values)
+        values.sort()
+        self._sorted = values
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def count(self) -> int:
+        """Number of scores."""
+        return len(self._sorted)
+
+    @property
+    def mean(self) -> float:
+        """Average score, or 0.0 for an empty distribution."""
+        return self._total / len(self._sorted) if self._sorted else 0.0
+
+    @property
+    def minimum(self) -> float:
+        """Lowest score, or 0.0 for an empty distribution."""
+        return self._sorted[0] if self._sorted else 0.0
+
+    @property
+    def maximum(self) -> float:
+        """Highest score, or 0.0 for an empty distribution."""
+        return self._sorted[-1] if self._sorted else 0.0
+
+    def count_at_most(self, value: float) -> int:
+        """Number of scores less than or equal to value."""
+        return bisect_right(self._sorted, value)
+
+    def count_below(self, value: float) -> int:
+        """Number of scores strictly less than value."""
+        return bisect_left(self._sorted, value)
+
+    def count_above(self, value: float) -> int:
+        """Number of scores strictly greater than value."""
+        return len(self._sorted) - bisect_right(self._sorted, value)
+
+    def percentile(self, value: float) -> float:
+        """
+        Percentile rank of a value: the share of scores at or below it.
+
+        Args:
+            value: Value to rank.
+
+        Returns:
+            Percentile rank from 0.0 to 100.0, rounded to 2 decimal places.
+        """
+        if not self._sorted:
+            return 0.0
+        return round(self.count_at_most(value) / len(self._sorted) * 100, 2)
+
+    def is_above_average(self, value: float) -> bool:
+        """Check whether a value is strictly above the mean score."""
+        return bool(self._sorted) and value > self.mean
+
+
+class SentimentColumns:
+    """
+    Sentiment counts of a restaurant list stored column-wise.
+
+    Build one instance per request and reuse it for ranking, candidate
+    selection and score statistics instead of re-reading each restaurant's
+    sentiment through per-object method calls.
+    """
+
+    def __init__(
+        self,
+        restaurants: Sequence[Restaurant],
+        vectorize: Optional[bool] = None,
+        priors: Optional[SentimentPriors] = None
+    ):
+        """
+        Load sentiment columns.
+
+        Args:
+            restaurants: Restaurants to score, in input order.
+            vectorize: Force (True) or disable (False) the NumPy engine; by
+                default it is used when NumPy is installed and the input has
+                at least VECTORIZE_THRESHOLD restaurants.
+            priors: Priors of the bayesian_average method; derived from the
+                restaurants themselves if None.
+        """
+        self.restaurants = list(restaurants)
+        self._priors = priors
+
+        likes, dislikes, neutral = [], [], []
+        for restaurant in self.restaurants:
+            sentiment = restaurant.sentiment
+            likes.append(sentiment.likes)
+            dislikes.append(sentiment.dislikes)
+            neutral.append(sentiment.neutral)
+
+        if vectorize is None:
+            vectorize = len(self.restaurants) >= VECTORIZE_THRESHOLD
+        self.vectorized = bool(vectorize) and np is not None
+
+        if self.vectorized:
+            self.likes = np.asarray(likes, dtype=np.int64)
+            self.dislikes = np.asarray(dislikes, dtype=np.int64)
+            self.neutral = np.asarray(neutral, dtype=np.int64)
+            self.totals = self.likes + self.dislikes + self.neutral
+            self._valid_positions = np.flatnonzero(self.totals > 0)
+        else:
+            self.likes = likes
+            self.dislikes = dislikes
+            self.neutral = neutral
+            self.totals = [l + d + n for l, d, n in zip(likes, dislikes, neutral)]
+            self._valid_positions = [i for i, total in enumerate(self.totals) if total > 0]
+
+        self._rank_cache: Dict[str, Tuple[Any, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.restaurants)
+
+    @property
+    def priors(self) -> SentimentPriors:
+        """Priors of the bayesian_average method."""
+        if self._priors is None:
+            valid = self._valid_positions
+            if self.vectorized:
+                likes, responses = int(self.likes[valid].sum()), int(self.totals[valid].sum())
+            else:
+                likes = sum(self.likes[i] for i in valid)
+                responses = sum(self.totals[i] for i in valid)
+            self._priors = SentimentPriors.from_counts(len(valid), likes, responses)
+        return self._priors
+
+    @property
+    def valid_count(self) -> int:
+        """Number of restaurants with at least one sentiment response."""
+        return len(self._valid_positions)
+
+    def valid_restaurants(self) -> List[Restaurant]:
+        """Restaurants with at least one sentiment response, in input order."""
+        return [self.restaurants[i] for i in self._valid_positions]
+
+    def percentage_scores(self, method: str) -> List[float]:
+        """
+        Calculate the percentage score of every restaurant.
+
+        Matches Sentiment.likes_percentage() for sentiment_likes,
+        Sentiment.combined_positive_percentage() for combined_sentiment and
+        SentimentPriors.score() for bayesian_average.
+
+        Args:
+            method: Ranking method.
+
+        Returns:
+            Scores in input order; 0.0 for restaurants without responses or
+            an unknown method.
+        """
+        if method not in RANKING_METHODS:
+            return [0.0] * len(self.restaurants)
+
+        scores = self._score_column(method)
+        return scores.tolist() if self.vectorized else scores
+
+    def score_map(self, method: str, valid_only: bool = False) -> Dict[str, float]:
+        """
+        Map restaurant IDs to percentage scores.
+
+        Args:
+            method: Ranking method.
+            valid_only: Only include restaurants with sentiment responses.
+
+        Returns:
+            Dictionary of restaurant ID to score (later duplicates win).
+        """
+        scores = self.percentage_scores(method)
+        if valid_only:
+            return {self.restaurants[i].id: scores[i] for i in self._valid_positions}
+        return dict(zip((r.id for r in self.restaurants), scores))
+
+    def score_distribution(self, method: str) -> ScoreDistribution:
+        """
+        Build the score distribution of restaurants with sentiment responses.
+
+        Args:
+            method: Ranking method.
+
+        Returns:
+            ScoreDistribution of percentage scores.
+        """
+        scores = self.percentage_scores(method)
+        return ScoreDistribution(scores[i] for i in self._valid_positions)
+
+    def rank(self, method: str, top_k: Optional[int] = None) -> List[Restaurant]:
+        """
+        Rank restaurants with sentiment data by a ranking method.
+
+        Args:
+            method: "sentiment_likes", "combined_sentiment" or "bayesian_average".
+            top_k: Return only the first top_k restaurants of the ranking.
+
+        Returns:
+            Ranked restaurants (highest first).
+
+        Raises:
+            ValueError: If the ranking method is invalid.
+        """
+        return [self.restaurants[i] for i in self.rank_positions(method, top_k)]
+
+    def rank_positions(self, method: str, top_k: Optional[int] = None) -> List[int]:
+        """
+        Rank input positions of restaurants with sentiment data.
+
+        Args:
+            method: "sentiment_likes", "combined_sentiment" or "bayesian_average".
+            top_k: Return only the first top_k positions of the ranking.
+
+        Returns:
+            Input positions in rank order.
+
+        Raises:
+            ValueError: If the ranking method is invalid.
+        """
+        if method not in RANKING_METHODS:
+            raise ValueError(f"Invalid ranking method: {method}")
+
+        if top_k is not None and top_k >= self.valid_count:
+            top_k = None
+        if top_k is not None and top_k <= 0:
+            return []
+
+        primary, secondary = self._rank_keys(method)
+        if self.vectorized:
+            return self._rank_vectorized(primary, secondary, top_k)
+
+        if top_k is not None:
+            # Input position as the final key reproduces the stable sort order
+            return heapq.nsmallest(
+                top_k,
+                self._valid_positions,
+                key=lambda i: (-primary[i], -secondary[i], i)
+            )
+
+        return sorted(
+            self._valid_positions,
+            key=lambda i: (primary[i], secondary[i]),
+            reverse=True
+        )
+
+    def summarize(self, method: str) -> Dict[str, Any]:
+        """
+        Compute sentiment statistics of restaurants with responses in one pass.
+
+        Args:
+            method: Ranking method used for the top and bottom scores.
+
+        Returns:
+            Dictionary with valid_count, average_likes, average_dislikes,
+            average_neutral, top_score and bottom_score (all 0 when there are
+            no valid restaurants).
+        """
+        count = self.valid_count
+        if count == 0:
+            return {
+                "valid_count": 0,
+                "average_likes": 0.0,
+                "average_dislikes": 0.0,
+                "average_neutral": 0.0,
+                "top_score": 0.0,
+                "bottom_score": 0.0
+            }
+
+        if self.vectorized:
+            valid = self._valid_positions
+            total_likes = int(self.likes[valid].sum())
+            total_dislikes = int(self.dislikes[valid].sum())
+            total_neutral = int(self.neutral[valid].sum())
+            if method in RANKING_METHODS:
+                scores = self._score_column(method)[valid]
+                top_score, bottom_score = float(scores.max()), float(scores.min())
+            else:
+                top_score = bottom_score = 0.0
+        else:
+            total_likes = total_dislikes = total_neutral = 0
+            top_score, bottom_score = float("-inf"), float("inf")
+            combined = method == "combined_sentiment"
+            bayesian = method == "bayesian_average"
+            priors = self.priors if bayesian else None
+            for i in self._valid_positions:
+                likes, neutral, total = self.likes[i], self.neutral[i], self.totals[i]
+                total_likes += likes
+                total_dislikes += self.dislikes[i]
+                total_neutral += neutral
+                if bayesian:
+                    score = priors.score(likes, total)
+                else:
+                    score = ((likes + neutral) if combined else likes) / total * 100
+                if score > top_score:
+                    top_score = score
+                if score < bottom_score:
+                    bottom_score = score
+            if method not in RANKING_METHODS:
+                top_score = bottom_score = 0.0
+
+        return {
+            "valid_count": count,
+            "average_likes": total_likes / count,
+            "average_dislikes": total_dislikes / count,
+            "average_neutral": total_neutral / count,
+            "top_score": top_score,
+            "bottom_score": bottom_score
+        }
+
+    def _score_column(self, method: str) -> Any:
+        """Percentage scores of a valid method as an array (or list)."""
+        if self.vectorized:
+            scores = np.zeros(len(self.restaurants), dtype=np.float64)
+            valid = self._valid_positions
+            if method == "bayesian_average":
+                priors = self.priors
+                scores[valid] = (
+                    (self.likes[valid] + priors.weight * priors.like_rate)
+                    / (self.totals[valid] + priors.weight) * 100
+                )
+            else:
+                numerators = self.likes if method == "sentiment_likes" else self.likes + self.neutral
+                scores[valid] = numerators[valid] / self.totals[valid] * 100
+            return scores
+
+        if method == "bayesian_average":
+            priors = self.priors
+            return [
+                priors.score(likes, total) if total > 0 else 0.0
+                for likes, total in zip(self.likes, self.totals)
+            ]
+        if method == "sentiment_likes":
+            numerators = self.likes
+        else:
+            numerators = [l + n for l, n in zip(self.likes, self.neutral)]
+        return [
+            (numerator / total * 100) if total > 0 else 0.0
+            for numerator, total in zip(numerators, self.totals)
+        ]
+
+    def _rank_keys(self, method: str) -> Tuple[Any, Any]:
+        """Get (primary, secondary) rank key columns for a method."""
+        if method not in self._rank_cache:
+            if method == "sentiment_likes":
+                keys = (self.likes, self.totals)
+            elif method == "bayesian_average":
+                # Score expressions match percentage_scores exactly
+                keys = (self._score_column(method), self.totals)
+            elif self.vectorized:
+                ratios = np.zeros(len(self.restaurants), dtype=np.float64)
+                valid = self._valid_positions
+                ratios[valid] = (self.likes[valid] + self.neutral[valid]) / self.totals[valid]
+                keys = (ratios, self.likes)
+            else:
+                ratios = [
+                    ((l + n) / total) if total > 0 else 0.0
+                    for l, n, total in zip(self.likes, self.neutral, self.totals)
+                ]
+                keys = (ratios, self.likes)
+            self._rank_cache[method] = keys
+        return self._rank_cache[method]
+
+    def _rank_vectorized(self, primary: Any, secondary: Any, top_k: Optional[int]) -> List[int]:
+        """Rank valid positions with NumPy, selecting top_k with argpartition."""
+        positions = self._valid_positions
+        negated_primary = -primary[positions]
+
+        if top_k is not None:
+            # Keep everything that ties with or beats the K-th primary key so
+            # the secondary key and input order decide the boundary exactly
+            kth = np.argpartition(negated_primary, top_k - 1)[top_k - 1]
+            selected = negated_primary <= negated_primary[kth]
+            positions = positions[selected]
+            negated_primary = negated_primary[selected]
+
+        order = np.lexsort((positions, -secondary[positions], negated_primary))
+        ranked = positions[order]
+        if top_k is not None:
+            ranked = ranked[:top_k]
+        return ranked.tolist()
@@ -6,16 +6,24 @@ sentiment score calculations, percentage calculations, and validation logic
 for restaurant sentiment data processing.
 """
 
+import heapq
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import math
+import random
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
 from dataclasses import dataclass
 
 from models.restaurant_models import Restaurant, Sentiment, SentimentAnalysis
 from models.validation_models import ValidationResult, ValidationError, ValidationErrorType
+from services.scoring_engine import ScoreDistribution, SentimentPriors
 
 
 logger = logging.getLogger(__name__)
 
+# Default bounds of the streaming aggregator's memory use
+DEFAULT_RESERVOIR_SIZE = 1024
+DEFAULT_STREAM_TOP_K = 10
+
 
 @dataclass
 class SentimentScoreResult:
@@ -27,6 +35,232 @@ class SentimentScoreResult:
     error_message: Optional[str] = None
 
 
+class StreamingSentimentAggregator:
+    """
+    Constant-memory sentiment statistics over a stream of restaurants.
+    
+    Restaurants are folded in one at a time: sentiment totals, Welford
+    mean/variance and min/max of the scores, a fixed-size reservoir sample
+    for percentile estimates and a bounded heap of the top K restaurants.
+    Memory use does not depend on the number of restaurants, and
+    to_analysis() returns the same SentimentAnalysis as
+    SentimentAnalysisService.analyze_restaurant_list for the same input.
+    
+    Percentiles are exact while no more than reservoir_size restaurants have
+    been scored, and estimated from a uniform sample afterwards.
+    """
+    
+    def __init__(
+        self, 
+        ranking_method: str = "sentiment_likes",
+        minimum_responses: int = 1,
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+        top_k: int = DEFAULT_STREAM_TOP_K,
+        random_seed: Optional[int] = None,
+        priors: Optional[SentimentPriors] = None
+    ):
+        """
+        Initialize an empty aggregate.
+        
+        Args:
+            ranking_method: Scoring method ("sentiment_likes", "combined_sentiment"
+                or "bayesian_average")
+            minimum_responses: Minimum sentiment responses for a restaurant to be scored
+            reservoir_size: Number of scores kept for percentile estimates
+            top_k: Number of top restaurants kept
+            random_seed: Optional seed for reproducible reservoir sampling
+            priors: Priors of bayesian_average; required for that method, since
+                a single pass cannot derive them from the stream
+        """
+        if ranking_method == "bayesian_average" and priors is None:
+            raise ValueError("Streaming bayesian_average analysis requires priors")
+        if reservoir_size < 1:
+            raise ValueError(f"reservoir_size must be at least 1, got {reservoir_size}")
+        if top_k < 0:
+            raise ValueError(f"top_k cannot be negative, got {top_k}")
+        
+        self.ranking_method = ranking_method
+        self.minimum_responses = minimum_responses
+        self.priors = priors
+        self.reservoir_size = reservoir_size
+        self.top_k = top_k
+        
+        self.restaurant_count = 0
+        self.total_likes = 0
+        self.total_dislikes = 0
+        self.total_neutral = 0
+        
+        self.score_count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._minimum: Optional[float] = None
+        self._maximum: Optional[float] = None
+        
+        self._reservoir: List[float] = []
+        self._top: List[Tuple[float, int, int, Restaurant]] = []
+        self._random = random.Random(random_seed)
+    
+    def add(self, restaurant: Restaurant) -> None:
+        """
+        Fold one restaurant into the aggregate.
+        
+        Args:
+            restaurant: Restaurant to add
+        """
+        sentiment = restaurant.sentiment
+        self.restaurant_count += 1
+        self.total_likes += sentiment.likes
+        self.total_dislikes += sentiment.dislikes
+        self.total_neutral += sentiment.neutral
+        
+        # Same validity rules as calculate_sentiment_score / calculate_combined_score
+        if sentiment.likes < 0 or sentiment.dislikes < 0 or sentiment.neutral < 0:
+            return
+        total_responses = sentiment.total_responses()
+        if total_responses < self.minimum_responses:
+            return
+        
+        if self.ranking_method == "combined_sentiment":
+            score = sentiment.combined_positive_percentage()
+        elif self.ranking_method == "bayesian_average":
+            score = self.priors.score(sentiment.likes, total_responses)
+        else:
+            score = sentiment.likes_percentage()
+        
+        self.score_count += 1
+        delta = score - self._mean
+        self._mean += delta / self.score_count
+        self._m2 += delta * (score - self._mean)
+        if self._minimum is None or score < self._minimum:
+            self._minimum = score
+        if self._maximum is None or score > self._maximum:
+            self._maximum = score
+        
+        # Reservoir sampling (Algorithm R)
+        if len(self._reservoir) < self.reservoir_size:
+            self._reservoir.append(score)
+        else:
+            slot = self._random.randrange(self.score_count)
+            if slot < self.reservoir_size:
+                self._reservoir[slot] = score
+        
+        # Ties keep the input order, as in rank_restaurants_by_score
+        if self.top_k:
+            entry = (score, total_responses, -self.score_count, restaurant)
+            if len(self._top) < self.top_k:
+                heapq.heappush(self._top, entry)
+            elif entry[:3] > self._top[0][:3]:
+                heapq.heapreplace(self._top, entry)
+    
+    def extend(self, restaurants: Iterable[Restaurant]) -> "StreamingSentimentAggregator":
+        """
+        Fold every restaurant of an iterable into the aggregate.
+        
+        Args:
+            restaurants: Restaurants to add
+            
+        Returns:
+            This aggregator
+        """
+        for restaurant in restaurants:
+            self.add(restaurant)
+        return self
+    
+    @property
+    def mean(self) -> float:
+        """Average score, or 0.0 if no restaurant was scored."""
+        return self._mean if self.score_count else 0.0
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the scores, or 0.0 if no restaurant was scored."""
+        return self._m2 / self.score_count if self.score_count else 0.0
+    
+    @property
+    def standard_deviation(self) -> float:
+        """Population standard deviation of the scores."""
+        return math.sqrt(self.variance)
+    
+    @property
+    def minimum(self) -> float:
+        """Lowest score, or 0.0 if no restaurant was scored."""
+        return self._minimum if self._minimum is not None else 0.0
+    
+    @property
+    def maximum(self) -> float:
+        """Highest score, or 0.0 if no restaurant was scored."""
+        return self._maximum if self._maximum is not None else 0.0
+    
+    def quantile(self, fraction: float) -> float:
+        """
+        Score below which the given fraction of scores falls (nearest rank).
+        
+        Args:
+            fraction: Fraction from 0.0 to 1.0
+            
+        Returns:
+            Score at the quantile, or 0.0 if no restaurant was scored
+        """
+        if not self._reservoir:
+            return 0.0
+        ordered = sorted(self._reservoir)
+        rank = math.ceil(fraction * len(ordered))
+        return ordered[min(max(rank, 1), len(ordered)) - 1]
+    
+    def top_restaurants(self) -> List[Tuple[Restaurant, float]]:
+        """
+        Get the top K restaurants by score.
+        
+        Returns:
+            List of (Restaurant, score) tuples, best first
+        """
+        ordered = sorted(self._top, reverse=True)
+        return [(restaurant, score) for score, _, _, restaurant in ordered]
+    
+    def to_analysis(self) -> SentimentAnalysis:
+        """
+        Summarise the aggregate as a SentimentAnalysis.
+        
+        Returns:
+            SentimentAnalysis with averages and score range
+        """
+        count = self.restaurant_count
+        return SentimentAnalysis(
+            restaurant_count=count,
+            average_likes=round(self.total_likes / count, 2) if count else 0.0,
+            average_dislikes=round(self.total_dislikes / count, 2) if count else 0.0,
+            average_neutral=round(self.total_neutral / count, 2) if count else 0.0,
+            top_sentiment_score=round(self.maximum, 2),
+            bottom_sentiment_score=round(self.minimum, 2),
+            ranking_method=self.ranking_method
+        )
+    
+    def score_statistics(self) -> Dict[str, Any]:
+        """
+        Get the score distribution statistics of the aggregate.
+        
+        Returns:
+            Dictionary with score count, mean, standard deviation, quartiles,
+            90th percentile and the top restaurants
+        """
+        return {
+            "scored_count": self.score_count,
+            "mean": round(self.mean, 2),
+            "standard_deviation": round(self.standard_deviation, 2),
+            "percentiles": {
+                "p25": round(self.quantile(0.25), 2),
+                "p50": round(self.quantile(0.5), 2),
+                "p75": round(self.quantile(0.75), 2),
+                "p90": round(self.quantile(0.9), 2)
+            },
+            "percentiles_exact": self.score_count <= self.reservoir_size,
+            "top_restaurants": [
+                {"id": restaurant.id, "name": restaurant.name, "score": round(score, 2)}
+                for restaurant, score in self.top_restaurants()
+            ]
+        }
+
+
 class SentimentAnalysisService:
     """
     Service for analyzing restaurant sentiment data and calculating scores.
@@ -186,6 +420,31 @@ class SentimentAnalysisService:
                 error_message=error_msg
             )
     
+    def calculate_bayesian_score(
+        self, 
+        sentiment: Sentiment, 
+        priors: SentimentPriors
+    ) -> SentimentScoreResult:
+        """
+        Calculate the Bayesian average like percentage.
+        
+        The like rate is shrunk towards the prior like rate, so restaurants
+        with few responses do not outrank consistently liked ones.
+        
+        Args:
+            sentiment: Sentiment object with likes, dislikes, neutral counts
+            priors: Prior like rate and weight
+            
+        Returns:
+            SentimentScoreResult with Bayesian score and metadata
+        """
+        # Same validation and minimum response rules as the likes score
+        result = self.calculate_sentiment_score(sentiment)
+        result.method = "bayesian_average"
+        if result.is_valid:
+            result.score = priors.score(sentiment.likes, result.total_responses)
+        return result
+    
     def get_sentiment_percentages(self, sentiment: Sentiment) -> Dict[str, float]:
         """
         Calculate all sentiment percentages for detailed analysis.
@@ -234,27 +493,27 @@ class SentimentAnalysisService:
     def rank_restaurants_by_score(
         self, 
         restaurants: List[Restaurant], 
-        score_method: str = "sentiment_likes"
+        score_method: str = "sentiment_likes",
+        priors: Optional[SentimentPriors] = None
     ) -> List[Tuple[Restaurant, SentimentScoreResult]]:
         """
         Rank restaurants by sentiment score using specified method.
         
         Args:
             restaurants: List of Restaurant objects to rank
-            score_method: Scoring method ("sentiment_likes" or "combined_sentiment")
+            score_method: Scoring method ("sentiment_likes", "combined_sentiment"
+                or "bayesian_average")
+            priors: Priors of bayesian_average; derived from the restaurants if None
             
         Returns:
             List of tuples (Restaurant, SentimentScoreResult) sorted by score descending
         """
         try:
             scored_restaurants = []
+            score_function = self._score_function(restaurants, score_method, priors)
             
             for restaurant in restaurants:
-                if score_method == "combined_sentiment":
-                    score_result = self.calculate_combined_score(restaurant.sentiment)
-                else:
-                    score_result = self.calculate_sentiment_score(restaurant.sentiment)
-                
+                score_result = score_function(restaurant.sentiment)
                 scored_restaurants.append((restaurant, score_result))
             
             # Sort by score (descending), then by total responses (descending) for tie-breaking
@@ -290,7 +549,8 @@ class SentimentAnalysisService:
     def analyze_restaurant_list(
         self, 
         restaurants: List[Restaurant], 
-        ranking_method: str = "sentiment_likes"
+        ranking_method: str = "sentiment_likes",
+        priors: Optional[SentimentPriors] = None
     ) -> SentimentAnalysis:
         """
         Perform comprehensive sentiment analysis on a list of restaurants.
@@ -298,6 +558,7 @@ class SentimentAnalysisService:
         Args:
             restaurants: List of Restaurant objects to analyze
             ranking_method: Method used for ranking analysis
+            priors: Priors of bayesian_average; derived from the restaurants if None
             
         Returns:
             SentimentAnalysis object with aggregate statistics
@@ -314,9 +575,12 @@ class SentimentAnalysisService:
                     ranking_method=ranking_method
                 )
             
-            # Calculate scores for all restaurants
-            scored_restaurants = self.rank_restaurants_by_score(restaurants, ranking_method)
-            valid_scores = [score.score for _, score in scored_restaurants if score.is_valid]
+            # Score every restaurant; only the distribution of valid scores is needed
+            score_function = self._score_function(restaurants, ranking_method, priors)
+            score_results = (score_function(r.sentiment) for r in restaurants)
+            distribution = ScoreDistribution(
+                result.score for result in score_results if result.is_valid
+            )
             
             # Calculate averages
             total_likes = sum(r.sentiment.likes for r in restaurants)
@@ -329,8 +593,8 @@ class SentimentAnalysisService:
             avg_neutral = total_neutral / restaurant_count
             
             # Get top and bottom scores
-            top_score = max(valid_scores) if valid_scores else 0.0
-            bottom_score = min(valid_scores) if valid_scores else 0.0
+            top_score = distribution.maximum
+            bottom_score = distribution.minimum
             
             analysis = SentimentAnalysis(
                 restaurant_count=restaurant_count,
@@ -361,6 +625,74 @@ class SentimentAnalysisService:
                 ranking_method=ranking_method
             )
     
+    def aggregate_restaurant_stream(
+        self, 
+        restaurants: Iterable[Restaurant], 
+        ranking_method: str = "sentiment_likes",
+        reservoir_size: int = DEFAULT_RESERVOIR_SIZE,
+        top_k: int = DEFAULT_STREAM_TOP_K,
+        priors: Optional[SentimentPriors] = None
+    ) -> StreamingSentimentAggregator:
+        """
+        Aggregate sentiment statistics over restaurants in constant memory.
+        
+        Unlike analyze_restaurant_list, restaurants may come from any iterable
+        (including generators) and no per-restaurant score results or log
+        lines are produced.
+        
+        Args:
+            restaurants: Restaurants to analyze
+            ranking_method: Method used for scoring
+            reservoir_size: Number of scores kept for percentile estimates
+            top_k: Number of top restaurants kept
+            priors: Priors of bayesian_average (required for that method)
+            
+        Returns:
+            StreamingSentimentAggregator holding the statistics
+            
+        Raises:
+            ValueError: If bayesian_average is requested without priors
+        """
+        aggregator = StreamingSentimentAggregator(
+            ranking_method=ranking_method,
+            minimum_responses=self.minimum_responses,
+            reservoir_size=reservoir_size,
+            top_k=top_k,
+            priors=priors
+        )
+        aggregator.extend(restaurants)
+        
+        self.logger.info(
+            f"Aggregated {aggregator.restaurant_count} restaurants. "
+            f"Score range: {aggregator.minimum:.2f}% - {aggregator.maximum:.2f}%"
+        )
+        
+        return aggregator
+    
+    def _score_function(
+        self, 
+        restaurants: List[Restaurant], 
+        method: str,
+        priors: Optional[SentimentPriors]
+    ) -> Callable[[Sentiment], SentimentScoreResult]:
+        """
+        Get the per-restaurant score calculation of a method.
+        
+        Args:
+            restaurants: Restaurants that will be scored (for derived priors)
+            method: Scoring method
+            priors: Priors of bayesian_average; derived from restaurants if None
+            
+        Returns:
+            Function scoring one Sentiment
+        """
+        if method == "combined_sentiment":
+            return self.calculate_combined_score
+        if method == "bayesian_average":
+            priors = priors or SentimentPriors.from_restaurants(restaurants)
+            return lambda sentiment: self.calculate_bayesian_score(sentiment, priors)
+        return self.calculate_sentiment_score
+    
     def _validate_sentiment_data(self, sentiment: Sentiment) -> ValidationResult:
         """
         Internal method to validate sentiment data structure and values.
@@ -11,6 +11,10 @@ from models.validation_models import ValidationResult, ValidationError, Validati
 from models.restaurant_models import Restaurant, Sentiment
 
 
+# Runs of whitespace collapsed to a single space by sanitize_restaurant_data
+_WHITESPACE_RUN = re.compile(r'\s+')
+
+
 class RestaurantDataValidator:
     """
     Validator for restaurant data structures and sentiment information.
@@ -232,15 +236,103 @@ class RestaurantDataValidator:
         
         return result
     
-    def validate_restaurant_list(self, restaurants: List[Dict[str, Any]]) -> ValidationResult:
+    def is_clean_restaurant(self, restaurant: Any) -> bool:
         """
-        Validate a list of restaurant data structures.
+        Check whether a restaurant would validate with no errors and no warnings.
+        
+        This is a fast path for well-formed records: it performs the same checks
+        as validate_restaurant_structure without building any ValidationResult,
+        error or warning objects. Records for which it returns False must be
+        validated with validate_restaurant_structure to get the details.
         
         Args:
-            restaurants: List of restaurant dictionaries to validate
+            restaurant: Restaurant data to check
             
         Returns:
-            ValidationResult with aggregated validation results
+            True if the restaurant is valid and produces no warnings
+        """
+        if not isinstance(restaurant, dict):
+            return False
+        
+        restaurant_id = restaurant.get("id")
+        name = restaurant.get("name")
+        sentiment = restaurant.get("sentiment")
+        if not (isinstance(restaurant_id, str) and restaurant_id.strip()):
+            return False
+        if not (isinstance(name, str) and name.strip()):
+            return False
+        if not isinstance(sentiment, dict):
+            return False
+        
+        for field, expected_type in self.OPTIONAL_RESTAURANT_FIELDS.items():
+            value = restaurant.get(field)
+            if value is not None and not isinstance(value, expected_type):
+                return False
+        
+        meal_types = restaurant.get("meal_type")
+        if isinstance(meal_types, list):
+            if not meal_types:
+                return False
+            for meal_type in meal_types:
+                if not isinstance(meal_type, str):
+                    return False
+        
+        total_responses = 0
+        for field in self.REQUIRED_SENTIMENT_FIELDS:
+            value = sentiment.get(field)
+            if not isinstance(value, int) or value < 0:
+                return False
+            total_responses += value
+        
+        # Zero responses produce a warning (an error in strict mode)
+        return total_responses > 0
+    
+    def validate_list_entry(
+        self, 
+        index: int, 
+        restaurant: Any, 
+        aggregate_result: ValidationResult
+    ) -> bool:
+        """
+        Validate one restaurant of a list and merge the outcome into a result.
+        
+        Errors and warnings are recorded exactly as validate_restaurant_list
+        records them. The valid count of aggregate_result is not updated.
+        
+        Args:
+            index: Position of the restaurant in the list
+            restaurant: Restaurant data to validate
+            aggregate_result: ValidationResult collecting the list outcome
+            
+        Returns:
+            True if the restaurant has no validation errors
+        """
+        if self.is_clean_restaurant(restaurant):
+            return True
+        
+        restaurant_result = self.validate_restaurant_structure(restaurant)
+        
+        # Update restaurant ID in errors if not set
+        for error in restaurant_result.errors:
+            if error.restaurant_id == "unknown":
+                error.restaurant_id = f"index_{index}"
+            aggregate_result.add_error(error)
+        
+        # Add warnings with index information
+        for warning in restaurant_result.warnings:
+            aggregate_result.add_warning(f"Restaurant {index}: {warning}")
+        
+        return not restaurant_result.has_errors()
+    
+    def validate_list_container(self, restaurants: Any) -> Optional[ValidationResult]:
+        """
+        Validate that restaurant data is a non-empty list.
+        
+        Args:
+            restaurants: Restaurant data to check
+            
+        Returns:
+            Failed ValidationResult if the container is invalid, None otherwise
         """
         if not isinstance(restaurants, list):
             result = ValidationResult(is_valid=False, total_count=0)
@@ -268,24 +360,28 @@ class RestaurantDataValidator:
             result.add_error(error)
             return result
         
+        return None
+    
+    def validate_restaurant_list(self, restaurants: List[Dict[str, Any]]) -> ValidationResult:
+        """
+        Validate a list of restaurant data structures.
+        
+        Args:
+            restaurants: List of restaurant dictionaries to validate
+            
+        Returns:
+            ValidationResult with aggregated validation results
+        """
+        container_result = self.validate_list_container(restaurants)
+        if container_result is not None:
+            return container_result
+        
         # Aggregate validation results
         aggregate_result = ValidationResult(is_valid=True, total_count=len(restaurants))
         valid_count = 0
         
         for i, restaurant in enumerate(restaurants):
-            restaurant_result = self.validate_restaurant_structure(restaurant)
-            
-            # Update restaurant ID in errors if not set
-            for error in restaurant_result.errors:
-                if error.restaurant_id == "unknown":
-                    error.restaurant_id = f"index_{i}"
-                aggregate_result.add_error(error)
-            
-            # Add warnings with index information
-            for warning in restaurant_result.warnings:
-                aggregate_result.add_warning(f"Restaurant {i}: {warning}")
-            
-            if not restaurant_result.has_errors():
+            if self.validate_list_entry(i, restaurant, aggregate_result):
                 valid_count += 1
         
         aggregate_result.valid_count = valid_count
@@ -309,10 +405,8 @@ class RestaurantDataValidator:
         string_fields = ["id", "name", "address", "location_category", "district", "price_range"]
         for field in string_fields:
             if field in sanitized and isinstance(sanitized[field], str):
-                # Strip whitespace and normalize
-                sanitized[field] = sanitized[field].strip()
-                # Remove extra whitespace
-                sanitized[field] = re.sub(r'\s+', ' ', sanitized[field])
+                # Strip whitespace and collapse runs of whitespace
+                sanitized[field] = _WHITESPACE_RUN.sub(' ', sanitized[field].strip())
         
         # Sanitize meal_type list
         if "meal_type" in sanitized and isinstance(sanitized["meal_type"], list):
@@ -0,0 +1,111 @@
+"""
+Unit tests for the reasoning benchmark harness.
+
+This module tests percentile calculation, baseline regression detection and
+workload loading of scripts/benchmark_reasoning.py, and runs one small
+workload end to end.
+"""
+
+import pytest
+from scripts.benchmark_reasoning import (
+    DEFAULT_REQUEST_DIR,
+    build_cases,
+    compare_to_baseline,
+    load_workloads,
+    measure,
+    percentile
+)
+
+
+def make_result(p50_ms: float = 10.0, p95_ms: float = 12.0, allocated_bytes: int = 1000):
+    """Create a benchmark result."""
+    return {
+        "case": "service.analyze_and_recommend",
+        "workload": "dataset_size_10",
+        "p50_ms": p50_ms,
+        "p95_ms": p95_ms,
+        "allocated_bytes": allocated_bytes
+    }
+
+
+class TestPercentile:
+    """Test cases for percentile()."""
+
+    def test_interpolates_between_values(self):
+        """Test linear interpolation between sorted values."""
+        values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        assert percentile(values, 0.5) == 3.0
+        assert percentile(values, 0.95) == pytest.approx(4.8)
+        assert percentile(values, 1.0) == 5.0
+
+    def test_empty_and_single_value(self):
+        """Test percentiles of empty and single-value inputs."""
+        assert percentile([], 0.5) == 0.0
+        assert percentile([7.0], 0.99) == 7.0
+
+
+class TestCompareToBaseline:
+    """Test cases for compare_to_baseline()."""
+
+    def test_within_tolerance(self):
+        """Test that results within the tolerances are not regressions."""
+        baseline = {"results": [make_result()]}
+        results = [make_result(p50_ms=12.0, p95_ms=14.0, allocated_bytes=1050)]
+
+        assert compare_to_baseline(results, baseline, 0.25, 0.10) == []
+
+    def test_reports_each_regressed_metric(self):
+        """Test that latency and allocation regressions are reported per metric."""
+        baseline = {"results": [make_result()]}
+        results = [make_result(p50_ms=20.0, p95_ms=12.0, allocated_bytes=2000)]
+
+        regressions = compare_to_baseline(results, baseline, 0.25, 0.10)
+
+        assert len(regressions) == 2
+        assert "p50_ms" in regressions[0]
+        assert "allocated_bytes" in regressions[1]
+
+    def test_small_latency_changes_are_ignored(self):
+        """Test that sub-millisecond noise on fast cases is not a regression."""
+        baseline = {"results": [make_result(p50_ms=0.1, p95_ms=0.2)]}
+        results = [make_result(p50_ms=0.4, p95_ms=0.6)]
+
+        assert compare_to_baseline(results, baseline, 0.25, 0.10) == []
+        assert len(compare_to_baseline(results, baseline, 0.25, 0.10, min_latency_delta_ms=0.0)) == 2
+
+    def test_new_cases_are_ignored(self):
+        """Test that cases missing from the baseline are not compared."""
+        assert compare_to_baseline([make_result(p50_ms=100.0)], {"results": []}, 0.25, 0.10) == []
+
+
+class TestHarness:
+    """Test cases for workload loading and measurement."""
+
+    def test_loads_shipped_requests_by_size(self):
+        """Test that shipped request files are loaded in restaurant count order."""
+        workloads = load_workloads_or_skip()
+        counts = [len(parameters["restaurants"]) for _, parameters in workloads]
+
+        assert counts == sorted(counts)
+        assert "performance_test_500" in [name for name, _ in workloads]
+
+    def test_measures_service_case(self):
+        """Test one service case end to end."""
+        workloads = [w for w in load_workloads_or_skip() if w[0] == "dataset_size_10"]
+        case, workload, count, call = build_cases(workloads, tools=None)[0]
+
+        metrics = measure(call, iterations=3, warmup=1)
+
+        assert (case, workload, count) == ("service.analyze_and_recommend", "dataset_size_10", 10)
+        assert 0 < metrics["p50_ms"] <= metrics["p99_ms"] <= metrics["max_ms"]
+        assert metrics["throughput_per_second"] > 0
+        assert metrics["allocated_bytes"] > 0
+
+
+def load_workloads_or_skip():
+    """Load the shipped benchmark requests, skipping if they are not present."""
+    workloads = load_workloads(DEFAULT_REQUEST_DIR)
+    if not workloads:
+        pytest.skip("Benchmark request files not available")
+    return workloads
@@ -9,6 +9,7 @@ import pytest
 import random
 from typing import List
 from services.recommendation_service import RecommendationAlgorithm, create_sentiment_analysis
+from services.scoring_engine import SentimentPriors
 from models.restaurant_models import Restaurant, Sentiment, RecommendationResult
 
 
@@ -366,6 +367,49 @@ class TestRecommendationAlgorithm:
         assert result.candidates[0].id == "rest4"  # Highest combined sentiment
         assert result.candidates[1].id == "rest1"  # Second highest combined sentiment
     
+    def test_rank_by_bayesian_average(self):
+        """Test Bayesian ranking with priors derived from the restaurants."""
+        ranked = self.algorithm.rank_by_bayesian_average(self.test_restaurants)
+        
+        # Prior like rate 200/405 with a weight of 405/4 responses
+        assert [r.id for r in ranked] == ["rest1", "rest2", "rest4", "rest3"]
+        assert self.algorithm.rank_by_bayesian_average([]) == []
+    
+    def test_rank_by_bayesian_average_with_priors(self):
+        """Test that given priors outweigh a perfect score from few reviews."""
+        newcomer = Restaurant(
+            id="rest6", name="New Restaurant", address="Address 6",
+            meal_type=["Korean"], sentiment=Sentiment(likes=3, dislikes=0, neutral=0),
+            location_category="Restaurant", district="Wan Chai", price_range="$$"
+        )
+        restaurants = self.test_restaurants + [newcomer]
+        
+        by_likes_rate = self.algorithm.calculate_ranking_scores(restaurants, "combined_sentiment")
+        ranked = self.algorithm.rank_by_bayesian_average(
+            restaurants, SentimentPriors(like_rate=0.5, weight=100.0)
+        )
+        
+        assert by_likes_rate["rest6"] == 100.0
+        assert ranked[0].id == "rest1"
+        assert [r.id for r in ranked].index("rest6") > 0
+    
+    def test_analyze_and_recommend_bayesian_average(self):
+        """Test the recommendation workflow with Bayesian ranking."""
+        priors = SentimentPriors(like_rate=0.5, weight=10.0)
+        result = self.algorithm.analyze_and_recommend(
+            self.test_restaurants,
+            ranking_method="bayesian_average",
+            candidate_count=2,
+            priors=priors
+        )
+        scores = self.algorithm.calculate_ranking_scores(
+            self.test_restaurants, "bayesian_average", priors
+        )
+        
+        assert [r.id for r in result.candidates] == ["rest1", "rest2"]
+        assert result.analysis_summary["priors"] == {"like_rate": 0.5, "weight": 10.0}
+        assert result.analysis_summary["top_score"] == scores["rest1"]
+    
     def test_analyze_and_recommend_empty_restaurants(self):
         """Test analysis and recommendation with empty restaurant list."""
         with pytest.raises(ValueError, match="No restaurants provided for analysis"):
@@ -488,6 +532,26 @@ class TestRecommendationAlgorithm:
         recommendation = self.algorithm.random_select(candidates)
         assert recommendation in candidates
     
+    def test_analyze_and_recommend_top_k_matches_full_ranking(self):
+        """Test partial candidate selection returns the head of the full ranking."""
+        rng = random.Random(3)
+        restaurants = [
+            Restaurant(
+                id=f"tie{i}", name=f"Tie Restaurant {i}", address=f"Address {i}",
+                meal_type=["lunch"],
+                sentiment=Sentiment(likes=rng.randint(0, 5), dislikes=rng.randint(0, 2),
+                                    neutral=rng.randint(0, 2)),
+                location_category="Restaurant", district="Central", price_range="$"
+            )
+            for i in range(500)
+        ]
+        
+        for method, rank in (("sentiment_likes", self.algorithm.rank_by_likes),
+                             ("combined_sentiment", self.algorithm.rank_by_combined_sentiment)):
+            result = self.algorithm.analyze_and_recommend(restaurants, method, candidate_count=20)
+            expected = [r.id for r in rank(restaurants)[:20]]
+            assert [r.id for r in result.candidates] == expected
+    
     def test_edge_case_extreme_sentiment_values(self):
         """Test ranking with extreme sentiment values."""
         extreme_restaurants = [
@@ -0,0 +1,152 @@
+"""
+Unit tests for the read-only restaurant dataset loader.
+
+This module tests resolving restaurant ids and (districts, meal_types) queries
+against district data files served by a local storage backend.
+"""
+
+import json
+import pytest
+from services.district_aliases import DistrictAliasIndex
+from services.restaurant_dataset import RestaurantDatasetError, RestaurantDatasetLoader
+from services.scoring_engine import SentimentPriors
+from services.storage_backends import LocalFileStorageBackend
+
+
+def make_record(restaurant_id: str, hours: str, likes: int = 10):
+    """Create a district file record."""
+    return {
+        "id": restaurant_id,
+        "name": f"Restaurant {restaurant_id}",
+        "address": "1 Test Street",
+        "mealType": ["Cantonese"],
+        "sentiment": {"likes": likes, "dislikes": 2, "neutral": 3},
+        "locationCategory": "Hong Kong Island",
+        "district": "Central",
+        "priceRange": "$101-200",
+        "operatingHours": {"Mon - Fri": [hours], "Sat - Sun": [hours], "Public Holiday": []},
+        "metadata": {"dataQuality": "complete", "version": "1.0.0", "qualityScore": 100}
+    }
+
+
+def write_district(base_path, region: str, district: str, records):
+    """Write a district data file."""
+    region_dir = base_path / region
+    region_dir.mkdir(parents=True, exist_ok=True)
+    content = {"metadata": {"district": district}, "restaurants": records}
+    (region_dir / f"{district}.json").write_text(json.dumps(content), encoding="utf-8")
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    """Local restaurant data for two districts."""
+    write_district(tmp_path, "hong-kong-island", "central-district", [
+        make_record("c1", "07:00 - 10:30"),
+        make_record("c2", "12:00 - 15:00"),
+        make_record("c3", "18:00 - 22:00")
+    ])
+    write_district(tmp_path, "kowloon", "tsim-sha-tsui", [
+        make_record("t1", "11:30 - 21:00")
+    ])
+    return tmp_path
+
+
+@pytest.fixture
+def loader(data_path):
+    """Loader over the local data with a fixed district index."""
+    alias_index = DistrictAliasIndex([
+        ("Central district", "Hong Kong Island"),
+        ("Tsim Sha Tsui", "Kowloon"),
+        ("Admiralty", "Hong Kong Island")
+    ])
+    return RestaurantDatasetLoader(LocalFileStorageBackend(data_path), alias_index, clock=FakeClock())
+
+
+class TestRestaurantDatasetLoader:
+    """Test cases for RestaurantDatasetLoader."""
+
+    def test_find_restaurants_converts_records(self, loader):
+        """Test that district records are converted to the reasoning input format."""
+        restaurants = loader.find_restaurants(["Central"])
+
+        assert [r["id"] for r in restaurants] == ["c1", "c2", "c3"]
+        assert restaurants[0] == {
+            "id": "c1",
+            "name": "Restaurant c1",
+            "address": "1 Test Street",
+            "meal_type": ["Cantonese"],
+            "sentiment": {"likes": 10, "dislikes": 2, "neutral": 3},
+            "location_category": "Hong Kong Island",
+            "district": "Central",
+            "price_range": "$101-200"
+        }
+
+    def test_find_restaurants_filters_by_any_meal_type(self, loader):
+        """Test that the meal filter matches restaurants open for any meal type."""
+        restaurants = loader.find_restaurants(["Central district", "tst"], ["breakfast", "dinner"])
+        assert [r["id"] for r in restaurants] == ["c1", "c3", "t1"]
+
+    def test_invalid_district_and_meal_type(self, loader):
+        """Test that invalid districts and meal types are rejected."""
+        with pytest.raises(RestaurantDatasetError, match="Invalid districts"):
+            loader.find_restaurants(["Atlantis"])
+        with pytest.raises(RestaurantDatasetError, match="Invalid meal types"):
+            loader.find_restaurants(["Central"], ["brunch"])
+
+    def test_district_without_data_file_is_empty(self, loader):
+        """Test that a configured district without a data file has no restaurants."""
+        assert loader.find_restaurants(["Admiralty"]) == []
+
+    def test_find_by_ids(self, loader):
+        """Test id lookups across all districts, keeping the requested order."""
+        found, missing = loader.find_by_ids(["t1", "c2", "unknown", "t1"])
+
+        assert [r["id"] for r in found] == ["t1", "c2"]
+        assert missing == ["unknown"]
+
+    def test_find_by_ids_within_districts(self, loader):
+        """Test that a district hint limits the districts loaded for an id lookup."""
+        found, missing = loader.find_by_ids(["c1", "t1"], districts=["Central"])
+
+        assert [r["id"] for r in found] == ["c1"]
+        assert missing == ["t1"]
+        assert loader.get_stats()["loaded_districts"] == 1
+
+    def test_results_are_independent_copies(self, loader):
+        """Test that modifying a result does not change the shared dataset."""
+        loader.find_restaurants(["Central"])[0]["sentiment"]["likes"] = 0
+        assert loader.find_restaurants(["Central"])[0]["sentiment"]["likes"] == 10
+
+    def test_stale_districts_are_reloaded(self, loader, data_path):
+        """Test that districts are re-read after the refresh interval."""
+        assert len(loader.find_restaurants(["tst"])) == 1
+        write_district(data_path, "kowloon", "tsim-sha-tsui", [
+            make_record("t1", "11:30 - 21:00"), make_record("t2", "11:30 - 21:00")
+        ])
+
+        assert len(loader.find_restaurants(["tst"])) == 1
+        loader._clock.now = loader.refresh_seconds
+        assert len(loader.find_restaurants(["tst"])) == 2
+        assert loader.find_by_ids(["t2"])[1] == []
+
+    def test_sentiment_priors(self, loader, data_path):
+        """Test dataset priors over all or some districts, refreshed with the data."""
+        # Four restaurants with 10 likes out of 15 responses each
+        assert loader.sentiment_priors() == SentimentPriors(like_rate=40 / 60, weight=15.0)
+        assert loader.sentiment_priors(["tst"]) == SentimentPriors(like_rate=10 / 15, weight=15.0)
+
+        write_district(data_path, "kowloon", "tsim-sha-tsui", [
+            make_record("t1", "11:30 - 21:00", likes=25)
+        ])
+        loader._clock.now = loader.refresh_seconds
+        assert loader.sentiment_priors(["tst"]) == SentimentPriors(like_rate=25 / 30, weight=30.0)
@@ -12,6 +12,8 @@ from unittest.mock import Mock, patch
 from typing import List, Dict, Any
 
 from services.restaurant_reasoning_service import RestaurantReasoningService
+from services.result_cache import ResultCache
+from services.scoring_engine import SentimentPriors
 from models.restaurant_models import Restaurant, Sentiment, RecommendationResult, SentimentAnalysis
 from models.validation_models import ValidationResult, ValidationError, ValidationErrorType
 
@@ -483,6 +485,58 @@ class TestRestaurantReasoningService(unittest.TestCase):
                 candidate_count=-1
             )
     
+    def test_prepare_restaurants_matches_list_validation(self):
+        """Test the single-pass pipeline reports the same validation result."""
+        data = self.sample_restaurant_data + [
+            {"id": "bad_001", "name": "", "sentiment": {"likes": 1, "dislikes": 0, "neutral": 0}},
+            {"id": "bad_002", "name": "No Meals", "meal_type": [],
+             "sentiment": {"likes": 0, "dislikes": 0, "neutral": 0}},
+            "not a restaurant"
+        ]
+        expected = self.reasoning_service.validate_restaurant_data(data)
+        
+        result, converted_count, valid_restaurants = self.reasoning_service._prepare_restaurants(
+            data, "sentiment_likes"
+        )
+        
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.valid_count, expected.valid_count)
+        self.assertEqual([e.to_dict() for e in result.errors], [e.to_dict() for e in expected.errors])
+        self.assertEqual(result.warnings, expected.warnings)
+        # Invalid input fails the request, so nothing is converted after the error
+        self.assertLessEqual(converted_count, len(self.sample_restaurant_data))
+    
+    def test_prepare_restaurants_converts_and_filters(self):
+        """Test valid input is sanitized, converted and filtered in one pass."""
+        data = [dict(r) for r in self.sample_restaurant_data]
+        data[0]["name"] = "  Great   Restaurant "
+        
+        result, converted_count, valid_restaurants = self.reasoning_service._prepare_restaurants(
+            data, "sentiment_likes"
+        )
+        
+        self.assertTrue(result.is_valid)
+        self.assertEqual(converted_count, len(data))
+        self.assertEqual(valid_restaurants[0].name, "Great Restaurant")
+        self.assertTrue(all(r.sentiment.total_responses() >= 1 for r in valid_restaurants))
+    
+    def test_prepare_restaurants_strict_mode_stops_at_first_error(self):
+        """Test strict mode stops validating at the first invalid restaurant."""
+        data = [
+            {"id": "bad_001", "name": "", "sentiment": {"likes": 1, "dislikes": 0, "neutral": 0}},
+            {"id": "bad_002", "name": "", "sentiment": {"likes": 1, "dislikes": 0, "neutral": 0}}
+        ] + self.sample_restaurant_data
+        
+        result, converted_count, valid_restaurants = self.strict_reasoning_service._prepare_restaurants(
+            data, "sentiment_likes"
+        )
+        
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.errors[0].restaurant_id, "bad_001")
+        self.assertEqual(converted_count, 0)
+        self.assertEqual(valid_restaurants, [])
+    
     def test_data_quality_metrics(self):
         """Test data quality metrics in analysis summary."""
         # Create mixed data with some invalid restaurants
@@ -546,6 +600,206 @@ class TestRestaurantReasoningService(unittest.TestCase):
         self.assertIsInstance(confidence["score_above_average"], bool)
         self.assertGreaterEqual(confidence["candidates_with_higher_score"], 0)
     
+    def test_result_cache_reuses_ranking_and_redraws_recommendation(self):
+        """Test that a repeated list is served from the cache with the same random picks."""
+        cached_service = RestaurantReasoningService(random_seed=42, result_cache=ResultCache())
+        uncached_service = RestaurantReasoningService(random_seed=42)
+        
+        for _ in range(5):
+            cached = cached_service.analyze_and_recommend(self.sample_restaurant_data, candidate_count=3)
+            uncached = uncached_service.analyze_and_recommend(self.sample_restaurant_data, candidate_count=3)
+            
+            self.assertEqual(cached.recommendation.id, uncached.recommendation.id)
+            self.assertEqual([c.id for c in cached.candidates], [c.id for c in uncached.candidates])
+            self.assertEqual(cached.analysis_summary, uncached.analysis_summary)
+        
+        stats = cached_service.result_cache.stats
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.hits, 4)
+    
+    def test_result_cache_keys_on_sentiment_and_method(self):
+        """Test that changed sentiment counts or ranking methods miss the cache."""
+        service = RestaurantReasoningService(random_seed=42, result_cache=ResultCache())
+        service.analyze_and_recommend(self.sample_restaurant_data)
+        service.analyze_and_recommend(self.sample_restaurant_data, ranking_method="combined_sentiment")
+        
+        changed_data = [dict(r) for r in self.sample_restaurant_data]
+        changed_data[0]["sentiment"] = {"likes": 1, "dislikes": 10, "neutral": 5}
+        result = service.analyze_and_recommend(changed_data)
+        
+        self.assertEqual(service.result_cache.stats.hits, 0)
+        self.assertEqual(len(service.result_cache), 3)
+        self.assertNotEqual(result.candidates[0].id, "rest_001")
+    
+    def test_result_cache_sentiment_analysis(self):
+        """Test that sentiment analyses are cached separately from rankings."""
+        service = RestaurantReasoningService(result_cache=ResultCache())
+        first = service.analyze_sentiment_only(self.sample_restaurant_data)
+        second = service.analyze_sentiment_only(self.sample_restaurant_data)
+        
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertEqual(service.result_cache.stats.hits, 1)
+        self.assertTrue(service.get_result_cache_metrics()["enabled"])
+    
+    def test_result_cache_skips_invalid_data(self):
+        """Test that invalid data is rejected on every call and never cached."""
+        service = RestaurantReasoningService(result_cache=ResultCache())
+        invalid_data = [{"id": "rest_001", "name": "Missing Sentiment"}]
+        
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                service.analyze_and_recommend(invalid_data)
+        
+        self.assertEqual(len(service.result_cache), 0)
+        self.assertEqual(service.get_result_cache_metrics()["stats"]["hits"], 0)
+
+    def test_result_cache_hit_returns_current_records(self):
+        """Test that a cached ranking returns the restaurants of the current request."""
+        service = RestaurantReasoningService(random_seed=42, result_cache=ResultCache())
+        service.analyze_and_recommend(self.sample_restaurant_data, candidate_count=3)
+
+        renamed_data = [
+            dict(r, name=f"New {r['name']}", address=f"New {r['address']}")
+            for r in self.sample_restaurant_data
+        ]
+        result = service.analyze_and_recommend(renamed_data, candidate_count=3)
+
+        self.assertEqual(service.result_cache.stats.hits, 1)
+        self.assertTrue(all(c.name.startswith("New ") for c in result.candidates))
+        self.assertTrue(all(c.address.startswith("New ") for c in result.candidates))
+        self.assertTrue(result.recommendation.name.startswith("New "))
+
+    def test_result_cache_hit_still_validates(self):
+        """Test that records failing validation are rejected even if their ranking is cached."""
+        service = RestaurantReasoningService(random_seed=42, result_cache=ResultCache())
+        service.analyze_and_recommend(self.sample_restaurant_data, candidate_count=3)
+        service.analyze_sentiment_only(self.sample_restaurant_data)
+
+        invalid_data = [dict(r) for r in self.sample_restaurant_data]
+        invalid_data[0]["name"] = ""
+
+        with self.assertRaises(ValueError):
+            service.analyze_and_recommend(invalid_data, candidate_count=3)
+        with self.assertRaises(ValueError):
+            service.analyze_sentiment_only(invalid_data)
+        self.assertEqual(service.result_cache.stats.hits, 0)
+
+    def test_analyze_and_recommend_batch_matches_individual_calls(self):
+        """Test that batch items produce the same results as separate calls."""
+        batch_service = RestaurantReasoningService(random_seed=42)
+        single_service = RestaurantReasoningService(random_seed=42)
+        requests = [
+            (self.sample_restaurant_data, "sentiment_likes", 3),
+            (self.sample_restaurant_data[:2], "combined_sentiment", None),
+            (self.sample_restaurant_data, "sentiment_likes", 3)
+        ]
+        
+        results = batch_service.analyze_and_recommend_batch(requests)
+        
+        self.assertEqual(len(results), 3)
+        for (data, method, count), (result, error) in zip(requests, results):
+            expected = single_service.analyze_and_recommend(data, method, count)
+            self.assertIsNone(error)
+            self.assertEqual(result.recommendation.id, expected.recommendation.id)
+            self.assertEqual([c.id for c in result.candidates], [c.id for c in expected.candidates])
+            self.assertEqual(result.ranking_method, method)
+    
+    def test_analyze_and_recommend_batch_reports_errors_per_item(self):
+        """Test that a failing batch item does not affect the other items."""
+        results = self.reasoning_service.analyze_and_recommend_batch([
+            (self.sample_restaurant_data, "sentiment_likes", 3),
+            (self.sample_restaurant_data, "invalid_method", 3),
+            ([], "sentiment_likes", 3)
+        ])
+        
+        self.assertIsNotNone(results[0][0])
+        self.assertIsNone(results[0][1])
+        self.assertIsNone(results[1][0])
+        self.assertIsNotNone(results[1][1])
+        self.assertIsNone(results[2][0])
+        self.assertIsNotNone(results[2][1])
+    
+    def test_analyze_and_recommend_batch_ranks_duplicate_lists_once(self):
+        """Test that identical lists in a batch share one ranking."""
+        service = RestaurantReasoningService(random_seed=42, result_cache=ResultCache())
+        results = service.analyze_and_recommend_batch(
+            [(self.sample_restaurant_data, "sentiment_likes", 3)] * 4
+        )
+        
+        self.assertTrue(all(error is None for _, error in results))
+        self.assertEqual(service.result_cache.stats.misses, 1)
+        self.assertEqual(service.result_cache.stats.hits, 3)
+    
+    def test_aggregate_sentiment_stream_matches_analyze_sentiment_only(self):
+        """Test that the streaming analysis equals the list analysis."""
+        expected = self.reasoning_service.analyze_sentiment_only(
+            self.sample_restaurant_data, "combined_sentiment"
+        )
+        aggregator = self.reasoning_service.aggregate_sentiment_stream(
+            iter(self.sample_restaurant_data), "combined_sentiment", top_k=2
+        )
+        
+        self.assertEqual(aggregator.to_analysis(), expected)
+        self.assertEqual(len(aggregator.top_restaurants()), 2)
+    
+    def test_aggregate_sentiment_stream_invalid_data(self):
+        """Test that the streaming analysis rejects what analyze_sentiment_only rejects."""
+        invalid_data = self.sample_restaurant_data + [{"id": "broken"}]
+        
+        for restaurant_data, method in (
+            (invalid_data, "sentiment_likes"),
+            (iter([]), "sentiment_likes"),
+            ("not_a_list", "sentiment_likes"),
+            (self.sample_restaurant_data, "invalid_method")
+        ):
+            with self.assertRaises(ValueError):
+                self.reasoning_service.aggregate_sentiment_stream(restaurant_data, method)
+    
+    def test_analyze_and_recommend_bayesian_average(self):
+        """Test Bayesian ranking with derived and explicit priors."""
+        derived = self.reasoning_service.analyze_and_recommend(
+            self.sample_restaurant_data, "bayesian_average", 2
+        )
+        priors = SentimentPriors(like_rate=0.5, weight=1000.0)
+        explicit = self.reasoning_service.analyze_and_recommend(
+            self.sample_restaurant_data, "bayesian_average", 2, priors=priors
+        )
+        
+        self.assertEqual(derived.ranking_method, "bayesian_average")
+        self.assertIn("priors", derived.analysis_summary)
+        self.assertEqual(explicit.analysis_summary["priors"], priors.to_dict())
+        self.assertIn("recommendation_confidence", explicit.analysis_summary)
+    
+    def test_bayesian_priors_are_part_of_the_cache_key(self):
+        """Test that cached rankings are only reused for the same priors."""
+        service = RestaurantReasoningService(random_seed=42, result_cache=ResultCache())
+        priors = SentimentPriors(like_rate=0.5, weight=10.0)
+        
+        service.analyze_and_recommend(self.sample_restaurant_data, "bayesian_average", 2, priors)
+        service.analyze_and_recommend(self.sample_restaurant_data, "bayesian_average", 2, priors)
+        service.analyze_and_recommend(
+            self.sample_restaurant_data, "bayesian_average", 2, SentimentPriors(0.9, 10.0)
+        )
+        
+        self.assertEqual(service.result_cache.stats.hits, 1)
+        self.assertEqual(service.result_cache.stats.misses, 2)
+    
+    def test_aggregate_sentiment_stream_bayesian_requires_priors(self):
+        """Test that streaming Bayesian analysis needs explicit priors."""
+        priors = SentimentPriors(like_rate=0.5, weight=10.0)
+        expected = self.reasoning_service.analyze_sentiment_only(
+            self.sample_restaurant_data, "bayesian_average", priors
+        )
+        aggregator = self.reasoning_service.aggregate_sentiment_stream(
+            self.sample_restaurant_data, "bayesian_average", priors=priors
+        )
+        
+        self.assertEqual(aggregator.to_analysis(), expected)
+        with self.assertRaises(ValueError):
+            self.reasoning_service.aggregate_sentiment_stream(
+                self.sample_restaurant_data, "bayesian_average"
+            )
+    
     def test_logging_integration(self):
         """Test that service operations are properly logged."""
         with self.assertLogs(level=logging.INFO) as log:
@@ -0,0 +1,129 @@
+"""
+Unit tests for the content-addressed result cache.
+
+This module tests request fingerprinting and the LRU, time-to-live and
+byte-budget eviction of ResultCache.
+"""
+
+import pytest
+from models.restaurant_models import Restaurant, Sentiment
+from services.result_cache import ResultCache, fingerprint_restaurants
+
+
+def make_restaurant(restaurant_id: str, likes: int, dislikes: int, neutral: int) -> Restaurant:
+    """Create a restaurant with the given sentiment counts."""
+    return Restaurant(
+        id=restaurant_id, name=restaurant_id, address="1 Test Street", meal_type=["lunch"],
+        sentiment=Sentiment(likes=likes, dislikes=dislikes, neutral=neutral),
+        location_category="Shop", district="Central", price_range="$"
+    )
+
+
+def make_data(likes: int = 10):
+    """Create a small restaurant list."""
+    return [make_restaurant("rest_001", likes, 2, 3), make_restaurant("rest_002", 5, 1, 0)]
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFingerprint:
+    """Test cases for fingerprint_restaurants."""
+
+    def test_changes_with_sentiment_order_and_parts(self):
+        """Test that sentiment counts, order and parts change the key."""
+        base = fingerprint_restaurants(make_data(), "sentiment_likes")
+        assert base == fingerprint_restaurants(make_data(), "sentiment_likes")
+        assert base != fingerprint_restaurants(make_data(likes=11), "sentiment_likes")
+        assert base != fingerprint_restaurants(list(reversed(make_data())), "sentiment_likes")
+        assert base != fingerprint_restaurants(make_data(), "combined_sentiment")
+
+    def test_unserializable_parts_are_not_fingerprinted(self):
+        """Test that parts without a JSON form yield no key."""
+        assert fingerprint_restaurants(make_data(), object()) is None
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hit_and_miss_counting(self):
+        """Test lookups update hit-rate statistics."""
+        cache = ResultCache()
+        assert cache.get("a") is None
+        cache.put("a", "value", 10)
+        assert cache.get("a") == "value"
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.to_dict()["stats"]["hit_rate"] == 50.0
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are not served once the TTL has passed."""
+        clock = FakeClock()
+        cache = ResultCache(ttl_seconds=10, clock=clock)
+        cache.put("a", "value", 10)
+
+        clock.now = 9.9
+        assert cache.get("a") == "value"
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert cache.total_bytes == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction when the entry limit is reached."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1, 10)
+        cache.put("b", 2, 10)
+        cache.get("a")
+        cache.put("c", 3, 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_byte_budget_is_enforced(self):
+        """Test eviction by size and rejection of oversized values."""
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", 1, 60)
+        cache.put("b", 2, 30)
+        cache.put("c", 3, 40)
+
+        assert cache.get("a") is None
+        assert cache.total_bytes == 70
+        assert not cache.put("d", 4, 101)
+        assert cache.stats.rejections == 1
+
+    def test_replacing_a_key_releases_its_bytes(self):
+        """Test that storing an existing key replaces its size."""
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", 1, 60)
+        cache.put("a", 2, 70)
+
+        assert len(cache) == 1
+        assert cache.total_bytes == 70
+        assert cache.get("a") == 2
+
+    def test_invalidate(self):
+        """Test dropping one or all entries."""
+        cache = ResultCache()
+        cache.put("a", 1, 10)
+        cache.put("b", 2, 10)
+        cache.invalidate("a")
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+        assert cache.stats.invalidations == 2
+
+    def test_invalid_limits_raise(self):
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            ResultCache(ttl_seconds=0)
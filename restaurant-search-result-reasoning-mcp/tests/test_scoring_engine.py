@@ -0,0 +1,225 @@
+"""
+Unit tests for the columnar sentiment scoring engine.
+
+This module checks that SentimentColumns ranks, selects top candidates and
+scores exactly like the per-restaurant reference computations, with both the
+pure-Python and the NumPy implementations.
+"""
+
+import random
+import pytest
+from typing import List
+from models.restaurant_models import Restaurant, Sentiment
+from services.scoring_engine import (
+    RANKING_METHODS,
+    VECTORIZE_THRESHOLD,
+    ScoreDistribution,
+    SentimentColumns,
+    SentimentPriors,
+    numpy_available
+)
+
+
+ENGINES = [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not numpy_available(), reason="NumPy not installed"))
+]
+
+
+def make_restaurants(count: int, seed: int = 7) -> List[Restaurant]:
+    """Create restaurants with small sentiment counts so ties are common."""
+    rng = random.Random(seed)
+    return [
+        Restaurant(
+            id=f"rest{i}", name=f"Restaurant {i}", address=f"Address {i}",
+            meal_type=["lunch"],
+            sentiment=Sentiment(likes=rng.randint(0, 6), dislikes=rng.randint(0, 3),
+                                neutral=rng.randint(0, 3)),
+            location_category="Restaurant", district="Central", price_range="$"
+        )
+        for i in range(count)
+    ]
+
+
+def reference_rank(restaurants: List[Restaurant], method: str) -> List[Restaurant]:
+    """Original sort-based ranking."""
+    valid = [r for r in restaurants if r.sentiment.total_responses() > 0]
+    if method == "sentiment_likes":
+        key = lambda r: (r.sentiment.likes, r.sentiment.total_responses())
+    elif method == "bayesian_average":
+        priors = SentimentPriors.from_restaurants(valid)
+        key = lambda r: (priors.score(r.sentiment.likes, r.sentiment.total_responses()),
+                         r.sentiment.total_responses())
+    else:
+        key = lambda r: ((r.sentiment.likes + r.sentiment.neutral) / r.sentiment.total_responses(),
+                         r.sentiment.likes)
+    return sorted(valid, key=key, reverse=True)
+
+
+class TestSentimentColumns:
+    """Test cases for SentimentColumns."""
+
+    @pytest.mark.parametrize("vectorize", ENGINES)
+    @pytest.mark.parametrize("method", RANKING_METHODS)
+    def test_rank_matches_reference(self, vectorize, method):
+        """Test full ranking matches the sort-based ranking, including ties."""
+        restaurants = make_restaurants(300)
+        columns = SentimentColumns(restaurants, vectorize=vectorize)
+
+        assert [r.id for r in columns.rank(method)] == [r.id for r in reference_rank(restaurants, method)]
+
+    @pytest.mark.parametrize("vectorize", ENGINES)
+    @pytest.mark.parametrize("method", RANKING_METHODS)
+    @pytest.mark.parametrize("top_k", [1, 5, 20, 299, 1000])
+    def test_top_k_matches_reference_prefix(self, vectorize, method, top_k):
+        """Test top-K selection returns the prefix of the full ranking."""
+        restaurants = make_restaurants(300)
+        columns = SentimentColumns(restaurants, vectorize=vectorize)
+
+        expected = [r.id for r in reference_rank(restaurants, method)[:top_k]]
+        assert [r.id for r in columns.rank(method, top_k=top_k)] == expected
+
+    @pytest.mark.parametrize("vectorize", ENGINES)
+    def test_percentage_scores_match_sentiment_methods(self, vectorize):
+        """Test scores equal the Sentiment percentage methods."""
+        restaurants = make_restaurants(100)
+        columns = SentimentColumns(restaurants, vectorize=vectorize)
+
+        assert columns.percentage_scores("sentiment_likes") == [
+            r.sentiment.likes_percentage() for r in restaurants
+        ]
+        assert columns.percentage_scores("combined_sentiment") == [
+            r.sentiment.combined_positive_percentage() for r in restaurants
+        ]
+        assert columns.percentage_scores("invalid") == [0.0] * len(restaurants)
+
+    @pytest.mark.parametrize("vectorize", ENGINES)
+    def test_bayesian_scores_use_priors(self, vectorize):
+        """Test Bayesian scores against SentimentPriors, with derived and given priors."""
+        restaurants = make_restaurants(100)
+        derived = SentimentPriors.from_restaurants(restaurants)
+        given = SentimentPriors(like_rate=0.9, weight=50.0)
+
+        for priors, columns in (
+            (derived, SentimentColumns(restaurants, vectorize=vectorize)),
+            (given, SentimentColumns(restaurants, vectorize=vectorize, priors=given))
+        ):
+            assert columns.priors == priors
+            assert columns.percentage_scores("bayesian_average") == [
+                priors.score(r.sentiment.likes, r.sentiment.total_responses())
+                if r.sentiment.total_responses() > 0 else 0.0
+                for r in restaurants
+            ]
+
+    @pytest.mark.parametrize("vectorize", ENGINES)
+    @pytest.mark.parametrize("method", RANKING_METHODS)
+    def test_summarize_matches_reference(self, vectorize, method):
+        """Test single-pass statistics against per-restaurant computations."""
+        restaurants = make_restaurants(200)
+        valid = [r for r in restaurants if r.sentiment.total_responses() > 0]
+        scores = SentimentColumns(valid).score_map(method)
+        stats = SentimentColumns(restaurants, vectorize=vectorize).summarize(method)
+
+        assert stats["valid_count"] == len(valid)
+        assert stats["average_likes"] == pytest.approx(sum(r.sentiment.likes for r in valid) / len(valid))
+        assert stats["average_neutral"] == pytest.approx(sum(r.sentiment.neutral for r in valid) / len(valid))
+        assert stats["top_score"] == max(scores.values())
+        assert stats["bottom_score"] == min(scores.values())
+
+    def test_summarize_without_valid_restaurants(self):
+        """Test statistics are zero when no restaurant has responses."""
+        restaurants = [r for r in make_restaurants(50) if r.sentiment.total_responses() == 0]
+        stats = SentimentColumns(restaurants).summarize("sentiment_likes")
+
+        assert stats["valid_count"] == 0
+        assert stats["top_score"] == 0.0
+
+    def test_score_map_valid_only(self):
+        """Test that valid_only skips restaurants without responses."""
+        restaurants = make_restaurants(50)
+        columns = SentimentColumns(restaurants)
+        scores = columns.score_map("sentiment_likes", valid_only=True)
+
+        assert set(scores) == {r.id for r in restaurants if r.sentiment.total_responses() > 0}
+
+    def test_small_inputs_use_pure_python(self):
+        """Test that inputs below the threshold are not vectorised."""
+        columns = SentimentColumns(make_restaurants(VECTORIZE_THRESHOLD - 1))
+        assert not columns.vectorized
+
+    def test_invalid_method_raises(self):
+        """Test that ranking with an unknown method raises ValueError."""
+        columns = SentimentColumns(make_restaurants(5))
+        with pytest.raises(ValueError, match="Invalid ranking method: invalid"):
+            columns.rank("invalid")
+
+    def test_non_positive_top_k_returns_empty(self):
+        """Test that a top_k of zero selects nothing."""
+        columns = SentimentColumns(make_restaurants(5))
+        assert columns.rank("sentiment_likes", top_k=0) == []
+
+
+class TestSentimentPriors:
+    """Test cases for SentimentPriors."""
+
+    def test_from_counts(self):
+        """Test priors are the overall like rate and mean responses."""
+        priors = SentimentPriors.from_counts(restaurant_count=4, likes=30, responses=40)
+
+        assert priors.like_rate == 0.75
+        assert priors.weight == 10.0
+        assert SentimentPriors.from_counts(0, 0, 0) == SentimentPriors()
+
+    def test_few_reviews_are_shrunk_towards_prior(self):
+        """Test a perfect score from few reviews ranks below a well-reviewed restaurant."""
+        few, many = make_restaurants(2)
+        few.sentiment = Sentiment(likes=2, dislikes=0, neutral=0)
+        many.sentiment = Sentiment(likes=90, dislikes=10, neutral=0)
+        priors = SentimentPriors(like_rate=0.6, weight=20.0)
+
+        ranked = SentimentColumns([few, many], priors=priors).rank("bayesian_average")
+
+        assert [r.id for r in ranked] == [many.id, few.id]
+        assert priors.score(2, 2) == pytest.approx(14 / 22 * 100)
+
+
+class TestScoreDistribution:
+    """Test cases for ScoreDistribution."""
+
+    def test_queries_match_linear_scans(self):
+        """Test rank queries against counting over the unsorted scores."""
+        rng = random.Random(3)
+        scores = [rng.choice([0.0, 25.0, 50.0, 66.67, 100.0]) for _ in range(200)]
+        distribution = ScoreDistribution(scores)
+
+        assert distribution.count == len(scores)
+        assert distribution.mean == pytest.approx(sum(scores) / len(scores))
+        assert distribution.minimum == min(scores)
+        assert distribution.maximum == max(scores)
+        for value in (-1.0, 0.0, 30.0, 50.0, 100.0, 101.0):
+            assert distribution.count_above(value) == sum(1 for s in scores if s > value)
+            assert distribution.count_below(value) == sum(1 for s in scores if s < value)
+            assert distribution.percentile(value) == round(
+                sum(1 for s in scores if s <= value) / len(scores) * 100, 2
+            )
+            assert distribution.is_above_average(value) == (value > sum(scores) / len(scores))
+
+    def test_empty_distribution(self):
+        """Test that an empty distribution answers with zeros."""
+        distribution = ScoreDistribution([])
+
+        assert distribution.count == 0
+        assert distribution.mean == 0.0
+        assert distribution.maximum == 0.0
+        assert distribution.percentile(50.0) == 0.0
+        assert not distribution.is_above_average(50.0)
+
+    @pytest.mark.parametrize("method", RANKING_METHODS)
+    def test_columns_score_distribution(self, method):
+        """Test the distribution built from columns covers valid restaurants only."""
+        restaurants = make_restaurants(100)
+        distribution = SentimentColumns(restaurants).score_distribution(method)
+        valid_scores = SentimentColumns(restaurants).score_map(method, valid_only=True).values()
+
+        assert distribution.count == len(valid_scores)
+        assert distribution.maximum == max(valid_scores)
@@ -12,7 +12,11 @@ import logging
 from typing import List
 
 # Import the modules to test
-from services.sentiment_service import SentimentAnalysisService, SentimentScoreResult
+from services.sentiment_service import (
+    SentimentAnalysisService,
+    SentimentScoreResult,
+    StreamingSentimentAggregator
+)
 from models.restaurant_models import Sentiment, Restaurant, SentimentAnalysis
 from models.validation_models import ValidationResult, ValidationError, ValidationErrorType
 
@@ -469,6 +473,93 @@ class TestSentimentScoreResult(unittest.TestCase):
         self.assertEqual(result.error_message, "Test error message")
 
 
+class TestStreamingSentimentAggregator(unittest.TestCase):
+    """Test cases for StreamingSentimentAggregator."""
+    
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.service = SentimentAnalysisService(minimum_responses=1)
+        self.restaurants = [
+            Restaurant(
+                id=f"rest{i}",
+                name=f"Restaurant {i}",
+                address=f"{i} Main St",
+                meal_type=["lunch"],
+                sentiment=Sentiment(likes=(i * 37) % 100, dislikes=(i * 11) % 30, neutral=i % 7),
+                location_category="Urban",
+                district="Central",
+                price_range="$$"
+            )
+            for i in range(200)
+        ]
+    
+    def test_matches_analyze_restaurant_list(self):
+        """Test that the streamed summary equals the list analysis."""
+        for method in ("sentiment_likes", "combined_sentiment"):
+            expected = self.service.analyze_restaurant_list(self.restaurants, method)
+            aggregator = self.service.aggregate_restaurant_stream(
+                (restaurant for restaurant in self.restaurants), method
+            )
+            
+            self.assertEqual(aggregator.to_analysis(), expected)
+    
+    def test_mean_and_variance(self):
+        """Test Welford mean and variance against a direct computation."""
+        aggregator = StreamingSentimentAggregator().extend(self.restaurants)
+        scores = [
+            r.sentiment.likes_percentage() for r in self.restaurants
+            if r.sentiment.total_responses() > 0
+        ]
+        mean = sum(scores) / len(scores)
+        variance = sum((score - mean) ** 2 for score in scores) / len(scores)
+        
+        self.assertEqual(aggregator.score_count, len(scores))
+        self.assertAlmostEqual(aggregator.mean, mean, places=9)
+        self.assertAlmostEqual(aggregator.variance, variance, places=9)
+        self.assertEqual(aggregator.minimum, min(scores))
+        self.assertEqual(aggregator.maximum, max(scores))
+    
+    def test_top_restaurants_follow_ranking_order(self):
+        """Test that the bounded top-K matches the sorted ranking."""
+        aggregator = StreamingSentimentAggregator(top_k=5).extend(self.restaurants)
+        ranked = self.service.rank_restaurants_by_score(self.restaurants)
+        
+        self.assertEqual(
+            [restaurant.id for restaurant, _ in aggregator.top_restaurants()],
+            [restaurant.id for restaurant, _ in ranked[:5]]
+        )
+    
+    def test_reservoir_bounds_memory_and_estimates_percentiles(self):
+        """Test that the reservoir stays bounded and percentiles stay close."""
+        small = StreamingSentimentAggregator(reservoir_size=1000).extend(self.restaurants)
+        sampled = StreamingSentimentAggregator(reservoir_size=50, random_seed=7)
+        sampled.extend(self.restaurants * 20)
+        
+        self.assertTrue(small.score_statistics()["percentiles_exact"])
+        self.assertFalse(sampled.score_statistics()["percentiles_exact"])
+        self.assertEqual(len(sampled._reservoir), 50)
+        self.assertAlmostEqual(sampled.quantile(0.5), small.quantile(0.5), delta=15)
+    
+    def test_empty_and_insufficient_responses(self):
+        """Test aggregates without any scored restaurant."""
+        empty = StreamingSentimentAggregator()
+        unscored = StreamingSentimentAggregator(minimum_responses=1000).extend(self.restaurants[:3])
+        
+        self.assertEqual(empty.to_analysis(), self.service.analyze_restaurant_list([]))
+        self.assertEqual(empty.quantile(0.5), 0.0)
+        self.assertEqual(unscored.restaurant_count, 3)
+        self.assertEqual(unscored.score_count, 0)
+        self.assertEqual(unscored.top_restaurants(), [])
+        self.assertEqual(unscored.to_analysis().top_sentiment_score, 0.0)
+    
+    def test_invalid_bounds(self):
+        """Test that invalid reservoir and top-K sizes are rejected."""
+        with self.assertRaises(ValueError):
+            StreamingSentimentAggregator(reservoir_size=0)
+        with self.assertRaises(ValueError):
+            StreamingSentimentAggregator(top_k=-1)
+
+
 if __name__ == '__main__':
     # Configure logging for tests
     logging.basicConfig(level=logging.DEBUG)
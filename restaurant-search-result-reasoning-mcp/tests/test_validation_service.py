@@ -349,6 +349,28 @@ class TestRestaurantDataValidator:
         assert result.errors[0].error_type == ValidationErrorType.EMPTY_DATA
         assert result.total_count == 0
     
+    def test_is_clean_restaurant_agrees_with_structure_validation(self):
+        """Test the fast path only accepts records with no errors or warnings."""
+        variants = [
+            self.valid_restaurant,
+            {**self.valid_restaurant, "meal_type": []},
+            {**self.valid_restaurant, "meal_type": ["Chinese", 3]},
+            {**self.valid_restaurant, "name": "   "},
+            {**self.valid_restaurant, "district": None},
+            {**self.valid_restaurant, "district": 12},
+            {**self.valid_restaurant, "sentiment": {"likes": 0, "dislikes": 0, "neutral": 0}},
+            {**self.valid_restaurant, "sentiment": {"likes": -1, "dislikes": 0, "neutral": 5}},
+            {**self.valid_restaurant, "sentiment": {"likes": "5", "dislikes": 0, "neutral": 5}},
+            {key: value for key, value in self.valid_restaurant.items() if key != "id"},
+            "not a restaurant"
+        ]
+        
+        for restaurant in variants:
+            for validator in (self.validator, self.strict_validator):
+                result = validator.validate_restaurant_structure(restaurant)
+                expected = not result.has_errors() and not result.has_warnings()
+                assert validator.is_clean_restaurant(restaurant) == expected
+    
     def test_sanitize_restaurant_data(self):
         """Test restaurant data sanitization."""
         dirty_restaurant = {